@@ -0,0 +1,154 @@
+"""Benchmark the thread and async AWSClientWrapper backends.
+
+Runs ``ec2:DescribeInstances`` through ``AWSClientWrapper.call`` against a local
+EC2 stand-in server (moto-style: it speaks the EC2 query protocol and returns a
+canned response after a simulated network latency), so no AWS account is needed.
+
+Usage:
+    python benchmarks/aws_client_backends.py
+    python benchmarks/aws_client_backends.py --concurrency 8 32 128 --calls 1000 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import os
+import threading
+import time
+from typing import Final
+
+from aiohttp import web
+from botocore.config import Config
+
+# Lift the global throttler limits so the benchmark measures the client backends.
+# These must be set before the throttler singleton is created.
+os.environ.setdefault("MAX_CONCURRENT_AWS_CALLS", "100000")
+os.environ.setdefault("AWS_API_RATE_LIMIT", "1000000")
+os.environ.setdefault("AWS_API_MAX_TOKENS", "1000000")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+from ohlala_smartops.aws.client import AWSClientBackend, AWSClientWrapper
+
+DESCRIBE_INSTANCES_RESPONSE: Final = """<?xml version="1.0" encoding="UTF-8"?>
+<DescribeInstancesResponse xmlns="http://ec2.amazonaws.com/doc/2016-11-15/">
+    <requestId>00000000-0000-0000-0000-000000000000</requestId>
+    <reservationSet>
+        <item>
+            <reservationId>r-0123456789abcdef0</reservationId>
+            <ownerId>123456789012</ownerId>
+            <instancesSet>
+                <item>
+                    <instanceId>i-0123456789abcdef0</instanceId>
+                    <instanceType>t3.micro</instanceType>
+                    <instanceState><code>16</code><name>running</name></instanceState>
+                </item>
+            </instancesSet>
+        </item>
+    </reservationSet>
+</DescribeInstancesResponse>"""
+
+
+class EC2StandIn:
+    """Minimal local EC2 endpoint running on its own thread and event loop."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.port = 0
+        self._ready = threading.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        await request.read()
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return web.Response(text=DESCRIBE_INSTANCES_RESPONSE, content_type="text/xml")
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        app = web.Application()
+        app.router.add_post("/", self._handle)
+        runner = web.AppRunner(app, access_log=None)
+        self._loop.run_until_complete(runner.setup())
+        site = web.TCPSite(runner, "127.0.0.1", 0, backlog=1024)
+        self._loop.run_until_complete(site.start())
+        self.port = runner.addresses[0][1]
+        self._ready.set()
+        self._loop.run_forever()
+
+    def start(self) -> str:
+        self._thread.start()
+        self._ready.wait()
+        return f"http://127.0.0.1:{self.port}"
+
+    def stop(self) -> None:
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+
+async def run_backend(
+    backend: AWSClientBackend, endpoint_url: str, concurrency: int, calls: int
+) -> float:
+    """Issue ``calls`` requests with at most ``concurrency`` in flight.
+
+    Returns:
+        Achieved throughput in calls per second.
+    """
+    wrapper = AWSClientWrapper(
+        "ec2",
+        region="us-east-1",
+        backend=backend,
+        endpoint_url=endpoint_url,
+        config=Config(max_pool_connections=concurrency, retries={"max_attempts": 1}),
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one_call() -> None:
+        async with semaphore:
+            await wrapper.call("describe_instances")
+
+    try:
+        # Warm up the client (connection pool, service model loading)
+        await asyncio.gather(*(one_call() for _ in range(concurrency)))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one_call() for _ in range(calls)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await wrapper.close()
+
+    return calls / elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[8, 32, 128])
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="Simulated server latency in seconds"
+    )
+    args = parser.parse_args()
+
+    server = EC2StandIn(args.latency)
+    endpoint_url = server.start()
+    backends: tuple[AWSClientBackend, ...] = ("thread", "async")
+
+    try:
+        print(f"{'concurrency':>11} | {'thread (calls/s)':>16} | {'async (calls/s)':>15} | speedup")
+        print("-" * 64)
+        for concurrency in args.concurrency:
+            results = {
+                backend: await run_backend(backend, endpoint_url, concurrency, args.calls)
+                for backend in backends
+            }
+            print(
+                f"{concurrency:>11} | {results['thread']:>16.1f} | {results['async']:>15.1f} | "
+                f"{results['async'] / results['thread']:.2f}x"
+            )
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -44,6 +44,13 @@ from ohlala_smartops.constants import (
 )
 from ohlala_smartops.utils.audit_logger import AuditLogger
 from ohlala_smartops.utils.bedrock_throttler import BedrockThrottler
+from ohlala_smartops.utils.fair_share import get_throttle_tenant
+from ohlala_smartops.utils.token_calibration import TokenFeatures, get_token_calibrator
+from ohlala_smartops.utils.token_quota import (
+    TokenQuotaExceededError,
+    TokenQuotas,
+    get_token_quotas,
+)
 from ohlala_smartops.utils.token_tracker import (
     TokenTracker,
     check_operation_limits,
@@ -66,6 +73,10 @@ class BedrockGuardrailError(BedrockClientError):
     """Exception raised when guardrail intervenes."""
 
 
+class BedrockQuotaError(BedrockClientError):
+    """Exception raised when a user or team has used up a token quota."""
+
+
 class BedrockClient:
     """Client for Amazon Bedrock AI interactions.
 
@@ -77,6 +88,7 @@ class BedrockClient:
         throttler: BedrockThrottler for rate limiting API calls.
         audit_logger: AuditLogger for compliance and security auditing.
         token_tracker: TokenTracker for monitoring token usage and costs.
+        token_quotas: TokenQuotas enforcing rolling per-user and per-team limits.
 
     Example:
         >>> client = BedrockClient()
@@ -96,6 +108,7 @@ class BedrockClient:
         audit_logger: AuditLogger | None = None,
         throttler: BedrockThrottler | None = None,
         token_tracker: TokenTracker | None = None,
+        token_quotas: TokenQuotas | None = None,
     ) -> None:
         """Initialize Bedrock client.
 
@@ -104,6 +117,8 @@ class BedrockClient:
             audit_logger: Optional custom audit logger. If None, creates default.
             throttler: Optional custom throttler. If None, creates default.
             token_tracker: Optional custom token tracker. If None, creates default.
+            token_quotas: Optional custom token quotas. If None, uses the global
+                quotas configured from the environment.
         """
         self.settings = get_settings()
         self.model_selector = ModelSelector()
@@ -113,6 +128,7 @@ class BedrockClient:
         self.audit_logger = audit_logger or AuditLogger()
         self.throttler = throttler or BedrockThrottler()
         self.token_tracker = token_tracker or TokenTracker()
+        self.token_quotas = token_quotas or get_token_quotas()
 
         # Tool attempt tracking (for future MCP integration)
         self._tool_attempt_counter: dict[str, int] = {}
@@ -153,6 +169,7 @@ class BedrockClient:
         Raises:
             BedrockModelError: If all model invocation attempts fail.
             BedrockGuardrailError: If guardrails block the request.
+            BedrockQuotaError: If the user or team has used up a token quota.
             BedrockClientError: For other client errors.
 
         Example:
@@ -221,6 +238,14 @@ class BedrockClient:
             logger.error(error_msg)
             raise BedrockClientError(error_msg)
 
+        # Rolling per-user and per-team quotas, so one user cannot spend everyone's budget
+        quota_user = user_id or "anonymous"
+        quota_team = get_throttle_tenant()
+        try:
+            self.token_quotas.check(quota_user, quota_team, estimated_input)
+        except TokenQuotaExceededError as e:
+            raise BedrockQuotaError(str(e)) from e
+
         # Build Bedrock request
         request: dict[str, Any] = {
             "anthropic_version": BEDROCK_ANTHROPIC_VERSION,
@@ -242,6 +267,16 @@ class BedrockClient:
             usage = response_body.get("usage", {})
             actual_input_tokens = usage.get("input_tokens", estimated_input)
             actual_output_tokens = usage.get("output_tokens", 0)
+            if "input_tokens" in usage:
+                # Learn from actual usage to calibrate future estimates
+                get_token_calibrator().observe(
+                    "bedrock_call",
+                    TokenFeatures.from_request(system_prompt, user_message, []),
+                    actual_input_tokens,
+                )
+            self.token_quotas.record(
+                quota_user, quota_team, actual_input_tokens + actual_output_tokens
+            )
 
             # Track the operation with token_tracker
             track_bedrock_operation(
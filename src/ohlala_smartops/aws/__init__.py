@@ -2,6 +2,7 @@
 
 This package provides AWS service integrations with:
 - Boto3 client wrappers with automatic throttling
+- Process-wide registry of shared AWS clients
 - Custom exception hierarchy for AWS errors
 - Async/await support for all AWS operations
 - Retry logic with exponential backoff
@@ -56,9 +57,11 @@ Example:
 """
 
 from ohlala_smartops.aws.client import (
+    AWSClientRegistry,
     AWSClientWrapper,
     create_aws_client,
     execute_with_retry,
+    get_client_registry,
 )
 from ohlala_smartops.aws.cloudwatch import (
     CloudWatchManager,
@@ -91,9 +94,10 @@ from ohlala_smartops.aws.ssm_commands import (
     SSMCommandManager,
 )
 from ohlala_smartops.aws.ssm_sessions import SSMSession, SSMSessionManager
-from ohlala_smartops.aws.tagging import ResourceTag, TaggingManager
+from ohlala_smartops.aws.tagging import ResourceTag, TaggingManager, get_tagging_manager
 
 __all__ = [
+    "AWSClientRegistry",
     "AWSClientWrapper",
     "AWSError",
     "CloudWatchError",
@@ -124,5 +128,7 @@ __all__ = [
     "ValidationError",
     "create_aws_client",
     "execute_with_retry",
+    "get_client_registry",
     "get_metrics_emitter",
+    "get_tagging_manager",
 ]
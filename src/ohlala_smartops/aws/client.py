@@ -3,14 +3,25 @@
 This module provides a wrapper around boto3 clients that automatically integrates
 with the global throttling system and provides consistent error handling across
 all AWS service operations.
+
+Two client backends are supported and selected per service via settings:
+- ``thread``: synchronous boto3 clients executed in the default thread pool
+- ``async``: native asyncio clients from aiobotocore (via aioboto3)
+
+Wrappers created through ``create_aws_client`` are shared process-wide via the
+``AWSClientRegistry``, so each (service, region, endpoint, profile) client is
+only built once no matter how many managers are instantiated.
 """
 
 import asyncio
 import logging
+import threading
+import time
 from collections.abc import Awaitable, Callable
-from contextlib import asynccontextmanager
-from typing import Any, Final, TypeVar
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, Final, Literal, TypeVar
 
+import aioboto3
 import boto3
 from botocore.client import BaseClient
 from botocore.exceptions import BotoCoreError, ClientError
@@ -27,12 +38,15 @@ from ohlala_smartops.aws.exceptions import (
     TimeoutError,
     ValidationError,
 )
-from ohlala_smartops.utils import throttled_aws_call
+from ohlala_smartops.config.settings import get_settings
+from ohlala_smartops.utils import is_throttling_error_code, throttled_aws_call
 
 logger: Final = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+AWSClientBackend = Literal["thread", "async"]
+
 
 class AWSClientWrapper:
     """Wrapper for boto3 clients with throttling and error handling.
@@ -44,21 +58,38 @@ class AWSClientWrapper:
     - Automatic retry logic for transient errors
     - Detailed logging of all AWS operations
 
-    The wrapper converts boto3's synchronous calls to async operations
-    and ensures all calls respect the global rate limits.
+    With the ``thread`` backend the wrapper converts boto3's synchronous calls
+    to async operations by running them in the default executor. With the
+    ``async`` backend it uses a native aiobotocore client, avoiding the thread
+    hop entirely. Both backends ensure all calls respect the global rate limits
+    and raise the same custom exceptions.
 
     Example:
         >>> wrapper = AWSClientWrapper("ec2", region="us-east-1")
         >>> result = await wrapper.call("describe_instances", InstanceIds=["i-123"])
+        >>> native = AWSClientWrapper("ec2", region="us-east-1", backend="async")
+        >>> result = await native.call("describe_instances")
+        >>> await native.close()
     """
 
-    def __init__(self, service_name: str, region: str | None = None, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        service_name: str,
+        region: str | None = None,
+        backend: AWSClientBackend | None = None,
+        profile_name: str | None = None,
+        **kwargs: Any,
+    ) -> None:
         """Initialize AWS client wrapper.
 
         Args:
             service_name: AWS service name (e.g., 'ec2', 'ssm', 's3').
             region: AWS region name. If None, uses default from environment/config.
                 Defaults to None.
+            backend: Client backend, 'thread' or 'async'. If None, resolved from
+                settings for this service. Defaults to None.
+            profile_name: AWS credentials profile name. If None, uses the default
+                credential chain. Defaults to None.
             **kwargs: Additional arguments passed to boto3.client().
 
         Example:
@@ -67,10 +98,153 @@ class AWSClientWrapper:
         """
         self.service_name = service_name
         self.region = region
-        self._client: BaseClient = boto3.client(  # type: ignore[call-overload]
-            service_name, region_name=region, **kwargs
+        self.profile_name = profile_name
+        self.backend: AWSClientBackend = backend or get_settings().get_aws_client_backend(
+            service_name
+        )
+        self._client_kwargs = kwargs
+        self._client: BaseClient | None = None
+        self._async_client_task: asyncio.Task[Any] | None = None
+        self._async_exit_stack: AsyncExitStack | None = None
+
+        if self.backend == "thread":
+            self._client = self._create_sync_client()
+
+        logger.info(
+            f"Initialized AWS {service_name} client for region {region or 'default'} "
+            f"({self.backend} backend)"
+        )
+
+    def _create_sync_client(self) -> BaseClient:
+        """Create the synchronous boto3 client.
+
+        Returns:
+            A boto3 client for this wrapper's service and region.
+        """
+        if self.profile_name:
+            session = boto3.Session(profile_name=self.profile_name)
+            profile_client: BaseClient = session.client(  # type: ignore[call-overload]
+                self.service_name, region_name=self.region, **self._client_kwargs
+            )
+            return profile_client
+
+        client: BaseClient = boto3.client(  # type: ignore[call-overload]
+            self.service_name, region_name=self.region, **self._client_kwargs
+        )
+        return client
+
+    async def _open_async_client(self) -> Any:
+        """Open a native aiobotocore client for this wrapper's service.
+
+        Returns:
+            The entered aiobotocore client.
+        """
+        session = aioboto3.Session(profile_name=self.profile_name)
+        exit_stack = AsyncExitStack()
+        client = await exit_stack.enter_async_context(
+            session.client(self.service_name, region_name=self.region, **self._client_kwargs)
         )
-        logger.info(f"Initialized AWS {service_name} client for region {region or 'default'}")
+        self._async_exit_stack = exit_stack
+        logger.debug(f"Opened async {self.service_name} client")
+        return client
+
+    async def _get_async_client(self) -> Any:
+        """Get the native async client, opening it on first use.
+
+        The client is bound to the event loop it was opened in. Concurrent first
+        callers share a single opening task so only one client is created. When
+        called from another event loop, the previous client is closed and a new
+        one opened.
+
+        Returns:
+            The aiobotocore client for the current event loop.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._async_client_task
+        if task is None or task.get_loop() is not loop or task.cancelled():
+            stale_stack = self._async_exit_stack if task is not None else None
+            stale_loop = task.get_loop() if task is not None else None
+            self._async_exit_stack = None
+            task = loop.create_task(self._open_async_client())
+            self._async_client_task = task
+            if stale_stack is not None and stale_loop is not None:
+                await self._close_stale_client(stale_stack, stale_loop)
+        try:
+            return await asyncio.shield(task)
+        except Exception:
+            # Allow the next call to retry opening the client
+            if self._async_client_task is task:
+                self._async_client_task = None
+            raise
+
+    async def _close_stale_client(
+        self, exit_stack: AsyncExitStack, owner_loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """Close a client opened in another event loop.
+
+        If that loop is still running (in another thread) the client is closed
+        there. Otherwise it is closed from the current loop, where closing the
+        old loop's connections may fail; that is logged rather than raised.
+
+        Args:
+            exit_stack: Exit stack holding the stale client.
+            owner_loop: Event loop the client was opened in.
+        """
+        if owner_loop.is_running() and owner_loop is not asyncio.get_running_loop():
+            asyncio.run_coroutine_threadsafe(exit_stack.aclose(), owner_loop)
+            return
+        try:
+            await exit_stack.aclose()
+            logger.debug(f"Closed async {self.service_name} client of a previous event loop")
+        except Exception as e:
+            logger.debug(f"Error closing async {self.service_name} client of a previous loop: {e}")
+
+    async def _invoke(self, operation: str, params: dict[str, Any]) -> Any:
+        """Invoke an operation on the configured backend.
+
+        Args:
+            operation: AWS operation name.
+            params: Operation-specific parameters.
+
+        Returns:
+            The raw response from the AWS operation.
+        """
+        if self.backend == "async":
+            client = await self._get_async_client()
+            return await getattr(client, operation)(**params)
+
+        # Execute boto3 call in thread pool (boto3 is synchronous)
+        loop = asyncio.get_running_loop()
+        client_method = getattr(self._get_sync_client(), operation)
+        return await loop.run_in_executor(None, lambda: client_method(**params))
+
+    def _get_sync_client(self) -> BaseClient:
+        """Get the synchronous boto3 client, creating it on first use.
+
+        Returns:
+            The boto3 client for this wrapper.
+        """
+        if self._client is None:
+            self._client = self._create_sync_client()
+        return self._client
+
+    async def close(self) -> None:
+        """Close the native async client if one was opened.
+
+        Thread-backend wrappers hold no resources that need closing, so this
+        is a no-op for them.
+
+        Example:
+            >>> wrapper = AWSClientWrapper("ec2", backend="async")
+            >>> await wrapper.call("describe_instances")
+            >>> await wrapper.close()
+        """
+        exit_stack = self._async_exit_stack
+        self._async_exit_stack = None
+        self._async_client_task = None
+        if exit_stack is not None:
+            await exit_stack.aclose()
+            logger.debug(f"Closed async {self.service_name} client")
 
     async def call(self, operation: str, **kwargs: Any) -> Any:
         """Execute AWS operation with throttling and error handling.
@@ -78,7 +252,7 @@ class AWSClientWrapper:
         This method wraps any boto3 client operation, providing:
         - Rate limiting through GlobalThrottler
         - Automatic error classification and custom exceptions
-        - Async execution in thread pool (boto3 is synchronous)
+        - Async execution in thread pool or on a native async client
         - Operation logging for debugging
 
         Args:
@@ -109,10 +283,7 @@ class AWSClientWrapper:
 
         try:
             async with throttled_aws_call(operation_name):
-                # Execute boto3 call in thread pool (boto3 is synchronous)
-                loop = asyncio.get_event_loop()
-                client_method = getattr(self._client, operation)
-                result = await loop.run_in_executor(None, lambda: client_method(**kwargs))
+                result = await self._invoke(operation, kwargs)
 
                 logger.debug(f"Successfully completed {operation_name}")
                 return result
@@ -176,7 +347,7 @@ class AWSClientWrapper:
         }
 
         # Throttling errors
-        if error_code in ("Throttling", "RequestLimitExceeded", "TooManyRequestsException"):
+        if is_throttling_error_code(error_code, self.service_name):
             return ThrottlingError(
                 error_message,
                 service=self.service_name,
@@ -294,6 +465,10 @@ class AWSClientWrapper:
             handling. Use this only when necessary and ensure you handle
             errors and rate limiting appropriately.
 
+        Note:
+            For ``async`` backend wrappers a synchronous boto3 client is
+            created on first access.
+
         Returns:
             The underlying boto3 BaseClient instance.
 
@@ -303,20 +478,193 @@ class AWSClientWrapper:
             >>> # Use with caution - no throttling or error handling!
         """
         logger.warning(f"Direct access to {self.service_name} client requested - bypassing wrapper")
-        return self._client
+        return self._get_sync_client()
+
+
+ClientKey = tuple[str, str | None, str | None, str | None, AWSClientBackend]
+
+
+class AWSClientRegistry:
+    """Process-wide registry of shared AWS client wrappers.
+
+    Building a boto3 client loads the service model and costs tens of
+    milliseconds and several MB of memory. Managers are instantiated per
+    command, so the registry lazily builds each client once per
+    (service, region, endpoint, credentials profile, backend) key and hands
+    out the same wrapper to every caller afterwards.
+
+    Example:
+        >>> registry = get_client_registry()
+        >>> ec2 = registry.get_client("ec2", region="us-east-1")
+        >>> assert registry.get_client("ec2", region="us-east-1") is ec2
+        >>> registry.get_stats()["clients_built"]
+        1
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty client registry."""
+        self._clients: dict[ClientKey, AWSClientWrapper] = {}
+        self._lock = threading.Lock()
+        self._cache_hits = 0
+        self._build_seconds = 0.0
+
+    def get_client(
+        self,
+        service_name: str,
+        region: str | None = None,
+        backend: AWSClientBackend | None = None,
+        endpoint_url: str | None = None,
+        profile_name: str | None = None,
+    ) -> AWSClientWrapper:
+        """Get the shared client wrapper for a key, building it on first use.
+
+        Args:
+            service_name: AWS service name (e.g., 'ec2', 'ssm').
+            region: AWS region name. Defaults to None (uses default region).
+            backend: Client backend, 'thread' or 'async'. Defaults to None
+                (resolved from settings).
+            endpoint_url: Custom endpoint URL. Defaults to None.
+            profile_name: AWS credentials profile name. Defaults to None.
+
+        Returns:
+            The shared AWSClientWrapper for this key.
+        """
+        resolved_backend = backend or get_settings().get_aws_client_backend(service_name)
+        key: ClientKey = (service_name, region, endpoint_url, profile_name, resolved_backend)
+
+        with self._lock:
+            wrapper = self._clients.get(key)
+            if wrapper is not None:
+                self._cache_hits += 1
+                return wrapper
+
+            start_time = time.perf_counter()
+            client_kwargs: dict[str, Any] = {}
+            if endpoint_url:
+                client_kwargs["endpoint_url"] = endpoint_url
+            wrapper = AWSClientWrapper(
+                service_name,
+                region,
+                backend=resolved_backend,
+                profile_name=profile_name,
+                **client_kwargs,
+            )
+            self._build_seconds += time.perf_counter() - start_time
+            self._clients[key] = wrapper
+
+        logger.debug(f"Registered shared {service_name} client ({len(self._clients)} total)")
+        return wrapper
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get client registry statistics for monitoring.
+
+        Returns:
+            Dictionary containing:
+            - clients_built: Number of distinct clients built
+            - cache_hits: Number of requests served by an existing client
+            - build_seconds: Total time spent building clients
+            - clients: Client keys formatted as "service/region[/endpoint][@profile] (backend)"
+        """
+        with self._lock:
+            keys = list(self._clients)
+            cache_hits = self._cache_hits
+            build_seconds = self._build_seconds
+
+        return {
+            "clients_built": len(keys),
+            "cache_hits": cache_hits,
+            "build_seconds": round(build_seconds, 3),
+            "clients": [self._format_key(key) for key in keys],
+        }
+
+    def log_report(self) -> None:
+        """Log a summary of the clients built so far."""
+        stats = self.get_stats()
+        logger.info(
+            f"AWS client registry: {stats['clients_built']} clients built in "
+            f"{stats['build_seconds']:.2f}s, {stats['cache_hits']} reuses"
+        )
+        for client in stats["clients"]:
+            logger.info(f"  - {client}")
+
+    async def close_all(self) -> None:
+        """Close all shared clients and empty the registry."""
+        with self._lock:
+            wrappers = list(self._clients.values())
+            self._clients.clear()
+
+        for wrapper in wrappers:
+            try:
+                await wrapper.close()
+            except Exception as e:
+                logger.warning(f"Error closing {wrapper.service_name} client: {e}")
+
+    def clear(self) -> None:
+        """Drop all shared clients and reset statistics without closing them."""
+        with self._lock:
+            self._clients.clear()
+            self._cache_hits = 0
+            self._build_seconds = 0.0
+
+    @staticmethod
+    def _format_key(key: ClientKey) -> str:
+        """Format a registry key for reporting.
+
+        Args:
+            key: Registry key tuple.
+
+        Returns:
+            Human-readable description of the key.
+        """
+        service_name, region, endpoint_url, profile_name, backend = key
+        description = f"{service_name}/{region or 'default'}"
+        if endpoint_url:
+            description += f"/{endpoint_url}"
+        if profile_name:
+            description += f"@{profile_name}"
+        return f"{description} ({backend})"
+
+
+# Global singleton instance
+_client_registry: AWSClientRegistry | None = None
+
+
+def get_client_registry() -> AWSClientRegistry:
+    """Get the global AWS client registry singleton instance.
+
+    Returns:
+        The global AWSClientRegistry instance, creating it if necessary.
+
+    Example:
+        >>> registry = get_client_registry()
+        >>> stats = registry.get_stats()
+    """
+    global _client_registry  # noqa: PLW0603
+    if _client_registry is None:
+        _client_registry = AWSClientRegistry()
+    return _client_registry
 
 
 def create_aws_client(
-    service_name: str, region: str | None = None, **kwargs: Any
+    service_name: str,
+    region: str | None = None,
+    backend: AWSClientBackend | None = None,
+    profile_name: str | None = None,
+    **kwargs: Any,
 ) -> AWSClientWrapper:
-    """Factory function to create AWS client wrapper.
+    """Factory function to get an AWS client wrapper.
 
-    This is a convenience function for creating AWSClientWrapper instances
-    with a cleaner syntax.
+    Wrappers are shared through the global AWSClientRegistry, so repeated
+    calls with the same service, region, endpoint and profile return the
+    same instance. Passing any other boto3 client arguments (such as a
+    custom ``config``) builds a dedicated, unshared wrapper instead.
 
     Args:
         service_name: AWS service name (e.g., 'ec2', 'ssm').
         region: AWS region name. Defaults to None (uses default region).
+        backend: Client backend, 'thread' or 'async'. Defaults to None
+            (resolved from settings).
+        profile_name: AWS credentials profile name. Defaults to None.
         **kwargs: Additional arguments for boto3.client().
 
     Returns:
@@ -326,7 +674,18 @@ def create_aws_client(
         >>> ec2_client = create_aws_client("ec2", region="us-east-1")
         >>> result = await ec2_client.call("describe_instances")
     """
-    return AWSClientWrapper(service_name, region, **kwargs)
+    if set(kwargs) - {"endpoint_url"}:
+        return AWSClientWrapper(
+            service_name, region, backend=backend, profile_name=profile_name, **kwargs
+        )
+
+    return get_client_registry().get_client(
+        service_name,
+        region,
+        backend=backend,
+        endpoint_url=kwargs.get("endpoint_url"),
+        profile_name=profile_name,
+    )
 
 
 async def execute_with_retry(
@@ -6,8 +6,9 @@ available metrics. All operations use the AWSClientWrapper for automatic throttl
 and error handling.
 """
 
+import json
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 from typing import Any, Final
 
@@ -15,6 +16,7 @@ from pydantic import BaseModel, Field, field_validator
 
 from ohlala_smartops.aws.client import AWSClientWrapper, create_aws_client
 from ohlala_smartops.aws.exceptions import CloudWatchError, ValidationError
+from ohlala_smartops.constants import METRICS_MAX_DATUMS_PER_REQUEST, METRICS_MAX_REQUEST_BYTES
 
 logger: Final = logging.getLogger(__name__)
 
@@ -73,6 +75,24 @@ class CloudWatchMetric(BaseModel):
         return v
 
 
+def _chunk_metric_data(metric_data: Sequence[dict[str, Any]]) -> Iterator[list[dict[str, Any]]]:
+    """Split datums into PutMetricData requests within the count and size limits."""
+    chunk: list[dict[str, Any]] = []
+    chunk_bytes = 0
+    for datum in metric_data:
+        datum_bytes = len(json.dumps(datum, default=str))
+        if chunk and (
+            len(chunk) >= METRICS_MAX_DATUMS_PER_REQUEST
+            or chunk_bytes + datum_bytes > METRICS_MAX_REQUEST_BYTES
+        ):
+            yield chunk
+            chunk, chunk_bytes = [], 0
+        chunk.append(datum)
+        chunk_bytes += datum_bytes
+    if chunk:
+        yield chunk
+
+
 class CloudWatchManager:
     """Manager for CloudWatch metrics operations with automatic throttling.
 
@@ -337,6 +357,60 @@ class CloudWatchManager:
                 operation="put_metric_data",
             ) from e
 
+    async def put_metric_data_batch(
+        self, namespace: str, metric_data: Sequence[dict[str, Any]]
+    ) -> int:
+        """Publish prepared metric datums, up to 1000 per PutMetricData request.
+
+        Requests are also split so that each stays under the request size limit.
+
+        Args:
+            namespace: CloudWatch namespace (cannot start with "AWS/").
+            metric_data: MetricDatum dictionaries as accepted by PutMetricData
+                (e.g., with ``Values``/``Counts`` or ``StatisticValues``).
+
+        Returns:
+            Number of PutMetricData requests made.
+
+        Raises:
+            ValidationError: If the namespace is invalid.
+            CloudWatchError: If an AWS API call fails. Earlier requests of the
+                batch have been published.
+
+        Example:
+            >>> requests = await manager.put_metric_data_batch(
+            ...     namespace="CustomApp/Performance",
+            ...     metric_data=[
+            ...         {"MetricName": "Requests", "Values": [1.0], "Counts": [42.0]},
+            ...     ],
+            ... )
+        """
+        if not namespace:
+            raise ValidationError("namespace is required", service="cloudwatch")
+
+        if namespace.startswith("AWS/"):
+            raise ValidationError(
+                "Custom namespaces cannot start with 'AWS/'", service="cloudwatch"
+            )
+
+        requests = 0
+        for chunk in _chunk_metric_data(metric_data):
+            try:
+                await self.client.call("put_metric_data", Namespace=namespace, MetricData=chunk)
+            except Exception as e:
+                logger.error(f"Failed to put metric data: {e}")
+                raise CloudWatchError(
+                    f"Failed to put metric data: {e}",
+                    service="cloudwatch",
+                    operation="put_metric_data",
+                ) from e
+            requests += 1
+
+        logger.debug(
+            f"Published {len(metric_data)} metric datums to {namespace} in {requests} requests"
+        )
+        return requests
+
     async def list_metrics(
         self,
         namespace: str | None = None,
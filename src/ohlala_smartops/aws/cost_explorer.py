@@ -9,17 +9,23 @@ Note: Cost Explorer API must be enabled in the AWS account before use.
 
 import logging
 from collections.abc import Sequence
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from typing import Any, Final
 
 from pydantic import BaseModel, Field, field_validator
 
 from ohlala_smartops.aws.client import AWSClientWrapper, create_aws_client
-from ohlala_smartops.aws.exceptions import CostExplorerError, ValidationError
+from ohlala_smartops.aws.exceptions import AWSError, CostExplorerError, ValidationError
 
 logger: Final = logging.getLogger(__name__)
 
+EC2_COMPUTE_SERVICE: Final[str] = "Amazon Elastic Compute Cloud - Compute"
+"""Cost Explorer SERVICE dimension value of EC2 instance usage."""
+
+RESOURCE_LEVEL_LOOKBACK_DAYS: Final[int] = 14
+"""Days of resource-level (per instance) cost data kept by Cost Explorer."""
+
 
 class CostDataPoint(BaseModel):
     """Model representing a cost data point.
@@ -68,6 +74,17 @@ class CostFilter(BaseModel):
     tags: dict[str, str] = Field(default_factory=dict)
 
 
+def _is_resource_data_unavailable(error: Exception) -> bool:
+    """Whether a GetCostAndUsageWithResources error means the account has not opted in."""
+    if not isinstance(error, AWSError):
+        return False
+    if error.error_code == "DataUnavailableException":
+        return True
+    return error.error_code in ("ValidationException", "ValidationError") and (
+        "resource" in error.message.lower()
+    )
+
+
 class CostExplorerManager:
     """Manager for AWS Cost Explorer operations with automatic throttling.
 
@@ -113,6 +130,8 @@ class CostExplorerManager:
         """
         self.region = region
         self.client = client or create_aws_client("ce", region=region)
+        # Cleared when the account has not opted in to resource-level data
+        self.resource_level_data = True
         logger.info(f"Initialized CostExplorerManager for region {region or 'default'}")
 
     async def get_cost_and_usage(
@@ -241,8 +260,12 @@ class CostExplorerManager:
     ) -> dict[str, list[CostDataPoint]]:
         """Get costs for specific EC2 instances.
 
-        This method retrieves cost data for EC2 instances by filtering with
-        resource tags or IDs.
+        Within the last 14 days, all instances are queried together with
+        GetCostAndUsageWithResources grouped by RESOURCE_ID, so the number of
+        (billed, rate limited) Cost Explorer calls does not grow with the number
+        of instances. Older periods, monthly granularity, and accounts without
+        resource-level data enabled fall back to one query per instance. Both
+        queries count EC2 compute costs only.
 
         Args:
             instance_ids: List of EC2 instance IDs.
@@ -272,12 +295,40 @@ class CostExplorerManager:
 
         logger.info(f"Getting costs for {len(instance_ids)} instance(s)")
 
+        oldest_resource_day = datetime.now(UTC).date() - timedelta(
+            days=RESOURCE_LEVEL_LOOKBACK_DAYS
+        )
+        if (
+            self.resource_level_data
+            and granularity in ("DAILY", "HOURLY")
+            and start_date.date() > oldest_resource_day
+        ):
+            try:
+                return await self._get_instance_costs_by_resource(
+                    instance_ids, start_date, end_date, granularity
+                )
+            except Exception as e:
+                if _is_resource_data_unavailable(e):
+                    self.resource_level_data = False
+                    logger.warning(
+                        f"Resource-level cost data unavailable, querying instances one by one: {e}"
+                    )
+                else:
+                    logger.warning(
+                        f"Grouped instance cost query failed, querying instances one by one: {e}"
+                    )
+
         result: dict[str, list[CostDataPoint]] = {iid: [] for iid in instance_ids}
 
         for instance_id in instance_ids:
             try:
                 # Build filter for this instance
-                filter_dict = {"Dimensions": {"Key": "RESOURCE_ID", "Values": [instance_id]}}
+                filter_dict = {
+                    "And": [
+                        {"Dimensions": {"Key": "SERVICE", "Values": [EC2_COMPUTE_SERVICE]}},
+                        {"Dimensions": {"Key": "RESOURCE_ID", "Values": [instance_id]}},
+                    ]
+                }
 
                 kwargs: dict[str, Any] = {
                     "TimePeriod": {
@@ -316,6 +367,91 @@ class CostExplorerManager:
         logger.info(f"Retrieved costs for {len(result)} instance(s)")
         return result
 
+    async def _get_instance_costs_by_resource(
+        self,
+        instance_ids: Sequence[str],
+        start_date: datetime,
+        end_date: datetime,
+        granularity: str,
+    ) -> dict[str, list[CostDataPoint]]:
+        """Get costs of several instances with GetCostAndUsageWithResources.
+
+        Results are grouped by RESOURCE_ID and split back per instance. Groups
+        of one time period may be spread over several pages. Instances without
+        costs in a period get a zero data point, as the per-instance query
+        returns.
+
+        Args:
+            instance_ids: List of EC2 instance IDs.
+            start_date: Start of time period (within the last 14 days).
+            end_date: End of time period.
+            granularity: "DAILY" or "HOURLY".
+
+        Returns:
+            Dictionary mapping instance IDs to their cost data points.
+        """
+        kwargs: dict[str, Any] = {
+            "TimePeriod": {
+                "Start": start_date.strftime("%Y-%m-%d"),
+                "End": end_date.strftime("%Y-%m-%d"),
+            },
+            "Granularity": granularity,
+            "Metrics": ["UnblendedCost"],
+            "Filter": {
+                "And": [
+                    {"Dimensions": {"Key": "SERVICE", "Values": [EC2_COMPUTE_SERVICE]}},
+                    {"Dimensions": {"Key": "RESOURCE_ID", "Values": list(instance_ids)}},
+                ]
+            },
+            "GroupBy": [{"Type": "DIMENSION", "Key": "RESOURCE_ID"}],
+        }
+
+        # Amounts by time period, then instance, merged across pages
+        periods: dict[tuple[str, str], dict[str, tuple[Decimal, str]]] = {}
+        estimated_periods: set[tuple[str, str]] = set()
+        unit = "USD"
+        calls = 0
+        next_token: str | None = None
+
+        while True:
+            if next_token:
+                kwargs["NextPageToken"] = next_token
+
+            response = await self.client.call("get_cost_and_usage_with_resources", **kwargs)
+            calls += 1
+
+            for time_result in response.get("ResultsByTime", []):
+                period = (time_result["TimePeriod"]["Start"], time_result["TimePeriod"]["End"])
+                amounts = periods.setdefault(period, {})
+                if time_result.get("Estimated", False):
+                    estimated_periods.add(period)
+
+                for group in time_result.get("Groups", []):
+                    cost = group["Metrics"]["UnblendedCost"]
+                    unit = cost["Unit"]
+                    amounts[group["Keys"][0]] = (Decimal(cost["Amount"]), unit)
+
+            next_token = response.get("NextPageToken")
+            if not next_token:
+                break
+
+        result: dict[str, list[CostDataPoint]] = {iid: [] for iid in instance_ids}
+        for period, amounts in periods.items():
+            for instance_id, datapoints in result.items():
+                amount, amount_unit = amounts.get(instance_id, (Decimal("0"), unit))
+                datapoints.append(
+                    CostDataPoint(
+                        time_period_start=datetime.fromisoformat(period[0]),
+                        time_period_end=datetime.fromisoformat(period[1]),
+                        amount=amount,
+                        unit=amount_unit,
+                        estimated=period in estimated_periods,
+                    )
+                )
+
+        logger.info(f"Retrieved costs for {len(result)} instance(s) in {calls} call(s)")
+        return result
+
     async def forecast_cost(
         self,
         start_date: datetime,
@@ -5,9 +5,20 @@ to CloudWatch. It wraps the CloudWatchManager with convenient methods for
 common metric patterns like command execution, security events, AI usage,
 and health status.
 
-All metrics are emitted asynchronously with automatic error handling. Failed
-metric emissions are logged but do not raise exceptions to avoid disrupting
-application flow.
+Metric events are not published one API call each. Events with the same name,
+dimensions and unit are aggregated in memory into one datum (a Values/Counts
+array, or a statistic set once there are too many distinct values), and a
+background task publishes the buffer with PutMetricData, up to 1000 datums per
+request, every 60 seconds, as soon as it holds 1000 datums, and on shutdown
+(``close``). Emitting a metric never waits for a publish. Failed publishes are
+logged but do not raise exceptions to avoid disrupting application flow.
+
+With ``metrics_output="emf"`` in settings, events are instead written as
+CloudWatch Embedded Metric Format (EMF) JSON lines to stdout or a file; the
+CloudWatch agent or awslogs log driver turns them into metrics without any API
+calls from the application. Events of one metric are buffered the same way and
+written as one line with an array of up to 100 values, from a worker thread
+when the buffer is flushed.
 
 Example:
     >>> from ohlala_smartops.aws.metrics_emitter import get_metrics_emitter
@@ -19,26 +30,207 @@ Example:
     ... )
 """
 
+import asyncio
+import contextlib
+import json
 import logging
+import sys
+import threading
+import time
 from datetime import UTC, datetime
 from functools import lru_cache
-from typing import Final
+from pathlib import Path
+from typing import IO, Any, Final, Literal
 
 from ohlala_smartops.aws.cloudwatch import CloudWatchManager
 from ohlala_smartops.config.settings import Settings, get_settings
+from ohlala_smartops.constants import (
+    METRICS_FLUSH_INTERVAL_SECONDS,
+    METRICS_MAX_DATUMS_PER_REQUEST,
+    METRICS_MAX_EMF_VALUES,
+    METRICS_MAX_VALUES_PER_DATUM,
+)
+from ohlala_smartops.utils.priority import throttle_priority
 
 logger: Final = logging.getLogger(__name__)
 
 DEFAULT_NAMESPACE: Final[str] = "OhlalaSmartOps"
 """Default CloudWatch namespace for custom metrics."""
 
+_MetricKey = tuple[str, tuple[tuple[str, str], ...], str]
+"""Metric name, sorted dimensions and unit identifying an aggregated datum."""
+
+
+class _MetricAggregate:
+    """Events of one metric aggregated into a single datum.
+
+    Values are counted per distinct value while there are at most 150 of them
+    (so CloudWatch can still compute percentiles); beyond that only the
+    statistic set (count, sum, minimum, maximum) is kept.
+    """
+
+    def __init__(self) -> None:
+        self.timestamp = datetime.now(UTC)
+        self.counts: dict[float, int] | None = {}
+        self.sample_count = 0
+        self.sum = 0.0
+        self.minimum = float("inf")
+        self.maximum = float("-inf")
+
+    def add(self, value: float) -> None:
+        self.sample_count += 1
+        self.sum += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        if self.counts is not None:
+            self.counts[value] = self.counts.get(value, 0) + 1
+            if len(self.counts) > METRICS_MAX_VALUES_PER_DATUM:
+                self.counts = None
+
+    def to_datum(self, key: _MetricKey) -> dict[str, Any]:
+        metric_name, dimensions, unit = key
+        datum: dict[str, Any] = {
+            "MetricName": metric_name,
+            "Timestamp": self.timestamp,
+            "Unit": unit,
+        }
+        if dimensions:
+            datum["Dimensions"] = [{"Name": name, "Value": value} for name, value in dimensions]
+        if self.counts is not None:
+            datum["Values"] = list(self.counts)
+            datum["Counts"] = [float(count) for count in self.counts.values()]
+        else:
+            datum["StatisticValues"] = {
+                "SampleCount": float(self.sample_count),
+                "Sum": self.sum,
+                "Minimum": self.minimum,
+                "Maximum": self.maximum,
+            }
+        return datum
+
+
+class _EmfValues:
+    """Values of one metric buffered for a single EMF line."""
+
+    def __init__(self, dimensions: dict[str, str]) -> None:
+        self.timestamp_ms = int(time.time() * 1000)
+        self.dimensions = dimensions
+        self.values: list[float] = []
+
+    def to_line(self, emf: "EmfWriter", key: _MetricKey) -> str:
+        metric_name, _, unit = key
+        return emf.format(
+            metric_name,
+            self.values[0] if len(self.values) == 1 else self.values,
+            unit,
+            self.dimensions,
+            timestamp_ms=self.timestamp_ms,
+        )
+
+
+class EmfWriter:
+    """Writes metric events as CloudWatch Embedded Metric Format JSON lines.
+
+    Each line declares the namespace, dimension names and unit in the ``_aws``
+    metadata, with the dimension values and the metric value (or an array of
+    values of several events) as top-level members. Writes are serialized, so
+    lines can be written from worker threads.
+    """
+
+    def __init__(self, namespace: str, path: str | Path | None = None) -> None:
+        """Initialize the writer.
+
+        Args:
+            namespace: CloudWatch namespace of the metrics.
+            path: File the lines are appended to. If None, writes to stdout.
+                Defaults to None.
+        """
+        self.namespace = namespace
+        self.path = Path(path) if path else None
+        self._file: IO[str] | None = None
+        self._lock = threading.Lock()
+
+    def format(
+        self,
+        metric_name: str,
+        value: float | list[float],
+        unit: str,
+        dimensions: dict[str, str],
+        timestamp_ms: int | None = None,
+    ) -> str:
+        """Format metric events as an EMF document.
+
+        Args:
+            metric_name: Name of the metric.
+            value: Metric value, or the values of several events (at most 100).
+            unit: Metric unit.
+            dimensions: All dimensions of the events.
+            timestamp_ms: Time of the (first) event in milliseconds since the
+                epoch. If None, uses the current time. Defaults to None.
+
+        Returns:
+            JSON document (without newline).
+        """
+        document: dict[str, Any] = {
+            "_aws": {
+                "Timestamp": (int(time.time() * 1000) if timestamp_ms is None else timestamp_ms),
+                "CloudWatchMetrics": [
+                    {
+                        "Namespace": self.namespace,
+                        "Dimensions": [list(dimensions)],
+                        "Metrics": [{"Name": metric_name, "Unit": unit}],
+                    }
+                ],
+            },
+            **dimensions,
+            metric_name: value,
+        }
+        return json.dumps(document, separators=(",", ":"))
+
+    def write(self, metric_name: str, value: float, unit: str, dimensions: dict[str, str]) -> None:
+        """Write a metric event as one EMF line.
+
+        Args:
+            metric_name: Name of the metric.
+            value: Metric value.
+            unit: Metric unit.
+            dimensions: All dimensions of the event.
+        """
+        self.write_lines([self.format(metric_name, value, unit, dimensions)])
+
+    def write_lines(self, lines: list[str]) -> None:
+        """Write formatted EMF documents, one per line, and flush the stream.
+
+        Args:
+            lines: Documents returned by ``format``.
+        """
+        with self._lock:
+            stream = self._stream()
+            stream.write("".join(line + "\n" for line in lines))
+            stream.flush()
+
+    def _stream(self) -> IO[str]:
+        if self.path is None:
+            return sys.stdout
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("a", encoding="utf-8")
+        return self._file
+
+    def close(self) -> None:
+        """Close the file, if any."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
 
 class MetricsEmitter:
     """Emit custom CloudWatch metrics for operational monitoring.
 
     This class provides convenient methods for emitting application metrics
-    to CloudWatch. All methods are async and handle errors gracefully by
-    logging failures without disrupting application flow.
+    to CloudWatch. Events are aggregated in memory and published in batches;
+    publishing failures are logged without disrupting application flow.
 
     Common dimensions (like StackName) are automatically added to all metrics
     when configured in settings.
@@ -48,6 +240,10 @@ class MetricsEmitter:
         namespace: CloudWatch namespace for metrics.
         common_dimensions: Dimensions added to all metrics (e.g., StackName).
         settings: Application settings.
+        output: "api" to publish with PutMetricData, "emf" to write EMF lines.
+        emf: EMF writer when output is "emf".
+        flush_interval: Seconds events are aggregated before being published.
+        max_buffered_metrics: Aggregated datums that trigger an immediate publish.
     """
 
     def __init__(
@@ -55,6 +251,11 @@ class MetricsEmitter:
         namespace: str = DEFAULT_NAMESPACE,
         cloudwatch: CloudWatchManager | None = None,
         settings: Settings | None = None,
+        *,
+        flush_interval: float = METRICS_FLUSH_INTERVAL_SECONDS,
+        max_buffered_metrics: int = METRICS_MAX_DATUMS_PER_REQUEST,
+        output: Literal["api", "emf"] | None = None,
+        emf_writer: EmfWriter | None = None,
     ) -> None:
         """Initialize metrics emitter.
 
@@ -64,6 +265,14 @@ class MetricsEmitter:
                 Defaults to None.
             settings: Application settings. If None, uses get_settings().
                 Defaults to None.
+            flush_interval: Seconds events are aggregated before being published.
+                Defaults to 60.
+            max_buffered_metrics: Aggregated datums that trigger an immediate
+                publish. Defaults to 1000.
+            output: "api" or "emf". If None, uses settings.metrics_output.
+                Defaults to None.
+            emf_writer: Optional EMF writer. If None and output is "emf",
+                writes to settings.metrics_emf_file or stdout. Defaults to None.
 
         Example:
             >>> emitter = MetricsEmitter()
@@ -79,7 +288,26 @@ class MetricsEmitter:
         if self.settings.stack_name:
             self.common_dimensions["StackName"] = self.settings.stack_name
 
-        logger.info(f"Initialized MetricsEmitter with namespace={namespace}")
+        self.output = output or self.settings.metrics_output
+        self.emf: EmfWriter | None = None
+        if self.output == "emf":
+            self.emf = emf_writer or EmfWriter(namespace, self.settings.metrics_emf_file)
+
+        self.flush_interval = flush_interval
+        self.max_buffered_metrics = max_buffered_metrics
+        self._buffer: dict[_MetricKey, _MetricAggregate] = {}
+        self._emf_buffer: dict[_MetricKey, _EmfValues] = {}
+        self._emf_lines: list[str] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        self._flush_now: asyncio.Event | None = None
+
+        # Metrics
+        self._events = 0
+        self._requests = 0
+        self._published_datums = 0
+        self._failed_datums = 0
+
+        logger.info(f"Initialized MetricsEmitter with namespace={namespace}, output={self.output}")
 
     async def emit_metric(
         self,
@@ -88,10 +316,14 @@ class MetricsEmitter:
         unit: str = "Count",
         dimensions: dict[str, str] | None = None,
     ) -> None:
-        """Emit a single metric to CloudWatch.
+        """Record a metric event for publishing to CloudWatch.
 
-        This is the base method used by all other convenience methods.
-        It adds common dimensions and handles errors gracefully.
+        This is the base method used by all other convenience methods. It adds
+        common dimensions and aggregates the event with earlier events of the
+        same metric; the background flush task publishes the buffer once the
+        flush interval has passed or it holds ``max_buffered_metrics`` datums.
+        In EMF mode the events of a metric are buffered for one EMF line
+        instead.
 
         Args:
             metric_name: Name of the metric.
@@ -108,24 +340,122 @@ class MetricsEmitter:
             ...     dimensions={"Environment": "Production"}
             ... )
         """
+        # Combine common dimensions with metric-specific dimensions
+        all_dimensions = self.common_dimensions.copy()
+        if dimensions:
+            all_dimensions.update(dimensions)
+
+        key = (metric_name, tuple(sorted(all_dimensions.items())), unit)
+        if self.emf is not None:
+            emf_values = self._emf_buffer.get(key)
+            if emf_values is None:
+                emf_values = self._emf_buffer[key] = _EmfValues(all_dimensions)
+            emf_values.values.append(float(value))
+            if len(emf_values.values) >= METRICS_MAX_EMF_VALUES:
+                self._emf_lines.append(self._emf_buffer.pop(key).to_line(self.emf, key))
+        else:
+            aggregate = self._buffer.get(key)
+            if aggregate is None:
+                aggregate = self._buffer[key] = _MetricAggregate()
+            aggregate.add(float(value))
+        self._events += 1
+
+        flush_now = self._schedule_flush()
+        if self._buffered() >= self.max_buffered_metrics:
+            flush_now.set()
+
+    def _buffered(self) -> int:
+        """Datums (or EMF lines) waiting to be published."""
+        return len(self._buffer) + len(self._emf_buffer) + len(self._emf_lines)
+
+    def _schedule_flush(self) -> asyncio.Event:
+        """Start the flush task unless running, returning the event that wakes it early."""
+        loop = asyncio.get_running_loop()
+        task = self._flush_task
+        if task is None or task.done() or task.get_loop() is not loop or self._flush_now is None:
+            self._flush_now = asyncio.Event()
+            self._flush_task = loop.create_task(self._flush_loop(self._flush_now))
+        return self._flush_now
+
+    async def _flush_loop(self, flush_now: asyncio.Event) -> None:
+        """Publish the buffer every flush interval, or when woken, until it stays empty."""
+        while self._buffered():
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(flush_now.wait(), self.flush_interval)
+            flush_now.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Publish the aggregated metrics now.
+
+        Metrics that fail to publish are dropped and logged; they are not
+        retried so that the buffer cannot grow while CloudWatch is unavailable.
+        In EMF mode the buffered lines are written from a worker thread.
+        """
+        if self.emf is not None:
+            await self._flush_emf(self.emf)
+            return
+        if not self._buffer:
+            return
+        buffer, self._buffer = self._buffer, {}
+        metric_data = [aggregate.to_datum(key) for key, aggregate in buffer.items()]
+
         try:
-            # Combine common dimensions with metric-specific dimensions
-            all_dimensions = self.common_dimensions.copy()
-            if dimensions:
-                all_dimensions.update(dimensions)
-
-            await self.cloudwatch.put_metric_data(
-                namespace=self.namespace,
-                metric_name=metric_name,
-                value=value,
-                unit=unit,
-                dimensions=all_dimensions if all_dimensions else None,
-                timestamp=datetime.now(UTC),
-            )
+            # Metrics are fire-and-forget - never let them delay user requests
+            with throttle_priority("bulk"):
+                self._requests += await self.cloudwatch.put_metric_data_batch(
+                    namespace=self.namespace, metric_data=metric_data
+                )
+            self._published_datums += len(metric_data)
+        except Exception as e:
+            # Log error but don't raise - metrics should not disrupt application flow
+            self._failed_datums += len(metric_data)
+            metric_names = ", ".join(sorted({metric_name for metric_name, _, _ in buffer}))
+            logger.error(f"Failed to emit metrics {metric_names}: {e}")
+
+    async def _flush_emf(self, emf: EmfWriter) -> None:
+        """Write the buffered EMF lines without blocking the event loop."""
+        lines, self._emf_lines = self._emf_lines, []
+        buffer, self._emf_buffer = self._emf_buffer, {}
+        lines += [emf_values.to_line(emf, key) for key, emf_values in buffer.items()]
+        if not lines:
+            return
 
+        try:
+            await asyncio.to_thread(emf.write_lines, lines)
+            self._published_datums += len(lines)
         except Exception as e:
             # Log error but don't raise - metrics should not disrupt application flow
-            logger.error(f"Failed to emit metric {metric_name}: {e}")
+            self._failed_datums += len(lines)
+            logger.error(f"Failed to write {len(lines)} EMF lines: {e}")
+
+    async def close(self) -> None:
+        """Cancel the pending delayed publish and publish the buffer (e.g., on shutdown)."""
+        task, self._flush_task = self._flush_task, None
+        self._flush_now = None
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self.flush()
+        if self.emf is not None:
+            self.emf.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get emitter statistics for monitoring.
+
+        Returns:
+            Dictionary with events recorded, datums (EMF lines in EMF mode)
+            buffered, published and failed, and PutMetricData requests made.
+        """
+        return {
+            "output": self.output,
+            "events": self._events,
+            "buffered_datums": self._buffered(),
+            "published_datums": self._published_datums,
+            "failed_datums": self._failed_datums,
+            "requests": self._requests,
+        }
 
     # =========================================================================
     # Security Metrics
@@ -5,17 +5,44 @@ including adding, removing, and querying tags. All operations use the AWSClientW
 for automatic throttling and error handling.
 """
 
+import asyncio
 import logging
-from collections.abc import Sequence
+import re
+from collections.abc import AsyncIterator, Mapping, Sequence
+from functools import lru_cache
 from typing import Any, Final
 
 from pydantic import BaseModel, Field, field_validator
 
 from ohlala_smartops.aws.client import AWSClientWrapper, create_aws_client
-from ohlala_smartops.aws.exceptions import TaggingError, ValidationError
+from ohlala_smartops.aws.exceptions import (
+    AWSError,
+    TaggingError,
+    ThrottlingError,
+    TimeoutError,
+    ValidationError,
+)
+from ohlala_smartops.constants import AWS_SERVER_ERROR_CODES
 
 logger: Final = logging.getLogger(__name__)
 
+TAG_BATCH_SIZE: Final[int] = 100
+"""Resource IDs per CreateTags/DeleteTags request.
+
+EC2 accepts up to 1000, but a single unknown ID fails the whole request, so
+smaller batches keep one bad ID from failing the rest of a large selection.
+"""
+
+TAG_BATCH_MAX_ATTEMPTS: Final[int] = 2
+"""Attempts per batch; failed batches are retried without the IDs AWS rejected."""
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a failed tagging request may succeed when retried unchanged."""
+    if isinstance(error, ThrottlingError | TimeoutError):
+        return True
+    return isinstance(error, AWSError) and error.error_code in AWS_SERVER_ERROR_CODES
+
 
 class ResourceTag(BaseModel):
     """Model representing an AWS resource tag with validated data.
@@ -98,8 +125,9 @@ class TaggingManager:
         """Add or update tags on AWS resources.
 
         This method adds tags to resources, creating new tags or updating existing ones.
-        AWS allows up to 50 tags per resource, and this method can tag up to 1000
-        resources in a single call.
+        AWS allows up to 50 tags per resource. Resources are tagged in concurrent
+        batches of ``TAG_BATCH_SIZE`` (see ``_apply_in_batches``), so any number
+        of resources can be passed.
 
         Args:
             resource_ids: Sequence of resource IDs (e.g., EC2 instance IDs).
@@ -110,7 +138,7 @@ class TaggingManager:
 
         Raises:
             ValidationError: If resource IDs are empty or tags are invalid.
-            TaggingError: If AWS API call fails.
+            TaggingError: If no resource could be tagged.
 
         Example:
             >>> tags = {"Environment": "Production", "Owner": "Alice"}
@@ -148,18 +176,7 @@ class TaggingManager:
         aws_tags = [{"Key": tag.key, "Value": tag.value} for tag in tag_objects]
 
         try:
-            # Batch tagging (up to 1000 resources per call)
-            await self.client.call(
-                "create_tags",
-                Resources=list(resource_ids),
-                Tags=aws_tags,
-            )
-
-            logger.info(f"Successfully tagged {len(resource_ids)} resource(s)")
-
-            # Return success for all resources
-            return dict.fromkeys(resource_ids, True)
-
+            results = await self._apply_in_batches("create_tags", resource_ids, aws_tags)
         except Exception as e:
             logger.error(f"Failed to tag resources: {e}")
             if isinstance(e, ValidationError):
@@ -170,6 +187,9 @@ class TaggingManager:
                 operation="create_tags",
             ) from e
 
+        logger.info(f"Successfully tagged {sum(results.values())} resource(s)")
+        return results
+
     async def get_resource_tags(
         self,
         resource_ids: Sequence[str],
@@ -250,7 +270,7 @@ class TaggingManager:
 
         Raises:
             ValidationError: If resource IDs or tag keys are empty.
-            TaggingError: If AWS API call fails.
+            TaggingError: If tags could not be removed from any resource.
 
         Example:
             >>> result = await manager.remove_tags(["i-123"], ["OldTag", "TempTag"])
@@ -269,17 +289,7 @@ class TaggingManager:
         aws_tags = [{"Key": key} for key in tag_keys]
 
         try:
-            await self.client.call(
-                "delete_tags",
-                Resources=list(resource_ids),
-                Tags=aws_tags,
-            )
-
-            logger.info(f"Successfully removed tags from {len(resource_ids)} resource(s)")
-
-            # Return success for all resources
-            return dict.fromkeys(resource_ids, True)
-
+            results = await self._apply_in_batches("delete_tags", resource_ids, aws_tags)
         except Exception as e:
             logger.error(f"Failed to remove tags: {e}")
             if isinstance(e, ValidationError):
@@ -290,9 +300,87 @@ class TaggingManager:
                 operation="delete_tags",
             ) from e
 
+        logger.info(f"Successfully removed tags from {sum(results.values())} resource(s)")
+        return results
+
+    async def _apply_in_batches(
+        self,
+        operation: str,
+        resource_ids: Sequence[str],
+        aws_tags: list[dict[str, str]],
+    ) -> dict[str, bool]:
+        """Send a tag write in concurrent batches, retrying only what failed.
+
+        Batches of ``TAG_BATCH_SIZE`` IDs are sent at once; the client's rate
+        limit buckets pace them. CreateTags and DeleteTags fail a whole request
+        when an ID is unknown, naming the rejected IDs in the error message.
+        Those IDs are marked failed and the rest of their batch is retried, as
+        are batches that failed transiently (throttling, timeouts, server
+        errors), up to ``TAG_BATCH_MAX_ATTEMPTS`` attempts.
+
+        Args:
+            operation: EC2 operation ("create_tags" or "delete_tags").
+            resource_ids: Resource IDs to apply the operation to.
+            aws_tags: Tags in AWS API format.
+
+        Returns:
+            Dictionary mapping resource IDs to success status.
+
+        Raises:
+            Exception: The first error if the operation failed for every resource.
+        """
+        unique_ids = list(dict.fromkeys(resource_ids))
+        results: dict[str, bool] = {}
+        errors: list[Exception] = []
+        pending = [
+            unique_ids[start : start + TAG_BATCH_SIZE]
+            for start in range(0, len(unique_ids), TAG_BATCH_SIZE)
+        ]
+
+        for attempt in range(1, TAG_BATCH_MAX_ATTEMPTS + 1):
+            outcomes = await asyncio.gather(
+                *(self.client.call(operation, Resources=batch, Tags=aws_tags) for batch in pending),
+                return_exceptions=True,
+            )
+            retry: list[list[str]] = []
+            for batch, outcome in zip(pending, outcomes, strict=True):
+                if not isinstance(outcome, BaseException):
+                    results.update(dict.fromkeys(batch, True))
+                    continue
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                errors.append(outcome)
+
+                named = set(re.split(r"[^\w-]+", str(outcome)))
+                rejected = [rid for rid in batch if rid in named]
+                results.update(dict.fromkeys(rejected, False))
+                rest = [rid for rid in batch if rid not in named]
+                if (
+                    rest
+                    and (rejected or _is_transient(outcome))
+                    and attempt < TAG_BATCH_MAX_ATTEMPTS
+                ):
+                    retry.append(rest)
+                else:
+                    results.update(dict.fromkeys(rest, False))
+            if not retry:
+                break
+            logger.info(f"Retrying {operation} for {sum(map(len, retry))} resource(s)")
+            pending = retry
+
+        failed = [rid for rid in unique_ids if not results[rid]]
+        if len(failed) == len(unique_ids):
+            raise errors[0]
+        if failed:
+            logger.warning(
+                f"{operation} failed for {len(failed)} of {len(unique_ids)} resource(s): "
+                f"{', '.join(failed[:10])}{'...' if len(failed) > 10 else ''}"
+            )
+        return {rid: results[rid] for rid in unique_ids}
+
     async def find_resources_by_tags(
         self,
-        tag_filters: dict[str, str],
+        tag_filters: Mapping[str, str | None],
         resource_types: Sequence[str] | None = None,
     ) -> list[str]:
         """Find AWS resources matching specified tag filters.
@@ -302,7 +390,8 @@ class TaggingManager:
         all resource types, but you can limit the search to specific types.
 
         Args:
-            tag_filters: Dictionary of tag key-value pairs to match (AND logic).
+            tag_filters: Dictionary of tag key-value pairs to match (AND logic). A
+                value of None matches any value of the key.
             resource_types: Optional sequence of resource type filters (e.g., ["ec2:instance"]).
                 If None, searches all resource types. Defaults to None.
 
@@ -322,50 +411,101 @@ class TaggingManager:
             >>> print(arns)
             ['arn:aws:ec2:us-east-1:123456789012:instance/i-123']
         """
-        if not tag_filters:
-            raise ValidationError("tag_filters cannot be empty", service="resourcegroupstaggingapi")
+        resource_arns: list[str] = []
+        async for page in self.iter_resources_by_tags(tag_filters, resource_types):
+            resource_arns.extend(page)
 
-        logger.info(f"Searching for resources with tag filters: {tag_filters}")
+        logger.info(f"Found {len(resource_arns)} resource(s) matching tag filters")
+        return resource_arns
 
-        # Convert tag filters to AWS API format
-        aws_tag_filters = [{"Key": k, "Values": [v]} for k, v in tag_filters.items()]
+    async def iter_resources_by_tags(
+        self,
+        tag_filters: Mapping[str, str | None],
+        resource_types: Sequence[str] | None = None,
+    ) -> AsyncIterator[list[str]]:
+        """Find AWS resources matching tag filters, one result page at a time.
 
-        try:
-            # Build API parameters
-            kwargs: dict[str, Any] = {"TagFilters": aws_tag_filters}
-            if resource_types:
-                kwargs["ResourceTypeFilters"] = list(resource_types)
+        Filtering happens server side, so only matching resources are returned.
+        Callers can start working on a page while the next one is fetched.
 
-            # Handle pagination
-            resource_arns: list[str] = []
-            pagination_token: str | None = None
+        Args:
+            tag_filters: Dictionary of tag key-value pairs to match (AND logic). A
+                value of None matches any value of the key.
+            resource_types: Optional sequence of resource type filters (e.g., ["ec2:instance"]).
+                If None, searches all resource types. Defaults to None.
 
-            while True:
-                if pagination_token:
-                    kwargs["PaginationToken"] = pagination_token
+        Yields:
+            Resource ARNs of each non-empty page of results.
 
-                response = await self._tagging_client.call("get_resources", **kwargs)
+        Raises:
+            ValidationError: If tag filters are empty.
+            TaggingError: If AWS API call fails.
+
+        Example:
+            >>> async for arns in manager.iter_resources_by_tags(
+            ...     {"Environment": "Production"}, resource_types=["ec2:instance"]
+            ... ):
+            ...     print(len(arns))
+        """
+        if not tag_filters:
+            raise ValidationError("tag_filters cannot be empty", service="resourcegroupstaggingapi")
 
-                # Extract ARNs from response
-                resource_arns.extend(
-                    resource["ResourceARN"]
-                    for resource in response.get("ResourceTagMappingList", [])
-                )
+        logger.info(f"Searching for resources with tag filters: {dict(tag_filters)}")
 
-                # Check for more results
-                pagination_token = response.get("PaginationToken")
-                if not pagination_token:
-                    break
+        # Convert tag filters to AWS API format (no Values matches any value)
+        aws_tag_filters = [
+            {"Key": k, "Values": [v]} if v is not None else {"Key": k}
+            for k, v in tag_filters.items()
+        ]
 
-            logger.info(f"Found {len(resource_arns)} resource(s) matching tag filters")
-            return resource_arns
+        # Build API parameters
+        kwargs: dict[str, Any] = {"TagFilters": aws_tag_filters}
+        if resource_types:
+            kwargs["ResourceTypeFilters"] = list(resource_types)
 
-        except Exception as e:
-            logger.error(f"Failed to find resources by tags: {e}")
-            if isinstance(e, ValidationError):
-                raise
-            raise TaggingError(
-                f"Failed to find resources by tags: {e}",
-                service="resourcegroupstaggingapi",
-                operation="get_resources",
-            ) from e
+        # Handle pagination
+        pagination_token: str | None = None
+
+        while True:
+            if pagination_token:
+                kwargs["PaginationToken"] = pagination_token
+
+            try:
+                response = await self._tagging_client.call("get_resources", **kwargs)
+            except Exception as e:
+                logger.error(f"Failed to find resources by tags: {e}")
+                if isinstance(e, ValidationError):
+                    raise
+                raise TaggingError(
+                    f"Failed to find resources by tags: {e}",
+                    service="resourcegroupstaggingapi",
+                    operation="get_resources",
+                ) from e
+
+            # Extract ARNs from response
+            page = [
+                resource["ResourceARN"] for resource in response.get("ResourceTagMappingList", [])
+            ]
+            if page:
+                yield page
+
+            # Check for more results
+            pagination_token = response.get("PaginationToken")
+            if not pagination_token:
+                break
+
+
+@lru_cache
+def get_tagging_manager(region: str | None = None) -> TaggingManager:
+    """Get the shared tagging manager of a region.
+
+    Sharing the manager reuses its AWS clients across commands instead of
+    creating new ones per message.
+
+    Args:
+        region: AWS region name. If None, uses the default region. Defaults to None.
+
+    Returns:
+        Cached TaggingManager instance for the region.
+    """
+    return TaggingManager(region=region)
@@ -15,6 +15,8 @@ from ohlala_smartops.bot.messages import (
 from ohlala_smartops.bot.state import (
     ConversationStateManager,
     InMemoryStateStorage,
+    RedisStateStorage,
+    SqliteStateStorage,
     StateStorage,
     create_state_manager,
 )
@@ -29,6 +31,8 @@ __all__ = [
     "OhlalaAdapter",
     # Bot orchestrator
     "OhlalaBot",
+    "RedisStateStorage",
+    "SqliteStateStorage",
     "StateStorage",
     # FastAPI app
     "app",
@@ -4,6 +4,7 @@ This module sets up the FastAPI application with health endpoints,
 Bot Framework message endpoint, and middleware.
 """
 
+import asyncio
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
@@ -15,13 +16,21 @@ from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 
 from ohlala_smartops.ai.bedrock_client import BedrockClient
+from ohlala_smartops.aws.client import get_client_registry
+from ohlala_smartops.aws.metrics_emitter import get_metrics_emitter
 from ohlala_smartops.bot.adapter import create_adapter
 from ohlala_smartops.bot.health import router as health_router
 from ohlala_smartops.bot.messages import router as messages_router
-from ohlala_smartops.bot.state import create_state_manager
+from ohlala_smartops.bot.state import (
+    ConversationStateManager,
+    SqliteStateStorage,
+    create_state_manager,
+)
 from ohlala_smartops.bot.teams_bot import OhlalaBot
 from ohlala_smartops.config.settings import Settings
 from ohlala_smartops.mcp.manager import MCPManager
+from ohlala_smartops.utils.audit_logger import get_audit_pipeline
+from ohlala_smartops.utils.token_tracker import get_token_tracker
 from ohlala_smartops.version import __version__
 from ohlala_smartops.workflow.command_tracker import AsyncCommandTracker
 from ohlala_smartops.workflow.write_operations import WriteOperationManager
@@ -45,7 +54,7 @@ command_tracker: Any | None = None
 
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:  # noqa: PLR0915
+async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:  # noqa: PLR0912, PLR0915
     """Manage application lifespan events.
 
     This context manager handles startup and shutdown events for the FastAPI application,
@@ -79,8 +88,16 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:  # noqa: PLR0915
 
     # Initialize conversation state storage
     logger.info("Initializing conversation state storage...")
-    state_manager = create_state_manager("memory")
-    logger.info("Conversation state storage initialized (in-memory)")
+    state_manager = create_state_manager(
+        settings.state_storage_type,
+        settings.state_redis_url,
+        settings.state_max_entries,
+        settings.state_write_behind_delay,
+        settings.state_sqlite_path,
+    )
+    if isinstance(state_manager, ConversationStateManager):
+        await state_manager.start()
+    logger.info(f"Conversation state storage initialized ({settings.state_storage_type})")
 
     # Initialize MCP manager with graceful fallback
     logger.info("Attempting to initialize MCP manager...")
@@ -109,7 +126,14 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:  # noqa: PLR0915
 
     # Initialize and start async command tracker
     logger.info("Starting async command tracker...")
-    command_tracker = AsyncCommandTracker(mcp_manager=mcp_manager)
+    # SQLite state storage also keeps tracked commands across restarts
+    tracked_command_store = (
+        state_manager.storage
+        if isinstance(state_manager, ConversationStateManager)
+        and isinstance(state_manager.storage, SqliteStateStorage)
+        else None
+    )
+    command_tracker = AsyncCommandTracker(mcp_manager=mcp_manager, store=tracked_command_store)
     await command_tracker.start()
     logger.info("Async command tracker started successfully")
 
@@ -124,6 +148,9 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:  # noqa: PLR0915
     )
     logger.info("Teams bot instance initialized successfully")
 
+    # Report AWS clients built during startup (further clients are built lazily and shared)
+    get_client_registry().log_report()
+
     logger.info("Startup completed successfully - all components initialized")
 
     yield
@@ -149,6 +176,26 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:  # noqa: PLR0915
         except Exception as e:
             logger.error(f"Error stopping write operation manager: {e}", exc_info=True)
 
+    # Flush held state writes and stop the in-memory state sweeper
+    if isinstance(state_manager, ConversationStateManager):
+        try:
+            await state_manager.close()
+        except Exception as e:
+            logger.error(f"Error closing conversation state manager: {e}", exc_info=True)
+
+    # Write daily token statistics held in memory
+    try:
+        await get_token_tracker().close()
+    except Exception as e:
+        logger.error(f"Error writing token usage statistics: {e}", exc_info=True)
+
+    # Publish buffered application metrics
+    if get_metrics_emitter.cache_info().currsize:
+        try:
+            await get_metrics_emitter().close()
+        except Exception as e:
+            logger.error(f"Error publishing buffered metrics: {e}", exc_info=True)
+
     # Close MCP manager
     if mcp_manager:
         try:
@@ -158,6 +205,20 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:  # noqa: PLR0915
         except Exception as e:
             logger.error(f"Error closing MCP manager: {e}", exc_info=True)
 
+    # Close shared AWS clients
+    try:
+        client_registry = get_client_registry()
+        client_registry.log_report()
+        await client_registry.close_all()
+    except Exception as e:
+        logger.error(f"Error closing AWS clients: {e}", exc_info=True)
+
+    # Write queued audit entries
+    try:
+        await asyncio.to_thread(get_audit_pipeline().close)
+    except Exception as e:
+        logger.error(f"Error closing audit log pipeline: {e}", exc_info=True)
+
     logger.info("Shutdown completed successfully")
 
 
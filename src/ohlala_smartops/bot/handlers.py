@@ -10,9 +10,11 @@ from typing import Any
 from botbuilder.core import ActivityHandler, TurnContext
 from botbuilder.schema import Activity, ChannelAccount
 
+from ohlala_smartops.constants import THROTTLE_DEFAULT_TENANT
 from ohlala_smartops.models import (
     ConversationContext,
     ConversationType,
+    TeamInfo,
     UserInfo,
     UserRole,
 )
@@ -20,6 +22,56 @@ from ohlala_smartops.models import (
 logger = logging.getLogger(__name__)
 
 
+def extract_team_info(activity: Activity) -> TeamInfo | None:
+    """Extract the Teams team an activity was sent from.
+
+    Args:
+        activity: Bot Framework activity.
+
+    Returns:
+        Team information from the activity's channel data, or None outside of a
+        team (personal and group chats).
+    """
+    channel_data = activity.channel_data
+    if not isinstance(channel_data, dict):
+        return None
+
+    team = channel_data.get("team")
+    if not isinstance(team, dict) or not team.get("id"):
+        return None
+
+    tenant = channel_data.get("tenant")
+    tenant_id = (tenant.get("id") if isinstance(tenant, dict) else None) or (
+        activity.conversation.tenant_id if activity.conversation else None
+    )
+    return TeamInfo(
+        id=team["id"],
+        name=team.get("name") or team["id"],
+        tenant_id=tenant_id or "unknown",
+    )
+
+
+def get_tenant_key(activity: Activity) -> str:
+    """Get the tenant an activity's AWS and Bedrock calls are throttled under.
+
+    Calls from a team's channels share the team's ID (``ConversationContext.team``),
+    so one team cannot crowd out the others; personal and group chats share their
+    Azure AD tenant ID.
+
+    Args:
+        activity: Bot Framework activity.
+
+    Returns:
+        Tenant key for ``throttle_tenant``.
+    """
+    team = extract_team_info(activity)
+    if team is not None:
+        return team.id
+
+    tenant_id = activity.conversation.tenant_id if activity.conversation else None
+    return tenant_id if isinstance(tenant_id, str) and tenant_id else THROTTLE_DEFAULT_TENANT
+
+
 class OhlalaActivityHandler(ActivityHandler):  # type: ignore[misc]
     """Custom activity handler for Ohlala SmartOps bot.
 
@@ -168,6 +220,7 @@ class OhlalaActivityHandler(ActivityHandler):  # type: ignore[misc]
         from_account = activity.from_property
 
         # Determine conversation type
+        team = extract_team_info(activity)
         conversation_type = ConversationType.PERSONAL
         if activity.channel_data:
             channel_data = activity.channel_data
@@ -193,7 +246,7 @@ class OhlalaActivityHandler(ActivityHandler):  # type: ignore[misc]
             conversation_id=activity.conversation.id,
             conversation_type=conversation_type,
             user=user,
-            team=None,  # TODO: Extract from channel_data if available
+            team=team,
             channel=None,  # TODO: Extract from channel_data if available
             service_url=activity.service_url,
         )
@@ -12,6 +12,7 @@ from fastapi import APIRouter, Response, status
 from pydantic import BaseModel, Field
 
 from ohlala_smartops.config.settings import Settings
+from ohlala_smartops.utils.global_throttler import get_global_throttler
 from ohlala_smartops.version import __version__
 
 logger = logging.getLogger(__name__)
@@ -94,6 +95,15 @@ async def health_check() -> HealthStatus:
         "message": "AWS health check not implemented",
     }
 
+    # Check circuit breakers of AWS services and MCP servers
+    breakers = get_global_throttler().get_circuit_breaker_stats()
+    tripped = sorted(name for name, stats in breakers.items() if stats["state"] != "closed")
+    checks["circuit_breakers"] = {
+        "status": "degraded" if tripped else "healthy",
+        "open": tripped,
+        "breakers": breakers,
+    }
+
     # TODO: Check Bot Framework adapter
     checks["bot_framework"] = {
         "status": "unknown",
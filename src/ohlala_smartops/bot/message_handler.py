@@ -11,7 +11,7 @@ from typing import Any, Protocol
 from botbuilder.core import MessageFactory, TurnContext
 from botbuilder.schema import Activity
 
-from ohlala_smartops.ai.bedrock_client import BedrockClient
+from ohlala_smartops.ai.bedrock_client import BedrockClient, BedrockQuotaError
 from ohlala_smartops.bot.state import ConversationStateManager
 from ohlala_smartops.mcp.manager import MCPManager
 from ohlala_smartops.workflow.command_tracker import AsyncCommandTracker
@@ -243,6 +243,8 @@ class MessageHandler:
 
             logger.info("Successfully processed natural language query")
 
+        except BedrockQuotaError as e:
+            await turn_context.send_activity(MessageFactory.text(f"⏳ {e}"))
         except Exception as e:
             logger.error(f"Error processing natural language query: {e}", exc_info=True)
             await turn_context.send_activity(
@@ -4,20 +4,59 @@ This module provides state management for tracking conversation context,
 state, and approval workflows across multiple turns.
 """
 
+import asyncio
+import contextlib
+import heapq
 import logging
+import math
+import queue
+import sqlite3
+import threading
+import time
 from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from typing import Protocol
+from typing import Any, Final, Literal, Protocol
 
+from pydantic import BaseModel
+
+from ohlala_smartops.constants import (
+    STATE_APPROVAL_RETENTION_SECONDS,
+    STATE_COMMAND_HISTORY_LIMIT,
+    STATE_COMMAND_HISTORY_TTL_SECONDS,
+    STATE_REDIS_KEY_PREFIX,
+    STATE_SWEEP_INTERVAL_SECONDS,
+)
 from ohlala_smartops.models import (
     ApprovalRequest,
+    ApprovalStatus,
     CommandHistoryEntry,
+    CommandTrackingInfo,
     ConversationContext,
     ConversationState,
+    WorkflowInfo,
 )
 
 logger = logging.getLogger(__name__)
 
+_ExpiringKind = Literal["state", "context", "approval"]
+_EXPIRING_KINDS: tuple[_ExpiringKind, ...] = ("state", "context", "approval")
+
+
+def _dump_model(model: BaseModel) -> str:
+    """Serialize a model to compact JSON, leaving out fields at their defaults."""
+    return model.model_dump_json(exclude_defaults=True)
+
+
+def _load_stored_approval(raw: str | None) -> ApprovalRequest | None:
+    """Deserialize a stored approval request, which may have expired since."""
+    if raw is None:
+        return None
+    return ApprovalRequest.model_validate_json(raw, context={"from_storage": True})
+
 
 class StateStorage(Protocol):
     """Protocol for state storage backends.
@@ -162,28 +201,246 @@ class InMemoryStateStorage:
     This storage backend keeps all state in memory. Data is lost when
     the application restarts. Use RedisStateStorage for production.
 
+    Expired states and contexts, and approvals past their retention period, are
+    removed by a background sweeper (see ``start``) driven by a min-heap of expiry
+    times, so a sweep only touches entries that are due. With ``max_entries`` set,
+    each map additionally evicts its least recently used entries.
+
     Attributes:
         _states: Dictionary of conversation states.
         _contexts: Dictionary of conversation contexts.
         _approvals: Dictionary of approval requests.
 
     Example:
-        >>> storage = InMemoryStateStorage()
+        >>> storage = InMemoryStateStorage(max_entries=10000)
+        >>> await storage.start()
         >>> await storage.set_state(state)
         >>> retrieved = await storage.get_state(conversation_id)
     """
 
-    def __init__(self) -> None:
-        """Initialize in-memory storage."""
-        self._states: dict[str, ConversationState] = {}
-        self._contexts: dict[str, ConversationContext] = {}
-        self._approvals: dict[str, ApprovalRequest] = {}
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        sweep_interval: float = STATE_SWEEP_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize in-memory storage.
+
+        Args:
+            max_entries: Maximum states, contexts and approvals kept each, evicting
+                the least recently used beyond it. Defaults to None (no cap).
+            sweep_interval: Seconds between sweeps of expired entries once the
+                sweeper is started. Defaults to 60.
+        """
+        self.max_entries = max_entries
+        self.sweep_interval = sweep_interval
+        self._states: OrderedDict[str, ConversationState] = OrderedDict()
+        self._contexts: OrderedDict[str, ConversationContext] = OrderedDict()
+        self._approvals: OrderedDict[str, ApprovalRequest] = OrderedDict()
         self._state_expiry: dict[str, datetime] = {}
         self._context_expiry: dict[str, datetime] = {}
+        self._approval_expiry: dict[str, datetime] = {}
         self._command_history: dict[str, CommandHistoryEntry] = {}
         self._user_command_ids: dict[str, list[str]] = {}
+
+        # Min-heap of (expiry, kind, key). Entries are not removed when a key is
+        # re-set or deleted; a popped entry only counts if the expiry still matches.
+        self._expiry_heap: list[tuple[datetime, _ExpiringKind, str]] = []
+        self._sweep_task: asyncio.Task[None] | None = None
+
+        # Approval indexes (dicts used as insertion-ordered sets of approval IDs).
+        # Approval objects are mutated in place by approve()/reject(), so the keys
+        # each approval is indexed under are remembered to unindex it on change.
+        self._approvals_by_status: dict[ApprovalStatus, dict[str, None]] = {}
+        self._approvals_by_requester: dict[str, dict[str, None]] = {}
+        self._approvals_by_voter: dict[str, dict[str, None]] = {}
+        self._approval_index_keys: dict[str, tuple[ApprovalStatus, str, frozenset[str]]] = {}
+
+        # Metrics
+        self._swept = 0
+        self._evicted = 0
         logger.info("Initialized in-memory state storage")
 
+    async def start(self) -> None:
+        """Start the background sweeper of expired entries."""
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(self._sweep_loop())
+            logger.info(f"In-memory state sweeper started ({self.sweep_interval}s interval)")
+
+    async def stop(self) -> None:
+        """Stop the background sweeper."""
+        if self._sweep_task and not self._sweep_task.done():
+            self._sweep_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sweep_task
+            logger.info("In-memory state sweeper stopped")
+
+    async def _sweep_loop(self) -> None:
+        """Sweep expired entries every ``sweep_interval`` seconds."""
+        while True:
+            try:
+                await asyncio.sleep(self.sweep_interval)
+                self.sweep_expired()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error sweeping expired state: {e}", exc_info=True)
+
+    def _expiry_map(self, kind: _ExpiringKind) -> dict[str, datetime]:
+        """Get the expiry dictionary of a map."""
+        if kind == "state":
+            return self._state_expiry
+        if kind == "context":
+            return self._context_expiry
+        return self._approval_expiry
+
+    def _entries(self, kind: _ExpiringKind) -> OrderedDict[str, Any]:
+        """Get the entry map of a kind."""
+        if kind == "state":
+            return self._states
+        if kind == "context":
+            return self._contexts
+        return self._approvals
+
+    def _schedule(self, kind: _ExpiringKind, key: str, expires_at: datetime) -> None:
+        """Record an entry's expiry and push it onto the expiry heap."""
+        expiry = self._expiry_map(kind)
+        if expiry.get(key) == expires_at:
+            return
+        expiry[key] = expires_at
+        heapq.heappush(self._expiry_heap, (expires_at, kind, key))
+
+        # Rebuild the heap once superseded entries outnumber live ones, keeping
+        # its size proportional to the number of stored entries
+        live = len(self._state_expiry) + len(self._context_expiry) + len(self._approval_expiry)
+        if len(self._expiry_heap) > 2 * live + 64:
+            self._expiry_heap = [
+                (expires_at, kind, key)
+                for kind in _EXPIRING_KINDS
+                for key, expires_at in self._expiry_map(kind).items()
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _store(self, kind: _ExpiringKind, key: str, value: Any) -> None:
+        """Store an entry as most recently used, evicting beyond ``max_entries``."""
+        entries = self._entries(kind)
+        entries[key] = value
+        entries.move_to_end(key)
+
+        while self.max_entries is not None and len(entries) > self.max_entries:
+            evicted_key, evicted = next(iter(entries.items()))
+            self._remove(kind, evicted_key)
+            self._evicted += 1
+            if kind == "approval" and evicted.status == ApprovalStatus.PENDING:
+                logger.warning(f"Evicted pending approval {evicted_key} (max_entries reached)")
+
+    def _remove(self, kind: _ExpiringKind, key: str) -> None:
+        """Remove an entry, its expiry and its index entries."""
+        self._entries(kind).pop(key, None)
+        self._expiry_map(kind).pop(key, None)
+        if kind == "approval":
+            self._unindex_approval(key)
+
+    @staticmethod
+    def _add_to_index(index: dict[Any, dict[str, None]], key: Any, approval_id: str) -> None:
+        """Add an approval ID to an index bucket."""
+        index.setdefault(key, {})[approval_id] = None
+
+    @staticmethod
+    def _remove_from_index(index: dict[Any, dict[str, None]], key: Any, approval_id: str) -> None:
+        """Remove an approval ID from an index bucket, dropping the bucket once empty."""
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(approval_id, None)
+            if not bucket:
+                del index[key]
+
+    def _index_approval(self, approval: ApprovalRequest) -> None:
+        """Index an approval by status, requester and users who voted on it."""
+        keys = (
+            approval.status,
+            approval.requester_id,
+            frozenset(approval.approvers + approval.rejectors),
+        )
+        if self._approval_index_keys.get(approval.id) == keys:
+            return
+
+        self._unindex_approval(approval.id)
+        status, requester_id, voters = keys
+        self._add_to_index(self._approvals_by_status, status, approval.id)
+        self._add_to_index(self._approvals_by_requester, requester_id, approval.id)
+        for voter_id in voters:
+            self._add_to_index(self._approvals_by_voter, voter_id, approval.id)
+        self._approval_index_keys[approval.id] = keys
+
+    def _unindex_approval(self, approval_id: str) -> None:
+        """Remove an approval from all indexes."""
+        keys = self._approval_index_keys.pop(approval_id, None)
+        if keys is None:
+            return
+
+        status, requester_id, voters = keys
+        self._remove_from_index(self._approvals_by_status, status, approval_id)
+        self._remove_from_index(self._approvals_by_requester, requester_id, approval_id)
+        for voter_id in voters:
+            self._remove_from_index(self._approvals_by_voter, voter_id, approval_id)
+
+    def sweep_expired(self) -> int:
+        """Remove entries whose expiry has passed.
+
+        Pops due entries off the expiry heap, so the cost is O(log n) per removed
+        or superseded entry rather than a scan of every map.
+
+        Returns:
+            Number of entries removed.
+        """
+        now = datetime.now(tz=UTC)
+        removed = 0
+
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, kind, key = heapq.heappop(self._expiry_heap)
+            if self._expiry_map(kind).get(key) != expires_at:
+                continue  # Superseded by a later set, or already removed
+            self._remove(kind, key)
+            removed += 1
+
+        self._swept += removed
+        if removed:
+            logger.debug(f"Swept {removed} expired entries from in-memory state storage")
+        return removed
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get entry counts and memory usage for monitoring.
+
+        The serialized size of all entries is computed on each call, so this is
+        meant for occasional monitoring rather than per-request use.
+
+        Returns:
+            Dictionary with entries per map, approvals per status, expiry heap
+            size, entry cap, entries removed by sweeps and by LRU eviction, and
+            the approximate size of the stored entries in bytes.
+        """
+        maps: dict[str, Any] = {
+            "states": self._states,
+            "contexts": self._contexts,
+            "approvals": self._approvals,
+            "commands": self._command_history,
+        }
+        return {
+            "entries": {name: len(entries) for name, entries in maps.items()},
+            "approvals_by_status": {
+                status.value: len(ids) for status, ids in self._approvals_by_status.items()
+            },
+            "expiry_heap_size": len(self._expiry_heap),
+            "max_entries": self.max_entries,
+            "swept": self._swept,
+            "evicted": self._evicted,
+            "approx_bytes": sum(
+                len(model.model_dump_json())
+                for entries in maps.values()
+                for model in entries.values()
+            ),
+        }
+
     async def get_state(self, conversation_id: str) -> ConversationState | None:
         """Get conversation state by ID.
 
@@ -202,7 +459,10 @@ class InMemoryStateStorage:
             await self.delete_state(conversation_id)
             return None
 
-        return self._states.get(conversation_id)
+        state = self._states.get(conversation_id)
+        if state is not None:
+            self._states.move_to_end(conversation_id)
+        return state
 
     async def set_state(self, state: ConversationState, ttl_seconds: int = 3600) -> None:
         """Store conversation state.
@@ -211,9 +471,9 @@ class InMemoryStateStorage:
             state: Conversation state to store.
             ttl_seconds: Time-to-live in seconds (default: 1 hour).
         """
-        self._states[state.conversation_id] = state
-        self._state_expiry[state.conversation_id] = datetime.now(tz=UTC) + timedelta(
-            seconds=ttl_seconds
+        self._store("state", state.conversation_id, state)
+        self._schedule(
+            "state", state.conversation_id, datetime.now(tz=UTC) + timedelta(seconds=ttl_seconds)
         )
         logger.debug(f"Stored state for conversation {state.conversation_id}")
 
@@ -235,7 +495,10 @@ class InMemoryStateStorage:
             await self.delete_context(conversation_id)
             return None
 
-        return self._contexts.get(conversation_id)
+        context = self._contexts.get(conversation_id)
+        if context is not None:
+            self._contexts.move_to_end(conversation_id)
+        return context
 
     async def set_context(self, context: ConversationContext, ttl_seconds: int = 86400) -> None:
         """Store conversation context.
@@ -244,9 +507,11 @@ class InMemoryStateStorage:
             context: Conversation context to store.
             ttl_seconds: Time-to-live in seconds (default: 24 hours).
         """
-        self._contexts[context.conversation_id] = context
-        self._context_expiry[context.conversation_id] = datetime.now(tz=UTC) + timedelta(
-            seconds=ttl_seconds
+        self._store("context", context.conversation_id, context)
+        self._schedule(
+            "context",
+            context.conversation_id,
+            datetime.now(tz=UTC) + timedelta(seconds=ttl_seconds),
         )
         logger.debug(f"Stored context for conversation {context.conversation_id}")
 
@@ -260,6 +525,8 @@ class InMemoryStateStorage:
             Approval request if found, None otherwise.
         """
         approval = self._approvals.get(approval_id)
+        if approval is not None:
+            self._approvals.move_to_end(approval_id)
 
         # Check if expired
         if approval and approval.is_expired():
@@ -269,17 +536,31 @@ class InMemoryStateStorage:
         return approval
 
     async def set_approval(self, approval: ApprovalRequest) -> None:
-        """Store approval request.
+        """Store approval request and update the approval indexes.
+
+        The request is removed STATE_APPROVAL_RETENTION_SECONDS after it expires.
 
         Args:
             approval: Approval request to store.
         """
-        self._approvals[approval.id] = approval
+        self._store("approval", approval.id, approval)
+        self._index_approval(approval)
+        self._schedule(
+            "approval",
+            approval.id,
+            approval.expires_at + timedelta(seconds=STATE_APPROVAL_RETENTION_SECONDS),
+        )
         logger.debug(f"Stored approval request {approval.id}")
 
     async def list_pending_approvals(self, user_id: str) -> list[ApprovalRequest]:
         """List pending approvals for a user.
 
+        Reads only the pending-status index, skipping approvals the user requested
+        or already voted on, so the cost does not grow with decided or expired
+        approvals kept for their retention period. Candidates are checked again
+        against the approval itself, since approvals changed in place are only
+        re-indexed when saved.
+
         Args:
             user_id: User ID to get approvals for.
 
@@ -287,17 +568,26 @@ class InMemoryStateStorage:
             List of pending approval requests where user can approve.
         """
         pending: list[ApprovalRequest] = []
+        ineligible = self._approvals_by_requester.get(user_id, {}).keys() | (
+            self._approvals_by_voter.get(user_id, {}).keys()
+        )
 
-        for approval in self._approvals.values():
-            # Check if expired
+        for approval_id in list(self._approvals_by_status.get(ApprovalStatus.PENDING, {})):
+            approval = self._approvals[approval_id]
+
+            # Check if expired (moves it to the expired index)
             if approval.is_expired():
                 approval.mark_expired()
                 await self.set_approval(approval)
                 continue
 
-            # Check if pending and user can approve
-            if approval.can_approve(user_id):
-                pending.append(approval)
+            # Check if user can approve, repairing the indexes if they are stale
+            if approval_id in ineligible:
+                continue
+            if approval.status != ApprovalStatus.PENDING or not approval.can_approve(user_id):
+                self._index_approval(approval)
+                continue
+            pending.append(approval)
 
         return pending
 
@@ -307,8 +597,7 @@ class InMemoryStateStorage:
         Args:
             conversation_id: Conversation ID to delete state for.
         """
-        self._states.pop(conversation_id, None)
-        self._state_expiry.pop(conversation_id, None)
+        self._remove("state", conversation_id)
         logger.debug(f"Deleted state for conversation {conversation_id}")
 
     async def delete_context(self, conversation_id: str) -> None:
@@ -317,8 +606,7 @@ class InMemoryStateStorage:
         Args:
             conversation_id: Conversation ID to delete context for.
         """
-        self._contexts.pop(conversation_id, None)
-        self._context_expiry.pop(conversation_id, None)
+        self._remove("context", conversation_id)
         logger.debug(f"Deleted context for conversation {conversation_id}")
 
     async def add_command_history(self, entry: CommandHistoryEntry) -> None:
@@ -334,8 +622,8 @@ class InMemoryStateStorage:
             self._user_command_ids[entry.user_id] = []
         self._user_command_ids[entry.user_id].insert(0, entry.command_id)  # Most recent first
 
-        # Limit history per user to 100 entries (prevent memory growth)
-        if len(self._user_command_ids[entry.user_id]) > 100:
+        # Limit history per user (prevent memory growth)
+        if len(self._user_command_ids[entry.user_id]) > STATE_COMMAND_HISTORY_LIMIT:
             old_command_id = self._user_command_ids[entry.user_id].pop()
             self._command_history.pop(old_command_id, None)
 
@@ -366,6 +654,851 @@ class InMemoryStateStorage:
         return self._command_history.get(command_id)
 
 
+class RedisStateStorage:
+    """Redis state storage shared by all bot workers and replicas.
+
+    Conversation state and context expire through native Redis key TTLs. Pending
+    approvals and per-user command history are indexed in sorted sets, so listing
+    them reads only the matching entries (with one MGET) instead of scanning all
+    keys. Models are stored as compact JSON without fields at their defaults.
+
+    Keys (under the key prefix):
+        state:<conversation_id>, context:<conversation_id>: Models with the TTL
+            given by the caller.
+        approval:<approval_id>: Approval request, kept until
+            STATE_APPROVAL_RETENTION_SECONDS after it expires.
+        approvals:pending: Sorted set of pending approval IDs by expiry time.
+        command:<command_id>: Command history entry.
+        history:<user_id>: Sorted set of the user's command IDs by timestamp,
+            trimmed to the newest STATE_COMMAND_HISTORY_LIMIT entries.
+
+    Example:
+        >>> storage = RedisStateStorage.from_url("redis://cache:6379/0")
+        >>> await storage.set_state(state)
+        >>> retrieved = await storage.get_state(conversation_id)
+    """
+
+    def __init__(self, client: Any, key_prefix: str = STATE_REDIS_KEY_PREFIX) -> None:
+        """Initialize Redis storage.
+
+        Args:
+            client: Async Redis-compatible client returning decoded strings
+                (e.g., ``redis.asyncio.Redis(decode_responses=True)``).
+            key_prefix: Prefix for all keys. Defaults to "ohlala:state:".
+        """
+        self.key_prefix = key_prefix
+        self._client = client
+        logger.info(f"Initialized Redis state storage (key prefix: {key_prefix})")
+
+    @classmethod
+    def from_url(cls, url: str, key_prefix: str = STATE_REDIS_KEY_PREFIX) -> "RedisStateStorage":
+        """Connect to a Redis server.
+
+        Args:
+            url: Redis URL, e.g. "redis://cache:6379/0" or "rediss://..." for TLS.
+            key_prefix: Prefix for all keys.
+
+        Returns:
+            Storage using a new connection pool for the URL.
+
+        Raises:
+            ImportError: If the optional ``redis`` package is not installed.
+        """
+        import redis.asyncio  # noqa: PLC0415 - optional dependency
+
+        return cls(redis.asyncio.Redis.from_url(url, decode_responses=True), key_prefix)
+
+    def _key(self, kind: str, identifier: str = "") -> str:
+        """Build a prefixed key, e.g. "ohlala:state:context:<conversation_id>"."""
+        return f"{self.key_prefix}{kind}:{identifier}" if identifier else f"{self.key_prefix}{kind}"
+
+    async def get_state(self, conversation_id: str) -> ConversationState | None:
+        """Get conversation state by ID.
+
+        Args:
+            conversation_id: Unique conversation identifier.
+
+        Returns:
+            Conversation state if found and not expired, None otherwise.
+        """
+        raw = await self._client.get(self._key("state", conversation_id))
+        return None if raw is None else ConversationState.model_validate_json(raw)
+
+    async def set_state(self, state: ConversationState, ttl_seconds: int = 3600) -> None:
+        """Store conversation state.
+
+        Args:
+            state: Conversation state to store.
+            ttl_seconds: Time-to-live in seconds (default: 1 hour).
+        """
+        await self._client.set(
+            self._key("state", state.conversation_id),
+            _dump_model(state),
+            px=max(1, int(ttl_seconds * 1000)),
+        )
+        logger.debug(f"Stored state for conversation {state.conversation_id}")
+
+    async def get_context(self, conversation_id: str) -> ConversationContext | None:
+        """Get conversation context by ID.
+
+        Args:
+            conversation_id: Unique conversation identifier.
+
+        Returns:
+            Conversation context if found and not expired, None otherwise.
+        """
+        raw = await self._client.get(self._key("context", conversation_id))
+        return None if raw is None else ConversationContext.model_validate_json(raw)
+
+    async def set_context(self, context: ConversationContext, ttl_seconds: int = 86400) -> None:
+        """Store conversation context.
+
+        Args:
+            context: Conversation context to store.
+            ttl_seconds: Time-to-live in seconds (default: 24 hours).
+        """
+        await self._client.set(
+            self._key("context", context.conversation_id),
+            _dump_model(context),
+            px=max(1, int(ttl_seconds * 1000)),
+        )
+        logger.debug(f"Stored context for conversation {context.conversation_id}")
+
+    async def get_approval(self, approval_id: str) -> ApprovalRequest | None:
+        """Get approval request by ID.
+
+        Args:
+            approval_id: Unique approval request identifier.
+
+        Returns:
+            Approval request if found, None otherwise.
+        """
+        approval = _load_stored_approval(await self._client.get(self._key("approval", approval_id)))
+
+        # Check if expired
+        if approval and approval.status == ApprovalStatus.PENDING and approval.is_expired():
+            approval.mark_expired()
+            await self.set_approval(approval)
+
+        return approval
+
+    async def set_approval(self, approval: ApprovalRequest) -> None:
+        """Store approval request and update the pending index.
+
+        Args:
+            approval: Approval request to store.
+        """
+        expires_in = (approval.expires_at - datetime.now(tz=UTC)).total_seconds()
+        ttl_seconds = max(0.0, expires_in) + STATE_APPROVAL_RETENTION_SECONDS
+        pending_key = self._key("approvals", "pending")
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.set(self._key("approval", approval.id), _dump_model(approval), ex=int(ttl_seconds))
+            if approval.status == ApprovalStatus.PENDING:
+                pipe.zadd(pending_key, {approval.id: approval.expires_at.timestamp()})
+            else:
+                pipe.zrem(pending_key, approval.id)
+            await pipe.execute()
+        logger.debug(f"Stored approval request {approval.id}")
+
+    async def list_pending_approvals(self, user_id: str) -> list[ApprovalRequest]:
+        """List pending approvals for a user.
+
+        Approvals that expired since they were stored are marked expired and
+        dropped from the pending index.
+
+        Args:
+            user_id: User ID to get approvals for.
+
+        Returns:
+            List of pending approval requests where user can approve, soonest
+            expiring first.
+        """
+        ids: list[str] = await self._client.zrange(self._key("approvals", "pending"), 0, -1)
+        if not ids:
+            return []
+
+        raws = await self._client.mget([self._key("approval", approval_id) for approval_id in ids])
+        pending: list[ApprovalRequest] = []
+        stale: list[str] = []
+
+        for approval_id, raw in zip(ids, raws, strict=True):
+            approval = _load_stored_approval(raw)
+            if approval is None:
+                # Approval key evicted or deleted - drop it from the index
+                stale.append(approval_id)
+                continue
+
+            # Check if expired
+            if approval.is_expired():
+                approval.mark_expired()
+                await self.set_approval(approval)
+                continue
+
+            # Check if pending and user can approve
+            if approval.can_approve(user_id):
+                pending.append(approval)
+
+        if stale:
+            await self._client.zrem(self._key("approvals", "pending"), *stale)
+
+        return pending
+
+    async def delete_state(self, conversation_id: str) -> None:
+        """Delete conversation state.
+
+        Args:
+            conversation_id: Conversation ID to delete state for.
+        """
+        await self._client.delete(self._key("state", conversation_id))
+        logger.debug(f"Deleted state for conversation {conversation_id}")
+
+    async def delete_context(self, conversation_id: str) -> None:
+        """Delete conversation context.
+
+        Args:
+            conversation_id: Conversation ID to delete context for.
+        """
+        await self._client.delete(self._key("context", conversation_id))
+        logger.debug(f"Deleted context for conversation {conversation_id}")
+
+    async def add_command_history(self, entry: CommandHistoryEntry) -> None:
+        """Add command to history, keeping the newest entries per user.
+
+        Args:
+            entry: Command history entry to store.
+        """
+        history_key = self._key("history", entry.user_id)
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.set(
+                self._key("command", entry.command_id),
+                _dump_model(entry),
+                ex=STATE_COMMAND_HISTORY_TTL_SECONDS,
+            )
+            pipe.zadd(history_key, {entry.command_id: entry.timestamp.timestamp()})
+            pipe.expire(history_key, STATE_COMMAND_HISTORY_TTL_SECONDS)
+            pipe.zrange(history_key, 0, -(STATE_COMMAND_HISTORY_LIMIT + 1))
+            *_, trimmed = await pipe.execute()
+
+        # Limit history per user (prevent unbounded growth)
+        if trimmed:
+            async with self._client.pipeline(transaction=True) as pipe:
+                pipe.zrem(history_key, *trimmed)
+                pipe.delete(*[self._key("command", command_id) for command_id in trimmed])
+                await pipe.execute()
+
+        logger.debug(f"Added command {entry.command_id} to history for user {entry.user_id}")
+
+    async def get_recent_commands(self, user_id: str, limit: int = 10) -> list[CommandHistoryEntry]:
+        """Get recent command history for a user.
+
+        Args:
+            user_id: User ID to get history for.
+            limit: Maximum number of entries to return.
+
+        Returns:
+            List of command history entries, most recent first.
+        """
+        if limit <= 0:
+            return []
+
+        command_ids = await self._client.zrevrange(self._key("history", user_id), 0, limit - 1)
+        if not command_ids:
+            return []
+
+        raws = await self._client.mget([self._key("command", cid) for cid in command_ids])
+        return [CommandHistoryEntry.model_validate_json(raw) for raw in raws if raw is not None]
+
+    async def get_command_history(self, command_id: str) -> CommandHistoryEntry | None:
+        """Get specific command history entry.
+
+        Args:
+            command_id: Command ID to retrieve.
+
+        Returns:
+            Command history entry if found, None otherwise.
+        """
+        raw = await self._client.get(self._key("command", command_id))
+        return None if raw is None else CommandHistoryEntry.model_validate_json(raw)
+
+
+_SQLITE_SCHEMA: Final = """
+CREATE TABLE IF NOT EXISTS states (
+    conversation_id TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_states_expires_at ON states (expires_at);
+
+CREATE TABLE IF NOT EXISTS contexts (
+    conversation_id TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_contexts_expires_at ON contexts (expires_at);
+
+CREATE TABLE IF NOT EXISTS approvals (
+    id TEXT PRIMARY KEY,
+    requester_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_approvals_expires_at ON approvals (expires_at);
+CREATE INDEX IF NOT EXISTS idx_approvals_requester_id ON approvals (requester_id);
+CREATE INDEX IF NOT EXISTS idx_approvals_status ON approvals (status, expires_at);
+
+CREATE TABLE IF NOT EXISTS command_history (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    command_id TEXT NOT NULL UNIQUE,
+    user_id TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_command_history_user_id ON command_history (user_id, seq);
+
+CREATE TABLE IF NOT EXISTS tracked_commands (
+    command_id TEXT PRIMARY KEY,
+    timeout_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS tracked_workflows (
+    workflow_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+"""
+"""Tables of SqliteStateStorage. Expiry and timeout times are Unix timestamps."""
+
+_SqlStatement = tuple[str, tuple[Any, ...]]
+
+
+class _SqliteWriter:
+    """Dedicated thread applying writes to SQLite with group commits.
+
+    Writes queued while a commit is in progress are committed together in the
+    next transaction, so concurrent callers share one fsync. A failing write
+    fails only its caller's future; the thread keeps serving other writes.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, max_batch: int) -> None:
+        self._connection = connection
+        self._max_batch = max_batch
+        self._queue: queue.SimpleQueue[tuple[list[_SqlStatement], asyncio.Future[None]] | None] = (
+            queue.SimpleQueue()
+        )
+        self._thread = threading.Thread(target=self._run, name="sqlite-state-writer", daemon=True)
+        self._thread.start()
+
+        # Metrics
+        self.commits = 0
+        self.writes = 0
+        self.errors = 0
+
+    async def execute(self, *statements: _SqlStatement) -> None:
+        """Apply statements in one transaction, returning once they are committed."""
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._queue.put((list(statements), future))
+        await future
+
+    async def close(self) -> None:
+        """Commit queued writes, then stop the thread and close the connection."""
+        self._queue.put(None)
+        await asyncio.to_thread(self._thread.join)
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            while len(batch) < self._max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._commit(batch)
+
+        self._connection.close()
+
+    def _commit(self, batch: list[tuple[list[_SqlStatement], asyncio.Future[None]]]) -> None:
+        try:
+            with self._connection:
+                for statements, _ in batch:
+                    for sql, params in statements:
+                        self._connection.execute(sql, params)
+            outcomes: list[BaseException | None] = [None] * len(batch)
+            self.commits += 1
+        except Exception:
+            # Retry one by one so that a failing write does not fail the others
+            outcomes = []
+            for statements, _ in batch:
+                try:
+                    with self._connection:
+                        for sql, params in statements:
+                            self._connection.execute(sql, params)
+                    outcomes.append(None)
+                    self.commits += 1
+                except Exception as e:
+                    outcomes.append(e)
+                    self.errors += 1
+
+        self.writes += len(batch)
+        for (_, future), error in zip(batch, outcomes, strict=True):
+            # The caller's event loop may have been closed in the meantime
+            with contextlib.suppress(RuntimeError):
+                future.get_loop().call_soon_threadsafe(_resolve_future, future, error)
+
+
+def _resolve_future(future: asyncio.Future[None], error: BaseException | None) -> None:
+    """Complete a write future unless its caller has gone away."""
+    if future.done():
+        return
+    if error is None:
+        future.set_result(None)
+    else:
+        future.set_exception(error)
+
+
+class SqliteStateStorage:
+    """Durable state storage on SQLite for single-node deployments.
+
+    Conversation state, approvals and command history survive restarts without
+    an external server, and so do the SSM commands and workflows of an
+    AsyncCommandTracker given this storage. The database runs in WAL mode
+    and all writes go through one writer thread that commits concurrent writes
+    together. Reads are served from an in-memory copy (an InMemoryStateStorage,
+    with the same semantics), which ``start`` restores from the database so a
+    restart needs no cold reads.
+
+    Example:
+        >>> storage = SqliteStateStorage("/var/lib/ohlala/state.db")
+        >>> await storage.start()  # Restores live entries into memory
+        >>> await storage.set_state(state)  # Returns once committed
+        >>> await storage.stop()
+    """
+
+    def __init__(
+        self,
+        path: str,
+        sweep_interval: float = STATE_SWEEP_INTERVAL_SECONDS,
+        max_batch: int = 256,
+    ) -> None:
+        """Open (or create) the database.
+
+        Args:
+            path: Database file path.
+            sweep_interval: Seconds between sweeps of expired entries, in memory
+                and in the database. Defaults to 60.
+            max_batch: Maximum writes committed in one transaction. Defaults to 256.
+        """
+        self.path = path
+        self.sweep_interval = sweep_interval
+        self._memory = InMemoryStateStorage(sweep_interval=sweep_interval)
+        self._purge_task: asyncio.Task[None] | None = None
+        self._restored = False
+
+        connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA busy_timeout=5000")
+        connection.executescript(_SQLITE_SCHEMA)
+        connection.isolation_level = "DEFERRED"  # Let `with connection` open transactions
+        self._writer = _SqliteWriter(connection, max_batch)
+        logger.info(f"Initialized SQLite state storage at {path}")
+
+    async def start(self) -> None:
+        """Restore live entries into memory and start sweeping expired entries."""
+        if not self._restored:
+            restored = await asyncio.to_thread(self._read_live_rows)
+            await self._restore(*restored)
+            self._restored = True
+
+        await self._memory.start()
+        if self._purge_task is None or self._purge_task.done():
+            self._purge_task = asyncio.create_task(self._purge_loop())
+
+    async def stop(self) -> None:
+        """Stop sweeping, commit pending writes and close the database."""
+        await self._memory.stop()
+        if self._purge_task and not self._purge_task.done():
+            self._purge_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._purge_task
+        await self._writer.close()
+        logger.info("SQLite state storage closed")
+
+    def _read_live_rows(
+        self,
+    ) -> tuple[list[tuple[str, float]], list[tuple[str, float]], list[str], list[str]]:
+        """Read unexpired rows (runs in a worker thread with its own connection)."""
+        now = time.time()
+        retention_cutoff = now - STATE_APPROVAL_RETENTION_SECONDS
+        connection = sqlite3.connect(self.path)
+        try:
+            states = connection.execute(
+                "SELECT data, expires_at FROM states WHERE expires_at > ?", (now,)
+            ).fetchall()
+            contexts = connection.execute(
+                "SELECT data, expires_at FROM contexts WHERE expires_at > ?", (now,)
+            ).fetchall()
+            approvals = connection.execute(
+                "SELECT data FROM approvals WHERE expires_at > ?", (retention_cutoff,)
+            ).fetchall()
+            commands = connection.execute(
+                "SELECT data FROM command_history ORDER BY seq"
+            ).fetchall()
+        finally:
+            connection.close()
+        return states, contexts, [row[0] for row in approvals], [row[0] for row in commands]
+
+    async def _restore(
+        self,
+        states: list[tuple[str, float]],
+        contexts: list[tuple[str, float]],
+        approvals: list[str],
+        commands: list[str],
+    ) -> None:
+        """Load rows read from the database into memory."""
+        now = time.time()
+        for data, expires_at in states:
+            await self._memory.set_state(
+                ConversationState.model_validate_json(data), ttl_seconds=math.ceil(expires_at - now)
+            )
+        for data, expires_at in contexts:
+            await self._memory.set_context(
+                ConversationContext.model_validate_json(data),
+                ttl_seconds=math.ceil(expires_at - now),
+            )
+        for data in approvals:
+            approval = _load_stored_approval(data)
+            if approval is not None:
+                await self._memory.set_approval(approval)
+        for data in commands:
+            await self._memory.add_command_history(CommandHistoryEntry.model_validate_json(data))
+
+        logger.info(
+            f"Restored {len(states)} states, {len(contexts)} contexts, {len(approvals)} "
+            f"approvals and {len(commands)} history entries from {self.path}"
+        )
+
+    async def _purge_loop(self) -> None:
+        """Delete expired rows every ``sweep_interval`` seconds."""
+        while True:
+            try:
+                await asyncio.sleep(self.sweep_interval)
+                await self.purge_expired()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error purging expired state: {e}", exc_info=True)
+
+    async def purge_expired(self) -> None:
+        """Delete expired states, contexts and approvals past retention from the database."""
+        now = time.time()
+        await self._writer.execute(
+            ("DELETE FROM states WHERE expires_at <= ?", (now,)),
+            ("DELETE FROM contexts WHERE expires_at <= ?", (now,)),
+            (
+                "DELETE FROM approvals WHERE expires_at <= ?",
+                (now - STATE_APPROVAL_RETENTION_SECONDS,),
+            ),
+        )
+
+    async def get_state(self, conversation_id: str) -> ConversationState | None:
+        """Get conversation state by ID.
+
+        Args:
+            conversation_id: Unique conversation identifier.
+
+        Returns:
+            Conversation state if found and not expired, None otherwise.
+        """
+        return await self._memory.get_state(conversation_id)
+
+    async def set_state(self, state: ConversationState, ttl_seconds: int = 3600) -> None:
+        """Store conversation state.
+
+        Args:
+            state: Conversation state to store.
+            ttl_seconds: Time-to-live in seconds (default: 1 hour).
+        """
+        await self._memory.set_state(state, ttl_seconds)
+        await self._writer.execute(
+            (
+                (
+                    "INSERT OR REPLACE INTO states (conversation_id, expires_at, data) "
+                    "VALUES (?, ?, ?)"
+                ),
+                (state.conversation_id, time.time() + ttl_seconds, _dump_model(state)),
+            )
+        )
+
+    async def get_context(self, conversation_id: str) -> ConversationContext | None:
+        """Get conversation context by ID.
+
+        Args:
+            conversation_id: Unique conversation identifier.
+
+        Returns:
+            Conversation context if found and not expired, None otherwise.
+        """
+        return await self._memory.get_context(conversation_id)
+
+    async def set_context(self, context: ConversationContext, ttl_seconds: int = 86400) -> None:
+        """Store conversation context.
+
+        Args:
+            context: Conversation context to store.
+            ttl_seconds: Time-to-live in seconds (default: 24 hours).
+        """
+        await self._memory.set_context(context, ttl_seconds)
+        await self._writer.execute(
+            (
+                (
+                    "INSERT OR REPLACE INTO contexts (conversation_id, expires_at, data) "
+                    "VALUES (?, ?, ?)"
+                ),
+                (context.conversation_id, time.time() + ttl_seconds, _dump_model(context)),
+            )
+        )
+
+    async def get_approval(self, approval_id: str) -> ApprovalRequest | None:
+        """Get approval request by ID.
+
+        Args:
+            approval_id: Unique approval request identifier.
+
+        Returns:
+            Approval request if found, None otherwise.
+        """
+        return await self._memory.get_approval(approval_id)
+
+    async def set_approval(self, approval: ApprovalRequest) -> None:
+        """Store approval request.
+
+        Args:
+            approval: Approval request to store.
+        """
+        await self._memory.set_approval(approval)
+        await self._writer.execute(
+            (
+                (
+                    "INSERT OR REPLACE INTO approvals (id, requester_id, status, expires_at, data) "
+                    "VALUES (?, ?, ?, ?, ?)"
+                ),
+                (
+                    approval.id,
+                    approval.requester_id,
+                    approval.status.value,
+                    approval.expires_at.timestamp(),
+                    _dump_model(approval),
+                ),
+            )
+        )
+
+    async def list_pending_approvals(self, user_id: str) -> list[ApprovalRequest]:
+        """List pending approvals for a user.
+
+        Approvals stored as pending whose expiry has passed are reported as
+        expired; the database keeps the stored status, which is rederived from
+        the expiry time when it is restored.
+
+        Args:
+            user_id: User ID to get approvals for.
+
+        Returns:
+            List of pending approval requests where user can approve.
+        """
+        return await self._memory.list_pending_approvals(user_id)
+
+    async def delete_state(self, conversation_id: str) -> None:
+        """Delete conversation state.
+
+        Args:
+            conversation_id: Conversation ID to delete state for.
+        """
+        await self._memory.delete_state(conversation_id)
+        await self._writer.execute(
+            ("DELETE FROM states WHERE conversation_id = ?", (conversation_id,))
+        )
+
+    async def delete_context(self, conversation_id: str) -> None:
+        """Delete conversation context.
+
+        Args:
+            conversation_id: Conversation ID to delete context for.
+        """
+        await self._memory.delete_context(conversation_id)
+        await self._writer.execute(
+            ("DELETE FROM contexts WHERE conversation_id = ?", (conversation_id,))
+        )
+
+    async def add_command_history(self, entry: CommandHistoryEntry) -> None:
+        """Add command to history, keeping the newest entries per user.
+
+        Args:
+            entry: Command history entry to store.
+        """
+        await self._memory.add_command_history(entry)
+        await self._writer.execute(
+            (
+                (
+                    "INSERT OR REPLACE INTO command_history (command_id, user_id, data) "
+                    "VALUES (?, ?, ?)"
+                ),
+                (entry.command_id, entry.user_id, _dump_model(entry)),
+            ),
+            # Limit history per user (prevent unbounded growth)
+            (
+                (
+                    "DELETE FROM command_history WHERE user_id = ? AND seq NOT IN "
+                    "(SELECT seq FROM command_history WHERE user_id = ? ORDER BY seq DESC LIMIT ?)"
+                ),
+                (entry.user_id, entry.user_id, STATE_COMMAND_HISTORY_LIMIT),
+            ),
+        )
+
+    async def get_recent_commands(self, user_id: str, limit: int = 10) -> list[CommandHistoryEntry]:
+        """Get recent command history for a user.
+
+        Args:
+            user_id: User ID to get history for.
+            limit: Maximum number of entries to return.
+
+        Returns:
+            List of command history entries, most recent first.
+        """
+        return await self._memory.get_recent_commands(user_id, limit)
+
+    async def get_command_history(self, command_id: str) -> CommandHistoryEntry | None:
+        """Get specific command history entry.
+
+        Args:
+            command_id: Command ID to retrieve.
+
+        Returns:
+            Command history entry if found, None otherwise.
+        """
+        return await self._memory.get_command_history(command_id)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get entry counts and write statistics for monitoring.
+
+        Returns:
+            Statistics of the in-memory copy (see InMemoryStateStorage.get_stats)
+            plus writes, commits and failed writes of the database writer.
+        """
+        return {
+            **self._memory.get_stats(),
+            "sqlite": {
+                "writes": self._writer.writes,
+                "commits": self._writer.commits,
+                "errors": self._writer.errors,
+            },
+        }
+
+    async def save_tracked_command(self, tracking_info: CommandTrackingInfo) -> None:
+        """Store an SSM command tracked by AsyncCommandTracker.
+
+        Args:
+            tracking_info: Tracking information of the command.
+        """
+        await self._writer.execute(
+            (
+                (
+                    "INSERT OR REPLACE INTO tracked_commands (command_id, timeout_at, data) "
+                    "VALUES (?, ?, ?)"
+                ),
+                (
+                    tracking_info.command_id,
+                    tracking_info.timeout_at.timestamp(),
+                    _dump_model(tracking_info),
+                ),
+            )
+        )
+
+    async def delete_tracked_command(self, command_id: str) -> None:
+        """Delete a tracked SSM command once it has completed.
+
+        Args:
+            command_id: SSM command ID.
+        """
+        await self._writer.execute(
+            ("DELETE FROM tracked_commands WHERE command_id = ?", (command_id,))
+        )
+
+    async def save_workflow(self, workflow_info: WorkflowInfo) -> None:
+        """Store a multi-instance workflow tracked by AsyncCommandTracker.
+
+        Args:
+            workflow_info: Workflow information.
+        """
+        await self._writer.execute(
+            (
+                "INSERT OR REPLACE INTO tracked_workflows (workflow_id, data) VALUES (?, ?)",
+                (workflow_info.workflow_id, _dump_model(workflow_info)),
+            )
+        )
+
+    async def delete_workflow(self, workflow_id: str) -> None:
+        """Delete a tracked workflow once it has completed.
+
+        Args:
+            workflow_id: Workflow ID.
+        """
+        await self._writer.execute(
+            ("DELETE FROM tracked_workflows WHERE workflow_id = ?", (workflow_id,))
+        )
+
+    async def load_tracked_commands(self) -> tuple[list[CommandTrackingInfo], list[WorkflowInfo]]:
+        """Load the tracked commands and workflows stored before a restart.
+
+        Commands whose timeout has passed are loaded too, so that the tracker
+        reports them as timed out instead of dropping them silently.
+
+        Returns:
+            Tracked commands and workflows.
+        """
+        commands, workflows = await asyncio.to_thread(self._read_tracked_rows)
+        return (
+            [CommandTrackingInfo.model_validate_json(data) for data in commands],
+            [WorkflowInfo.model_validate_json(data) for data in workflows],
+        )
+
+    def _read_tracked_rows(self) -> tuple[list[str], list[str]]:
+        """Read tracked commands and workflows (runs in a worker thread)."""
+        connection = sqlite3.connect(self.path)
+        try:
+            commands = connection.execute(
+                "SELECT data FROM tracked_commands ORDER BY timeout_at"
+            ).fetchall()
+            workflows = connection.execute("SELECT data FROM tracked_workflows").fetchall()
+        finally:
+            connection.close()
+        return [row[0] for row in commands], [row[0] for row in workflows]
+
+
+@dataclass
+class _StateTurn:
+    """Conversation states loaded and changed while handling one activity."""
+
+    manager: "ConversationStateManager"
+    states: dict[str, ConversationState] = field(default_factory=dict)
+    dirty: dict[str, int] = field(default_factory=dict)  # Conversation ID -> TTL
+    closed: bool = False  # Set once the turn ends; tasks it spawned then write through
+
+
+_current_turn: ContextVar[_StateTurn | None] = ContextVar("state_turn", default=None)
+
+
 class ConversationStateManager:
     """Manager for conversation state and context.
 
@@ -373,8 +1506,19 @@ class ConversationStateManager:
     state, context, and approval workflows. It handles serialization,
     caching, and storage backend interactions.
 
+    Within ``turn()``, each conversation state is read from storage once and
+    saves are held back until the turn ends, so handling one message costs one
+    read and at most one write per state however often handlers load and save
+    it. Concurrent turns of the same conversation share one state object, so
+    neither overwrites the other's changes when it ends, and saves made after
+    the turn ended (by tasks it spawned) are written right away. Turns on other
+    replicas are not coordinated, as without turns. With ``write_behind_delay``
+    set, writes are further held for that long and bursts of writes to the same
+    state are merged into one.
+
     Attributes:
         storage: Storage backend for state persistence.
+        write_behind_delay: Seconds to hold state writes before flushing them.
 
     Example:
         >>> manager = ConversationStateManager(InMemoryStateStorage())
@@ -382,15 +1526,164 @@ class ConversationStateManager:
         >>> context = await manager.get_context(conversation_id)
     """
 
-    def __init__(self, storage: StateStorage) -> None:
+    def __init__(self, storage: StateStorage, write_behind_delay: float = 0.0) -> None:
         """Initialize state manager with storage backend.
 
         Args:
             storage: Storage backend to use.
+            write_behind_delay: Seconds to hold state writes so that bursts are
+                merged. Defaults to 0.0 (write at the end of each turn).
         """
         self.storage = storage
+        self.write_behind_delay = write_behind_delay
+        self._pending_writes: dict[str, tuple[ConversationState, int]] = {}
+        self._flush_tasks: dict[str, asyncio.Task[None]] = {}
+        # States held by open turns, with the number of turns holding each
+        self._turn_states: dict[str, tuple[ConversationState, int]] = {}
+
+        # Metrics
+        self._state_reads = 0
+        self._state_writes = 0
+        self._coalesced_writes = 0
         logger.info(f"Initialized conversation state manager with {type(storage).__name__}")
 
+    async def start(self) -> None:
+        """Start background work of the storage backend (sweepers, SQLite restore)."""
+        if isinstance(self.storage, InMemoryStateStorage | SqliteStateStorage):
+            await self.storage.start()
+
+    async def close(self) -> None:
+        """Flush held state writes and stop background work."""
+        await self.flush()
+        if isinstance(self.storage, InMemoryStateStorage | SqliteStateStorage):
+            await self.storage.stop()
+
+    @contextlib.asynccontextmanager
+    async def turn(self) -> AsyncIterator[None]:
+        """Group the state reads and writes of one activity into a unit of work.
+
+        States are cached for the duration of the block and changed states are
+        written once when it exits, even if the block raises. Nested blocks join
+        the outermost one, and concurrent blocks share the states of the
+        conversations they both use.
+
+        Example:
+            >>> async with manager.turn():
+            ...     state = await manager.get_state(conversation_id)
+            ...     state.turn_count += 1
+            ...     await manager.save_state(state)  # Written when the block exits
+        """
+        if self._active_turn() is not None:
+            yield
+            return
+
+        unit = _StateTurn(self)
+        token = _current_turn.set(unit)
+        try:
+            yield
+        finally:
+            _current_turn.reset(token)
+            unit.closed = True
+            try:
+                for conversation_id, ttl_seconds in unit.dirty.items():
+                    held = self._turn_states.get(conversation_id)
+                    state = held[0] if held is not None else unit.states[conversation_id]
+                    await self._write_state(state, ttl_seconds)
+            finally:
+                self._release_turn_states(unit)
+
+    def _active_turn(self) -> _StateTurn | None:
+        """Get this manager's open unit of work for the current activity, if any."""
+        unit = _current_turn.get()
+        if unit is None or unit.manager is not self or unit.closed:
+            return None
+        return unit
+
+    def _hold_turn_state(self, unit: _StateTurn, state: ConversationState) -> None:
+        """Make a state the one used by all open turns of its conversation."""
+        conversation_id = state.conversation_id
+        held = self._turn_states.get(conversation_id)
+        holders = held[1] if held is not None else 0
+        if conversation_id not in unit.states:
+            holders += 1
+        unit.states[conversation_id] = state
+        self._turn_states[conversation_id] = (state, holders)
+
+    def _release_turn_states(self, unit: _StateTurn) -> None:
+        """Drop the states no other open turn holds."""
+        for conversation_id in unit.states:
+            held = self._turn_states.get(conversation_id)
+            if held is None:
+                continue
+            state, holders = held
+            if holders <= 1:
+                del self._turn_states[conversation_id]
+            else:
+                self._turn_states[conversation_id] = (state, holders - 1)
+
+    async def _write_state(self, state: ConversationState, ttl_seconds: int) -> None:
+        """Write a state now, or hold it for the write-behind delay."""
+        if self.write_behind_delay <= 0:
+            await self._store_state(state, ttl_seconds)
+            return
+
+        conversation_id = state.conversation_id
+        if conversation_id in self._pending_writes:
+            self._coalesced_writes += 1
+        self._pending_writes[conversation_id] = (state, ttl_seconds)
+        if conversation_id not in self._flush_tasks:
+            self._flush_tasks[conversation_id] = asyncio.create_task(
+                self._delayed_flush(conversation_id)
+            )
+
+    async def _store_state(self, state: ConversationState, ttl_seconds: int) -> None:
+        """Write a state to storage, logging failures (writes happen after the fact)."""
+        self._state_writes += 1
+        try:
+            await self.storage.set_state(state, ttl_seconds)
+        except Exception as e:
+            logger.error(
+                f"Failed to write state for conversation {state.conversation_id}: {e}",
+                exc_info=True,
+            )
+
+    async def _delayed_flush(self, conversation_id: str) -> None:
+        """Write a held state once the write-behind delay has passed."""
+        await asyncio.sleep(self.write_behind_delay)
+        self._flush_tasks.pop(conversation_id, None)
+        pending = self._pending_writes.pop(conversation_id, None)
+        if pending is not None:
+            await self._store_state(*pending)
+
+    async def flush(self) -> None:
+        """Write all held states now (e.g., on shutdown)."""
+        tasks = list(self._flush_tasks.values())
+        self._flush_tasks.clear()
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        pending = list(self._pending_writes.values())
+        self._pending_writes.clear()
+        for state, ttl_seconds in pending:
+            await self._store_state(state, ttl_seconds)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get state read and write statistics for monitoring.
+
+        Returns:
+            Dictionary with state reads and writes that reached storage, writes
+            merged into a later one, and writes currently held.
+        """
+        return {
+            "state_reads": self._state_reads,
+            "state_writes": self._state_writes,
+            "coalesced_writes": self._coalesced_writes,
+            "pending_writes": len(self._pending_writes),
+        }
+
     async def get_state(self, conversation_id: str) -> ConversationState:
         """Get or create conversation state.
 
@@ -400,7 +1693,20 @@ class ConversationStateManager:
         Returns:
             Conversation state (creates new if not found).
         """
-        state = await self.storage.get_state(conversation_id)
+        unit = self._active_turn()
+        if unit is not None and conversation_id in unit.states:
+            return unit.states[conversation_id]
+
+        held = self._turn_states.get(conversation_id)
+        pending = self._pending_writes.get(conversation_id)
+        state: ConversationState | None
+        if held is not None:
+            state = held[0]
+        elif pending is not None:
+            state = pending[0]
+        else:
+            self._state_reads += 1
+            state = await self.storage.get_state(conversation_id)
 
         if state is None:
             # Create new state
@@ -414,20 +1720,41 @@ class ConversationStateManager:
                 original_prompt=None,
                 handled_by_ssm_tracker=False,
             )
-            await self.storage.set_state(state)
+            if unit is not None:
+                unit.dirty[conversation_id] = 3600
+            else:
+                await self._write_state(state, 3600)
             logger.info(f"Created new state for conversation {conversation_id}")
 
+        if unit is not None:
+            self._hold_turn_state(unit, state)
         return state
 
     async def save_state(self, state: ConversationState, ttl_seconds: int = 3600) -> None:
         """Save conversation state.
 
+        Inside ``turn()``, the write happens when the turn ends. Outside of it,
+        including tasks that outlive the turn that spawned them, it is written
+        right away.
+
         Args:
             state: Conversation state to save.
             ttl_seconds: Time-to-live in seconds.
         """
         state.updated_at = datetime.now(tz=UTC)
-        await self.storage.set_state(state, ttl_seconds)
+        unit = self._active_turn()
+        if unit is not None:
+            if state.conversation_id in unit.dirty:
+                self._coalesced_writes += 1
+            self._hold_turn_state(unit, state)
+            unit.dirty[state.conversation_id] = ttl_seconds
+            return
+
+        held = self._turn_states.get(state.conversation_id)
+        if held is not None:
+            # Open turns of the conversation write this state when they end
+            self._turn_states[state.conversation_id] = (state, held[1])
+        await self._write_state(state, ttl_seconds)
 
     async def get_context(self, conversation_id: str) -> ConversationContext | None:
         """Get conversation context.
@@ -486,6 +1813,16 @@ class ConversationStateManager:
         Args:
             conversation_id: Conversation ID to clear.
         """
+        unit = self._active_turn()
+        if unit is not None:
+            unit.states.pop(conversation_id, None)
+            unit.dirty.pop(conversation_id, None)
+        self._turn_states.pop(conversation_id, None)
+        self._pending_writes.pop(conversation_id, None)
+        task = self._flush_tasks.pop(conversation_id, None)
+        if task is not None:
+            task.cancel()
+
         await self.storage.delete_state(conversation_id)
         await self.storage.delete_context(conversation_id)
         logger.info(f"Cleared all data for conversation {conversation_id}")
@@ -524,28 +1861,52 @@ class ConversationStateManager:
         return await self.storage.get_command_history(command_id)
 
 
-def create_state_manager(storage_type: str = "memory") -> ConversationStateManager:
+def create_state_manager(
+    storage_type: str = "memory",
+    redis_url: str | None = None,
+    max_entries: int | None = None,
+    write_behind_delay: float = 0.0,
+    sqlite_path: str | None = None,
+) -> ConversationStateManager:
     """Create a conversation state manager with the specified storage backend.
 
     Args:
-        storage_type: Type of storage backend ("memory" or "redis").
+        storage_type: Type of storage backend ("memory", "sqlite" or "redis").
+        redis_url: Redis URL, required for the "redis" backend.
+        max_entries: Maximum states, contexts and approvals kept each by the
+            "memory" backend. Defaults to None (no cap).
+        write_behind_delay: Seconds to hold state writes so that bursts are
+            merged. Defaults to 0.0.
+        sqlite_path: Database file path, required for the "sqlite" backend.
 
     Returns:
         Configured ConversationStateManager instance.
 
     Raises:
-        ValueError: If storage_type is not supported.
+        ValueError: If storage_type is not supported, or "redis" or "sqlite" is
+            requested without a URL or path.
+        ImportError: If "redis" is requested but the redis package is not installed.
 
     Example:
         >>> manager = create_state_manager("memory")
         >>> # Use for development and testing
+        >>> manager = create_state_manager("sqlite", sqlite_path="/data/state.db")
+        >>> # Use for a single node that must keep state across restarts
+        >>> manager = create_state_manager("redis", "redis://cache:6379/0")
+        >>> # Use for multiple workers or replicas
     """
+    storage: StateStorage
     if storage_type == "memory":
-        storage = InMemoryStateStorage()
+        storage = InMemoryStateStorage(max_entries=max_entries)
+    elif storage_type == "sqlite":
+        if not sqlite_path:
+            raise ValueError("SQLite state storage requires a database path (STATE_SQLITE_PATH)")
+        storage = SqliteStateStorage(sqlite_path)
     elif storage_type == "redis":
-        # TODO: Implement RedisStateStorage
-        raise NotImplementedError("Redis storage not yet implemented. Use 'memory' for now.")
+        if not redis_url:
+            raise ValueError("Redis state storage requires a Redis URL (STATE_REDIS_URL)")
+        storage = RedisStateStorage.from_url(redis_url)
     else:
         raise ValueError(f"Unknown storage type: {storage_type}")
 
-    return ConversationStateManager(storage)
+    return ConversationStateManager(storage, write_behind_delay=write_behind_delay)
@@ -16,11 +16,13 @@ from botbuilder.schema import Attachment
 
 from ohlala_smartops.ai.bedrock_client import BedrockClient
 from ohlala_smartops.bot.card_handler import CardHandler
+from ohlala_smartops.bot.handlers import get_tenant_key
 from ohlala_smartops.bot.message_handler import MessageHandler
 from ohlala_smartops.bot.state import ConversationStateManager, InMemoryStateStorage
 from ohlala_smartops.bot.typing_handler import TypingHandler
 from ohlala_smartops.commands.registry import register_commands
 from ohlala_smartops.mcp.manager import MCPManager
+from ohlala_smartops.utils.fair_share import throttle_tenant
 from ohlala_smartops.workflow.command_tracker import AsyncCommandTracker
 from ohlala_smartops.workflow.write_operations import WriteOperationManager
 
@@ -100,6 +102,21 @@ class OhlalaBot(TeamsActivityHandler):  # type: ignore[misc]
 
     # Core Teams activity handlers
 
+    async def on_turn(self, turn_context: TurnContext) -> None:
+        """Process an incoming activity on behalf of its team.
+
+        AWS and Bedrock calls made while handling the activity, including
+        background tasks it starts, share throttler capacity fairly with other
+        teams (see get_tenant_key). Conversation state is read once and written
+        once for the whole activity (see ConversationStateManager.turn).
+
+        Args:
+            turn_context: Bot Framework turn context.
+        """
+        with throttle_tenant(get_tenant_key(turn_context.activity)):
+            async with self.state_manager.turn():
+                await super().on_turn(turn_context)
+
     async def on_message_activity(self, turn_context: TurnContext) -> None:
         """Handle incoming message activities.
 
@@ -6,14 +6,69 @@ for EC2 instances, helping with cost tracking and forecasting.
 Phase 5C: Monitoring & Information commands.
 """
 
+import asyncio
 import logging
-from decimal import Decimal
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal, InvalidOperation
 from typing import Any, Final
 
 from ohlala_smartops.commands.base import BaseCommand
+from ohlala_smartops.constants import COSTS_FORECAST_BUDGET_SECONDS
+from ohlala_smartops.utils.cost_cache import get_cost_cache
 
 logger: Final = logging.getLogger(__name__)
 
+COST_METRIC: Final[str] = "UnblendedCost"
+"""Cost Explorer metric shown by /costs."""
+
+FORECAST_PERIOD: Final[str] = "remaining month"
+"""Period covered by the /costs forecast, also its cost cache key."""
+
+# Forecast fetches in flight by cost cache scope, including ones past the budget.
+# Module level because a command instance is created per message.
+_forecast_tasks: dict[str, "asyncio.Task[dict[str, Any] | None]"] = {}
+
+
+def _period_days(period: str, today: date) -> list[date]:
+    """Days covered by a /costs period, ending today (UTC).
+
+    Args:
+        period: Time period ("today", "week" for the last 7 days, "month" for
+            the month to date).
+        today: Current UTC day.
+
+    Returns:
+        Days of the period in order.
+    """
+    if period == "today":
+        start = today
+    elif period == "week":
+        start = today - timedelta(days=6)
+    else:
+        start = today.replace(day=1)
+    return [start + timedelta(days=offset) for offset in range((today - start).days + 1)]
+
+
+def _target_params(target: str) -> dict[str, Any]:
+    """Cost Explorer tool parameters selecting an instance or all EC2 instances.
+
+    Args:
+        target: Instance ID or "all".
+
+    Returns:
+        Parameters to merge into the tool arguments.
+    """
+    if target != "all":
+        return {"InstanceId": target}
+    return {
+        "Filter": {
+            "Dimensions": {
+                "Key": "SERVICE",
+                "Values": ["Amazon Elastic Compute Cloud - Compute"],
+            }
+        }
+    }
+
 
 class CostsCommand(BaseCommand):
     """Handler for /costs command - Display AWS cost information.
@@ -137,37 +192,225 @@ class CostsCommand(BaseCommand):
             }
 
     async def _get_costs(self, target: str, period: str, context: dict[str, Any]) -> dict[str, Any]:
-        """Get cost data from Cost Explorer.
+        """Get daily costs and the forecast, fetched concurrently.
+
+        Daily costs are required; the forecast is optional. If the forecast is
+        not in by the time the costs are and ``COSTS_FORECAST_BUDGET_SECONDS``
+        have passed, the result is marked ``forecast_pending``. The forecast
+        call keeps running and caches its result, so the next /costs (e.g., the
+        card's Refresh) shows it.
 
         Args:
             target: Instance ID or "all".
             period: Time period ("today", "week", "month").
             context: Execution context.
 
+        Returns:
+            Dictionary with total cost, daily costs, forecast and, if the
+            forecast is late, ``forecast_pending``.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + COSTS_FORECAST_BUDGET_SECONDS
+        scope = "ec2" if target == "all" else target
+        today = datetime.now(UTC).date()
+
+        has_forecast, forecast = await asyncio.to_thread(
+            get_cost_cache().get_forecast, scope, FORECAST_PERIOD, today
+        )
+        forecast_task = None
+        if not has_forecast:
+            forecast_task = self._start_forecast(target, scope, today, context)
+
+        costs = await self._get_daily_costs(target, period, scope, today, context)
+
+        if forecast_task is not None:
+            done, _ = await asyncio.wait({forecast_task}, timeout=max(0.0, deadline - loop.time()))
+            if done:
+                forecast = forecast_task.result()
+            else:
+                logger.info(f"Forecast of {scope} costs exceeded the latency budget")
+                costs["forecast_pending"] = True
+
+        if forecast is not None or "forecast" not in costs:
+            costs["forecast"] = forecast
+        return costs
+
+    async def _get_daily_costs(
+        self, target: str, period: str, scope: str, today: date, context: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Get daily costs, fetching from Cost Explorer only what the cost cache lacks.
+
+        Settled days come from the cache; the query covers the first day that is
+        missing or still estimated through today. Only days in the response are
+        cached; a failed query or one without a daily breakdown is returned as
+        is.
+
+        Args:
+            target: Instance ID or "all".
+            period: Time period ("today", "week", "month").
+            scope: Cost cache scope of the target.
+            today: Current UTC day.
+            context: Execution context.
+
+        Returns:
+            Dictionary with total cost and daily costs.
+        """
+        cache = get_cost_cache()
+        days = _period_days(period, today)
+
+        missing = await asyncio.to_thread(cache.missing_days, scope, COST_METRIC, days)
+        if missing:
+            start = min(missing)
+            costs = await self._fetch_costs(target, period, start, today, context)
+            daily_costs = costs.get("daily_costs")
+            if "error" in costs or not daily_costs:
+                # Nothing to cache: a failure must not be cached as $0
+                return costs
+
+            requested = set(days[days.index(start) :])
+            fetched: dict[date, tuple[Decimal, bool]] = {}
+            for entry in daily_costs:
+                try:
+                    day = date.fromisoformat(str(entry["date"])[:10])
+                    amount = Decimal(str(entry.get("amount", 0)))
+                except (KeyError, ValueError, InvalidOperation):
+                    continue
+                if day in requested:
+                    fetched[day] = (amount, bool(entry.get("estimated", False)))
+            await asyncio.to_thread(
+                cache.put_daily,
+                scope,
+                COST_METRIC,
+                [(day, amount, estimated) for day, (amount, estimated) in fetched.items()],
+                today,
+            )
+            logger.debug(f"Fetched {len(fetched)} of {len(days)} days of {scope} costs")
+
+        cached = await asyncio.to_thread(cache.get_daily, scope, COST_METRIC, days[0], today)
+        return {
+            "total_cost": sum(cached.values(), Decimal("0")),
+            "daily_costs": [
+                {"date": day.isoformat(), "amount": amount} for day, amount in cached.items()
+            ],
+        }
+
+    async def _fetch_costs(
+        self, target: str, period: str, start: date, end: date, context: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Query Cost Explorer for daily costs.
+
+        Args:
+            target: Instance ID or "all".
+            period: Time period ("today", "week", "month").
+            start: First day to fetch.
+            end: Last day to fetch (inclusive).
+            context: Execution context.
+
         Returns:
             Dictionary with cost data.
+
+        Raises:
+            Exception: If the tool returned an error.
         """
         # Build parameters for MCP tool
-        params: dict[str, Any] = {"Granularity": "DAILY", "Period": period}
+        params: dict[str, Any] = {
+            "Granularity": "DAILY",
+            "Period": period,
+            "TimePeriod": {
+                "Start": start.isoformat(),
+                "End": (end + timedelta(days=1)).isoformat(),
+            },
+            **_target_params(target),
+        }
 
         if target != "all":
             # Get costs for specific instance
-            params["InstanceId"] = target
             result = await self.call_mcp_tool("get-instance-costs", params, context)
         else:
             # Get costs for all instances
-            params["Metrics"] = ["UnblendedCost"]
-            params["Filter"] = {
-                "Dimensions": {
-                    "Key": "SERVICE",
-                    "Values": ["Amazon Elastic Compute Cloud - Compute"],
-                }
-            }
+            params["Metrics"] = [COST_METRIC]
             result = await self.call_mcp_tool("get-cost-and-usage", params, context)
 
+        if "error" in result:
+            raise Exception(f"Failed to get costs: {result['error']}")
         costs = result.get("costs", {})
         return costs if isinstance(costs, dict) else {}
 
+    def _start_forecast(
+        self, target: str, scope: str, today: date, context: dict[str, Any]
+    ) -> "asyncio.Task[dict[str, Any] | None]":
+        """Start fetching a forecast, or join the fetch already running for the scope.
+
+        Args:
+            target: Instance ID or "all".
+            scope: Cost cache scope of the target.
+            today: Current UTC day.
+            context: Execution context.
+
+        Returns:
+            Task resolving to the forecast (None if unavailable).
+        """
+        # Tasks of another event loop (e.g., a previous test) cannot be awaited here
+        task = _forecast_tasks.get(scope)
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._fetch_forecast(target, scope, today, context))
+            _forecast_tasks[scope] = task
+
+            def forget(done: "asyncio.Task[dict[str, Any] | None]") -> None:
+                if _forecast_tasks.get(scope) is done:
+                    del _forecast_tasks[scope]
+
+            task.add_done_callback(forget)
+        return task
+
+    async def _fetch_forecast(
+        self, target: str, scope: str, today: date, context: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Query Cost Explorer for the forecast of the rest of the month and cache it.
+
+        Errors are logged rather than raised since the forecast is optional;
+        failed forecasts, including error payloads and responses without a
+        forecast, are not cached so the next /costs tries again.
+
+        Args:
+            target: Instance ID or "all".
+            scope: Cost cache scope of the target.
+            today: Current UTC day.
+            context: Execution context.
+
+        Returns:
+            Forecast with amount and period, or None if unavailable.
+        """
+        start = today + timedelta(days=1)
+        end = (today.replace(day=1) + timedelta(days=32)).replace(day=1)
+        forecast: dict[str, Any] | None = None
+        if start < end:
+            params: dict[str, Any] = {
+                "Granularity": "MONTHLY",
+                "Metric": "UNBLENDED_COST",
+                "TimePeriod": {"Start": start.isoformat(), "End": end.isoformat()},
+                **_target_params(target),
+            }
+            try:
+                result = await self.call_mcp_tool("forecast-cost", params, context)
+                if "error" in result or not result.get("forecast"):
+                    logger.warning(
+                        f"No forecast of {scope} costs: {result.get('error', 'empty response')}"
+                    )
+                    return None
+                forecast = {
+                    "amount": Decimal(str(result["forecast"].get("amount", 0))),
+                    "period": result["forecast"].get("period", FORECAST_PERIOD),
+                }
+            except Exception as e:
+                logger.warning(f"Failed to get forecast of {scope} costs: {e}")
+                return None
+
+        await asyncio.to_thread(
+            get_cost_cache().put_forecast, scope, FORECAST_PERIOD, today, forecast
+        )
+        return forecast
+
     def _build_costs_card(
         self,
         target: str,
@@ -260,6 +503,8 @@ class CostsCommand(BaseCommand):
             # Forecast (if available)
             if forecast:
                 card_body.append(self._build_forecast_section(forecast))
+            elif cost_data.get("forecast_pending"):
+                card_body.append(self._build_forecast_pending_section())
 
         # Refresh action
         card_body.append(
@@ -461,3 +706,28 @@ class CostsCommand(BaseCommand):
                 },
             ],
         }
+
+    def _build_forecast_pending_section(self) -> dict[str, Any]:
+        """Build placeholder for a forecast still being calculated.
+
+        Returns:
+            Container telling the user to refresh for the forecast.
+        """
+        return {
+            "type": "Container",
+            "spacing": "Medium",
+            "items": [
+                {
+                    "type": "TextBlock",
+                    "text": "📈 Forecast",
+                    "weight": "Bolder",
+                    "size": "Medium",
+                },
+                {
+                    "type": "TextBlock",
+                    "text": "⏳ Still being calculated. Select Refresh in a few seconds to see it.",
+                    "wrap": True,
+                    "isSubtle": True,
+                },
+            ],
+        }
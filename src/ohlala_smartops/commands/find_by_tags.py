@@ -6,13 +6,18 @@ matching specified tag filters.
 Phase 5E: Resource Tagging.
 """
 
+import asyncio
 import logging
 from typing import Any, Final
 
+from ohlala_smartops.aws.tagging import get_tagging_manager
 from ohlala_smartops.commands.base import BaseCommand
 
 logger: Final = logging.getLogger(__name__)
 
+DESCRIBE_BATCH_SIZE: Final[int] = 100
+"""Matching instance IDs described per describe-instances call."""
+
 
 class FindByTagsCommand(BaseCommand):
     """Handler for /find-tags command - Find instances by tag criteria.
@@ -53,6 +58,7 @@ class FindByTagsCommand(BaseCommand):
             args: Command arguments (tag filters).
             context: Execution context containing:
                 - mcp_manager: MCPManager instance
+                - tagging_manager: TaggingManager instance (optional)
 
         Returns:
             Command result with card showing matching instances.
@@ -157,46 +163,87 @@ class FindByTagsCommand(BaseCommand):
     ) -> list[dict[str, Any]]:
         """Find instances matching tag filters.
 
+        The filters are applied by the Resource Groups Tagging API, so only
+        matching instances are returned, page by page. Each page's instances
+        are described in batches of ``DESCRIBE_BATCH_SIZE`` while the next page
+        is fetched, filtering on instance ID so that an instance terminated
+        since it was tagged is left out rather than failing its batch. Batches
+        that fail (including MCP error payloads) are skipped unless all of them
+        fail.
+
         Args:
             tag_filters: Dictionary of tag key to value (None means any value).
-            context: Execution context.
+            context: Execution context, optionally containing a
+                ``tagging_manager`` and the AWS ``region``. Without a
+                ``tagging_manager``, the shared one of the region is used.
 
         Returns:
             List of matching instance dictionaries.
-        """
-        # First get all instances
-        result = await self.call_mcp_tool("list-instances", {}, context)
-        all_instances = result.get("instances", [])
 
-        if not all_instances:
-            return []
-
-        # Filter instances by tags
-        matching_instances: list[dict[str, Any]] = []
-
-        for instance in all_instances:
-            instance_tags = instance.get("Tags", {})
+        Raises:
+            Exception: If every describe-instances batch failed.
+        """
+        tagging_manager = context.get("tagging_manager") or get_tagging_manager(
+            context.get("region")
+        )
 
-            if not isinstance(instance_tags, dict):
-                continue
+        describe_tasks: list[asyncio.Task[dict[str, Any]]] = []
+        try:
+            async for arns in tagging_manager.iter_resources_by_tags(
+                tag_filters, resource_types=["ec2:instance"]
+            ):
+                instance_ids = [arn.rsplit("/", 1)[-1] for arn in arns]
+                describe_tasks.extend(
+                    asyncio.create_task(
+                        self._describe_batch(
+                            instance_ids[start : start + DESCRIBE_BATCH_SIZE], context
+                        )
+                    )
+                    for start in range(0, len(instance_ids), DESCRIBE_BATCH_SIZE)
+                )
+        except BaseException:
+            for task in describe_tasks:
+                task.cancel()
+            await asyncio.gather(*describe_tasks, return_exceptions=True)
+            raise
+
+        results = await asyncio.gather(*describe_tasks, return_exceptions=True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors and len(errors) == len(results):
+            raise errors[0]
+        if errors:
+            logger.warning(f"Failed to describe {len(errors)} batch(es) of tagged instances")
+
+        return [
+            instance
+            for result in results
+            if not isinstance(result, BaseException)
+            for instance in result.get("instances", [])
+        ]
 
-            # Check if all filters match (AND logic)
-            matches = True
-            for filter_key, filter_value in tag_filters.items():
-                if filter_key not in instance_tags:
-                    matches = False
-                    break
+    async def _describe_batch(
+        self, instance_ids: list[str], context: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Describe a batch of instances, raising on MCP error payloads.
 
-                # If filter_value is None, just check key exists
-                # Check exact value match if filter_value is provided
-                if filter_value is not None and instance_tags[filter_key] != filter_value:
-                    matches = False
-                    break
+        Args:
+            instance_ids: Instance IDs of the batch.
+            context: Execution context.
 
-            if matches:
-                matching_instances.append(instance)
+        Returns:
+            describe-instances result with the instances that still exist.
 
-        return matching_instances
+        Raises:
+            Exception: If the tool returned an error (e.g., an open circuit breaker).
+        """
+        result = await self.call_mcp_tool(
+            "describe-instances",
+            {"Filters": [{"Name": "instance-id", "Values": instance_ids}]},
+            context,
+        )
+        if "error" in result:
+            raise Exception(f"Failed to describe instances: {result['error']}")
+        return result
 
     def _build_results_card(
         self, tag_filters: dict[str, str | None], instances: list[dict[str, Any]]
@@ -14,6 +14,7 @@ from ohlala_smartops.commands.health.card_builder import CardBuilder
 from ohlala_smartops.commands.health.chart_builder import ChartBuilder
 from ohlala_smartops.commands.health.metrics_collector import MetricsCollector
 from ohlala_smartops.commands.health.system_inspector import SystemInspector
+from ohlala_smartops.utils.priority import throttle_priority
 
 # Configure structured logging with fallback for Python 3.13 compatibility
 try:
@@ -341,7 +342,9 @@ class HealthDashboardCommand(BaseCommand):
                     self.metrics_collector.get_instance_health_summary(inst_id) for inst_id in batch
                 ]
 
-                batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
+                # Background priority so overview batches never delay other users
+                with throttle_priority("background"):
+                    batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
 
                 # Add results, handling exceptions
                 for result in batch_results:
@@ -8,13 +8,16 @@ import time
 from typing import Any
 
 from ohlala_smartops.commands.base import BaseCommand
+from ohlala_smartops.utils.fair_share import get_throttle_tenant
+from ohlala_smartops.utils.token_quota import get_token_quotas
 from ohlala_smartops.utils.token_tracker import get_token_tracker
 
 
 class TokenUsageCommand(BaseCommand):
     """Display token usage statistics and costs.
 
-    Shows current session and daily usage with cost breakdowns.
+    Shows current session and daily usage with cost breakdowns, and the user's
+    and team's rolling token usage against their quotas.
     Provides budget monitoring and intelligent recommendations.
 
     Usage:
@@ -57,7 +60,7 @@ class TokenUsageCommand(BaseCommand):
     async def execute(
         self,
         args: list[str],
-        context: dict[str, Any],  # noqa: ARG002
+        context: dict[str, Any],
     ) -> dict[str, Any]:
         """Execute the token usage command.
 
@@ -100,6 +103,12 @@ class TokenUsageCommand(BaseCommand):
         else:
             message = self._format_brief_report(session_stats, daily_stats)
 
+        # Rolling per-user and per-team usage (the team is the current fair-share tenant)
+        user_id = context.get("user_id")
+        if user_id:
+            usage = get_token_quotas().get_usage(user_id, get_throttle_tenant())
+            message += "\n\n" + self._format_quota_usage(usage)
+
         return {"success": True, "message": message}
 
     def _reset_daily_stats(self) -> dict[str, Any]:
@@ -230,6 +239,28 @@ class TokenUsageCommand(BaseCommand):
 
         return "\n".join(lines)
 
+    def _format_quota_usage(self, usage: dict[str, dict[str, dict[str, Any]]]) -> str:
+        """Format rolling token usage against quotas.
+
+        Args:
+            usage: Usage by scope and window (see TokenQuotas.get_usage)
+
+        Returns:
+            Formatted quota section
+        """
+        lines = ["**Rolling Token Usage:**"]
+        for scope, label in (("user", "You"), ("team", "Your team")):
+            windows = []
+            for window, counter in usage[scope].items():
+                limit = counter["limit"]
+                used = f"{counter['used']:,}"
+                windows.append(
+                    f"{used} / {limit:,} per {window}" if limit else f"{used} per {window}"
+                )
+            lines.append(f"• {label}: " + ", ".join(windows))
+
+        return "\n".join(lines)
+
     def _format_runtime(self, start_time: float) -> str:
         """Format session runtime.
 
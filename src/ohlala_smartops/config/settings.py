@@ -54,6 +54,19 @@ class Settings(BaseSettings):
         description="AWS region for deployment",
     )
 
+    aws_client_backend: Literal["thread", "async"] = Field(
+        default="thread",
+        description=(
+            "Default AWS client backend: 'thread' runs boto3 in the executor, "
+            "'async' uses native aiobotocore clients"
+        ),
+    )
+
+    aws_client_backend_overrides: dict[str, Literal["thread", "async"]] = Field(
+        default_factory=dict,
+        description='Per-service AWS client backend overrides (e.g. {"ec2": "async"})',
+    )
+
     # =========================================================================
     # Microsoft Teams Bot Configuration
     # =========================================================================
@@ -198,6 +211,58 @@ class Settings(BaseSettings):
         description="Maximum tokens in AWS API rate limit bucket",
     )
 
+    aws_service_rate_limits_enabled: bool = Field(
+        default=True,
+        description="Enable per-service and per-operation-class AWS API token buckets",
+    )
+
+    aws_adaptive_rate_enabled: bool = Field(
+        default=False,
+        description="Adapt AWS API rate limits to observed throttling (AIMD)",
+    )
+
+    aws_adaptive_rate_min: float = Field(
+        default=1.0,
+        ge=0.1,
+        le=1000.0,
+        description="Floor in tokens per second for the adaptive AWS API rate",
+    )
+
+    aws_adaptive_rate_max: float = Field(
+        default=50.0,
+        ge=0.1,
+        le=1000.0,
+        description="Ceiling in tokens per second for the adaptive AWS API rate",
+    )
+
+    aws_adaptive_rate_increase: float = Field(
+        default=0.1,
+        gt=0.0,
+        le=100.0,
+        description="Tokens per second added to the adaptive rate per successful call",
+    )
+
+    aws_adaptive_rate_decrease_factor: float = Field(
+        default=0.5,
+        gt=0.0,
+        lt=1.0,
+        description="Multiplier applied to the adaptive rate when throttling is detected",
+    )
+
+    aws_adaptive_rate_cooldown: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=60.0,
+        description="Minimum seconds between two adaptive rate decreases",
+    )
+
+    aws_tenant_max_concurrent: int = Field(
+        default=0,
+        ge=0,
+        le=100,
+        description="Maximum concurrent AWS API calls per tenant (0 for no cap)",
+    )
+
     max_concurrent_bedrock_calls: int = Field(
         default=2,
         ge=1,
@@ -219,16 +284,99 @@ class Settings(BaseSettings):
         description="Maximum tokens in Bedrock API rate limit bucket",
     )
 
+    bedrock_tenant_max_concurrent: int = Field(
+        default=0,
+        ge=0,
+        le=20,
+        description="Maximum concurrent Bedrock API calls per tenant (0 for no cap)",
+    )
+
+    throttle_redis_url: str | None = Field(
+        default=None,
+        description="Redis URL of the rate limit buckets shared between bot replicas",
+    )
+
+    aws_shared_lease_size: int = Field(
+        default=5,
+        ge=1,
+        le=100,
+        description="AWS API tokens leased from the shared bucket per Redis round trip",
+    )
+
+    bedrock_shared_lease_size: int = Field(
+        default=1,
+        ge=1,
+        le=20,
+        description="Bedrock tokens leased from the shared bucket per Redis round trip",
+    )
+
+    throttle_lease_ttl: float = Field(
+        default=1.0,
+        gt=0.0,
+        le=60.0,
+        description="Seconds a lease of shared rate limit tokens stays usable",
+    )
+
+    token_quota_user_per_minute: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum Bedrock tokens per user in a rolling minute (0 for no limit)",
+    )
+
+    token_quota_user_per_hour: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum Bedrock tokens per user in a rolling hour (0 for no limit)",
+    )
+
+    token_quota_user_per_day: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum Bedrock tokens per user in a rolling day (0 for no limit)",
+    )
+
+    token_quota_team_per_minute: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum Bedrock tokens per team in a rolling minute (0 for no limit)",
+    )
+
+    token_quota_team_per_hour: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum Bedrock tokens per team in a rolling hour (0 for no limit)",
+    )
+
+    token_quota_team_per_day: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum Bedrock tokens per team in a rolling day (0 for no limit)",
+    )
+
     aws_circuit_breaker_enabled: bool = Field(
         default=False,
-        description="Enable circuit breaker for AWS API calls",
+        description="Enable per-service circuit breakers for AWS API and MCP calls",
     )
 
     aws_circuit_breaker_threshold: int = Field(
         default=100,
         ge=1,
         le=1000,
-        description="Consecutive failures before circuit breaker opens",
+        description="Minimum calls in the rolling window before a circuit breaker can open",
+    )
+
+    aws_circuit_breaker_error_rate: float = Field(
+        default=0.5,
+        gt=0.0,
+        le=1.0,
+        description="Share of failed calls in the rolling window that opens a circuit breaker",
+    )
+
+    aws_circuit_breaker_window: float = Field(
+        default=60.0,
+        ge=1.0,
+        le=3600.0,
+        description="Length of the circuit breaker error-rate window in seconds",
     )
 
     aws_circuit_breaker_timeout: float = Field(
@@ -238,6 +386,13 @@ class Settings(BaseSettings):
         description="Seconds to keep circuit breaker open",
     )
 
+    aws_circuit_breaker_half_open_probes: int = Field(
+        default=3,
+        ge=1,
+        le=100,
+        description="Probe calls admitted while a circuit breaker is half-open",
+    )
+
     max_concurrent_requests: int = Field(
         default=10,
         ge=1,
@@ -259,6 +414,39 @@ class Settings(BaseSettings):
         description="Include PII in audit logs (requires proper controls)",
     )
 
+    audit_log_sink: Literal["logging", "stdout", "file"] = Field(
+        default="logging",
+        description=(
+            "Where audit entries are written: the application log, stdout as "
+            "one line per entry, or a rotating file"
+        ),
+    )
+
+    audit_log_file: str = Field(
+        default="logs/audit.log",
+        description="Audit log file of the 'file' sink",
+    )
+
+    audit_log_file_max_bytes: int = Field(
+        default=10 * 1024 * 1024,
+        ge=1024,
+        description="Size at which the audit log file is rotated",
+    )
+
+    audit_log_file_backup_count: int = Field(
+        default=5,
+        ge=0,
+        le=100,
+        description="Rotated audit log files kept",
+    )
+
+    audit_log_queue_size: int = Field(
+        default=10_000,
+        ge=1,
+        le=1_000_000,
+        description="Audit entries queued for writing before new entries are dropped",
+    )
+
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
         default="INFO",
         description="Application log level",
@@ -269,6 +457,19 @@ class Settings(BaseSettings):
         description="CloudFormation stack name for metrics namespacing",
     )
 
+    metrics_output: Literal["api", "emf"] = Field(
+        default="api",
+        description=(
+            "How application metrics reach CloudWatch: batched PutMetricData calls, "
+            "or Embedded Metric Format log lines picked up by the log agent"
+        ),
+    )
+
+    metrics_emf_file: str | None = Field(
+        default=None,
+        description="File the Embedded Metric Format lines are appended to (stdout if unset)",
+    )
+
     # =========================================================================
     # Application Configuration
     # =========================================================================
@@ -280,6 +481,42 @@ class Settings(BaseSettings):
         description="Port for the FastAPI application",
     )
 
+    state_storage_type: Literal["memory", "sqlite", "redis"] = Field(
+        default="memory",
+        description=(
+            "Conversation state storage backend ('sqlite' to keep state across restarts "
+            "on a single node, 'redis' for multiple replicas)"
+        ),
+    )
+
+    state_redis_url: str | None = Field(
+        default=None,
+        description="Redis URL of the conversation state storage",
+    )
+
+    state_sqlite_path: str | None = Field(
+        default=None,
+        description="SQLite database file of the conversation state storage",
+    )
+
+    state_max_entries: int | None = Field(
+        default=None,
+        ge=1,
+        description="Maximum states, contexts and approvals kept each in memory (LRU eviction)",
+    )
+
+    state_write_behind_delay: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=10.0,
+        description="Seconds to hold conversation state writes so bursts are merged (0 to off)",
+    )
+
+    cost_cache_path: str | None = Field(
+        default=None,
+        description="SQLite database file of the daily cost cache (in memory if unset)",
+    )
+
     @field_validator("bedrock_model_id", mode="after")
     @classmethod
     def set_bedrock_model_id(cls, v: str | None, info: ValidationInfo) -> str:
@@ -352,6 +589,17 @@ class Settings(BaseSettings):
         """
         return self.bedrock_guardrail_version_override or self.bedrock_guardrail_version
 
+    def get_aws_client_backend(self, service_name: str) -> Literal["thread", "async"]:
+        """Get the AWS client backend to use for a service.
+
+        Args:
+            service_name: AWS service name (e.g., 'ec2', 'ssm').
+
+        Returns:
+            The per-service override if configured, otherwise the default backend.
+        """
+        return self.aws_client_backend_overrides.get(service_name, self.aws_client_backend)
+
     def get_bedrock_model_candidates(self) -> list[str]:
         """Get list of Bedrock model IDs to try in order.
 
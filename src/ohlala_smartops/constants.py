@@ -200,6 +200,24 @@ DEFAULT_METRIC_PERIOD: Final[int] = 300
 DEFAULT_MAX_TOOLS_DISPLAY: Final[int] = 10
 """Maximum number of tools/resources to display in responses."""
 
+METRICS_FLUSH_INTERVAL_SECONDS: Final[float] = 60.0
+"""Seconds application metrics are aggregated in memory before being published."""
+
+METRICS_MAX_DATUMS_PER_REQUEST: Final[int] = 1000
+"""Maximum metric datums in one PutMetricData request (CloudWatch limit)."""
+
+METRICS_MAX_REQUEST_BYTES: Final[int] = 500_000
+"""Maximum JSON size of the datums in one PutMetricData request.
+
+Half the 1 MB CloudWatch request limit, leaving room for the protocol encoding.
+"""
+
+METRICS_MAX_EMF_VALUES: Final[int] = 100
+"""Maximum values in the array of one metric in an EMF document (CloudWatch limit)."""
+
+METRICS_MAX_VALUES_PER_DATUM: Final[int] = 150
+"""Maximum distinct values in the Values/Counts arrays of one datum (CloudWatch limit)."""
+
 # =============================================================================
 # Bedrock Model Configuration
 # =============================================================================
@@ -254,6 +272,164 @@ creative and varied responses.
 BEDROCK_ANTHROPIC_VERSION: Final[str] = "bedrock-2023-05-31"
 """Anthropic API version for Bedrock integration."""
 
+# =============================================================================
+# AWS API Rate Limits
+# =============================================================================
+
+AWS_API_RATE_LIMITS: Final[dict[str, dict[str, tuple[float, int]]]] = {
+    "ec2": {
+        "service": (25.0, 300),
+        "read": (20.0, 100),
+        "mutate": (5.0, 200),
+    },
+    "ssm": {
+        "service": (20.0, 40),
+        "read": (20.0, 40),
+        "mutate": (5.0, 10),
+    },
+    "cloudwatch": {
+        "service": (50.0, 100),
+        "read": (25.0, 50),
+        "mutate": (50.0, 100),
+    },
+    "ce": {
+        "service": (5.0, 5),
+        "read": (5.0, 5),
+        "mutate": (1.0, 1),
+    },
+    "resourcegroupstaggingapi": {
+        "service": (15.0, 15),
+        "read": (10.0, 15),
+        "mutate": (5.0, 5),
+    },
+}
+"""Default token buckets per AWS service as (tokens per second, bucket size).
+
+Each service has a service-wide bucket plus one bucket per operation class:
+``read`` for non-mutating calls (Describe*, List*, Get*) and ``mutate`` for
+everything else. Values mirror AWS's published per-account API rate limits
+(e.g. EC2 request token buckets of 100/20 for non-mutating and 200/5 for
+mutating actions, and roughly 5 TPS for Cost Explorer). Calls to services
+not listed here are only limited by the global bucket. Can be overridden per
+service via the AWS_SERVICE_RATE_LIMITS environment variable.
+"""
+
+AWS_THROTTLING_ERROR_CODES: Final[frozenset[str]] = frozenset(
+    {
+        "Throttling",
+        "ThrottlingException",
+        "ThrottledException",
+        "RequestLimitExceeded",
+        "RequestThrottled",
+        "RequestThrottledException",
+        "TooManyRequestsException",
+        "SlowDown",
+    }
+)
+"""AWS error codes indicating a request was throttled by the service."""
+
+AWS_SERVICE_THROTTLING_ERROR_CODES: Final[dict[str, frozenset[str]]] = {
+    "ce": frozenset({"LimitExceededException"}),
+}
+"""Additional throttling error codes of specific AWS services.
+
+Cost Explorer reports throttling as LimitExceededException. Other services use
+that code for exceeded quotas (e.g., too many resources), which backing off
+does not fix, so it only counts as throttling for the services listed here.
+"""
+
+AWS_SERVER_ERROR_CODES: Final[frozenset[str]] = frozenset(
+    {
+        "InternalError",
+        "InternalFailure",
+        "InternalServerError",
+        "InternalServerException",
+        "InternalServiceError",
+        "ServiceUnavailable",
+        "ServiceUnavailableException",
+        "Unavailable",
+        "RequestTimeout",
+        "RequestTimeoutException",
+    }
+)
+"""AWS error codes indicating a fault of the service rather than of the request.
+
+Only these count towards circuit breaker error rates; client errors such as
+InvalidInstanceID.NotFound or AccessDenied do not.
+"""
+
+AWS_READ_OPERATION_PREFIXES: Final[tuple[str, ...]] = (
+    "describe",
+    "list",
+    "get",
+    "search",
+    "lookup",
+    "batch_get",
+    "forecast",
+)
+"""Operation name prefixes that classify an AWS call as a read (non-mutating) call."""
+
+MCP_TOOL_SERVICES: Final[dict[str, str]] = {
+    "list-instances": "ec2",
+    "describe-instances": "ec2",
+    "start-instances": "ec2",
+    "stop-instances": "ec2",
+    "reboot-instances": "ec2",
+    "get-instances": "ec2",
+    "get-instance-status": "ec2",
+    "send-command": "ssm",
+    "exec-command": "ssm",
+    "list-commands": "ssm",
+    "get-command-invocation": "ssm",
+    "list-command-invocations": "ssm",
+    "list-sessions": "ssm",
+    "describe-instance-information": "ssm",
+    "get-instance-metrics": "cloudwatch",
+    "get-cost-and-usage": "ce",
+    "get-instance-costs": "ce",
+    "forecast-cost": "ce",
+    "tag-resources": "resourcegroupstaggingapi",
+    "remove-tags": "resourcegroupstaggingapi",
+    "get-resource-tags": "resourcegroupstaggingapi",
+}
+"""AWS service backing each MCP AWS API tool, used to pick its rate limit buckets."""
+
+THROTTLE_PRIORITIES: Final[tuple[str, ...]] = ("interactive", "background", "bulk")
+"""Throttler priority classes, highest first.
+
+interactive: a user is waiting (Teams commands). background: work nobody is
+actively waiting on (command status polling, health overview batches). bulk:
+fire-and-forget work (metrics).
+"""
+
+THROTTLE_RESERVED_SHARES: Final[dict[str, float]] = {
+    "background": 0.2,
+    "bulk": 0.05,
+}
+"""Minimum share of throttler grants reserved for each lower priority class while it waits."""
+
+THROTTLE_DEFAULT_TENANT: Final[str] = "default"
+"""Tenant key for throttled calls made outside of a Teams conversation."""
+
+THROTTLE_DEFAULT_TENANT_WEIGHT: Final[float] = 1.0
+"""Fair-share weight of tenants without a configured weight."""
+
+THROTTLE_TENANT_STATS_IDLE_SECONDS: Final[float] = 3600.0
+"""Seconds without throttled calls after which a tenant's wait statistics are dropped."""
+
+THROTTLE_REDIS_KEY_PREFIX: Final[str] = "ohlala:throttle:"
+"""Default Redis key prefix of the token buckets shared between bot replicas."""
+
+THROTTLE_REDIS_TIMEOUT_SECONDS: Final[float] = 0.5
+"""Connect and response timeout of the shared rate limit backend.
+
+Every throttled call may wait on the backend, so it must fail fast rather than
+after a TCP timeout when the server is unreachable.
+"""
+
+THROTTLE_REDIS_RETRY_SECONDS: Final[float] = 5.0
+"""Seconds the shared rate limit backend is skipped after a failure."""
+
 # =============================================================================
 # Model Context Protocol (MCP) Configuration
 # =============================================================================
@@ -272,6 +448,80 @@ This server provides AWS documentation and knowledge queries via MCP protocol.
 Can be overridden via MCP_AWS_KNOWLEDGE_URL environment variable.
 """
 
+MCP_RATE_LIMIT_ERROR_CODE: Final[int] = -32002
+"""JSON-RPC error code returned by MCP servers when a call is rate limited."""
+
+# =============================================================================
+# Conversation State Storage
+# =============================================================================
+
+STATE_REDIS_KEY_PREFIX: Final[str] = "ohlala:state:"
+"""Default Redis key prefix of conversation state, approvals and command history."""
+
+STATE_COMMAND_HISTORY_LIMIT: Final[int] = 100
+"""Maximum number of command history entries kept per user."""
+
+STATE_COMMAND_HISTORY_TTL_SECONDS: Final[int] = 30 * 24 * 3600
+"""Seconds a command history entry is kept in Redis (30 days)."""
+
+STATE_APPROVAL_RETENTION_SECONDS: Final[int] = 7 * 24 * 3600
+"""Seconds an approval request is kept in storage after it expires (7 days).
+
+Lets approval cards clicked late still report the outcome of the request.
+"""
+
+STATE_SWEEP_INTERVAL_SECONDS: Final[float] = 60.0
+"""Seconds between sweeps of expired entries from in-memory state storage."""
+
+# =============================================================================
+# Token Usage Tracking
+# =============================================================================
+
+TOKEN_STATS_FLUSH_INTERVAL_SECONDS: Final[float] = 5.0
+"""Seconds daily token statistics are held in memory before being written to disk.
+
+Updates made within the interval are written together; at most this much
+tracking is lost if the process crashes.
+"""
+
+TOKEN_CALIBRATION_MIN_SAMPLES: Final[int] = 20
+"""Bedrock calls of an operation type observed before its fitted token model is used."""
+
+TOKEN_CALIBRATION_SAFETY_MARGIN: Final[float] = 0.1
+"""Share added to calibrated token estimates to cover prediction error."""
+
+TOKEN_CALIBRATION_FORGETTING_FACTOR: Final[float] = 0.995
+"""Weight kept by older observations at each calibration update (1.0 never forgets)."""
+
+# =============================================================================
+# Audit Logging
+# =============================================================================
+
+AUDIT_LOG_BATCH_SIZE: Final[int] = 256
+"""Maximum audit entries serialized and written to the sink in one batch."""
+
+AUDIT_LOG_CLOSE_TIMEOUT_SECONDS: Final[float] = 10.0
+"""Seconds to wait at shutdown for queued audit entries to be written."""
+
+# =============================================================================
+# Cost Reporting
+# =============================================================================
+
+COST_CACHE_SETTLE_DAYS: Final[int] = 3
+"""Days after which Cost Explorer no longer revises a day's cost.
+
+More recent days are cached as estimated and fetched again once stale.
+"""
+
+COST_CACHE_ESTIMATED_TTL_SECONDS: Final[float] = 21600.0
+"""Seconds an estimated daily cost is served from the cache before it is fetched again."""
+
+COSTS_FORECAST_BUDGET_SECONDS: Final[float] = 2.0
+"""Seconds /costs waits for the forecast before showing the card without it.
+
+The card marks the forecast as pending; it is cached when it arrives.
+"""
+
 
 def get_bedrock_model_for_region(aws_region: str) -> str:
     """Get the optimal Claude Sonnet 4.5 model ID for an AWS region.
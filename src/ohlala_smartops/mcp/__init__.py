@@ -11,6 +11,7 @@ from ohlala_smartops.mcp.exceptions import (
     MCPAuthenticationError,
     MCPConnectionError,
     MCPError,
+    MCPRateLimitError,
     MCPTimeoutError,
     MCPToolNotFoundError,
 )
@@ -23,6 +24,7 @@ __all__ = [
     "MCPError",
     "MCPHTTPClient",
     "MCPManager",
+    "MCPRateLimitError",
     "MCPTimeoutError",
     "MCPToolNotFoundError",
 ]
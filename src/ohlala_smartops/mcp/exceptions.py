@@ -16,6 +16,8 @@ Example:
             logger.error(f"MCP operation timed out: {e}")
 """
 
+from ohlala_smartops.constants import MCP_RATE_LIMIT_ERROR_CODE
+
 
 class MCPError(Exception):
     """Base exception for MCP-related errors.
@@ -86,3 +88,20 @@ class MCPAuthenticationError(MCPError):
         ...
         MCPAuthenticationError: Invalid API key for MCP server
     """
+
+
+class MCPRateLimitError(MCPError):
+    """Raised when the MCP server keeps rate limiting a call after all retries.
+
+    Attributes:
+        error_code: The JSON-RPC rate limit error code, so throttlers can
+            recognize the error without matching on its message.
+
+    Example:
+        >>> raise MCPRateLimitError("JSON-RPC error -32002: Too many requests")
+        Traceback (most recent call last):
+        ...
+        MCPRateLimitError: JSON-RPC error -32002: Too many requests
+    """
+
+    error_code: int = MCP_RATE_LIMIT_ERROR_CODE
@@ -26,10 +26,12 @@ from typing import Any, Final
 import aiohttp
 
 from ohlala_smartops.config import get_settings
+from ohlala_smartops.constants import MCP_RATE_LIMIT_ERROR_CODE
 from ohlala_smartops.mcp.exceptions import (
     MCPAuthenticationError,
     MCPConnectionError,
     MCPError,
+    MCPRateLimitError,
     MCPTimeoutError,
     MCPToolNotFoundError,
 )
@@ -37,7 +39,7 @@ from ohlala_smartops.mcp.exceptions import (
 logger: Final = logging.getLogger(__name__)
 
 # JSON-RPC error codes
-_JSONRPC_RATE_LIMIT_ERROR: Final[int] = -32002
+_JSONRPC_RATE_LIMIT_ERROR: Final[int] = MCP_RATE_LIMIT_ERROR_CODE
 _JSONRPC_AUTH_ERROR: Final[int] = -32003
 _JSONRPC_METHOD_NOT_FOUND: Final[int] = -32601
 
@@ -277,7 +279,13 @@ class MCPHTTPClient:
                                     f"JSON-RPC method not found {error_code}: {error_message}"
                                 ) from None
 
-                            # Non-retryable JSON-RPC error or max retries exceeded
+                            # Rate limited on every attempt - surface it so throttlers back off
+                            if error_code == _JSONRPC_RATE_LIMIT_ERROR:
+                                raise MCPRateLimitError(
+                                    f"JSON-RPC error {error_code}: {error_message}"
+                                ) from None
+
+                            # Non-retryable JSON-RPC error
                             raise MCPError(
                                 f"JSON-RPC error {error_code}: {error_message}"
                             ) from None
@@ -40,11 +40,11 @@ from ohlala_smartops.constants import DEFAULT_MCP_AWS_API_URL, DEFAULT_MCP_AWS_K
 from ohlala_smartops.mcp.exceptions import MCPConnectionError, MCPError
 from ohlala_smartops.mcp.http_client import MCPHTTPClient
 from ohlala_smartops.utils.audit_logger import AuditLogger
-from ohlala_smartops.utils.global_throttler import (
+from ohlala_smartops.utils.circuit_breaker import (
     CircuitBreakerOpenError,
     CircuitBreakerTrippedError,
-    throttled_aws_call,
 )
+from ohlala_smartops.utils.global_throttler import throttled_aws_call
 
 logger: Final = logging.getLogger(__name__)
 
@@ -234,7 +234,7 @@ class MCPManager:
             # At this point, aws_api_client is guaranteed to be non-None due to initialization check
             assert self.aws_api_client is not None
             try:
-                async with throttled_aws_call(actual_tool_name):
+                async with throttled_aws_call(actual_tool_name, mcp_server="aws-api"):
                     result = await self.aws_api_client.call_tool(actual_tool_name, arguments)
             except (CircuitBreakerOpenError, CircuitBreakerTrippedError) as circuit_error:
                 logger.warning("Circuit breaker blocked %s: %s", actual_tool_name, circuit_error)
@@ -294,7 +294,7 @@ class MCPManager:
 
             # Apply global throttling to AWS Knowledge calls
             try:
-                async with throttled_aws_call(f"knowledge_{tool_name}"):
+                async with throttled_aws_call(f"knowledge_{tool_name}", mcp_server="aws-knowledge"):
                     result = await self.aws_knowledge_client.call_tool(tool_name, arguments)
                 return cast(dict[str, Any], result)
             except (CircuitBreakerOpenError, CircuitBreakerTrippedError) as circuit_error:
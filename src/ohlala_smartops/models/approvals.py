@@ -9,7 +9,7 @@ from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
 
 class ApprovalStatus(str, Enum):
@@ -86,11 +86,16 @@ class ApprovalRequest(BaseModel):
 
     @field_validator("expires_at")
     @classmethod
-    def validate_expiration(cls, v: datetime) -> datetime:
+    def validate_expiration(cls, v: datetime, info: ValidationInfo) -> datetime:
         """Validate that expiration is in the future.
 
+        Requests loaded from a state storage backend (validation context
+        ``{"from_storage": True}``) are accepted as stored, since they may have
+        expired in the meantime.
+
         Args:
             v: Expiration timestamp.
+            info: Validation info with the optional validation context.
 
         Returns:
             Validated expiration timestamp.
@@ -98,6 +103,8 @@ class ApprovalRequest(BaseModel):
         Raises:
             ValueError: If expiration is in the past.
         """
+        if info.context and info.context.get("from_storage"):
+            return v
         if v <= datetime.now(tz=UTC):
             raise ValueError("Expiration time must be in the future")
         return v
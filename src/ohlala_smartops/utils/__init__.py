@@ -5,30 +5,72 @@ This package provides common utilities for:
 - PowerShell command validation and fixing
 - SSM command validation and preprocessing
 - Command formatting and sanitization
-- Token estimation and cost tracking
+- Token estimation, cost tracking and per-user/per-team token quotas
+- Caching of daily AWS costs
 - AWS API throttling and rate limiting
 """
 
-from ohlala_smartops.utils.audit_logger import AuditLogger, get_audit_logger
+from ohlala_smartops.utils.audit_logger import (
+    AuditLogger,
+    AuditPipeline,
+    AuditSink,
+    get_audit_logger,
+    get_audit_pipeline,
+)
 from ohlala_smartops.utils.bedrock_throttler import (
     BedrockThrottler,
     get_bedrock_throttler,
     throttled_bedrock_call,
 )
-from ohlala_smartops.utils.global_throttler import (
+from ohlala_smartops.utils.circuit_breaker import (
+    CircuitBreaker,
     CircuitBreakerOpenError,
     CircuitBreakerTrippedError,
+)
+from ohlala_smartops.utils.cost_cache import CostCache, get_cost_cache
+from ohlala_smartops.utils.fair_share import (
+    FairShareSemaphore,
+    get_throttle_tenant,
+    throttle_tenant,
+)
+from ohlala_smartops.utils.global_throttler import (
     GlobalThrottler,
+    TokenBucket,
+    classify_operation,
     get_global_throttler,
+    is_rate_limit_error,
+    is_throttling_error_code,
     throttled_aws_call,
 )
 from ohlala_smartops.utils.powershell import (
     detect_powershell_syntax_errors,
     validate_and_fix_powershell,
 )
+from ohlala_smartops.utils.priority import (
+    PrioritySemaphore,
+    ThrottlePriority,
+    get_throttle_priority,
+    throttle_priority,
+)
+from ohlala_smartops.utils.shared_limiter import (
+    InMemoryLimiterBackend,
+    RedisLimiterBackend,
+    SharedTokenBucket,
+)
 from ohlala_smartops.utils.ssm import preprocess_ssm_commands
 from ohlala_smartops.utils.ssm_validation import fix_common_issues, validate_ssm_commands
+from ohlala_smartops.utils.token_calibration import (
+    TokenCalibrator,
+    TokenFeatures,
+    get_token_calibrator,
+)
 from ohlala_smartops.utils.token_estimator import TokenEstimator
+from ohlala_smartops.utils.token_quota import (
+    RollingWindowCounter,
+    TokenQuotaExceededError,
+    TokenQuotas,
+    get_token_quotas,
+)
 from ohlala_smartops.utils.token_tracker import (
     TokenTracker,
     check_operation_limits,
@@ -41,23 +83,50 @@ from ohlala_smartops.utils.token_tracker import (
 
 __all__ = [
     "AuditLogger",
+    "AuditPipeline",
+    "AuditSink",
     "BedrockThrottler",
+    "CircuitBreaker",
     "CircuitBreakerOpenError",
     "CircuitBreakerTrippedError",
+    "CostCache",
+    "FairShareSemaphore",
     "GlobalThrottler",
+    "InMemoryLimiterBackend",
+    "PrioritySemaphore",
+    "RedisLimiterBackend",
+    "RollingWindowCounter",
+    "SharedTokenBucket",
+    "ThrottlePriority",
+    "TokenBucket",
+    "TokenCalibrator",
     "TokenEstimator",
+    "TokenFeatures",
+    "TokenQuotaExceededError",
+    "TokenQuotas",
     "TokenTracker",
     "check_operation_limits",
+    "classify_operation",
     "detect_powershell_syntax_errors",
     "estimate_bedrock_input_tokens",
     "fix_common_issues",
     "get_audit_logger",
+    "get_audit_pipeline",
     "get_bedrock_throttler",
+    "get_cost_cache",
     "get_global_throttler",
+    "get_throttle_priority",
+    "get_throttle_tenant",
+    "get_token_calibrator",
+    "get_token_quotas",
     "get_token_tracker",
     "get_usage_report",
     "get_usage_summary",
+    "is_rate_limit_error",
+    "is_throttling_error_code",
     "preprocess_ssm_commands",
+    "throttle_priority",
+    "throttle_tenant",
     "throttled_aws_call",
     "throttled_bedrock_call",
     "track_bedrock_operation",
@@ -5,6 +5,13 @@ including command execution, MCP calls, Bedrock inference, security events,
 and write operations. Audit logs are structured JSON entries that can be
 ingested by log aggregation systems for compliance and security monitoring.
 
+Audit calls sit on the path of every MCP call, Bedrock call, command and write
+operation, so they only build the entry and put it on a bounded queue. An
+``AuditPipeline`` thread serializes queued entries and writes them in batches to
+an ``AuditSink`` (the application log, stdout, a rotating file, or memory in
+tests). When the queue is full, new entries are dropped and counted rather than
+blocking requests; ``AuditPipeline.get_stats()`` reports queue depth and drops.
+
 Example:
     >>> from ohlala_smartops.utils.audit_logger import get_audit_logger
     >>> audit_logger = get_audit_logger()
@@ -20,14 +27,20 @@ Example:
     ... )
 """
 
+import atexit
+import copy
 import json
 import logging
-from collections.abc import Callable
+import queue
+import sys
+import threading
 from datetime import UTC, datetime
 from functools import lru_cache
-from typing import Any, Final
+from pathlib import Path
+from typing import IO, Any, Final, Protocol
 
 from ohlala_smartops.config.settings import Settings, get_settings
+from ohlala_smartops.constants import AUDIT_LOG_BATCH_SIZE, AUDIT_LOG_CLOSE_TIMEOUT_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +56,380 @@ SENSITIVE_KEYS: Final[tuple[str, ...]] = (
     "access_token",
 )
 
+AuditLine = tuple[int, str]
+"""Serialized audit entry: log level and line (e.g., ``AUDIT_MCP: {...}``)."""
+
+
+class AuditSink(Protocol):
+    """Destination of serialized audit entries, written from the pipeline thread."""
+
+    def write(self, lines: list[AuditLine]) -> None:
+        """Write a batch of serialized entries."""
+        ...
+
+    def close(self) -> None:
+        """Release resources; called once after the last batch."""
+        ...
+
+
+class LoggingAuditSink:
+    """Writes audit entries to the application log at their level."""
+
+    def write(self, lines: list[AuditLine]) -> None:
+        for level, line in lines:
+            if level >= logging.CRITICAL:
+                logger.critical(line)
+            elif level >= logging.WARNING:
+                logger.warning(line)
+            else:
+                logger.info(line)
+
+    def close(self) -> None:
+        pass
+
+
+class StreamAuditSink:
+    """Writes audit entries to a text stream (stdout by default), one per line."""
+
+    def __init__(self, stream: IO[str] | None = None) -> None:
+        """Initialize the sink.
+
+        Args:
+            stream: Stream to write to. Defaults to sys.stdout at write time.
+        """
+        self._stream = stream
+
+    def write(self, lines: list[AuditLine]) -> None:
+        stream = self._stream or sys.stdout
+        stream.write("".join(f"{line}\n" for _, line in lines))
+        stream.flush()
+
+    def close(self) -> None:
+        pass
+
+
+class RotatingFileAuditSink:
+    """Appends audit entries to a file, rotating it when it grows too large.
+
+    Rotated files are renamed ``audit.log.1``, ``audit.log.2``, ... with
+    ``.1`` the most recent, and the oldest beyond ``backup_count`` is deleted.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int, backup_count: int) -> None:
+        """Initialize the sink, creating the file's directory if needed.
+
+        Args:
+            path: Audit log file.
+            max_bytes: Size at which the file is rotated before a batch is written.
+            backup_count: Rotated files kept (0 truncates the file instead).
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: IO[str] | None = None
+
+    def _open(self) -> IO[str]:
+        if self._file is None:
+            self._file = self.path.open("a", encoding="utf-8")
+        return self._file
+
+    def _rotate(self) -> None:
+        self.close()
+        if self.backup_count == 0:
+            self.path.unlink(missing_ok=True)
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{index}")
+            if source.exists():
+                source.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+        self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+
+    def write(self, lines: list[AuditLine]) -> None:
+        data = "".join(f"{line}\n" for _, line in lines)
+        file = self._open()
+        if file.tell() > 0 and file.tell() + len(data.encode()) > self.max_bytes:
+            self._rotate()
+            file = self._open()
+        file.write(data)
+        file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class MemoryAuditSink:
+    """Keeps audit entries in memory (for tests)."""
+
+    def __init__(self) -> None:
+        self.lines: list[AuditLine] = []
+        self.batches = 0
+
+    def write(self, lines: list[AuditLine]) -> None:
+        self.lines.extend(lines)
+        self.batches += 1
+
+    def close(self) -> None:
+        pass
+
+    @property
+    def entries(self) -> list[dict[str, Any]]:
+        """Audit entries written so far, parsed back from their lines."""
+        return [json.loads(line.split(": ", 1)[1]) for _, line in self.lines]
+
+
+_QueuedEntry = tuple[str, int, dict[str, Any]]
+
+
+class AuditPipeline:
+    """Bounded queue of audit entries drained in batches by a background thread.
+
+    ``submit`` is non-blocking and costs a queue put; serialization and sink I/O
+    happen on the pipeline thread, which is started by the first submitted entry
+    so that a pipeline with auditing disabled never runs one. When the queue is
+    full, new entries are dropped and counted, with a warning when a run of drops
+    starts.
+    """
+
+    def __init__(
+        self,
+        sink: AuditSink,
+        queue_size: int = 10_000,
+        batch_size: int = AUDIT_LOG_BATCH_SIZE,
+    ) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            sink: Destination of serialized entries.
+            queue_size: Entries queued before new entries are dropped.
+                Defaults to 10000.
+            batch_size: Maximum entries per sink write. Defaults to 256.
+        """
+        self.sink = sink
+        self.batch_size = batch_size
+        self._queue: queue.Queue[_QueuedEntry | None] = queue.Queue(maxsize=queue_size)
+        self._closed = False
+        self._dropping = False
+
+        # Metrics
+        self._submitted = 0
+        self._dropped = 0
+        self._written = 0
+        self._batches = 0
+        self._sink_errors = 0
+        self._serialize_errors = 0
+        self._max_queue_depth = 0
+
+        self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+        self._start_lock = threading.Lock()
+
+    def submit(self, log_prefix: str, level: int, audit_entry: dict[str, Any]) -> bool:
+        """Queue an entry for writing without blocking.
+
+        Args:
+            log_prefix: Prefix of the written line (e.g., "AUDIT_MCP").
+            level: Log level of the entry.
+            audit_entry: Structured audit entry. Must not be modified afterwards.
+
+        Returns:
+            True if queued, False if dropped because the queue is full or the
+            pipeline is closed.
+        """
+        if self._closed:
+            self._dropped += 1
+            return False
+        if self._thread.ident is None:
+            with self._start_lock:
+                if self._closed:
+                    self._dropped += 1
+                    return False
+                if self._thread.ident is None:
+                    self._thread.start()
+        try:
+            self._queue.put_nowait((log_prefix, level, audit_entry))
+        except queue.Full:
+            self._dropped += 1
+            if not self._dropping:
+                self._dropping = True
+                logger.warning(
+                    f"Audit log queue full ({self._queue.maxsize} entries), dropping entries"
+                )
+            return False
+
+        self._submitted += 1
+        self._max_queue_depth = max(self._max_queue_depth, self._queue.qsize())
+        return True
+
+    def flush(self) -> None:
+        """Block until every queued entry has been written."""
+        self._queue.join()
+
+    def close(self, timeout: float = AUDIT_LOG_CLOSE_TIMEOUT_SECONDS) -> None:
+        """Write queued entries, then stop the thread and close the sink.
+
+        Entries submitted after closing are dropped. Safe to call more than once.
+
+        Args:
+            timeout: Seconds to wait for queued entries. Defaults to 10.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        with self._start_lock:
+            if self._thread.ident is None:
+                self.sink.close()
+                return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning(
+                f"Audit log writer did not finish within {timeout}s, "
+                f"{self._queue.qsize()} entries may be lost"
+            )
+            return
+        self.sink.close()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.task_done()
+                    stopping = True
+                    break
+                batch.append(item)
+
+            try:
+                self._write(batch)
+            except Exception as e:
+                logger.error(f"Unexpected error writing audit entries: {e}", exc_info=True)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, batch: list[_QueuedEntry]) -> None:
+        lines: list[tuple[int, str]] = []
+        for log_prefix, level, audit_entry in batch:
+            try:
+                lines.append((level, f"{log_prefix}: {json.dumps(audit_entry, default=str)}"))
+            except Exception as e:
+                # A bad entry (non-string keys, circular references) must not stop the writer
+                self._serialize_errors += 1
+                logger.error(f"Failed to serialize {log_prefix} audit entry: {e}")
+
+        if lines:
+            try:
+                self.sink.write(lines)
+                self._written += len(lines)
+                self._batches += 1
+            except Exception as e:
+                self._sink_errors += 1
+                logger.error(f"Failed to write {len(lines)} audit entries: {e}")
+        if self._dropping and self._queue.qsize() < self._queue.maxsize // 2:
+            self._dropping = False
+            logger.info(f"Audit log queue recovered, {self._dropped} entries dropped so far")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get pipeline statistics for monitoring.
+
+        Returns:
+            Dictionary with sink type, queue depth and capacity, highest depth
+            seen, and counts of submitted, written and dropped entries, batches,
+            sink errors and entries that could not be serialized.
+        """
+        return {
+            "sink": type(self.sink).__name__,
+            "queue_depth": self._queue.qsize(),
+            "queue_size": self._queue.maxsize,
+            "max_queue_depth": self._max_queue_depth,
+            "submitted": self._submitted,
+            "written": self._written,
+            "dropped": self._dropped,
+            "batches": self._batches,
+            "sink_errors": self._sink_errors,
+            "serialize_errors": self._serialize_errors,
+        }
+
+
+def create_audit_sink(settings: Settings) -> AuditSink:
+    """Create the audit sink configured in settings.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        Sink for the configured ``audit_log_sink``.
+    """
+    if settings.audit_log_sink == "stdout":
+        return StreamAuditSink()
+    if settings.audit_log_sink == "file":
+        return RotatingFileAuditSink(
+            settings.audit_log_file,
+            max_bytes=settings.audit_log_file_max_bytes,
+            backup_count=settings.audit_log_file_backup_count,
+        )
+    return LoggingAuditSink()
+
+
+# Global instance and the sink settings it was created with
+_audit_pipeline: AuditPipeline | None = None
+_audit_pipeline_config: tuple[Any, ...] | None = None
+
+
+def _pipeline_config(settings: Settings) -> tuple[Any, ...]:
+    return (
+        settings.audit_log_sink,
+        settings.audit_log_file,
+        settings.audit_log_file_max_bytes,
+        settings.audit_log_file_backup_count,
+        settings.audit_log_queue_size,
+    )
+
+
+def get_audit_pipeline(settings: Settings | None = None) -> AuditPipeline:
+    """Get the global audit pipeline singleton instance.
+
+    The pipeline is closed at interpreter exit so that queued entries are written.
+
+    Args:
+        settings: Settings used to create the pipeline, or checked against the
+            existing one. If None, uses get_settings().
+
+    Returns:
+        The global AuditPipeline instance, creating it if necessary.
+
+    Raises:
+        ValueError: If the pipeline was created with different sink or queue
+            settings. Pass an AuditPipeline to AuditLogger to use other settings.
+    """
+    global _audit_pipeline, _audit_pipeline_config  # noqa: PLW0603
+    settings = settings or get_settings()
+    config = _pipeline_config(settings)
+    if _audit_pipeline is None:
+        _audit_pipeline = AuditPipeline(
+            create_audit_sink(settings), queue_size=settings.audit_log_queue_size
+        )
+        _audit_pipeline_config = config
+        atexit.register(_audit_pipeline.close)
+    elif config != _audit_pipeline_config:
+        raise ValueError(
+            f"Audit pipeline already created with sink settings {_audit_pipeline_config}, "
+            f"got {config}"
+        )
+    return _audit_pipeline
+
 
 class AuditLogger:
     """Centralized audit logging for all bot operations.
@@ -55,17 +442,27 @@ class AuditLogger:
         enabled: Whether audit logging is enabled.
         include_pii: Whether to include PII in audit logs.
         settings: Application settings instance.
+        pipeline: Pipeline writing the entries in the background.
     """
 
-    def __init__(self, settings: Settings | None = None) -> None:
+    def __init__(
+        self, settings: Settings | None = None, pipeline: AuditPipeline | None = None
+    ) -> None:
         """Initialize the audit logger.
 
         Args:
             settings: Application settings. If None, uses get_settings().
+            pipeline: Pipeline writing the entries. If None, uses the global
+                pipeline from get_audit_pipeline().
         """
         self.settings = settings or get_settings()
         self.enabled = self.settings.enable_audit_logging
         self.include_pii = self.settings.audit_log_include_pii
+        self.pipeline = pipeline or get_audit_pipeline(self.settings)
+
+    def flush(self) -> None:
+        """Block until every audit entry logged so far has been written."""
+        self.pipeline.flush()
 
     def log_command_execution(
         self,
@@ -222,7 +619,7 @@ class AuditLogger:
             "execution_time_ms": execution_time_ms,
         }
 
-        logger.info(f"AUDIT_BEDROCK: {json.dumps(audit_entry)}")
+        self._emit_audit_log("AUDIT_BEDROCK", audit_entry)
 
     def log_security_event(
         self,
@@ -264,15 +661,14 @@ class AuditLogger:
         }
 
         # Map severity to appropriate log level
-        log_func: Callable[[str], None]
         if severity == "critical":
-            log_func = logger.critical
+            level = logging.CRITICAL
         elif severity == "warning":
-            log_func = logger.warning
+            level = logging.WARNING
         else:
-            log_func = logger.info
+            level = logging.INFO
 
-        log_func(f"AUDIT_SECURITY: {json.dumps(audit_entry)}")
+        self.pipeline.submit("AUDIT_SECURITY", level, audit_entry)
 
     def log_write_operation(
         self,
@@ -323,7 +719,7 @@ class AuditLogger:
             "confirmed": confirmed,
         }
 
-        logger.info(f"AUDIT_WRITE: {json.dumps(audit_entry)}")
+        self._emit_audit_log("AUDIT_WRITE", audit_entry)
 
     def _sanitize_arguments(self, arguments: dict[str, Any]) -> dict[str, Any]:
         """Remove or redact sensitive information from arguments.
@@ -335,10 +731,11 @@ class AuditLogger:
             arguments: Dictionary potentially containing sensitive data.
 
         Returns:
-            Sanitized dictionary with sensitive values redacted.
+            Sanitized copy with sensitive values redacted. The entry is written
+            later by the pipeline thread, so nothing is shared with the caller.
         """
         if self.include_pii:
-            return arguments
+            return copy.deepcopy(arguments)
 
         sanitized: dict[str, Any] = {}
 
@@ -352,12 +749,16 @@ class AuditLogger:
             elif isinstance(value, list) and value and isinstance(value[0], dict):
                 # Sanitize list of dictionaries
                 sanitized[key] = [
-                    self._sanitize_arguments(item) if isinstance(item, dict) else item
+                    (
+                        self._sanitize_arguments(item)
+                        if isinstance(item, dict)
+                        else copy.deepcopy(item)
+                    )
                     for item in value
                 ]
             else:
-                # Keep other values as-is (primitives, lists of IDs, etc.)
-                sanitized[key] = value
+                # Keep other values (primitives, lists of IDs, etc.)
+                sanitized[key] = copy.deepcopy(value)
 
         return sanitized
 
@@ -367,19 +768,19 @@ class AuditLogger:
         audit_entry: dict[str, Any],
         success: bool = True,
     ) -> None:
-        """Emit an audit log entry at the appropriate level.
+        """Queue an audit log entry at the appropriate level.
+
+        Failed operations are written at warning level with a ``_FAILED`` prefix.
 
         Args:
             log_prefix: Prefix for the log message.
             audit_entry: Structured audit entry to log.
             success: Whether the operation was successful.
         """
-        log_message = f"{log_prefix}: {json.dumps(audit_entry)}"
-
         if success:
-            logger.info(log_message)
+            self.pipeline.submit(log_prefix, logging.INFO, audit_entry)
         else:
-            logger.warning(f"{log_prefix}_FAILED: {json.dumps(audit_entry)}")
+            self.pipeline.submit(f"{log_prefix}_FAILED", logging.WARNING, audit_entry)
 
 
 @lru_cache
@@ -3,6 +3,12 @@
 This module provides rate limiting and concurrency control for AWS Bedrock API calls
 to prevent throttling errors. It implements a token bucket algorithm combined with
 semaphore-based concurrency limiting.
+
+Concurrency slots are shared fairly between tenants (Teams teams), see
+``ohlala_smartops.utils.fair_share``, and handed out by priority class (interactive,
+background, bulk) within a tenant, see ``ohlala_smartops.utils.priority``. With
+``THROTTLE_REDIS_URL`` set, the rate limit applies across all bot replicas, see
+``ohlala_smartops.utils.shared_limiter``.
 """
 
 import asyncio
@@ -13,6 +19,19 @@ from collections.abc import AsyncGenerator
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from typing import Any, Final
 
+from ohlala_smartops.utils.fair_share import (
+    FairShareSemaphore,
+    TenantWaitStats,
+    get_throttle_tenant,
+    load_tenant_weights,
+)
+from ohlala_smartops.utils.priority import (
+    PriorityWaitStats,
+    ThrottlePriority,
+    get_throttle_priority,
+)
+from ohlala_smartops.utils.shared_limiter import SharedTokenBucket, get_shared_limiter_backend
+
 logger: Final = logging.getLogger(__name__)
 
 
@@ -27,6 +46,15 @@ class BedrockThrottler:
     - MAX_CONCURRENT_BEDROCK_CALLS: Maximum concurrent API calls (default: 2)
     - BEDROCK_API_RATE_LIMIT: Tokens per second (default: 0.5)
     - BEDROCK_API_MAX_TOKENS: Maximum token bucket size (default: 5)
+    - BEDROCK_TENANT_MAX_CONCURRENT: Maximum concurrent calls per tenant, 0 for no cap
+      (default: 0)
+    - THROTTLE_TENANT_WEIGHTS: JSON fair-share weights per tenant (default: every
+      tenant weighs 1.0)
+    - THROTTLE_REDIS_URL: Redis URL of the token bucket shared between replicas
+      (default: unset, limits apply per process)
+    - BEDROCK_SHARED_LEASE_SIZE: Tokens leased from the shared bucket per round
+      trip (default: 1)
+    - THROTTLE_LEASE_TTL: Seconds a lease of shared tokens stays usable (default: 1.0)
     """
 
     def __init__(self) -> None:
@@ -36,15 +64,36 @@ class BedrockThrottler:
         self.tokens_per_second = float(os.getenv("BEDROCK_API_RATE_LIMIT", "0.5"))
         self.max_tokens = int(os.getenv("BEDROCK_API_MAX_TOKENS", "5"))
 
+        # Per-tenant fair-share configuration
+        self.tenant_weights = load_tenant_weights()
+        self.tenant_max_concurrent = int(os.getenv("BEDROCK_TENANT_MAX_CONCURRENT", "0"))
+
         # Internal state
-        self._semaphore = asyncio.Semaphore(self.max_concurrent_calls)
+        self._semaphore = FairShareSemaphore(
+            self.max_concurrent_calls, self.tenant_weights, self.tenant_max_concurrent
+        )
         self._tokens = float(self.max_tokens)
         self._last_refill = time.time()
         self._token_lock = asyncio.Lock()
 
+        # Shared (multi-replica) rate limiting - small leases, Bedrock rates are low
+        backend = get_shared_limiter_backend()
+        self._shared = (
+            SharedTokenBucket(
+                backend,
+                "bedrock",
+                lease_size=int(os.getenv("BEDROCK_SHARED_LEASE_SIZE", "1")),
+                lease_ttl=float(os.getenv("THROTTLE_LEASE_TTL", "1.0")),
+            )
+            if backend is not None
+            else None
+        )
+
         # Metrics
         self._total_requests = 0
         self._throttled_requests = 0
+        self._priority_stats = PriorityWaitStats()
+        self._tenant_stats = TenantWaitStats()
 
         logger.info(
             f"Bedrock throttler initialized: {self.max_concurrent_calls} concurrent, "
@@ -99,7 +148,10 @@ class BedrockThrottler:
 
     @asynccontextmanager
     async def throttled_bedrock_request(
-        self, operation_name: str = "bedrock_call"
+        self,
+        operation_name: str = "bedrock_call",
+        priority: ThrottlePriority | None = None,
+        tenant: str | None = None,
     ) -> AsyncGenerator[None]:
         """Context manager for throttled Bedrock API requests.
 
@@ -109,6 +161,10 @@ class BedrockThrottler:
 
         Args:
             operation_name: Name of the operation for logging purposes. Defaults to "bedrock_call".
+            priority: Priority class ("interactive", "background" or "bulk").
+                Defaults to the current context's priority (see throttle_priority).
+            tenant: Tenant the call is made for. Defaults to the current
+                context's tenant (see throttle_tenant).
 
         Yields:
             None. The context manager handles throttling transparently.
@@ -123,12 +179,20 @@ class BedrockThrottler:
             ...     result = await bedrock_client.call()
         """
         self._total_requests += 1
+        priority = priority or get_throttle_priority()
+        tenant = tenant or get_throttle_tenant()
+        requested_at = asyncio.get_running_loop().time()
 
         try:
             # Acquire semaphore for concurrency limiting
-            async with self._semaphore:
-                # Wait for token bucket
+            async with self._semaphore.hold(priority, tenant):
+                # Wait for token bucket, and the replica-shared one if configured
                 await self._wait_for_token()
+                if self._shared is not None:
+                    await self._shared.acquire(1, self.tokens_per_second, self.max_tokens)
+                waited = asyncio.get_running_loop().time() - requested_at
+                self._priority_stats.record(priority, waited)
+                self._tenant_stats.record(tenant, waited)
 
                 logger.debug(
                     f"Bedrock throttler: allowing {operation_name} (tokens: {self._tokens:.1f})"
@@ -166,6 +230,11 @@ class BedrockThrottler:
             - current_tokens: Current number of tokens in the bucket
             - max_concurrent_calls: Maximum concurrent calls allowed
             - tokens_per_second: Rate of token refill
+            - shared: Lease statistics of the replica-shared bucket, None when
+              limits apply per process
+            - priorities: Admitted requests and queue wait per priority class
+            - tenants: Admitted requests, queue wait, held slots and queued calls
+              per tenant
 
         Example:
             >>> throttler = BedrockThrottler()
@@ -178,6 +247,9 @@ class BedrockThrottler:
             "current_tokens": round(self._tokens, 2),
             "max_concurrent_calls": self.max_concurrent_calls,
             "tokens_per_second": self.tokens_per_second,
+            "shared": self._shared.get_stats() if self._shared is not None else None,
+            "priorities": self._priority_stats.get_stats(),
+            "tenants": self._tenant_stats.get_stats(self._semaphore),
         }
 
 
@@ -203,11 +275,16 @@ def get_bedrock_throttler() -> BedrockThrottler:
 
 def throttled_bedrock_call(
     operation_name: str = "bedrock_call",
+    priority: ThrottlePriority | None = None,
+    tenant: str | None = None,
 ) -> AbstractAsyncContextManager[None]:
     """Convenience context manager for throttled Bedrock API calls.
 
     Args:
         operation_name: Name of the operation for logging. Defaults to "bedrock_call".
+        priority: Priority class ("interactive", "background" or "bulk").
+            Defaults to the current context's priority.
+        tenant: Tenant the call is made for. Defaults to the current context's tenant.
 
     Returns:
         Async context manager for throttled Bedrock requests.
@@ -217,4 +294,4 @@ def throttled_bedrock_call(
         ...     result = await bedrock_client.call()
     """
     throttler = get_bedrock_throttler()
-    return throttler.throttled_bedrock_request(operation_name)
+    return throttler.throttled_bedrock_request(operation_name, priority, tenant)
@@ -0,0 +1,253 @@
+"""Circuit breakers with a rolling error-rate window and half-open probing.
+
+A breaker guards one dependency (an AWS service such as Cost Explorer, or an MCP
+server) so that an outage makes calls to that dependency fail fast without
+affecting the others:
+
+- closed: calls pass. The breaker opens when, within the rolling window, at
+  least ``min_requests`` calls completed and the share of failures reached
+  ``error_rate_threshold``.
+- open: calls are rejected with ``CircuitBreakerOpenError`` until
+  ``open_timeout`` seconds have passed.
+- half-open: up to ``half_open_probes`` probe calls are admitted at a time. The
+  breaker closes once that many probes in a row succeed, and opens again as soon
+  as one fails.
+
+Example:
+    >>> breaker = CircuitBreaker("ce", min_requests=20, error_rate_threshold=0.5)
+    >>> probe = breaker.admit()
+    >>> try:
+    ...     result = await get_cost_and_usage()
+    ... except Exception:
+    ...     breaker.record_failure(probe)
+    ...     raise
+    >>> breaker.record_success(probe)
+"""
+
+import logging
+import time
+from collections import deque
+from typing import Any, Final, Literal
+
+logger: Final = logging.getLogger(__name__)
+
+CircuitState = Literal["closed", "open", "half_open"]
+"""State of a circuit breaker."""
+
+
+class CircuitBreakerOpenError(Exception):
+    """Raised when circuit breaker is open and blocking requests.
+
+    This exception indicates that the circuit breaker is currently open
+    due to a recent trip, and requests are being blocked until the timeout expires.
+    """
+
+
+class CircuitBreakerTrippedError(Exception):
+    """Raised when circuit breaker trips due to too many failures.
+
+    This exception is raised when the error rate in the rolling window reaches
+    the configured threshold, or a half-open probe fails, opening the breaker.
+    """
+
+
+class CircuitBreaker:
+    """Circuit breaker for one dependency, driven by its recent error rate."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        min_requests: int = 100,
+        error_rate_threshold: float = 0.5,
+        window_seconds: float = 60.0,
+        open_timeout: float = 10.0,
+        half_open_probes: int = 3,
+    ) -> None:
+        """Initialize a closed breaker.
+
+        Args:
+            name: Breaker name used in logs and statistics (e.g., "ce", "mcp:aws-api").
+            min_requests: Minimum calls in the window before the breaker can open.
+                Defaults to 100.
+            error_rate_threshold: Share of failed calls in the window that opens
+                the breaker. Defaults to 0.5.
+            window_seconds: Length of the rolling window. Defaults to 60.0.
+            open_timeout: Seconds the breaker stays open before probing. Defaults to 10.0.
+            half_open_probes: Concurrent probes admitted while half-open, and
+                successful probes needed to close. Defaults to 3.
+        """
+        self.name = name
+        self.min_requests = min_requests
+        self.error_rate_threshold = error_rate_threshold
+        self.window_seconds = window_seconds
+        self.open_timeout = open_timeout
+        self.half_open_probes = half_open_probes
+
+        self._state: CircuitState = "closed"
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+
+        # Metrics
+        self._trips = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open breaker turns half-open once its timeout has passed."""
+        if self._state == "open" and time.monotonic() - self._opened_at >= self.open_timeout:
+            self._state = "half_open"
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+            logger.info(f"Circuit breaker {self.name} half-open - admitting probe requests")
+        return self._state
+
+    def _evict(self, now: float) -> None:
+        """Drop outcomes that have left the rolling window."""
+        cutoff = now - self.window_seconds
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            _, failed = self._outcomes.popleft()
+            self._failures -= failed
+
+    def _record(self, failed: bool) -> None:
+        """Add an outcome to the rolling window."""
+        now = time.monotonic()
+        self._evict(now)
+        self._outcomes.append((now, failed))
+        self._failures += failed
+
+    def _open(self, reason: str) -> None:
+        """Open the breaker and start the open timeout."""
+        self._state = "open"
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self._failures = 0
+        self._trips += 1
+        logger.warning(
+            f"Circuit breaker {self.name} TRIPPED ({reason}). "
+            f"Blocking requests for {self.open_timeout}s"
+        )
+
+    def _close(self) -> None:
+        """Close the breaker with an empty window."""
+        self._state = "closed"
+        self._outcomes.clear()
+        self._failures = 0
+        self._probes_in_flight = 0
+        logger.info(f"Circuit breaker {self.name} closed - allowing requests")
+
+    def admit(self) -> bool:
+        """Check whether a call may proceed.
+
+        Returns:
+            True if the call is a half-open probe, False for a regular call.
+            Pass the value to ``record_success``, ``record_failure`` or
+            ``release_probe`` when the call completes.
+
+        Raises:
+            CircuitBreakerOpenError: If the breaker is open, or half-open with
+                all probe slots taken.
+        """
+        state = self.state
+        if state == "closed":
+            return False
+
+        if state == "half_open" and self._probes_in_flight < self.half_open_probes:
+            self._probes_in_flight += 1
+            return True
+
+        self._rejected += 1
+        if state == "open":
+            remaining = self.open_timeout - (time.monotonic() - self._opened_at)
+            raise CircuitBreakerOpenError(
+                f"Circuit breaker open for {self.name}, retry in {remaining:.1f}s"
+            )
+        raise CircuitBreakerOpenError(
+            f"Circuit breaker half-open for {self.name}, probes in progress"
+        )
+
+    def record_success(self, probe: bool = False) -> None:
+        """Record a successful call.
+
+        Args:
+            probe: Value returned by ``admit`` for the call.
+        """
+        if probe:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if self._state == "half_open":
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_probes:
+                    self._close()
+        elif self._state == "closed":
+            self._record(failed=False)
+
+    def record_failure(self, probe: bool = False) -> bool:
+        """Record a failed call, opening the breaker if needed.
+
+        Args:
+            probe: Value returned by ``admit`` for the call.
+
+        Returns:
+            True if this failure opened the breaker.
+        """
+        if probe:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if self._state == "half_open":
+                self._open("half-open probe failed")
+                return True
+            return False
+
+        if self._state != "closed":
+            return False
+
+        self._record(failed=True)
+        requests = len(self._outcomes)
+        if requests >= self.min_requests and (
+            self._failures / requests >= self.error_rate_threshold
+        ):
+            self._open(
+                f"{self._failures}/{requests} calls failed in the last {self.window_seconds:.0f}s"
+            )
+            return True
+        return False
+
+    def release_probe(self, probe: bool) -> None:
+        """Free a probe slot for a call whose outcome says nothing about health.
+
+        Args:
+            probe: Value returned by ``admit`` for the call.
+        """
+        if probe:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def reset(self) -> None:
+        """Force the breaker closed (for admin use)."""
+        self._close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get breaker statistics for monitoring.
+
+        Returns:
+            Dictionary with state, calls and failures in the rolling window,
+            error rate, seconds until probing (while open), number of trips and
+            number of rejected calls.
+        """
+        state = self.state
+        self._evict(time.monotonic())
+        requests = len(self._outcomes)
+        return {
+            "state": state,
+            "window_requests": requests,
+            "window_failures": self._failures,
+            "error_rate": round(self._failures / requests, 3) if requests else 0.0,
+            "retry_after_seconds": (
+                round(max(0.0, self.open_timeout - (time.monotonic() - self._opened_at)), 1)
+                if state == "open"
+                else 0.0
+            ),
+            "trips": self._trips,
+            "rejected": self._rejected,
+        }
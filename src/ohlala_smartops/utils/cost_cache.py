@@ -0,0 +1,284 @@
+"""Local store of daily Cost Explorer costs, filled incrementally.
+
+Cost Explorer figures for a day keep changing for a few days while usage is
+billed, then never change again. Every ``/costs`` invocation used to query the
+whole period, paying for a Cost Explorer request (and its latency) for data that
+was already known.
+
+``CostCache`` keeps daily amounts in SQLite keyed by scope (e.g., "ec2" or an
+instance ID), day, metric and group, with an estimated flag. Callers ask for the
+days of a period that need fetching: days never seen, and estimated days (recent
+or flagged ``Estimated`` by Cost Explorer) last fetched more than
+``COST_CACHE_ESTIMATED_TTL_SECONDS`` ago. Settled days are served from the cache
+forever. Forecasts are kept per scope and period until the next UTC day.
+
+With ``cost_cache_path`` unset the database lives in memory for the life of the
+process; set it to keep costs across restarts.
+
+Example:
+    >>> cache = get_cost_cache()
+    >>> days = cache.missing_days("ec2", "UnblendedCost", period_days)
+    >>> ...  # fetch from min(days), then
+    >>> cache.put_daily("ec2", "UnblendedCost", fetched_days, today=today)
+    >>> cache.get_daily("ec2", "UnblendedCost", period_days[0], period_days[-1])
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Final
+
+from ohlala_smartops.config.settings import Settings, get_settings
+from ohlala_smartops.constants import COST_CACHE_ESTIMATED_TTL_SECONDS, COST_CACHE_SETTLE_DAYS
+
+logger: Final = logging.getLogger(__name__)
+
+_SCHEMA: Final = """
+CREATE TABLE IF NOT EXISTS daily_costs (
+    scope TEXT NOT NULL,
+    day TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    group_key TEXT NOT NULL,
+    amount TEXT NOT NULL,
+    estimated INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (scope, metric, group_key, day)
+);
+
+CREATE TABLE IF NOT EXISTS forecasts (
+    scope TEXT NOT NULL,
+    period TEXT NOT NULL,
+    day TEXT NOT NULL,
+    data TEXT,
+    PRIMARY KEY (scope, period)
+);
+"""
+"""Tables of CostCache. Amounts are decimal strings, days ISO dates (UTC)."""
+
+
+class CostCache:
+    """SQLite store of daily costs and forecasts per scope.
+
+    Methods are synchronous and thread-safe; call them with ``asyncio.to_thread``
+    from async code when the database is a file.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        settle_days: int = COST_CACHE_SETTLE_DAYS,
+        estimated_ttl: float = COST_CACHE_ESTIMATED_TTL_SECONDS,
+    ) -> None:
+        """Open (creating if needed) the cost database.
+
+        Args:
+            path: Database file path, or ":memory:" for a per-process cache.
+                Defaults to ":memory:".
+            settle_days: Days after which Cost Explorer no longer revises a
+                day's cost. Days this recent are stored as estimated. Defaults to 3.
+            estimated_ttl: Seconds an estimated day is served before it is
+                fetched again. Defaults to 21600 (6 hours).
+        """
+        self.path = path
+        self.settle_days = settle_days
+        self.estimated_ttl = estimated_ttl
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA busy_timeout=5000")
+        self._connection.executescript(_SCHEMA)
+
+        # Metrics
+        self._days_served = 0
+        self._days_fetched = 0
+        logger.info(f"Initialized cost cache at {path}")
+
+    def missing_days(
+        self, scope: str, metric: str, days: Sequence[date], group: str = ""
+    ) -> list[date]:
+        """Get the days of a period whose cost has to be fetched.
+
+        Args:
+            scope: Whose costs (e.g., "ec2" for all instances, or an instance ID).
+            metric: Cost metric (e.g., "UnblendedCost").
+            days: Days of the period.
+            group: Group of a grouped query (e.g., a usage type). Defaults to "".
+
+        Returns:
+            Days not cached, or cached as estimated longer than the TTL ago.
+        """
+        if not days:
+            return []
+        stale_before = time.time() - self.estimated_ttl
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT day FROM daily_costs WHERE scope = ? AND metric = ? AND group_key = ? "
+                "AND day BETWEEN ? AND ? AND (estimated = 0 OR fetched_at >= ?)",
+                (scope, metric, group, min(days).isoformat(), max(days).isoformat(), stale_before),
+            ).fetchall()
+        fresh = {row[0] for row in rows}
+        missing = [day for day in days if day.isoformat() not in fresh]
+        self._days_served += len(days) - len(missing)
+        return missing
+
+    def get_daily(
+        self, scope: str, metric: str, start: date, end: date, group: str = ""
+    ) -> dict[date, Decimal]:
+        """Get cached daily costs.
+
+        Args:
+            scope: Whose costs.
+            metric: Cost metric.
+            start: First day (inclusive).
+            end: Last day (inclusive).
+            group: Group of a grouped query. Defaults to "".
+
+        Returns:
+            Mapping of day to cost for the cached days of the range.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT day, amount FROM daily_costs WHERE scope = ? AND metric = ? "
+                "AND group_key = ? AND day BETWEEN ? AND ? ORDER BY day",
+                (scope, metric, group, start.isoformat(), end.isoformat()),
+            ).fetchall()
+        return {date.fromisoformat(day): Decimal(amount) for day, amount in rows}
+
+    def put_daily(
+        self,
+        scope: str,
+        metric: str,
+        costs: Iterable[tuple[date, Decimal, bool]],
+        today: date,
+        group: str = "",
+    ) -> None:
+        """Store fetched daily costs, replacing earlier values of the same days.
+
+        Args:
+            scope: Whose costs.
+            metric: Cost metric.
+            costs: Day, cost and whether Cost Explorer marked it ``Estimated``.
+            today: Current UTC day. Days within ``settle_days`` of it are
+                stored as estimated whatever Cost Explorer said.
+            group: Group of a grouped query. Defaults to "".
+        """
+        now = time.time()
+        settled_before = today - timedelta(days=self.settle_days)
+        rows = [
+            (
+                scope,
+                day.isoformat(),
+                metric,
+                group,
+                str(amount),
+                estimated or day >= settled_before,
+                now,
+            )
+            for day, amount, estimated in costs
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO daily_costs "
+                "(scope, day, metric, group_key, amount, estimated, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        self._days_fetched += len(rows)
+
+    def get_forecast(
+        self, scope: str, period: str, today: date
+    ) -> tuple[bool, dict[str, Any] | None]:
+        """Get the forecast cached today for a scope and period.
+
+        Args:
+            scope: Whose costs.
+            period: Period the forecast was fetched with (e.g., "month").
+            today: Current UTC day.
+
+        Returns:
+            Whether a forecast was cached today, and the forecast (None if
+            Cost Explorer had none). The amount is a Decimal.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM forecasts WHERE scope = ? AND period = ? AND day = ?",
+                (scope, period, today.isoformat()),
+            ).fetchone()
+        if row is None:
+            return False, None
+        forecast: dict[str, Any] | None = json.loads(row[0]) if row[0] else None
+        if forecast and "amount" in forecast:
+            forecast["amount"] = Decimal(forecast["amount"])
+        return True, forecast
+
+    def put_forecast(
+        self, scope: str, period: str, today: date, forecast: dict[str, Any] | None
+    ) -> None:
+        """Cache a forecast until the next UTC day.
+
+        Args:
+            scope: Whose costs.
+            period: Period the forecast was fetched with.
+            today: Current UTC day.
+            forecast: Forecast to cache, or None to record that there was none.
+        """
+        data = json.dumps(forecast, default=str) if forecast else None
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO forecasts (scope, period, day, data) VALUES (?, ?, ?, ?)",
+                (scope, period, today.isoformat(), data),
+            )
+
+    def clear(self) -> None:
+        """Delete all cached costs and forecasts."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM daily_costs")
+            self._connection.execute("DELETE FROM forecasts")
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics for monitoring.
+
+        Returns:
+            Dictionary with the database path, cached days, days served from
+            the cache and days fetched from Cost Explorer.
+        """
+        with self._lock:
+            (cached_days,) = self._connection.execute("SELECT COUNT(*) FROM daily_costs").fetchone()
+        return {
+            "path": self.path,
+            "cached_days": cached_days,
+            "days_served": self._days_served,
+            "days_fetched": self._days_fetched,
+        }
+
+
+# Global instance
+_cost_cache: CostCache | None = None
+
+
+def get_cost_cache(settings: Settings | None = None) -> CostCache:
+    """Get the global cost cache singleton instance.
+
+    Args:
+        settings: Settings used when creating the cache. If None, uses
+            get_settings().
+
+    Returns:
+        The global CostCache instance, creating it if necessary.
+    """
+    global _cost_cache  # noqa: PLW0603
+    if _cost_cache is None:
+        settings = settings or get_settings()
+        _cost_cache = CostCache(settings.cost_cache_path or ":memory:")
+    return _cost_cache
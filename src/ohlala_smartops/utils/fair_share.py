@@ -0,0 +1,452 @@
+"""Per-tenant fair-share scheduling for throttled AWS and Bedrock calls.
+
+Calls are grouped by tenant: the Teams team a conversation belongs to, or the
+Azure AD tenant for personal and group chats. When tenants compete for throttler
+capacity they are served by weighted fair queuing (start-time fair queuing), so
+a team running ``/health`` on a whole account gets its share of tokens and slots
+without making every other team wait behind it. Within a tenant, waiters are
+served by priority class, see ``ohlala_smartops.utils.priority``.
+
+The tenant is taken from the current context, set per Teams activity with
+``throttle_tenant``; tasks created inside the block inherit it.
+
+Example:
+    >>> with throttle_tenant(team_id):
+    ...     await handle_command(turn_context)
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+from collections.abc import AsyncGenerator, Callable, Generator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, Final
+
+from ohlala_smartops.constants import (
+    THROTTLE_DEFAULT_TENANT,
+    THROTTLE_DEFAULT_TENANT_WEIGHT,
+    THROTTLE_TENANT_STATS_IDLE_SECONDS,
+)
+from ohlala_smartops.utils.priority import (
+    PriorityWaitQueue,
+    ThrottlePriority,
+    get_throttle_priority,
+)
+
+logger: Final = logging.getLogger(__name__)
+
+_current_tenant: Final[ContextVar[str]] = ContextVar(
+    "throttle_tenant", default=THROTTLE_DEFAULT_TENANT
+)
+
+# Tolerance for floating point error when comparing virtual start tags
+_TAG_EPSILON: Final[float] = 1e-9
+
+
+@contextmanager
+def throttle_tenant(tenant_id: str | None) -> Generator[None]:
+    """Run throttled calls in the block on behalf of a tenant.
+
+    Args:
+        tenant_id: Team or Azure AD tenant ID. None or empty uses the default tenant.
+
+    Yields:
+        None.
+
+    Example:
+        >>> with throttle_tenant("19:team@thread.tacv2"):
+        ...     await command.execute(args, context)
+    """
+    token = _current_tenant.set(tenant_id or THROTTLE_DEFAULT_TENANT)
+    try:
+        yield
+    finally:
+        _current_tenant.reset(token)
+
+
+def get_throttle_tenant() -> str:
+    """Get the tenant of the current context.
+
+    Returns:
+        The tenant set with ``throttle_tenant``, or the default tenant.
+    """
+    return _current_tenant.get()
+
+
+def load_tenant_weights() -> dict[str, float]:
+    """Load fair-share weights from the THROTTLE_TENANT_WEIGHTS environment variable.
+
+    The variable holds a JSON object mapping tenant IDs to positive weights, e.g.
+    ``{"19:ops@thread.tacv2": 3, "19:dev@thread.tacv2": 1}``. A tenant with weight
+    3 gets three times the share of a tenant with weight 1 while both are waiting.
+
+    Returns:
+        Mapping of tenant ID to weight. Empty if unset or invalid.
+    """
+    raw_weights = os.getenv("THROTTLE_TENANT_WEIGHTS", "")
+    if not raw_weights:
+        return {}
+
+    try:
+        weights = {tenant: float(weight) for tenant, weight in json.loads(raw_weights).items()}
+    except (ValueError, TypeError, AttributeError) as e:
+        logger.warning(f"Ignoring invalid THROTTLE_TENANT_WEIGHTS: {e}")
+        return {}
+
+    invalid = [tenant for tenant, weight in weights.items() if not weight > 0]
+    for tenant in invalid:
+        logger.warning(f"Ignoring non-positive throttle weight for tenant {tenant}")
+        del weights[tenant]
+    return weights
+
+
+class FairShareQueue:
+    """Waiters from several tenants, served by weighted fair queuing.
+
+    Each tenant has its own ``PriorityWaitQueue``. The next waiter comes from the
+    tenant with the lowest virtual start tag: serving a waiter advances its
+    tenant's tag by ``tokens / weight``, and a tenant that was idle starts again at
+    the current virtual time, so it cannot bank credit while it has nothing queued.
+    Ties go to the tenant that has been waiting longest.
+    """
+
+    def __init__(
+        self,
+        weights: dict[str, float] | None = None,
+        reserved_shares: dict[str, float] | None = None,
+    ) -> None:
+        """Initialize empty queues.
+
+        Args:
+            weights: Fair-share weight per tenant. Unlisted tenants get
+                THROTTLE_DEFAULT_TENANT_WEIGHT.
+            reserved_shares: Reserved share per lower priority class within a
+                tenant. Defaults to THROTTLE_RESERVED_SHARES.
+        """
+        self.weights = weights or {}
+        self._reserved_shares = reserved_shares
+        self._tenants: dict[str, PriorityWaitQueue] = {}
+        self._finish_tags: dict[str, float] = {}
+        self._virtual_time = 0.0
+
+    def __len__(self) -> int:
+        """Get the number of queued waiters, including cancelled ones not yet purged."""
+        return sum(len(queue) for queue in self._tenants.values())
+
+    def append(
+        self,
+        tenant: str,
+        priority: ThrottlePriority,
+        waiter: asyncio.Future[None],
+        tokens: int = 1,
+    ) -> None:
+        """Queue a waiter behind the others of its tenant and priority class.
+
+        Args:
+            tenant: Tenant the waiter belongs to.
+            priority: Priority class of the waiter.
+            waiter: Future resolved when the waiter is served.
+            tokens: Units the waiter needs (tokens or semaphore slots). Defaults to 1.
+        """
+        queue = self._tenants.get(tenant)
+        if queue is None:
+            queue = self._tenants[tenant] = PriorityWaitQueue(self._reserved_shares)
+        queue.append(priority, waiter, tokens)
+
+    def _start_tag(self, tenant: str) -> float:
+        """Get the virtual time at which the tenant's next waiter starts service."""
+        return max(self._virtual_time, self._finish_tags.get(tenant, 0.0))
+
+    def _select(self, eligible: Callable[[str], bool] | None) -> str | None:
+        """Pick the tenant to serve next, dropping tenants with no live waiters."""
+        selected: str | None = None
+        best_tag = math.inf
+        for tenant, queue in list(self._tenants.items()):
+            if queue.peek() is None:
+                del self._tenants[tenant]
+                continue
+            if eligible is not None and not eligible(tenant):
+                continue
+            tag = self._start_tag(tenant)
+            if tag < best_tag - _TAG_EPSILON:
+                selected, best_tag = tenant, tag
+        return selected
+
+    def peek(
+        self, eligible: Callable[[str], bool] | None = None
+    ) -> tuple[str, int, asyncio.Future[None]] | None:
+        """Get the waiter that will be served next without removing it.
+
+        Args:
+            eligible: Optional filter; tenants for which it returns False are
+                skipped (e.g. tenants at their concurrency cap).
+
+        Returns:
+            Tuple of (tenant, tokens, future) for the next waiter, or None if no
+            eligible waiters are queued.
+        """
+        tenant = self._select(eligible)
+        if tenant is None:
+            return None
+        head = self._tenants[tenant].peek()
+        assert head is not None  # _select only returns tenants with live waiters
+        return (tenant, *head)
+
+    def popleft(
+        self, eligible: Callable[[str], bool] | None = None
+    ) -> tuple[str, int, asyncio.Future[None]]:
+        """Remove the waiter returned by ``peek`` and charge its tenant.
+
+        Args:
+            eligible: The same filter passed to ``peek``.
+
+        Returns:
+            Tuple of (tenant, tokens, future) for the served waiter.
+
+        Raises:
+            IndexError: If no eligible waiters are queued.
+        """
+        tenant = self._select(eligible)
+        if tenant is None:
+            raise IndexError("popleft from an empty FairShareQueue")
+
+        tokens, waiter = self._tenants[tenant].popleft()
+        start_tag = self._start_tag(tenant)
+        self._virtual_time = start_tag
+        self._finish_tags[tenant] = start_tag + tokens / self.weights.get(
+            tenant, THROTTLE_DEFAULT_TENANT_WEIGHT
+        )
+
+        # Tags of idle tenants at or behind the virtual time no longer matter
+        self._finish_tags = {
+            name: tag
+            for name, tag in self._finish_tags.items()
+            if tag > self._virtual_time or name in self._tenants
+        }
+        return tenant, tokens, waiter
+
+    def get_queued(self) -> dict[str, int]:
+        """Get the number of live waiters per tenant.
+
+        Returns:
+            Mapping of tenant to queued waiters, for tenants with waiters.
+        """
+        queued = {
+            tenant: sum(queue.get_queued().values()) for tenant, queue in self._tenants.items()
+        }
+        return {tenant: count for tenant, count in queued.items() if count}
+
+
+class FairShareSemaphore:
+    """Concurrency limiter shared fairly between tenants, with per-tenant caps.
+
+    Free slots go to the next waiter of a ``FairShareQueue``. Tenants at their
+    concurrency cap are skipped until one of their calls completes, so a single
+    tenant can never hold every slot.
+
+    Example:
+        >>> semaphore = FairShareSemaphore(8, max_per_tenant=4)
+        >>> async with semaphore.hold():
+        ...     await describe_instances()
+    """
+
+    def __init__(
+        self,
+        value: int,
+        weights: dict[str, float] | None = None,
+        max_per_tenant: int | None = None,
+    ) -> None:
+        """Initialize the semaphore.
+
+        Args:
+            value: Number of concurrent holders allowed.
+            weights: Fair-share weight per tenant.
+            max_per_tenant: Maximum concurrent holders per tenant. None or 0
+                means no cap beyond ``value``.
+        """
+        self._value = value
+        self.max_per_tenant = max_per_tenant or None
+        self._waiters = FairShareQueue(weights)
+        self._in_flight: dict[str, int] = {}
+
+    def _has_capacity(self, tenant: str) -> bool:
+        """Check whether a tenant is below its concurrency cap."""
+        return self.max_per_tenant is None or self._in_flight.get(tenant, 0) < self.max_per_tenant
+
+    def _grant(self, tenant: str) -> None:
+        """Hand a slot to a tenant."""
+        self._value -= 1
+        self._in_flight[tenant] = self._in_flight.get(tenant, 0) + 1
+
+    def _dispatch(self) -> None:
+        """Hand free slots to eligible waiters in fair-share order."""
+        while self._value > 0 and self._waiters.peek(self._has_capacity) is not None:
+            tenant, _, waiter = self._waiters.popleft(self._has_capacity)
+            self._grant(tenant)
+            waiter.set_result(None)
+
+    async def acquire(
+        self, priority: ThrottlePriority | None = None, tenant: str | None = None
+    ) -> None:
+        """Take a slot, waiting for the tenant's fair share if slots are contended.
+
+        Args:
+            priority: Priority class. Defaults to the current context's priority.
+            tenant: Tenant taking the slot. Defaults to the current context's tenant.
+        """
+        tenant = tenant or get_throttle_tenant()
+        if (
+            self._value > 0
+            and self._has_capacity(tenant)
+            and self._waiters.peek(self._has_capacity) is None
+        ):
+            self._grant(tenant)
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(tenant, priority or get_throttle_priority(), waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just before the cancellation landed - pass the slot on
+                self.release(tenant)
+            raise
+
+    def release(self, tenant: str | None = None) -> None:
+        """Give a slot back and hand free slots to the next eligible waiters.
+
+        Args:
+            tenant: Tenant that held the slot. Defaults to the current context's tenant.
+        """
+        tenant = tenant or get_throttle_tenant()
+        held = self._in_flight.get(tenant, 0) - 1
+        if held > 0:
+            self._in_flight[tenant] = held
+        else:
+            self._in_flight.pop(tenant, None)
+        self._value += 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def hold(
+        self, priority: ThrottlePriority | None = None, tenant: str | None = None
+    ) -> AsyncGenerator[None]:
+        """Hold a slot for the duration of the block.
+
+        Args:
+            priority: Priority class. Defaults to the current context's priority.
+            tenant: Tenant taking the slot. Defaults to the current context's tenant.
+
+        Yields:
+            None.
+        """
+        tenant = tenant or get_throttle_tenant()
+        await self.acquire(priority, tenant)
+        try:
+            yield
+        finally:
+            self.release(tenant)
+
+    def get_in_flight(self) -> dict[str, int]:
+        """Get the number of slots held per tenant.
+
+        Returns:
+            Mapping of tenant to held slots, for tenants holding slots.
+        """
+        return dict(self._in_flight)
+
+    def get_queued(self) -> dict[str, int]:
+        """Get the number of waiters per tenant.
+
+        Returns:
+            Mapping of tenant to queued waiters, for tenants with waiters.
+        """
+        return self._waiters.get_queued()
+
+
+class TenantWaitStats:
+    """Queue wait statistics per tenant.
+
+    Every Teams conversation is a tenant, so the statistics of tenants without
+    calls for ``idle_seconds`` are dropped rather than kept for the life of the
+    process.
+    """
+
+    def __init__(self, idle_seconds: float = THROTTLE_TENANT_STATS_IDLE_SECONDS) -> None:
+        """Initialize empty statistics.
+
+        Args:
+            idle_seconds: Seconds without calls after which a tenant's statistics
+                are dropped. Defaults to 3600.
+        """
+        self.idle_seconds = idle_seconds
+        self._requests: dict[str, int] = {}
+        self._total_wait: dict[str, float] = {}
+        self._max_wait: dict[str, float] = {}
+        self._last_seen: dict[str, float] = {}
+        self._next_eviction = time.monotonic() + idle_seconds
+
+    def record(self, tenant: str, wait_time: float) -> None:
+        """Record how long a call waited before it was admitted.
+
+        Args:
+            tenant: Tenant the call was made for.
+            wait_time: Seconds between the request and its admission.
+        """
+        now = time.monotonic()
+        self._evict_idle(now)
+        self._requests[tenant] = self._requests.get(tenant, 0) + 1
+        self._total_wait[tenant] = self._total_wait.get(tenant, 0.0) + wait_time
+        self._max_wait[tenant] = max(self._max_wait.get(tenant, 0.0), wait_time)
+        self._last_seen[tenant] = now
+
+    def _evict_idle(self, now: float) -> None:
+        """Drop the statistics of idle tenants, at most once per idle period."""
+        if now < self._next_eviction:
+            return
+        self._next_eviction = now + self.idle_seconds
+        idle = [t for t, seen in self._last_seen.items() if now - seen >= self.idle_seconds]
+        for tenant in idle:
+            del self._requests[tenant], self._total_wait[tenant], self._max_wait[tenant]
+            del self._last_seen[tenant]
+        if idle:
+            logger.debug(f"Dropped wait statistics of {len(idle)} idle tenants")
+
+    def get_stats(self, semaphore: FairShareSemaphore | None = None) -> dict[str, dict[str, Any]]:
+        """Get wait statistics for monitoring.
+
+        Args:
+            semaphore: Optional semaphore whose held slots and queued calls are
+                reported alongside, including tenants not yet admitted.
+
+        Returns:
+            Mapping of tenant to admitted requests, average wait and maximum wait
+            in seconds (plus "in_flight" and "queued" if a semaphore is given).
+        """
+        self._evict_idle(time.monotonic())
+        stats: dict[str, dict[str, Any]] = {
+            tenant: {
+                "requests": requests,
+                "avg_wait_seconds": round(self._total_wait[tenant] / requests, 3),
+                "max_wait_seconds": round(self._max_wait[tenant], 3),
+            }
+            for tenant, requests in self._requests.items()
+        }
+        if semaphore is None:
+            return stats
+
+        in_flight = semaphore.get_in_flight()
+        queued = semaphore.get_queued()
+        for tenant in {**in_flight, **queued}:
+            stats.setdefault(
+                tenant, {"requests": 0, "avg_wait_seconds": 0.0, "max_wait_seconds": 0.0}
+            )
+        for tenant, tenant_stats in stats.items():
+            tenant_stats["in_flight"] = in_flight.get(tenant, 0)
+            tenant_stats["queued"] = queued.get(tenant, 0)
+        return stats
@@ -2,11 +2,26 @@
 
 This module provides global rate limiting with circuit breaker pattern for all AWS API
 calls across the application. It uses a token bucket algorithm for rate limiting and
-semaphores for concurrency control, combined with a circuit breaker to prevent
-cascade failures.
+semaphores for concurrency control, combined with circuit breakers to prevent
+cascade failures. Each AWS service and each MCP server has its own breaker, so an
+outage of one (e.g. Cost Explorer) fails fast without slowing down the others.
+
+Rate limiting is hierarchical: every call takes a token from the global bucket and,
+for known AWS services, from a per-service bucket and a per-operation-class (read or
+mutate) bucket sized after AWS's published API rate limits.
+
+In adaptive mode the refill rates follow an AIMD (additive increase, multiplicative
+decrease) controller: they grow slowly while calls succeed and are cut sharply when
+AWS or an MCP server reports throttling, staying within a configured floor and ceiling.
+
+Waiters are served by priority class (interactive, background, bulk) with a reserved
+share for lower classes, see ``ohlala_smartops.utils.priority``. When several tenants
+(Teams teams) are waiting, tokens and concurrency slots are shared between them by
+weighted fair queuing, see ``ohlala_smartops.utils.fair_share``.
 """
 
 import asyncio
+import json
 import logging
 import os
 import time
@@ -14,23 +29,398 @@ from collections.abc import AsyncGenerator
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from typing import Any, Final
 
+from ohlala_smartops.constants import (
+    AWS_API_RATE_LIMITS,
+    AWS_READ_OPERATION_PREFIXES,
+    AWS_SERVER_ERROR_CODES,
+    AWS_SERVICE_THROTTLING_ERROR_CODES,
+    AWS_THROTTLING_ERROR_CODES,
+    MCP_RATE_LIMIT_ERROR_CODE,
+    MCP_TOOL_SERVICES,
+)
+from ohlala_smartops.utils.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerOpenError,
+    CircuitBreakerTrippedError,
+)
+from ohlala_smartops.utils.fair_share import (
+    FairShareQueue,
+    FairShareSemaphore,
+    TenantWaitStats,
+    get_throttle_tenant,
+    load_tenant_weights,
+)
+from ohlala_smartops.utils.priority import (
+    PriorityWaitStats,
+    ThrottlePriority,
+    get_throttle_priority,
+)
+from ohlala_smartops.utils.shared_limiter import SharedTokenBucket, get_shared_limiter_backend
+
 logger: Final = logging.getLogger(__name__)
 
+# Tolerance for floating point error when comparing refilled tokens to a request
+_TOKEN_EPSILON: Final[float] = 1e-9
+
+
+def classify_operation(operation_name: str) -> tuple[str | None, str]:
+    """Classify an operation into its AWS service and operation class.
+
+    Operation names are either ``service:operation`` (from AWSClientWrapper) or
+    MCP tool names such as ``list-instances``.
+
+    Args:
+        operation_name: Name of the throttled operation.
 
-class CircuitBreakerOpenError(Exception):
-    """Raised when circuit breaker is open and blocking requests.
+    Returns:
+        Tuple of (service name or None if unknown, "read" or "mutate").
 
-    This exception indicates that the circuit breaker is currently open
-    due to a recent trip, and requests are being blocked until the timeout expires.
+    Example:
+        >>> classify_operation("ec2:describe_instances")
+        ('ec2', 'read')
+        >>> classify_operation("send-command")
+        ('ssm', 'mutate')
     """
+    service: str | None
+    if ":" in operation_name:
+        service, operation = operation_name.split(":", 1)
+    else:
+        service, operation = MCP_TOOL_SERVICES.get(operation_name), operation_name
+
+    normalized = operation.lower().replace("-", "_")
+    operation_class = "read" if normalized.startswith(AWS_READ_OPERATION_PREFIXES) else "mutate"
+    return service, operation_class
+
 
+def is_throttling_error_code(error_code: str | None, service: str | None = None) -> bool:
+    """Check whether an AWS error code means the request was throttled.
 
-class CircuitBreakerTrippedError(Exception):
-    """Raised when circuit breaker trips due to too many failures.
+    Args:
+        error_code: AWS error code (e.g., "ThrottlingException").
+        service: AWS service the code was returned by, for service-specific
+            codes such as Cost Explorer's LimitExceededException. Defaults to None.
+
+    Returns:
+        True if the code indicates throttling.
 
-    This exception is raised when the consecutive failure count reaches
-    the configured threshold, triggering the circuit breaker.
+    Example:
+        >>> is_throttling_error_code("LimitExceededException", "ce")
+        True
+        >>> is_throttling_error_code("LimitExceededException", "cloudformation")
+        False
     """
+    if error_code in AWS_THROTTLING_ERROR_CODES:
+        return True
+    return error_code in AWS_SERVICE_THROTTLING_ERROR_CODES.get(service or "", frozenset())
+
+
+def is_rate_limit_error(error: BaseException, service: str | None = None) -> bool:
+    """Check whether an error means the request was throttled.
+
+    Recognizes AWS throttling error codes, either on a converted ``ThrottlingError``
+    (``error_code`` attribute) or on a raw botocore ``ClientError`` (``response``
+    attribute), and the MCP JSON-RPC rate limit code carried by ``MCPRateLimitError``.
+    Falls back to matching "rate limit" or "429" in the error message.
+
+    Args:
+        error: The exception raised by the throttled call.
+        service: AWS service of the call, for service-specific throttling codes.
+            Defaults to the error's ``service`` attribute, if any.
+
+    Returns:
+        True if the error indicates throttling.
+
+    Example:
+        >>> is_rate_limit_error(ThrottlingError("Rate exceeded", error_code="Throttling"))
+        True
+        >>> is_rate_limit_error(ValueError("bad input"))
+        False
+    """
+    error_code = getattr(error, "error_code", None)
+    if error_code is None:
+        response = getattr(error, "response", None)
+        if isinstance(response, dict):
+            error_code = response.get("Error", {}).get("Code")
+
+    if service is None:
+        service = getattr(error, "service", None)
+    if is_throttling_error_code(error_code, service) or error_code == MCP_RATE_LIMIT_ERROR_CODE:
+        return True
+
+    message = str(error).lower()
+    return "rate limit" in message or "429" in message
+
+
+def is_circuit_breaker_failure(error: BaseException) -> bool:
+    """Check whether an error counts against the circuit breaker of a dependency.
+
+    Only faults of the dependency itself count: AWS 5xx responses and server-side
+    error codes, and errors without an AWS error code (timeouts, connection and MCP
+    errors). Caller errors such as an unknown instance ID or a denied permission do
+    not, so users mistyping IDs cannot open the breaker for everyone. Throttling is
+    handled separately by the rate limiter (see is_rate_limit_error).
+
+    Args:
+        error: The exception raised by the throttled call.
+
+    Returns:
+        True if the error indicates the dependency is unhealthy.
+
+    Example:
+        >>> is_circuit_breaker_failure(EC2Error("Internal error", error_code="InternalError"))
+        True
+        >>> is_circuit_breaker_failure(EC2Error("Denied", error_code="AccessDenied"))
+        False
+    """
+    error_code = getattr(error, "error_code", None)
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        status_code = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        if isinstance(status_code, int):
+            return status_code >= 500
+        error_code = error_code or response.get("Error", {}).get("Code")
+
+    if isinstance(error_code, str):
+        return error_code in AWS_SERVER_ERROR_CODES
+    return True
+
+
+def _now() -> float:
+    """Get the current time on the running event loop's (monotonic) clock.
+
+    Falls back to ``time.monotonic()``, which the default event loop also uses,
+    when called outside of an event loop.
+    """
+    try:
+        return asyncio.get_running_loop().time()
+    except RuntimeError:
+        return time.monotonic()
+
+
+class TokenBucket:
+    """FIFO token bucket for one level of the rate limiting hierarchy.
+
+    Callers that cannot be served immediately join a queue. Only the head of the
+    queue has a wake-up timer, armed for the exact time its tokens become available,
+    so waiters are served in fair-share order between tenants, in priority order
+    within a tenant and in arrival order within a priority class, later callers
+    can never take tokens ahead of earlier ones of the same tenant and class, and
+    the bucket is never overdrafted.
+
+    With a shared bucket, granted callers additionally take their tokens from the
+    bucket shared by all bot replicas, which enforces the limit cluster-wide.
+
+    Example:
+        >>> bucket = TokenBucket("ce", tokens_per_second=5.0, max_tokens=5)
+        >>> waited = await bucket.acquire()
+        >>> waited = await bucket.acquire(3)  # batch call worth three requests
+    """
+
+    def __init__(
+        self,
+        name: str,
+        tokens_per_second: float,
+        max_tokens: int,
+        *,
+        min_rate: float | None = None,
+        max_rate: float | None = None,
+        tenant_weights: dict[str, float] | None = None,
+        shared: SharedTokenBucket | None = None,
+    ) -> None:
+        """Initialize a full token bucket.
+
+        Args:
+            name: Bucket name used in logs and statistics (e.g., "ec2:read").
+            tokens_per_second: Initial refill rate.
+            max_tokens: Bucket capacity (maximum burst).
+            min_rate: Floor for adaptive rate decreases. Defaults to tokens_per_second.
+            max_rate: Ceiling for adaptive rate increases. Defaults to tokens_per_second.
+            tenant_weights: Fair-share weight per tenant for queued waiters.
+            shared: Bucket shared with other replicas. Defaults to None (this
+                process only).
+        """
+        self.name = name
+        self.tokens_per_second = tokens_per_second
+        self.max_tokens = max_tokens
+        self.min_rate = tokens_per_second if min_rate is None else min_rate
+        self.max_rate = tokens_per_second if max_rate is None else max_rate
+        self._tokens = float(max_tokens)
+        self._last_refill = _now()
+        self._last_decrease: float | None = None
+        self._waiters = FairShareQueue(tenant_weights)
+        self._wakeup: asyncio.TimerHandle | None = None
+        self.shared = shared
+
+        # Metrics
+        self._acquired = 0
+        self._waits = 0
+        self._total_wait_time = 0.0
+        self._rate_decreases = 0
+
+    def _refill(self) -> None:
+        """Add tokens proportional to the time elapsed since the last refill."""
+        now = _now()
+        elapsed = max(0.0, now - self._last_refill)
+        self._tokens = min(float(self.max_tokens), self._tokens + elapsed * self.tokens_per_second)
+        self._last_refill = now
+
+    def _dispatch(self) -> None:
+        """Serve queued waiters in queue order and arm the wake-up for the next one.
+
+        Waiters at the head of the queue are granted their tokens while the bucket
+        holds enough; the wake-up timer is then set for the exact time the new head's
+        tokens will be available.
+        """
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+
+        self._refill()
+        while (head := self._waiters.peek()) is not None:
+            _, tokens, waiter = head
+            if self._tokens + _TOKEN_EPSILON < tokens:
+                break
+            self._waiters.popleft()
+            self._tokens = max(0.0, self._tokens - tokens)
+            waiter.set_result(None)
+
+        if (head := self._waiters.peek()) is not None:
+            _, tokens, _ = head
+            delay = (tokens - self._tokens) / self.tokens_per_second
+            self._wakeup = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+    async def acquire(
+        self,
+        tokens: int = 1,
+        priority: ThrottlePriority | None = None,
+        tenant: str | None = None,
+    ) -> float:
+        """Take tokens, waiting in fair-share, priority and FIFO order until they are available.
+
+        Args:
+            tokens: Number of tokens to take, e.g. the number of requests a batch
+                call stands for. Defaults to 1.
+            priority: Priority class. Defaults to the current context's priority.
+            tenant: Tenant taking the tokens. Defaults to the current context's tenant.
+
+        Returns:
+            Seconds spent waiting for the tokens.
+
+        Raises:
+            ValueError: If tokens is not between 1 and the bucket capacity.
+        """
+        if not 1 <= tokens <= self.max_tokens:
+            raise ValueError(
+                f"Cannot acquire {tokens} tokens from {self.name} bucket of size {self.max_tokens}"
+            )
+
+        self._refill()
+        if self._waiters.peek() is None and self._tokens >= tokens:
+            self._tokens -= tokens
+            self._acquired += tokens
+            return await self._acquire_shared(tokens)
+
+        loop = asyncio.get_running_loop()
+        waiter: asyncio.Future[None] = loop.create_future()
+        self._waiters.append(
+            tenant or get_throttle_tenant(), priority or get_throttle_priority(), waiter, tokens
+        )
+        start_time = loop.time()
+        self._dispatch()
+
+        logger.debug(
+            f"Rate limiting: {self.name} queued for {tokens} token(s), {len(self._waiters)} waiting"
+        )
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just before the cancellation landed - give the tokens back
+                self._tokens = min(float(self.max_tokens), self._tokens + tokens)
+            self._dispatch()
+            raise
+
+        waited = loop.time() - start_time
+        self._acquired += tokens
+        self._waits += 1
+        self._total_wait_time += waited
+        return waited + await self._acquire_shared(tokens)
+
+    async def _acquire_shared(self, tokens: int) -> float:
+        """Take granted tokens from the shared bucket as well, if there is one.
+
+        The shared bucket refills at this bucket's current rate, so adaptive rate
+        cuts slow down the whole cluster.
+
+        Returns:
+            Seconds spent waiting for the shared bucket.
+        """
+        if self.shared is None:
+            return 0.0
+        return await self.shared.acquire(tokens, self.tokens_per_second, self.max_tokens)
+
+    def increase_rate(self, step: float) -> None:
+        """Additively raise the refill rate, up to the ceiling.
+
+        Args:
+            step: Tokens per second to add.
+        """
+        self._refill()
+        self.tokens_per_second = min(self.max_rate, self.tokens_per_second + step)
+        if self._waiters.peek() is not None:
+            self._dispatch()
+
+    def decrease_rate(self, factor: float, cooldown: float = 0.0) -> bool:
+        """Multiplicatively cut the refill rate, down to the floor.
+
+        Any banked burst is dropped so the next calls are paced at the new rate.
+        Cuts within ``cooldown`` seconds of the previous one are ignored, so a
+        burst of throttled calls from one congestion event only cuts the rate once.
+
+        Args:
+            factor: Multiplier applied to the rate (e.g., 0.5 halves it).
+            cooldown: Minimum seconds between two cuts. Defaults to 0.0.
+
+        Returns:
+            True if the rate was cut, False if the cut was skipped by the cooldown.
+        """
+        now = _now()
+        if self._last_decrease is not None and now - self._last_decrease < cooldown:
+            return False
+
+        self._refill()
+        self.tokens_per_second = max(self.min_rate, self.tokens_per_second * factor)
+        self._tokens = 0.0
+        self._last_decrease = now
+        self._rate_decreases += 1
+        logger.warning(
+            f"Throttling detected: {self.name} rate reduced to "
+            f"{self.tokens_per_second:.2f} tokens/sec"
+        )
+        if self._waiters.peek() is not None:
+            self._dispatch()
+        return True
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get bucket statistics for monitoring.
+
+        Returns:
+            Dictionary with current tokens, refill rate, capacity, tokens acquired,
+            queued waiters, number of waits, total wait time and number of adaptive
+            rate cuts.
+        """
+        return {
+            "current_tokens": round(self._tokens, 2),
+            "tokens_per_second": round(self.tokens_per_second, 3),
+            "max_tokens": self.max_tokens,
+            "acquired": self._acquired,
+            "queued": sum(self._waiters.get_queued().values()),
+            "waits": self._waits,
+            "total_wait_seconds": round(self._total_wait_time, 3),
+            "rate_decreases": self._rate_decreases,
+            **({"shared": self.shared.get_stats()} if self.shared is not None else {}),
+        }
 
 
 class GlobalThrottler:
@@ -44,17 +434,45 @@ class GlobalThrottler:
     - MAX_CONCURRENT_AWS_CALLS: Maximum concurrent calls (default: 8)
     - AWS_API_RATE_LIMIT: Tokens per second (default: 15.0)
     - AWS_API_MAX_TOKENS: Maximum token bucket size (default: 30)
-    - AWS_CIRCUIT_BREAKER_ENABLED: Enable circuit breaker (default: false)
-    - AWS_CIRCUIT_BREAKER_THRESHOLD: Failure threshold (default: 100)
+    - AWS_CIRCUIT_BREAKER_ENABLED: Enable circuit breakers (default: false)
+    - AWS_CIRCUIT_BREAKER_THRESHOLD: Minimum calls in the window before a breaker
+      can open (default: 100)
+    - AWS_CIRCUIT_BREAKER_ERROR_RATE: Share of failed calls that opens a breaker
+      (default: 0.5)
+    - AWS_CIRCUIT_BREAKER_WINDOW: Rolling error-rate window in seconds (default: 60.0)
     - AWS_CIRCUIT_BREAKER_TIMEOUT: Circuit open timeout in seconds (default: 10.0)
+    - AWS_CIRCUIT_BREAKER_HALF_OPEN_PROBES: Probe calls admitted while half-open
+      (default: 3)
+    - AWS_SERVICE_RATE_LIMITS_ENABLED: Enable per-service buckets (default: true)
+    - AWS_SERVICE_RATE_LIMITS: JSON overrides for the per-service bucket table, e.g.
+      ``{"ce": {"service": [10, 10], "read": [10, 10], "mutate": [2, 2]}}``
+    - AWS_ADAPTIVE_RATE_ENABLED: Adapt refill rates to observed throttling (default: false)
+    - AWS_ADAPTIVE_RATE_MIN: Floor for the global refill rate (default: 1.0)
+    - AWS_ADAPTIVE_RATE_MAX: Ceiling for the global refill rate (default: 50.0)
+    - AWS_ADAPTIVE_RATE_INCREASE: Tokens/sec added per successful call (default: 0.1)
+    - AWS_ADAPTIVE_RATE_DECREASE_FACTOR: Rate multiplier on throttling (default: 0.5)
+    - AWS_ADAPTIVE_RATE_COOLDOWN: Minimum seconds between two rate cuts (default: 1.0)
+    - AWS_TENANT_MAX_CONCURRENT: Maximum concurrent calls per tenant, 0 for no cap
+      (default: 0)
+    - THROTTLE_TENANT_WEIGHTS: JSON fair-share weights per tenant, e.g.
+      ``{"19:ops@thread.tacv2": 3}`` (default: every tenant weighs 1.0)
+    - THROTTLE_REDIS_URL: Redis URL of the token buckets shared between replicas
+      (default: unset, limits apply per process)
+    - AWS_SHARED_LEASE_SIZE: Tokens leased from a shared bucket per round trip
+      (default: 5)
+    - THROTTLE_LEASE_TTL: Seconds a lease of shared tokens stays usable (default: 1.0)
+
+    In adaptive mode, calls to a service with its own buckets adapt those buckets
+    (ceiling: the configured service limit), so throttling by one service does not
+    slow down the others; all other calls adapt the global rate.
     """
 
     def __init__(self) -> None:
         """Initialize the global throttler with configuration from environment variables."""
         # Rate limiting configuration
         self.max_concurrent_calls = int(os.getenv("MAX_CONCURRENT_AWS_CALLS", "8"))
-        self.tokens_per_second = float(os.getenv("AWS_API_RATE_LIMIT", "15.0"))
-        self.max_tokens = int(os.getenv("AWS_API_MAX_TOKENS", "30"))
+        tokens_per_second = float(os.getenv("AWS_API_RATE_LIMIT", "15.0"))
+        max_tokens = int(os.getenv("AWS_API_MAX_TOKENS", "30"))
 
         # Circuit breaker configuration
         self.circuit_breaker_enabled = (
@@ -62,144 +480,316 @@ class GlobalThrottler:
         )
         self.circuit_breaker_threshold = int(os.getenv("AWS_CIRCUIT_BREAKER_THRESHOLD", "100"))
         self.circuit_breaker_timeout = float(os.getenv("AWS_CIRCUIT_BREAKER_TIMEOUT", "10.0"))
+        self.circuit_breaker_error_rate = float(os.getenv("AWS_CIRCUIT_BREAKER_ERROR_RATE", "0.5"))
+        self.circuit_breaker_window = float(os.getenv("AWS_CIRCUIT_BREAKER_WINDOW", "60.0"))
+        self.circuit_breaker_half_open_probes = int(
+            os.getenv("AWS_CIRCUIT_BREAKER_HALF_OPEN_PROBES", "3")
+        )
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
 
-        # Internal state
-        self._semaphore = asyncio.Semaphore(self.max_concurrent_calls)
-        self._tokens = float(self.max_tokens)
-        self._last_refill = time.time()
-        self._token_lock = asyncio.Lock()
+        # Per-service rate limiting configuration
+        self.service_rate_limits_enabled = (
+            os.getenv("AWS_SERVICE_RATE_LIMITS_ENABLED", "true").lower() == "true"
+        )
+        self.service_rate_limits = self._load_service_rate_limits()
+        self._service_buckets: dict[str, TokenBucket] = {}
+
+        # Adaptive (AIMD) rate control configuration
+        self.adaptive_rate_enabled = (
+            os.getenv("AWS_ADAPTIVE_RATE_ENABLED", "false").lower() == "true"
+        )
+        self.adaptive_min_rate = float(os.getenv("AWS_ADAPTIVE_RATE_MIN", "1.0"))
+        self.adaptive_max_rate = float(os.getenv("AWS_ADAPTIVE_RATE_MAX", "50.0"))
+        self.adaptive_increase = float(os.getenv("AWS_ADAPTIVE_RATE_INCREASE", "0.1"))
+        self.adaptive_decrease_factor = float(os.getenv("AWS_ADAPTIVE_RATE_DECREASE_FACTOR", "0.5"))
+        self.adaptive_cooldown = float(os.getenv("AWS_ADAPTIVE_RATE_COOLDOWN", "1.0"))
+        self.configured_tokens_per_second = tokens_per_second
+
+        # Per-tenant fair-share configuration
+        self.tenant_weights = load_tenant_weights()
+        self.tenant_max_concurrent = int(os.getenv("AWS_TENANT_MAX_CONCURRENT", "0"))
+
+        # Shared (multi-replica) rate limiting configuration
+        self._shared_backend = get_shared_limiter_backend()
+        self.shared_lease_size = int(os.getenv("AWS_SHARED_LEASE_SIZE", "5"))
+        self.shared_lease_ttl = float(os.getenv("THROTTLE_LEASE_TTL", "1.0"))
+
+        if self.adaptive_rate_enabled:
+            tokens_per_second = min(
+                self.adaptive_max_rate, max(self.adaptive_min_rate, tokens_per_second)
+            )
 
-        # Circuit breaker state
-        self._consecutive_failures = 0
-        self._circuit_open_until = 0.0
-        self._circuit_lock = asyncio.Lock()
+        # Internal state
+        self._semaphore = FairShareSemaphore(
+            self.max_concurrent_calls, self.tenant_weights, self.tenant_max_concurrent
+        )
+        self._bucket = TokenBucket(
+            "global",
+            tokens_per_second,
+            max_tokens,
+            min_rate=self.adaptive_min_rate if self.adaptive_rate_enabled else None,
+            max_rate=self.adaptive_max_rate if self.adaptive_rate_enabled else None,
+            tenant_weights=self.tenant_weights,
+            shared=self._create_shared_bucket("global"),
+        )
 
         # Metrics
         self._total_requests = 0
         self._throttled_requests = 0
         self._circuit_breaker_trips = 0
+        self._priority_stats = PriorityWaitStats()
+        self._tenant_stats = TenantWaitStats()
 
         logger.info(
             f"Global throttler initialized: {self.max_concurrent_calls} concurrent, "
-            f"{self.tokens_per_second} tokens/sec, circuit breaker: {self.circuit_breaker_enabled}"
+            f"{self.tokens_per_second} tokens/sec, "
+            f"circuit breaker: {self.circuit_breaker_enabled}, "
+            f"adaptive rate: {self.adaptive_rate_enabled}, "
+            f"shared: {self._shared_backend is not None}"
         )
 
-    async def _refill_tokens(self) -> None:
-        """Refill token bucket based on elapsed time.
+    def _create_shared_bucket(self, name: str) -> SharedTokenBucket | None:
+        """Create the replica-shared counterpart of a bucket, if a backend is configured.
+
+        Args:
+            name: Name of the local bucket (e.g., "global", "ce:read").
 
-        Implements the token bucket refill logic, adding tokens proportional
-        to the time elapsed since the last refill.
+        Returns:
+            Shared bucket keyed "aws:<name>", or None for per-process limits only.
         """
-        now = time.time()
-        elapsed = now - self._last_refill
+        if self._shared_backend is None:
+            return None
+        return SharedTokenBucket(
+            self._shared_backend,
+            f"aws:{name}",
+            lease_size=self.shared_lease_size,
+            lease_ttl=self.shared_lease_ttl,
+        )
 
-        # Add tokens based on elapsed time
-        tokens_to_add = elapsed * self.tokens_per_second
-        self._tokens = min(float(self.max_tokens), self._tokens + tokens_to_add)
-        self._last_refill = now
+    @property
+    def tokens_per_second(self) -> float:
+        """Current refill rate of the global bucket (changes in adaptive mode)."""
+        return self._bucket.tokens_per_second
+
+    @tokens_per_second.setter
+    def tokens_per_second(self, value: float) -> None:
+        self._bucket.tokens_per_second = value
+
+    @property
+    def max_tokens(self) -> int:
+        """Capacity of the global bucket."""
+        return self._bucket.max_tokens
 
-    async def _wait_for_token(self) -> None:
-        """Wait for an available token, implementing token bucket algorithm.
+    @max_tokens.setter
+    def max_tokens(self, value: int) -> None:
+        self._bucket.max_tokens = value
 
-        This method checks if a token is available in the bucket. If not,
-        it calculates the wait time and sleeps before trying again.
+    @staticmethod
+    def _load_service_rate_limits() -> dict[str, dict[str, tuple[float, int]]]:
+        """Load the per-service bucket table, applying environment overrides.
+
+        Returns:
+            Mapping of service name to bucket level ("service", "read", "mutate")
+            to (tokens per second, bucket size).
         """
-        async with self._token_lock:
-            await self._refill_tokens()
+        limits = {service: dict(levels) for service, levels in AWS_API_RATE_LIMITS.items()}
 
-            if self._tokens >= 1:
-                self._tokens -= 1
-                return
+        overrides = os.getenv("AWS_SERVICE_RATE_LIMITS", "")
+        if not overrides:
+            return limits
 
-            # Calculate how long to wait for next token
-            wait_time = 1.0 / self.tokens_per_second
-            logger.info(f"Rate limiting: waiting {wait_time:.2f}s for token (scaling gracefully)")
+        try:
+            for service, levels in json.loads(overrides).items():
+                service_limits = limits.setdefault(service, {})
+                for level, (rate, burst) in levels.items():
+                    service_limits[level] = (float(rate), int(burst))
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring invalid AWS_SERVICE_RATE_LIMITS override: {e}")
 
-        # Wait outside the lock to avoid blocking other operations
-        await asyncio.sleep(wait_time)
+        return limits
 
-        # Try again after waiting
-        async with self._token_lock:
-            await self._refill_tokens()
-            if self._tokens >= 1:
-                self._tokens -= 1
-            else:
-                # This shouldn't happen, but be defensive
-                logger.warning("Token still not available after waiting")
+    def _get_service_buckets(self, operation_name: str) -> list[TokenBucket]:
+        """Get the service and operation-class buckets that apply to an operation.
 
-    async def _check_circuit_breaker(self) -> None:
-        """Check if circuit breaker is open and should block requests.
+        Buckets are created lazily the first time a service is seen.
 
-        Raises:
-            CircuitBreakerOpenError: If circuit breaker is currently open.
+        Args:
+            operation_name: Name of the throttled operation.
+
+        Returns:
+            Buckets to acquire, most specific first. Empty for unknown services
+            or when per-service rate limiting is disabled.
         """
-        if not self.circuit_breaker_enabled:
+        if not self.service_rate_limits_enabled:
+            return []
+
+        service, operation_class = classify_operation(operation_name)
+        if service is None or service not in self.service_rate_limits:
+            return []
+
+        buckets: list[TokenBucket] = []
+        for level, name in (
+            (operation_class, f"{service}:{operation_class}"),
+            ("service", service),
+        ):
+            limit = self.service_rate_limits[service].get(level)
+            if limit is None:
+                continue
+            bucket = self._service_buckets.get(name)
+            if bucket is None:
+                rate, burst = limit
+                bucket = TokenBucket(
+                    name,
+                    rate,
+                    burst,
+                    min_rate=min(self.adaptive_min_rate, rate),
+                    max_rate=rate,
+                    tenant_weights=self.tenant_weights,
+                    shared=self._create_shared_bucket(name),
+                )
+                self._service_buckets[name] = bucket
+            buckets.append(bucket)
+        return buckets
+
+    def _adapt_rate(self, service_buckets: list[TokenBucket], throttled: bool) -> None:
+        """Apply one AIMD step after a call completes.
+
+        Calls that went through service buckets adapt those buckets; all other
+        calls adapt the global bucket. No-op unless adaptive mode is enabled.
+
+        Args:
+            service_buckets: Service buckets the call acquired tokens from.
+            throttled: True if the call was throttled, False if it succeeded.
+        """
+        if not self.adaptive_rate_enabled:
             return
 
-        async with self._circuit_lock:
-            now = time.time()
+        for bucket in service_buckets or [self._bucket]:
+            if throttled:
+                bucket.decrease_rate(self.adaptive_decrease_factor, self.adaptive_cooldown)
+            else:
+                bucket.increase_rate(self.adaptive_increase)
 
-            # Check if circuit breaker timeout has expired
-            if self._circuit_open_until > now:
-                remaining = self._circuit_open_until - now
-                raise CircuitBreakerOpenError(f"Circuit breaker open for {remaining:.1f}s more")
+    def _get_circuit_breakers(
+        self, operation_name: str, mcp_server: str | None
+    ) -> list[CircuitBreaker]:
+        """Get the circuit breakers that guard an operation.
 
-            # Reset circuit breaker if timeout expired
-            if self._circuit_open_until > 0 and now >= self._circuit_open_until:
-                logger.info("Circuit breaker reset - allowing requests")
-                self._circuit_open_until = 0.0
-                self._consecutive_failures = 0
+        MCP tool calls are guarded by the breaker of their MCP server only: an
+        MCP server outage must not open the AWS service breakers of direct SDK
+        calls. Direct calls are guarded by the breaker of their AWS service, or
+        share the "aws" breaker when the service is unknown. Breakers are
+        created lazily the first time they are needed.
 
-    async def _record_failure(self) -> None:
-        """Record a failure and potentially trip circuit breaker.
+        Args:
+            operation_name: Name of the throttled operation.
+            mcp_server: Name of the MCP server handling the call, if any.
 
-        Raises:
-            CircuitBreakerTrippedError: If consecutive failures reach threshold.
+        Returns:
+            Breakers to check, empty when circuit breakers are disabled.
         """
         if not self.circuit_breaker_enabled:
-            return
+            return []
+
+        service, _ = classify_operation(operation_name)
+        name = f"mcp:{mcp_server}" if mcp_server else service or "aws"
+
+        breaker = self._circuit_breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name,
+                min_requests=self.circuit_breaker_threshold,
+                error_rate_threshold=self.circuit_breaker_error_rate,
+                window_seconds=self.circuit_breaker_window,
+                open_timeout=self.circuit_breaker_timeout,
+                half_open_probes=self.circuit_breaker_half_open_probes,
+            )
+            self._circuit_breakers[name] = breaker
+        return [breaker]
+
+    @staticmethod
+    def _admit_circuit_breakers(breakers: list[CircuitBreaker]) -> list[bool]:
+        """Check every breaker guarding a call, undoing admissions if one rejects it.
 
-        async with self._circuit_lock:
-            self._consecutive_failures += 1
+        Args:
+            breakers: Breakers guarding the call.
 
-            if self._consecutive_failures >= self.circuit_breaker_threshold:
-                self._circuit_open_until = time.time() + self.circuit_breaker_timeout
-                self._circuit_breaker_trips += 1
-                logger.warning(
-                    f"Circuit breaker TRIPPED after {self._consecutive_failures} failures. "
-                    f"Blocking requests for {self.circuit_breaker_timeout}s"
-                )
-                raise CircuitBreakerTrippedError(
-                    f"Circuit breaker tripped after {self._consecutive_failures} "
-                    "consecutive failures"
-                )
+        Returns:
+            Probe flag per breaker (see CircuitBreaker.admit).
 
-    async def _record_success(self) -> None:
-        """Record a successful request and reset failure counter."""
-        if not self.circuit_breaker_enabled:
-            return
+        Raises:
+            CircuitBreakerOpenError: If any of the breakers is open.
+        """
+        probes: list[bool] = []
+        for breaker in breakers:
+            try:
+                probes.append(breaker.admit())
+            except CircuitBreakerOpenError:
+                for admitted, probe in zip(breakers, probes, strict=False):
+                    admitted.release_probe(probe)
+                raise
+        return probes
+
+    def _record_circuit_failure(
+        self, breakers: list[CircuitBreaker], probes: list[bool], operation_name: str
+    ) -> None:
+        """Record a failed call on its breakers.
 
-        async with self._circuit_lock:
-            self._consecutive_failures = 0
+        Raises:
+            CircuitBreakerTrippedError: If the failure opened any of the breakers.
+        """
+        tripped = [
+            breaker.name
+            for breaker, probe in zip(breakers, probes, strict=True)
+            if breaker.record_failure(probe)
+        ]
+        if tripped:
+            self._circuit_breaker_trips += 1
+            raise CircuitBreakerTrippedError(
+                f"Circuit breaker {', '.join(tripped)} tripped by failing {operation_name}"
+            )
 
     @asynccontextmanager
-    async def throttled_request(self, operation_name: str = "aws_api_call") -> AsyncGenerator[None]:
+    async def throttled_request(
+        self,
+        operation_name: str = "aws_api_call",
+        tokens: int = 1,
+        priority: ThrottlePriority | None = None,
+        tenant: str | None = None,
+        mcp_server: str | None = None,
+    ) -> AsyncGenerator[None]:
         """Context manager for throttled AWS API requests with circuit breaker.
 
         This async context manager handles concurrency limiting, rate limiting,
-        and circuit breaker logic. It detects rate limit errors and adds recovery
-        delays, while other errors contribute to the circuit breaker failure count.
+        and circuit breaker logic. It detects rate limit errors and backs off (a
+        fixed recovery delay, or a rate cut in adaptive mode), while dependency
+        failures (see is_circuit_breaker_failure) count towards the error rate of
+        the call's MCP server breaker, or its AWS service breaker for direct calls.
+
+        Per-service and per-operation-class tokens are taken before a concurrency
+        slot, so calls waiting on a slow service quota (e.g. Cost Explorer) never
+        hold slots needed by other services. Every stage shares capacity fairly
+        between tenants and, within a tenant, serves higher priority classes
+        first, so interactive calls overtake queued background work.
 
         Args:
             operation_name: Name of the operation for logging purposes.
                 Defaults to "aws_api_call".
+            tokens: Tokens to take from each bucket, e.g. the number of requests
+                a batch call stands for. Defaults to 1.
+            priority: Priority class ("interactive", "background" or "bulk").
+                Defaults to the current context's priority (see throttle_priority).
+            tenant: Tenant the call is made for. Defaults to the current
+                context's tenant (see throttle_tenant).
+            mcp_server: Name of the MCP server handling the call, for its circuit
+                breaker. Defaults to None (direct AWS SDK call).
 
         Yields:
             None. The context manager handles throttling transparently.
 
         Raises:
-            CircuitBreakerOpenError: If circuit breaker is currently open.
-            CircuitBreakerTrippedError: If this request trips the circuit breaker.
+            CircuitBreakerOpenError: If a breaker guarding the call is open.
+            CircuitBreakerTrippedError: If this request trips a circuit breaker.
             Exception: Re-raises any exceptions from the wrapped code.
 
         Example:
@@ -208,38 +798,62 @@ class GlobalThrottler:
             ...     result = await make_aws_call()
         """
         self._total_requests += 1
+        priority = priority or get_throttle_priority()
+        tenant = tenant or get_throttle_tenant()
+        requested_at = asyncio.get_running_loop().time()
+        breakers: list[CircuitBreaker] = []
+        probes: list[bool] = []
 
         try:
-            # Check circuit breaker first
-            await self._check_circuit_breaker()
+            # Check circuit breakers first, so calls to a failing dependency fail fast
+            breakers = self._get_circuit_breakers(operation_name, mcp_server)
+            probes = self._admit_circuit_breakers(breakers)
+
+            # Wait for the service and operation-class buckets
+            service_buckets = self._get_service_buckets(operation_name)
+            for bucket in service_buckets:
+                await bucket.acquire(tokens, priority, tenant)
 
             # Acquire semaphore for concurrency limiting
-            async with self._semaphore:
+            async with self._semaphore.hold(priority, tenant):
                 # Wait for token bucket
-                await self._wait_for_token()
+                await self._bucket.acquire(tokens, priority, tenant)
+                waited = asyncio.get_running_loop().time() - requested_at
+                self._priority_stats.record(priority, waited)
+                self._tenant_stats.record(tenant, waited)
 
-                logger.debug(f"Throttler: allowing {operation_name} (tokens: {self._tokens:.1f})")
+                logger.debug(
+                    f"Throttler: allowing {operation_name} (tokens: {self._bucket._tokens:.1f})"
+                )
 
                 start_time = time.time()
                 try:
                     yield
 
                     # Record success
-                    await self._record_success()
+                    for breaker, probe in zip(breakers, probes, strict=True):
+                        breaker.record_success(probe)
+                    probes = []
+                    self._adapt_rate(service_buckets, throttled=False)
 
                     duration = time.time() - start_time
                     logger.debug(f"Throttler: {operation_name} completed in {duration:.2f}s")
 
                 except Exception as e:
-                    # Check if this is a rate limiting error - delay instead of failing
-                    if "rate limit" in str(e).lower() or "429" in str(e):
-                        logger.warning(f"Rate limit detected, applying additional delay: {e}")
+                    # Check if this is a rate limiting error - back off instead of failing
+                    if is_rate_limit_error(e, classify_operation(operation_name)[0]):
                         self._throttled_requests += 1
-                        # Don't record as failure for circuit breaker - just add delay
-                        await asyncio.sleep(2.0)  # Additional delay for rate limit recovery
-                    else:
-                        # Only record non-rate-limit errors as failures
-                        await self._record_failure()
+                        # Don't record as failure for circuit breakers - just back off
+                        if self.adaptive_rate_enabled:
+                            logger.warning(f"Rate limit detected for {operation_name}: {e}")
+                            self._adapt_rate(service_buckets, throttled=True)
+                        else:
+                            logger.warning(f"Rate limit detected, applying additional delay: {e}")
+                            await asyncio.sleep(2.0)  # Additional delay for rate limit recovery
+                    elif is_circuit_breaker_failure(e):
+                        # Only record dependency failures against the breakers
+                        failed_probes, probes = probes, []
+                        self._record_circuit_failure(breakers, failed_probes, operation_name)
                     raise
 
         except (CircuitBreakerOpenError, CircuitBreakerTrippedError):
@@ -248,6 +862,10 @@ class GlobalThrottler:
         except Exception as e:
             logger.error(f"Throttler error for {operation_name}: {e}")
             raise
+        finally:
+            # Calls that ended without a health signal give their probe slots back
+            for breaker, probe in zip(breakers, probes, strict=False):
+                breaker.release_probe(probe)
 
     def get_stats(self) -> dict[str, Any]:
         """Get throttling statistics for monitoring.
@@ -256,12 +874,20 @@ class GlobalThrottler:
             Dictionary containing throttling metrics:
             - total_requests: Total number of requests processed
             - throttled_requests: Number of requests that hit rate limits
-            - circuit_breaker_trips: Number of times circuit breaker tripped
+            - circuit_breaker_trips: Number of calls that tripped a circuit breaker
             - current_tokens: Current number of tokens in the bucket
             - max_concurrent_calls: Maximum concurrent calls allowed
-            - tokens_per_second: Rate of token refill
-            - consecutive_failures: Current consecutive failure count
-            - circuit_open: Whether circuit breaker is currently open
+            - tokens_per_second: Current (effective) rate of token refill
+            - configured_tokens_per_second: Rate of token refill at startup
+            - adaptive_rate: Adaptive mode state (enabled, floor, ceiling, rate cuts)
+            - circuit_open: Whether any circuit breaker is currently open
+            - circuit_breakers: State and rolling error rate per circuit breaker
+            - buckets: Per-service and per-operation-class bucket statistics
+            - shared: Lease statistics of the replica-shared global bucket, None
+              when limits apply per process
+            - priorities: Admitted requests and queue wait per priority class
+            - tenants: Admitted requests, queue wait, held slots and queued calls
+              per tenant
 
         Example:
             >>> throttler = GlobalThrottler()
@@ -272,30 +898,56 @@ class GlobalThrottler:
             "total_requests": self._total_requests,
             "throttled_requests": self._throttled_requests,
             "circuit_breaker_trips": self._circuit_breaker_trips,
-            "current_tokens": round(self._tokens, 2),
+            "current_tokens": round(self._bucket._tokens, 2),
             "max_concurrent_calls": self.max_concurrent_calls,
-            "tokens_per_second": self.tokens_per_second,
-            "consecutive_failures": self._consecutive_failures,
-            "circuit_open": (
-                self._circuit_open_until > time.time() if self.circuit_breaker_enabled else False
+            "tokens_per_second": round(self.tokens_per_second, 3),
+            "configured_tokens_per_second": self.configured_tokens_per_second,
+            "adaptive_rate": {
+                "enabled": self.adaptive_rate_enabled,
+                "min_rate": self.adaptive_min_rate,
+                "max_rate": self.adaptive_max_rate,
+                "rate_decreases": self._bucket._rate_decreases,
+            },
+            "circuit_open": any(
+                breaker.state == "open" for breaker in self._circuit_breakers.values()
             ),
+            "circuit_breakers": self.get_circuit_breaker_stats(),
+            "buckets": {
+                name: bucket.get_stats() for name, bucket in sorted(self._service_buckets.items())
+            },
+            "shared": self._bucket.shared.get_stats() if self._bucket.shared is not None else None,
+            "priorities": self._priority_stats.get_stats(),
+            "tenants": self._tenant_stats.get_stats(self._semaphore),
         }
 
-    async def reset_circuit_breaker(self) -> None:
-        """Manually reset circuit breaker (for admin use).
+    def get_circuit_breaker_stats(self) -> dict[str, dict[str, Any]]:
+        """Get the state of every circuit breaker, e.g. for the health endpoint.
 
-        Resets the circuit breaker state, clearing the failure counter
-        and reopening the circuit. Useful for manual intervention after
-        resolving underlying issues.
+        Returns:
+            Mapping of breaker name ("ec2", "ce", "mcp:aws-api", ...) to its
+            statistics (see CircuitBreaker.get_stats).
+        """
+        return {
+            name: breaker.get_stats() for name, breaker in sorted(self._circuit_breakers.items())
+        }
+
+    async def reset_circuit_breaker(self, name: str | None = None) -> None:
+        """Manually reset circuit breakers (for admin use).
+
+        Closes the breakers and clears their error-rate windows. Useful for
+        manual intervention after resolving underlying issues.
+
+        Args:
+            name: Breaker to reset (e.g., "ce"). Defaults to None (all breakers).
 
         Example:
             >>> throttler = GlobalThrottler()
-            >>> await throttler.reset_circuit_breaker()
+            >>> await throttler.reset_circuit_breaker("ce")
         """
-        async with self._circuit_lock:
-            self._circuit_open_until = 0.0
-            self._consecutive_failures = 0
-            logger.info("Circuit breaker manually reset")
+        for breaker_name, breaker in self._circuit_breakers.items():
+            if name is None or breaker_name == name:
+                breaker.reset()
+        logger.info(f"Circuit breaker manually reset: {name or 'all'}")
 
 
 # Global singleton instance
@@ -318,11 +970,23 @@ def get_global_throttler() -> GlobalThrottler:
     return _global_throttler
 
 
-def throttled_aws_call(operation_name: str = "aws_api_call") -> AbstractAsyncContextManager[None]:
+def throttled_aws_call(
+    operation_name: str = "aws_api_call",
+    tokens: int = 1,
+    priority: ThrottlePriority | None = None,
+    tenant: str | None = None,
+    mcp_server: str | None = None,
+) -> AbstractAsyncContextManager[None]:
     """Convenience context manager for throttled AWS API calls.
 
     Args:
         operation_name: Name of the operation for logging. Defaults to "aws_api_call".
+        tokens: Tokens to take, e.g. the number of requests a batch call stands
+            for. Defaults to 1.
+        priority: Priority class ("interactive", "background" or "bulk").
+            Defaults to the current context's priority.
+        tenant: Tenant the call is made for. Defaults to the current context's tenant.
+        mcp_server: Name of the MCP server handling the call, for its circuit breaker.
 
     Returns:
         Async context manager for throttled AWS requests with circuit breaker.
@@ -332,4 +996,4 @@ def throttled_aws_call(operation_name: str = "aws_api_call") -> AbstractAsyncCon
         ...     result = await mcp_call()
     """
     throttler = get_global_throttler()
-    return throttler.throttled_request(operation_name)
+    return throttler.throttled_request(operation_name, tokens, priority, tenant, mcp_server)
@@ -0,0 +1,277 @@
+"""Priority classes for throttled AWS and Bedrock calls.
+
+Interactive calls (a user waiting in Teams) are served before background work
+(command status polling, health overview batches), which is served before bulk
+work (metrics). Each lower class has a reserved share of grants while it is
+waiting, so it is slowed down under contention but never fully starved.
+
+A priority can be passed per call, or set for a whole code path with
+``throttle_priority``; tasks created inside the block inherit it.
+
+Example:
+    >>> with throttle_priority("background"):
+    ...     await mcp_manager.call_aws_api_tool("get-command-invocation", arguments)
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, Final, Literal
+
+from ohlala_smartops.constants import THROTTLE_PRIORITIES, THROTTLE_RESERVED_SHARES
+
+ThrottlePriority = Literal["interactive", "background", "bulk"]
+"""Priority class of a throttled call, highest first."""
+
+_current_priority: Final[ContextVar[ThrottlePriority]] = ContextVar(
+    "throttle_priority", default="interactive"
+)
+
+# Tolerance for floating point error when comparing accrued share credits
+_CREDIT_EPSILON: Final[float] = 1e-9
+
+
+@contextmanager
+def throttle_priority(priority: ThrottlePriority) -> Generator[None]:
+    """Run throttled calls in the block with the given priority.
+
+    Args:
+        priority: Priority class for calls that do not pass one explicitly.
+
+    Yields:
+        None.
+
+    Example:
+        >>> with throttle_priority("bulk"):
+        ...     await emitter.emit_metric("Requests", 1.0)
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def get_throttle_priority() -> ThrottlePriority:
+    """Get the priority class of the current context.
+
+    Returns:
+        The priority set with ``throttle_priority``, or "interactive".
+    """
+    return _current_priority.get()
+
+
+class PriorityWaitQueue:
+    """Per-priority FIFO queues of waiters with reserved shares for lower classes.
+
+    The highest waiting class is served first. Every grant adds its reserved
+    share to each waiting lower class; once a class has accrued a whole grant
+    it is served next. A class with a 0.2 share therefore gets at least one in
+    five grants while it waits. Credits are dropped when a class stops waiting.
+    """
+
+    def __init__(self, reserved_shares: dict[str, float] | None = None) -> None:
+        """Initialize empty queues.
+
+        Args:
+            reserved_shares: Share of grants reserved per lower priority class.
+                Defaults to THROTTLE_RESERVED_SHARES.
+        """
+        self.reserved_shares = (
+            THROTTLE_RESERVED_SHARES if reserved_shares is None else reserved_shares
+        )
+        self._queues: dict[str, deque[tuple[int, asyncio.Future[None]]]] = {
+            priority: deque() for priority in THROTTLE_PRIORITIES
+        }
+        self._credits: dict[str, float] = dict.fromkeys(THROTTLE_PRIORITIES, 0.0)
+
+    def __len__(self) -> int:
+        """Get the number of queued waiters, including cancelled ones not yet purged."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    def append(
+        self, priority: ThrottlePriority, waiter: asyncio.Future[None], tokens: int = 1
+    ) -> None:
+        """Queue a waiter behind the others of its class.
+
+        Args:
+            priority: Priority class of the waiter.
+            waiter: Future resolved when the waiter is served.
+            tokens: Units the waiter needs (tokens or semaphore slots). Defaults to 1.
+        """
+        self._queues[priority].append((tokens, waiter))
+
+    def _waiting_classes(self) -> list[str]:
+        """Get classes with live waiters, highest priority first, dropping cancelled heads."""
+        waiting = []
+        for priority, queue in self._queues.items():
+            while queue and queue[0][1].done():
+                queue.popleft()
+            if queue:
+                waiting.append(priority)
+            else:
+                self._credits[priority] = 0.0
+        return waiting
+
+    def _select(self, waiting: list[str]) -> str:
+        """Pick the class to serve next from the waiting classes."""
+        for priority in waiting[1:]:
+            if self._credits[priority] >= 1 - _CREDIT_EPSILON:
+                return priority
+        return waiting[0]
+
+    def peek(self) -> tuple[int, asyncio.Future[None]] | None:
+        """Get the waiter that will be served next without removing it.
+
+        Returns:
+            Tuple of (tokens, future) for the next waiter, or None if none are waiting.
+        """
+        waiting = self._waiting_classes()
+        if not waiting:
+            return None
+        return self._queues[self._select(waiting)][0]
+
+    def popleft(self) -> tuple[int, asyncio.Future[None]]:
+        """Remove the waiter returned by ``peek`` and charge its class.
+
+        Returns:
+            Tuple of (tokens, future) for the served waiter.
+
+        Raises:
+            IndexError: If no waiters are queued.
+        """
+        waiting = self._waiting_classes()
+        if not waiting:
+            raise IndexError("popleft from an empty PriorityWaitQueue")
+
+        selected = self._select(waiting)
+        if selected != waiting[0]:
+            self._credits[selected] -= 1
+        for priority in waiting[1:]:
+            self._credits[priority] += self.reserved_shares.get(priority, 0.0)
+        return self._queues[selected].popleft()
+
+    def get_queued(self) -> dict[str, int]:
+        """Get the number of live waiters per priority class.
+
+        Returns:
+            Mapping of priority class to queued waiters.
+        """
+        return {
+            priority: sum(1 for _, waiter in queue if not waiter.done())
+            for priority, queue in self._queues.items()
+        }
+
+
+class PrioritySemaphore:
+    """Concurrency limiter that hands out free slots by priority class.
+
+    Example:
+        >>> semaphore = PrioritySemaphore(8)
+        >>> async with semaphore.hold("background"):
+        ...     await poll_command_status()
+    """
+
+    def __init__(self, value: int) -> None:
+        """Initialize the semaphore.
+
+        Args:
+            value: Number of concurrent holders allowed.
+        """
+        self._value = value
+        self._waiters = PriorityWaitQueue()
+
+    async def acquire(self, priority: ThrottlePriority | None = None) -> None:
+        """Take a slot, waiting behind higher priority and earlier waiters.
+
+        Args:
+            priority: Priority class. Defaults to the current context's priority.
+        """
+        if self._value > 0 and self._waiters.peek() is None:
+            self._value -= 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(priority or get_throttle_priority(), waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just before the cancellation landed - pass the slot on
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Give a slot back, handing it to the next waiter if there is one."""
+        if self._waiters.peek() is not None:
+            _, waiter = self._waiters.popleft()
+            waiter.set_result(None)
+            return
+        self._value += 1
+
+    @asynccontextmanager
+    async def hold(self, priority: ThrottlePriority | None = None) -> AsyncGenerator[None]:
+        """Hold a slot for the duration of the block.
+
+        Args:
+            priority: Priority class. Defaults to the current context's priority.
+
+        Yields:
+            None.
+        """
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def get_queued(self) -> dict[str, int]:
+        """Get the number of waiters per priority class.
+
+        Returns:
+            Mapping of priority class to queued waiters.
+        """
+        return self._waiters.get_queued()
+
+
+class PriorityWaitStats:
+    """Queue wait statistics per priority class."""
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self._requests: dict[str, int] = dict.fromkeys(THROTTLE_PRIORITIES, 0)
+        self._total_wait: dict[str, float] = dict.fromkeys(THROTTLE_PRIORITIES, 0.0)
+        self._max_wait: dict[str, float] = dict.fromkeys(THROTTLE_PRIORITIES, 0.0)
+
+    def record(self, priority: ThrottlePriority, wait_time: float) -> None:
+        """Record how long a call waited before it was admitted.
+
+        Args:
+            priority: Priority class of the call.
+            wait_time: Seconds between the request and its admission.
+        """
+        self._requests[priority] += 1
+        self._total_wait[priority] += wait_time
+        self._max_wait[priority] = max(self._max_wait[priority], wait_time)
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get wait statistics for monitoring.
+
+        Returns:
+            Mapping of priority class to admitted requests, average wait and
+            maximum wait in seconds.
+        """
+        return {
+            priority: {
+                "requests": self._requests[priority],
+                "avg_wait_seconds": (
+                    round(self._total_wait[priority] / self._requests[priority], 3)
+                    if self._requests[priority]
+                    else 0.0
+                ),
+                "max_wait_seconds": round(self._max_wait[priority], 3),
+            }
+            for priority in THROTTLE_PRIORITIES
+        }
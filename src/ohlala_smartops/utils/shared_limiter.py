@@ -0,0 +1,341 @@
+"""Token buckets shared between bot replicas.
+
+The throttlers limit calls per process, so N replicas behind a load balancer would
+make N times the configured AWS and Bedrock rate and run into account-level
+throttling. When ``THROTTLE_REDIS_URL`` is set, every token bucket is backed by a
+bucket in Redis (or any server speaking the Redis protocol and Lua scripting, such
+as Valkey or ElastiCache) that all replicas take from atomically.
+
+To avoid a network round trip per call, each replica leases tokens in small batches
+(``SharedTokenBucket``) and hands them out locally. Leases expire after a short TTL
+so an idle replica cannot sit on tokens that others need.
+
+If the backend is not configured, not installed or unreachable, the throttlers fall
+back to their in-process buckets alone. Backend calls time out after
+``THROTTLE_REDIS_TIMEOUT_SECONDS``, and after a failure the backend is skipped for
+``THROTTLE_REDIS_RETRY_SECONDS`` before one caller tries it again, so an unreachable
+server never stalls throttled calls for more than one timeout.
+
+Example:
+    >>> backend = InMemoryLimiterBackend()  # stand-in for Redis in tests
+    >>> bucket = SharedTokenBucket(backend, "aws:global", lease_size=5)
+    >>> waited = await bucket.acquire(1, tokens_per_second=15.0, max_tokens=30)
+"""
+
+import asyncio
+import logging
+import math
+import os
+from typing import Any, Final, Protocol
+
+from ohlala_smartops.constants import (
+    THROTTLE_REDIS_KEY_PREFIX,
+    THROTTLE_REDIS_RETRY_SECONDS,
+    THROTTLE_REDIS_TIMEOUT_SECONDS,
+)
+
+logger: Final = logging.getLogger(__name__)
+
+# Tolerance for floating point refill arithmetic (a token refilled "exactly" on time
+# may come out a hair short of 1.0)
+_TOKEN_EPSILON: Final[float] = 1e-9
+
+TOKEN_BUCKET_SCRIPT: Final = """
+local requested = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local capacity = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local granted = math.min(requested, math.floor(tokens + 1e-9))
+tokens = math.max(0, tokens - granted)
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+
+local wait = 0
+if granted == 0 then
+    wait = (1 - tokens) / rate
+end
+return {granted, tostring(wait)}
+"""
+"""Atomic token-bucket take: refill from the server clock, grant up to the request.
+
+Returns the number of tokens granted and, when none were, the seconds until one
+will be available. Replicas use the Redis server's clock, so their own clocks do
+not need to agree.
+"""
+
+
+class SharedLimiterBackend(Protocol):
+    """Store of token buckets shared between replicas."""
+
+    async def take(
+        self, key: str, tokens: int, tokens_per_second: float, max_tokens: int
+    ) -> tuple[int, float]:
+        """Atomically take up to ``tokens`` tokens from a bucket.
+
+        Args:
+            key: Bucket key (e.g., "aws:global").
+            tokens: Maximum number of tokens to take.
+            tokens_per_second: Refill rate of the bucket.
+            max_tokens: Bucket capacity.
+
+        Returns:
+            Tuple of tokens granted and, if none were granted, seconds until
+            one is available.
+        """
+        ...
+
+
+class RedisLimiterBackend:
+    """Shared token buckets in Redis, updated atomically by a Lua script."""
+
+    def __init__(self, client: Any, key_prefix: str = THROTTLE_REDIS_KEY_PREFIX) -> None:
+        """Initialize the backend.
+
+        Args:
+            client: Async Redis-compatible client (e.g., ``redis.asyncio.Redis``).
+            key_prefix: Prefix for the bucket keys. Defaults to "ohlala:throttle:".
+        """
+        self.key_prefix = key_prefix
+        self._client = client
+        self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    @classmethod
+    def from_url(
+        cls,
+        url: str,
+        key_prefix: str = THROTTLE_REDIS_KEY_PREFIX,
+        timeout: float = THROTTLE_REDIS_TIMEOUT_SECONDS,
+    ) -> "RedisLimiterBackend":
+        """Connect to a Redis server.
+
+        Args:
+            url: Redis URL, e.g. "redis://cache:6379/0" or "rediss://..." for TLS.
+            key_prefix: Prefix for the bucket keys.
+            timeout: Connect and socket timeout in seconds. Defaults to 0.5.
+
+        Returns:
+            Backend using a new connection pool for the URL.
+
+        Raises:
+            ImportError: If the optional ``redis`` package is not installed.
+        """
+        import redis.asyncio  # noqa: PLC0415 - optional dependency
+
+        client = redis.asyncio.Redis.from_url(
+            url, socket_timeout=timeout, socket_connect_timeout=timeout
+        )
+        return cls(client, key_prefix)
+
+    async def take(
+        self, key: str, tokens: int, tokens_per_second: float, max_tokens: int
+    ) -> tuple[int, float]:
+        """Atomically take up to ``tokens`` tokens from a bucket (see SharedLimiterBackend)."""
+        granted, wait = await self._script(
+            keys=[f"{self.key_prefix}{key}"], args=[tokens, tokens_per_second, max_tokens]
+        )
+        return int(granted), float(wait)
+
+
+class InMemoryLimiterBackend:
+    """In-process stand-in for RedisLimiterBackend with the same bucket semantics.
+
+    Useful in tests and local development: several throttlers sharing one instance
+    behave like replicas sharing a Redis server.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    async def take(
+        self, key: str, tokens: int, tokens_per_second: float, max_tokens: int
+    ) -> tuple[int, float]:
+        """Take up to ``tokens`` tokens from a bucket (see SharedLimiterBackend)."""
+        now = asyncio.get_running_loop().time()
+        available, last = self._buckets.get(key, (float(max_tokens), now))
+        available = min(float(max_tokens), available + max(0.0, now - last) * tokens_per_second)
+
+        granted = min(tokens, math.floor(available + _TOKEN_EPSILON))
+        available = max(0.0, available - granted)
+        self._buckets[key] = (available, now)
+
+        wait = (1 - available) / tokens_per_second if granted == 0 else 0.0
+        return granted, wait
+
+
+class SharedTokenBucket:
+    """Local lease cache in front of a shared token bucket.
+
+    Tokens are taken from the backend ``lease_size`` at a time and handed out
+    locally until they run out or the lease expires, so most calls need no network
+    round trip. Unused tokens of an expired lease are dropped, which errs on the
+    side of calling AWS less rather than more.
+
+    While the backend is failing (degraded), calls skip it without taking the
+    lock, and one call per ``retry_interval`` checks whether it is back.
+    """
+
+    def __init__(
+        self,
+        backend: SharedLimiterBackend,
+        key: str,
+        lease_size: int = 5,
+        lease_ttl: float = 1.0,
+        *,
+        timeout: float = THROTTLE_REDIS_TIMEOUT_SECONDS,
+        retry_interval: float = THROTTLE_REDIS_RETRY_SECONDS,
+    ) -> None:
+        """Initialize the bucket with an empty lease.
+
+        Args:
+            backend: Store of the shared bucket.
+            key: Bucket key (e.g., "aws:global", "aws:ce:read", "bedrock").
+            lease_size: Tokens to lease per round trip. Defaults to 5.
+            lease_ttl: Seconds a lease stays usable. Defaults to 1.0.
+            timeout: Seconds to wait for the backend before treating it as
+                failed. Defaults to 0.5.
+            retry_interval: Seconds the backend is skipped after a failure.
+                Defaults to 5.0.
+        """
+        self.key = key
+        self.lease_size = lease_size
+        self.lease_ttl = lease_ttl
+        self.timeout = timeout
+        self.retry_interval = retry_interval
+        self._backend = backend
+        self._leased = 0
+        self._lease_expires = 0.0
+        self._lock = asyncio.Lock()
+        self._degraded = False
+        self._retry_at = 0.0
+
+        # Metrics
+        self._round_trips = 0
+        self._expired_tokens = 0
+        self._backend_errors = 0
+
+    async def acquire(self, tokens: int, tokens_per_second: float, max_tokens: int) -> float:
+        """Take tokens from the lease, leasing more from the backend as needed.
+
+        Args:
+            tokens: Number of tokens to take.
+            tokens_per_second: Refill rate of the shared bucket.
+            max_tokens: Capacity of the shared bucket.
+
+        Returns:
+            Seconds spent waiting for the shared bucket. Returns immediately while
+            the backend is failing, leaving the call to the local buckets alone.
+        """
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+
+        if self._degraded:
+            if start_time < self._retry_at:
+                return 0.0
+            # This call probes the backend; the others keep skipping it meanwhile
+            self._retry_at = start_time + self.retry_interval
+
+        errors_before = self._backend_errors
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if self._backend_errors != errors_before:
+                    # The backend failed while this call waited for the lock
+                    return now - start_time
+                if self._leased and now >= self._lease_expires:
+                    self._expired_tokens += self._leased
+                    self._leased = 0
+
+                if self._leased >= tokens:
+                    self._leased -= tokens
+                    return loop.time() - start_time
+
+                request = min(max_tokens, max(self.lease_size, tokens - self._leased))
+                try:
+                    granted, wait = await asyncio.wait_for(
+                        self._backend.take(self.key, request, tokens_per_second, max_tokens),
+                        self.timeout,
+                    )
+                except Exception as e:
+                    self._backend_errors += 1
+                    self._retry_at = loop.time() + self.retry_interval
+                    if not self._degraded:
+                        self._degraded = True
+                        logger.warning(
+                            f"Shared rate limiter unavailable for {self.key}, "
+                            f"using local limits only: {e}"
+                        )
+                    return loop.time() - start_time
+
+                self._round_trips += 1
+                if self._degraded:
+                    self._degraded = False
+                    logger.info(f"Shared rate limiter available again for {self.key}")
+
+                if granted:
+                    self._leased += granted
+                    self._lease_expires = loop.time() + self.lease_ttl
+                else:
+                    await asyncio.sleep(wait)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get lease statistics for monitoring.
+
+        Returns:
+            Dictionary with bucket key, whether the backend is currently
+            unreachable, tokens currently leased, backend round trips, tokens
+            dropped with expired leases and backend errors.
+        """
+        return {
+            "key": self.key,
+            "degraded": self._degraded,
+            "leased_tokens": self._leased,
+            "round_trips": self._round_trips,
+            "expired_tokens": self._expired_tokens,
+            "backend_errors": self._backend_errors,
+        }
+
+
+_backends: dict[str, SharedLimiterBackend] = {}
+
+
+def get_shared_limiter_backend() -> SharedLimiterBackend | None:
+    """Get the backend configured by ``THROTTLE_REDIS_URL``, if any.
+
+    Backends are cached per URL, so all throttlers of a process share one
+    connection pool.
+
+    Returns:
+        The shared backend, or None to use in-process limits only (no URL
+        configured, or the ``redis`` package is not installed).
+    """
+    url = os.getenv("THROTTLE_REDIS_URL", "")
+    if not url:
+        return None
+
+    backend = _backends.get(url)
+    if backend is None:
+        key_prefix = os.getenv("THROTTLE_REDIS_KEY_PREFIX", THROTTLE_REDIS_KEY_PREFIX)
+        try:
+            backend = RedisLimiterBackend.from_url(url, key_prefix)
+        except ImportError:
+            logger.warning(
+                "THROTTLE_REDIS_URL is set but the redis package is not installed "
+                "(pip install ohlala-smartops[redis]); using in-process rate limits only"
+            )
+            return None
+        _backends[url] = backend
+        logger.info(f"Shared rate limiting enabled (key prefix: {key_prefix})")
+    return backend
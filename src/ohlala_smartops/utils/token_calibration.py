@@ -0,0 +1,256 @@
+"""Online calibration of Bedrock input token estimates from actual usage.
+
+Token estimates decide whether a request fits the model's context window and
+count against the token quotas. The built-in heuristic (3.5 characters per
+token) is conservative, so requests are rejected or split earlier than needed.
+
+``TokenCalibrator`` records, per operation type, the ``usage.input_tokens``
+Bedrock reports against features of the request (text and JSON size) and fits
+a linear model by exponentially weighted least squares, so it follows prompt
+and model changes. Each update costs a few multiplications and no history is
+kept. Until an operation type has ``min_samples`` observations, callers fall
+back to their heuristics, and fitted estimates carry a safety margin.
+
+Example:
+    >>> features = TokenFeatures.from_request(system_prompt, prompt, tool_definitions)
+    >>> estimate = get_token_calibrator().estimate("bedrock_call", features)
+    >>> ...  # call Bedrock
+    >>> get_token_calibrator().observe("bedrock_call", features, usage["input_tokens"])
+"""
+
+import json
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any, Final
+
+from ohlala_smartops.constants import (
+    TOKEN_CALIBRATION_FORGETTING_FACTOR,
+    TOKEN_CALIBRATION_MIN_SAMPLES,
+    TOKEN_CALIBRATION_SAFETY_MARGIN,
+)
+
+logger: Final = logging.getLogger(__name__)
+
+# Ridge regularization of the feature weights (not the intercept)
+_RIDGE: Final[float] = 1e-3
+
+
+@dataclass(frozen=True)
+class TokenFeatures:
+    """Size features of a Bedrock request that drive its input token count."""
+
+    chars: int
+    """Characters of system prompt, user message and conversation context."""
+
+    json_chars: int
+    """Characters of serialized tool definitions and tool results."""
+
+    @classmethod
+    def from_request(
+        cls,
+        system_prompt: str,
+        user_message: str,
+        tool_definitions: list[dict[str, Any]],
+        conversation_context: str = "",
+        tool_results: list[dict[str, Any]] | None = None,
+    ) -> "TokenFeatures":
+        """Extract features from the parts of a Bedrock request.
+
+        Args:
+            system_prompt: System prompt text.
+            user_message: User's message.
+            tool_definitions: List of tool definitions.
+            conversation_context: Previous conversation context. Defaults to "".
+            tool_results: Tool execution results. Defaults to None.
+
+        Returns:
+            Features of the request.
+        """
+        json_chars = len(json.dumps(tool_definitions)) if tool_definitions else 0
+        if tool_results:
+            json_chars += len(json.dumps(tool_results))
+        return cls(
+            chars=len(system_prompt) + len(user_message) + len(conversation_context),
+            json_chars=json_chars,
+        )
+
+    def vector(self) -> list[float]:
+        """Regression inputs: intercept and thousands of characters."""
+        return [1.0, self.chars / 1000, self.json_chars / 1000]
+
+
+class _OperationModel:
+    """Exponentially weighted least squares fit of input tokens for one operation type.
+
+    Keeps the weighted sums X'X and X'y (a few dozen floats) and solves the ridge
+    regularized normal equations when the weights are needed. The ridge term keeps
+    the system solvable while a feature never varies (e.g., no tools yet), and
+    sets the weight of such a feature to zero.
+    """
+
+    def __init__(self, forgetting_factor: float) -> None:
+        size = len(TokenFeatures(0, 0).vector())
+        self.forgetting_factor = forgetting_factor
+        self._xtx = [[0.0] * size for _ in range(size)]
+        self._xty = [0.0] * size
+        self._weights: list[float] | None = [0.0] * size
+        self.samples = 0
+        self.mean_abs_error = 0.0  # Relative error of predictions made before each update
+
+    @property
+    def weights(self) -> list[float]:
+        """Fitted weights, solved again after updates."""
+        if self._weights is None:
+            size = len(self._xty)
+            matrix = [
+                [*row[:i], row[i] + (_RIDGE if i else 0.0), *row[i + 1 :], self._xty[i]]
+                for i, row in enumerate(self._xtx)
+            ]
+            self._weights = _solve(matrix, size)
+        return self._weights
+
+    def predict(self, x: list[float]) -> float:
+        return sum(w * v for w, v in zip(self.weights, x, strict=True))
+
+    def update(self, x: list[float], y: float) -> None:
+        if self.samples and y > 0:
+            relative_error = abs(self.predict(x) - y) / y
+            self.mean_abs_error += (relative_error - self.mean_abs_error) / min(self.samples, 50)
+
+        decay = self.forgetting_factor
+        self._xtx = [
+            [decay * v + x[i] * x[j] for j, v in enumerate(row)] for i, row in enumerate(self._xtx)
+        ]
+        self._xty = [decay * v + x[i] * y for i, v in enumerate(self._xty)]
+        self._weights = None
+
+        self.samples += 1
+
+
+def _solve(matrix: list[list[float]], size: int) -> list[float]:
+    """Solve an augmented linear system by Gaussian elimination with partial pivoting."""
+    for col in range(size):
+        pivot = max(range(col, size), key=lambda row: abs(matrix[row][col]))
+        matrix[col], matrix[pivot] = matrix[pivot], matrix[col]
+        if abs(matrix[col][col]) < 1e-12:
+            continue
+        for row in range(col + 1, size):
+            factor = matrix[row][col] / matrix[col][col]
+            matrix[row] = [a - factor * b for a, b in zip(matrix[row], matrix[col], strict=True)]
+
+    solution = [0.0] * size
+    for row in range(size - 1, -1, -1):
+        if abs(matrix[row][row]) < 1e-12:
+            continue
+        rest = sum(matrix[row][col] * solution[col] for col in range(row + 1, size))
+        solution[row] = (matrix[row][size] - rest) / matrix[row][row]
+    return solution
+
+
+class TokenCalibrator:
+    """Learns input token counts per operation type from actual Bedrock usage."""
+
+    def __init__(
+        self,
+        min_samples: int = TOKEN_CALIBRATION_MIN_SAMPLES,
+        safety_margin: float = TOKEN_CALIBRATION_SAFETY_MARGIN,
+        forgetting_factor: float = TOKEN_CALIBRATION_FORGETTING_FACTOR,
+    ) -> None:
+        """Initialize an uncalibrated calibrator.
+
+        Args:
+            min_samples: Observations of an operation type before its fitted
+                model is used. Defaults to 20.
+            safety_margin: Share added to fitted estimates. Defaults to 0.1.
+            forgetting_factor: Weight kept by older observations at each update
+                (1.0 never forgets). Defaults to 0.995.
+        """
+        self.min_samples = min_samples
+        self.safety_margin = safety_margin
+        self.forgetting_factor = forgetting_factor
+        self._models: dict[str, _OperationModel] = {}
+
+    def observe(self, operation_type: str, features: TokenFeatures, input_tokens: int) -> None:
+        """Record the input tokens Bedrock reported for a request.
+
+        Args:
+            operation_type: Type of operation (e.g., "bedrock_call", "health_check").
+            features: Features of the request.
+            input_tokens: ``usage.input_tokens`` of the response.
+        """
+        model = self._models.get(operation_type)
+        if model is None:
+            model = self._models[operation_type] = _OperationModel(self.forgetting_factor)
+        model.update(features.vector(), float(input_tokens))
+        if model.samples == self.min_samples:
+            logger.info(
+                f"Token estimates for {operation_type} calibrated from {model.samples} calls"
+            )
+
+    def _calibrated(self, operation_type: str) -> _OperationModel | None:
+        """Get the model of an operation type once it has enough observations."""
+        model = self._models.get(operation_type)
+        return model if model is not None and model.samples >= self.min_samples else None
+
+    def _with_margin(self, tokens: float) -> int | None:
+        """Apply the safety margin, rejecting implausible predictions."""
+        return math.ceil(tokens * (1 + self.safety_margin)) if tokens > 0 else None
+
+    def estimate(self, operation_type: str, features: TokenFeatures) -> int | None:
+        """Estimate the input tokens of a request.
+
+        Args:
+            operation_type: Type of operation.
+            features: Features of the request.
+
+        Returns:
+            Estimated input tokens including the safety margin, or None if the
+            operation type is not calibrated yet (use a heuristic instead).
+        """
+        model = self._calibrated(operation_type)
+        if model is None:
+            return None
+        return self._with_margin(model.predict(features.vector()))
+
+    def reset(self) -> None:
+        """Forget all observations."""
+        self._models.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get calibration statistics for monitoring.
+
+        Returns:
+            Dictionary mapping operation types to observations, whether the
+            fitted model is in use, mean relative error of its predictions and
+            the fitted tokens per 1K characters and per 1K JSON characters.
+        """
+        return {
+            operation_type: {
+                "samples": model.samples,
+                "calibrated": model.samples >= self.min_samples,
+                "mean_abs_error": round(model.mean_abs_error, 3),
+                "weights": {
+                    "base": round(model.weights[0], 1),
+                    "per_1k_chars": round(model.weights[1], 1),
+                    "per_1k_json_chars": round(model.weights[2], 1),
+                },
+            }
+            for operation_type, model in self._models.items()
+        }
+
+
+# Global instance
+_token_calibrator: TokenCalibrator | None = None
+
+
+def get_token_calibrator() -> TokenCalibrator:
+    """Get the global token calibrator singleton instance.
+
+    Returns:
+        The global TokenCalibrator instance, creating it if necessary.
+    """
+    global _token_calibrator  # noqa: PLW0603
+    if _token_calibrator is None:
+        _token_calibrator = TokenCalibrator()
+    return _token_calibrator
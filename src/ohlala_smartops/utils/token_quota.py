@@ -0,0 +1,347 @@
+"""Rolling-window Bedrock token quotas per user and per team.
+
+The daily cost limit of ``TokenTracker`` is global, so one heavy user can spend the
+whole deployment's budget in an hour. ``TokenQuotas`` counts the tokens each user
+and each team (the fair-share tenant, see ``ohlala_smartops.utils.fair_share``)
+used in the last minute, hour and day, and rejects a Bedrock call up front when
+its estimated input would take a counter over its limit.
+
+The team of a channel conversation is its Teams team. Personal and group chats
+belong to no team and count against their Azure AD tenant instead, so for them
+the team quotas apply to the whole tenant.
+
+Each counter is a fixed-size ring of time buckets with a running total, so
+checking and recording a call costs the same however many calls were made.
+Tokens leave a window one bucket at a time (every second for the minute window,
+every minute for the hour window, every 15 minutes for the day window). Counters
+of users and teams with no usage left in any window are dropped periodically.
+
+Limits are configured via environment variables, 0 meaning no limit:
+    - TOKEN_QUOTA_USER_PER_MINUTE, TOKEN_QUOTA_USER_PER_HOUR, TOKEN_QUOTA_USER_PER_DAY
+    - TOKEN_QUOTA_TEAM_PER_MINUTE, TOKEN_QUOTA_TEAM_PER_HOUR, TOKEN_QUOTA_TEAM_PER_DAY
+
+Example:
+    >>> quotas = TokenQuotas(user_limits={"hour": 200_000})
+    >>> quotas.check("user123", "19:team@thread.tacv2", estimated_tokens=5_000)
+    >>> quotas.record("user123", "19:team@thread.tacv2", tokens=6_200)
+"""
+
+import logging
+import os
+import time
+from typing import Any, Final, Literal
+
+logger: Final = logging.getLogger(__name__)
+
+QuotaWindow = Literal["minute", "hour", "day"]
+"""Length of a rolling quota window."""
+
+QuotaScope = Literal["user", "team"]
+"""Who a quota applies to."""
+
+_WINDOWS: Final[dict[QuotaWindow, tuple[int, int]]] = {
+    "minute": (60, 60),
+    "hour": (3600, 60),
+    "day": (86400, 96),
+}
+"""Window length in seconds and number of ring buckets per window."""
+
+_EVICTION_INTERVAL: Final[float] = 900.0
+"""Seconds between sweeps dropping the counters of idle users and teams."""
+
+
+class TokenQuotaExceededError(Exception):
+    """Raised when a call would take a user or team over a token quota.
+
+    Attributes:
+        scope: Whether the user or the team quota was exceeded.
+        window: Rolling window of the exceeded quota.
+        retry_after: Seconds until enough tokens have left the window.
+    """
+
+    def __init__(self, scope: QuotaScope, window: QuotaWindow, retry_after: float) -> None:
+        """Initialize the error.
+
+        Args:
+            scope: Whether the user or the team quota was exceeded.
+            window: Rolling window of the exceeded quota.
+            retry_after: Seconds until enough tokens have left the window.
+        """
+        self.scope = scope
+        self.window = window
+        self.retry_after = retry_after
+        owner = "Your" if scope == "user" else "Your team's"
+        super().__init__(
+            f"{owner} Bedrock token quota per {window} is used up, "
+            f"retry in {_format_seconds(retry_after)}"
+        )
+
+
+def _format_seconds(seconds: float) -> str:
+    """Format a wait for users (e.g., "45s", "12 min", "3 h")."""
+    if seconds < 60:
+        return f"{max(1, round(seconds))}s"
+    if seconds < 3600:
+        return f"{round(seconds / 60)} min"
+    return f"{round(seconds / 3600)} h"
+
+
+class RollingWindowCounter:
+    """Sum of amounts added within the last ``window_seconds``, in a ring of buckets.
+
+    The window moves forward one bucket at a time; each bucket is cleared when it
+    is reused, so memory is fixed and every operation touches at most ``buckets``
+    slots (usually one).
+    """
+
+    def __init__(self, window_seconds: int, buckets: int) -> None:
+        """Initialize an empty counter.
+
+        Args:
+            window_seconds: Length of the rolling window.
+            buckets: Number of ring buckets; the window advances in steps of
+                ``window_seconds / buckets``.
+        """
+        self.window_seconds = window_seconds
+        self.bucket_seconds = window_seconds / buckets
+        self._counts = [0] * buckets
+        self._epoch = 0  # Index (in bucket steps since the clock's epoch) of the newest bucket
+        self._total = 0
+
+    def _advance(self, now: float) -> int:
+        """Move the window to ``now``, clearing buckets that left it.
+
+        Returns:
+            Ring index of the current bucket.
+        """
+        epoch = int(now // self.bucket_seconds)
+        size = len(self._counts)
+        if epoch > self._epoch:
+            for step in range(min(epoch - self._epoch, size)):
+                index = (self._epoch + 1 + step) % size
+                self._total -= self._counts[index]
+                self._counts[index] = 0
+            self._epoch = epoch
+        return self._epoch % size
+
+    def add(self, amount: int, now: float) -> None:
+        """Add an amount at time ``now``.
+
+        Args:
+            amount: Amount to add (e.g., tokens used by a call).
+            now: Current time in seconds.
+        """
+        self._counts[self._advance(now)] += amount
+        self._total += amount
+
+    def total(self, now: float) -> int:
+        """Sum of the amounts added within the window ending at ``now``.
+
+        Args:
+            now: Current time in seconds.
+
+        Returns:
+            Total of the window.
+        """
+        self._advance(now)
+        return self._total
+
+    def time_until_below(self, limit: int, now: float) -> float:
+        """Seconds until the total drops to ``limit`` or less as old buckets expire.
+
+        Args:
+            limit: Target total.
+            now: Current time in seconds.
+
+        Returns:
+            Seconds to wait, 0.0 if the total is already within the limit.
+        """
+        total = self.total(now)
+        if total <= limit:
+            return 0.0
+
+        size = len(self._counts)
+        for age in range(size - 1, -1, -1):
+            total -= self._counts[(self._epoch - age) % size]
+            if total <= limit:
+                # The bucket expires when the window has moved past its end
+                expires_at = (self._epoch - age + size) * self.bucket_seconds
+                return max(0.0, expires_at - now)
+        return self.window_seconds
+
+
+class TokenQuotas:
+    """Rolling-window token counters and quotas per user and per team."""
+
+    def __init__(
+        self,
+        user_limits: dict[QuotaWindow, int] | None = None,
+        team_limits: dict[QuotaWindow, int] | None = None,
+    ) -> None:
+        """Initialize quotas with empty counters.
+
+        Usage is counted in every window whether or not it has a limit, so it
+        can be reported.
+
+        Args:
+            user_limits: Maximum tokens per user by window. Missing or 0 means
+                no limit. Defaults to no limits.
+            team_limits: Maximum tokens per team by window. Missing or 0 means
+                no limit. Defaults to no limits.
+        """
+        self.limits: dict[QuotaScope, dict[QuotaWindow, int]] = {
+            "user": {window: limit for window, limit in (user_limits or {}).items() if limit > 0},
+            "team": {window: limit for window, limit in (team_limits or {}).items() if limit > 0},
+        }
+        self._counters: dict[tuple[QuotaScope, str], dict[QuotaWindow, RollingWindowCounter]] = {}
+        self._next_eviction = 0.0
+
+        # Metrics
+        self._rejected = 0
+
+    @classmethod
+    def from_env(cls) -> "TokenQuotas":
+        """Create quotas from the TOKEN_QUOTA_* environment variables.
+
+        Returns:
+            Quotas with the configured limits.
+        """
+
+        def limits(scope: str) -> dict[QuotaWindow, int]:
+            return {
+                window: int(os.getenv(f"TOKEN_QUOTA_{scope}_PER_{window.upper()}", "0"))
+                for window in _WINDOWS
+            }
+
+        return cls(user_limits=limits("USER"), team_limits=limits("TEAM"))
+
+    @staticmethod
+    def _keys(user_id: str, team_id: str) -> tuple[tuple[QuotaScope, str], ...]:
+        """Counter keys of a call made by a user for a team."""
+        return (("user", user_id), ("team", team_id))
+
+    def _counters_for(self, scope: QuotaScope, key: str) -> dict[QuotaWindow, RollingWindowCounter]:
+        """Get (creating if needed) the window counters of a user or team."""
+        counters = self._counters.get((scope, key))
+        if counters is None:
+            counters = {
+                window: RollingWindowCounter(seconds, buckets)
+                for window, (seconds, buckets) in _WINDOWS.items()
+            }
+            self._counters[(scope, key)] = counters
+        return counters
+
+    def check(self, user_id: str, team_id: str, estimated_tokens: int) -> None:
+        """Check that a call fits within the user's and team's quotas.
+
+        Args:
+            user_id: User making the call.
+            team_id: Team (fair-share tenant) the call is made for.
+            estimated_tokens: Estimated input tokens of the call.
+
+        Raises:
+            TokenQuotaExceededError: If the call would take a counter over its
+                limit. The error reports the longest wait among exceeded quotas.
+        """
+        now = time.time()
+        exceeded: TokenQuotaExceededError | None = None
+        for scope, key in self._keys(user_id, team_id):
+            scope_limits = self.limits[scope]
+            if not scope_limits:
+                continue
+            counters = self._counters_for(scope, key)
+            for window, limit in scope_limits.items():
+                counter = counters[window]
+                if counter.total(now) + estimated_tokens <= limit:
+                    continue
+                retry_after = counter.time_until_below(max(0, limit - estimated_tokens), now)
+                if exceeded is None or retry_after > exceeded.retry_after:
+                    exceeded = TokenQuotaExceededError(scope, window, retry_after)
+
+        if exceeded is not None:
+            self._rejected += 1
+            logger.warning(
+                f"Token quota per {exceeded.window} exceeded for {exceeded.scope} "
+                f"{user_id if exceeded.scope == 'user' else team_id}"
+            )
+            raise exceeded
+
+    def record(self, user_id: str, team_id: str, tokens: int) -> None:
+        """Count the tokens a completed call used.
+
+        Args:
+            user_id: User who made the call.
+            team_id: Team (fair-share tenant) the call was made for.
+            tokens: Input plus output tokens of the call.
+        """
+        now = time.time()
+        self._evict_idle(now)
+        for scope, key in self._keys(user_id, team_id):
+            for counter in self._counters_for(scope, key).values():
+                counter.add(tokens, now)
+
+    def _evict_idle(self, now: float) -> None:
+        """Drop the counters of users and teams with no usage left, at most every 15 min."""
+        if now < self._next_eviction:
+            return
+        self._next_eviction = now + _EVICTION_INTERVAL
+        # The day window contains the others, so an empty day means no usage at all
+        idle = [key for key, counters in self._counters.items() if not counters["day"].total(now)]
+        for key in idle:
+            del self._counters[key]
+        if idle:
+            logger.debug(f"Dropped token quota counters of {len(idle)} idle users and teams")
+
+    def get_usage(self, user_id: str, team_id: str) -> dict[str, dict[str, dict[str, Any]]]:
+        """Get a user's and team's token usage per window.
+
+        Args:
+            user_id: User to report.
+            team_id: Team to report.
+
+        Returns:
+            Mapping of scope ("user", "team") to window to a dictionary with
+            tokens used and the limit (None if unlimited).
+        """
+        now = time.time()
+        usage: dict[str, dict[str, dict[str, Any]]] = {}
+        for scope, key in self._keys(user_id, team_id):
+            counters = self._counters.get((scope, key), {})
+            usage[scope] = {
+                window: {
+                    "used": counters[window].total(now) if window in counters else 0,
+                    "limit": self.limits[scope].get(window),
+                }
+                for window in _WINDOWS
+            }
+        return usage
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get quota statistics for monitoring.
+
+        Returns:
+            Dictionary with configured limits, number of users and teams
+            counted and number of rejected calls.
+        """
+        return {
+            "limits": self.limits,
+            "users": sum(scope == "user" for scope, _ in self._counters),
+            "teams": sum(scope == "team" for scope, _ in self._counters),
+            "rejected": self._rejected,
+        }
+
+
+# Global instance
+_token_quotas: TokenQuotas | None = None
+
+
+def get_token_quotas() -> TokenQuotas:
+    """Get the global token quotas singleton instance.
+
+    Returns:
+        The global TokenQuotas instance, created from the environment if necessary.
+    """
+    global _token_quotas  # noqa: PLW0603
+    if _token_quotas is None:
+        _token_quotas = TokenQuotas.from_env()
+    return _token_quotas
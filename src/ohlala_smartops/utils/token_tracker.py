@@ -3,16 +3,27 @@
 This module provides token tracking, usage limits, and cost monitoring to prevent
 exceeding AWS Bedrock model limits and manage costs. It maintains both session-based
 and daily statistics with persistent storage.
+
+Daily statistics are written behind: tracking an operation only updates the
+in-memory counters, and the file is rewritten at most once per flush interval
+(and on shutdown) in a worker thread, so Bedrock calls never wait for the disk.
 """
 
 import argparse
+import asyncio
+import contextlib
 import json
 import logging
+import os
+import tempfile
 import time
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Final
 
+from ohlala_smartops.constants import TOKEN_STATS_FLUSH_INTERVAL_SECONDS
+from ohlala_smartops.utils.token_calibration import TokenFeatures, get_token_calibrator
+
 logger: Final = logging.getLogger(__name__)
 
 
@@ -20,7 +31,9 @@ class TokenTracker:
     """Tracks token usage, costs, and enforces limits for Bedrock operations.
 
     Maintains both session-based (in-memory) and daily (persistent) statistics.
-    Daily statistics are stored in a JSON file and reset at midnight UTC.
+    Daily statistics are stored in a JSON file and reset at midnight UTC. Inside an
+    event loop the file is written behind, at most once per ``flush_interval``;
+    call ``close()`` on shutdown to write the last updates.
 
     Attributes:
         PRICING: Claude Sonnet 4.5 pricing per 1K tokens.
@@ -45,14 +58,23 @@ class TokenTracker:
     def __init__(
         self,
         storage_path: str = "/tmp/smartops_daily_tokens.json",  # nosec B108
+        flush_interval: float = TOKEN_STATS_FLUSH_INTERVAL_SECONDS,
     ) -> None:
         """Initialize the token tracker.
 
         Args:
             storage_path: Path to store daily statistics.
                 Defaults to /tmp/smartops_daily_tokens.json.
+            flush_interval: Seconds updates are held before the daily statistics
+                are written. Defaults to 5.0.
         """
         self.storage_path = Path(storage_path)
+        self.flush_interval = flush_interval
+        self._version = 0  # Incremented by every change of the daily statistics
+        self._saved_version = 0  # Version last written successfully
+        self._flush_task: asyncio.Task[None] | None = None
+        self._write_lock = asyncio.Lock()
+        self._flushes = 0
         self.session_stats: dict[str, Any] = {
             "operations": 0,
             "total_input_tokens": 0,
@@ -98,15 +120,91 @@ class TokenTracker:
         }
 
     def _save_daily_stats(self) -> None:
-        """Save daily statistics to persistent storage.
+        """Save daily statistics to persistent storage now.
 
         Logs errors if saving fails but does not raise exceptions.
         """
+        version = self._version
+        if self._write_stats(json.dumps(self.daily_stats, indent=2)):
+            self._saved_version = max(self._saved_version, version)
+
+    def _write_stats(self, payload: str) -> bool:
+        """Atomically replace the statistics file with ``payload``.
+
+        The payload goes to a temporary file in the same directory that is then
+        renamed over the old file, so readers and concurrent writers never see a
+        partially written file. Logs errors but does not raise exceptions.
+
+        Args:
+            payload: Serialized daily statistics.
+
+        Returns:
+            True if the file was written.
+        """
+        temp_path: str | None = None
         try:
-            with self.storage_path.open("w") as f:
-                json.dump(self.daily_stats, f, indent=2)
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.storage_path.parent, prefix=f".{self.storage_path.name}.", suffix=".tmp"
+            )
+            with os.fdopen(fd, "w") as f:
+                f.write(payload)
+            Path(temp_path).replace(self.storage_path)
+            self._flushes += 1
+            return True
         except Exception as e:
             logger.error(f"Failed to save daily stats: {e}")
+            if temp_path is not None:
+                with contextlib.suppress(OSError):
+                    Path(temp_path).unlink()
+            return False
+
+    def _schedule_flush(self) -> None:
+        """Mark the daily statistics changed and arrange for them to be written.
+
+        Inside an event loop, a write is scheduled ``flush_interval`` seconds out
+        unless one is already pending, so updates in between share one write.
+        Without a running loop (e.g., the CLI) nothing would be blocked, so the
+        statistics are written right away.
+        """
+        self._version += 1
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._save_daily_stats()
+            return
+
+        task = self._flush_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._flush_task = loop.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        """Write the daily statistics once the flush interval has passed."""
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write pending daily statistics now, off the event loop.
+
+        The statistics are serialized on the loop, so the written snapshot is
+        consistent, and the file is replaced in a worker thread. If the write
+        fails, the statistics stay pending for the next flush.
+        """
+        async with self._write_lock:
+            version = self._version
+            if version == self._saved_version:
+                return
+            payload = json.dumps(self.daily_stats, indent=2)
+            if await asyncio.to_thread(self._write_stats, payload):
+                self._saved_version = max(self._saved_version, version)
+
+    async def close(self) -> None:
+        """Cancel the pending delayed write and write pending statistics (e.g., on shutdown)."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self.flush()
 
     def estimate_tokens(self, text: str) -> int:
         """Estimate token count for text.
@@ -296,7 +394,9 @@ class TokenTracker:
     ) -> dict[str, Any]:
         """Track a completed operation and update statistics.
 
-        Updates both session and daily statistics, and persists daily stats to disk.
+        Updates both session and daily statistics. Daily statistics are written to
+        disk behind the call (see ``flush``), so tracking never waits for disk I/O
+        inside the event loop.
 
         Args:
             operation_type: Type of operation (e.g., 'health_check', 'disk_analysis').
@@ -359,8 +459,8 @@ class TokenTracker:
         )
         self.daily_stats["operations_by_type"][operation_type]["cost"] += total_cost
 
-        # Save updated stats
-        self._save_daily_stats()
+        # Persist updated stats (written behind, coalescing updates)
+        self._schedule_flush()
 
         # Log the operation
         logger.info(
@@ -490,15 +590,22 @@ def estimate_bedrock_input_tokens(
     tool_definitions: list[dict[str, Any]],
     conversation_context: str = "",
     tool_results: list[dict[str, Any]] | None = None,
+    *,
+    operation_type: str = "bedrock_call",
 ) -> int:
     """Estimate total input tokens for a Bedrock request.
 
+    Once enough calls of the operation type were observed, the estimate comes
+    from the model fitted to actual Bedrock usage (see ``TokenCalibrator``);
+    until then from the character count.
+
     Args:
         system_prompt: System prompt text.
         user_message: User's message.
         tool_definitions: List of tool definitions.
         conversation_context: Previous conversation context. Defaults to "".
         tool_results: Tool execution results. Defaults to None.
+        operation_type: Type of operation. Defaults to "bedrock_call".
 
     Returns:
         Estimated input token count.
@@ -507,6 +614,17 @@ def estimate_bedrock_input_tokens(
         >>> tokens = estimate_bedrock_input_tokens("System", "Hello", [], "")
         >>> print(tokens)
     """
+    features = TokenFeatures.from_request(
+        system_prompt,
+        user_message,
+        tool_definitions,
+        conversation_context,
+        tool_results,
+    )
+    calibrated = get_token_calibrator().estimate(operation_type, features)
+    if calibrated is not None:
+        return calibrated
+
     tracker = get_token_tracker()
     total_text = ""
 
@@ -7,11 +7,13 @@ user confirmation before execution, and async command tracking for SSM operation
 from ohlala_smartops.workflow.command_tracker import (
     AsyncCommandTracker,
     CommandCompletionCallback,
+    TrackedCommandStore,
 )
 from ohlala_smartops.workflow.write_operations import WriteOperationManager
 
 __all__ = [
     "AsyncCommandTracker",
     "CommandCompletionCallback",
+    "TrackedCommandStore",
     "WriteOperationManager",
 ]
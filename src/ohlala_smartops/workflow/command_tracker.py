@@ -9,6 +9,7 @@ Phase 3C: Core command tracking implementation without Bot Framework dependencie
 import asyncio
 import contextlib
 import logging
+from collections.abc import Awaitable
 from datetime import UTC, datetime
 from typing import Any, Final, Protocol
 
@@ -18,6 +19,7 @@ from ohlala_smartops.models.command_tracking import (
     SSMCommandStatus,
     WorkflowInfo,
 )
+from ohlala_smartops.utils.priority import throttle_priority
 
 logger: Final = logging.getLogger(__name__)
 
@@ -51,6 +53,34 @@ class CommandCompletionCallback(Protocol):
         ...
 
 
+class TrackedCommandStore(Protocol):
+    """Protocol for storage keeping tracked commands across restarts.
+
+    Implemented by SqliteStateStorage. Commands and workflows are saved when
+    they are created or change status, and deleted once they complete.
+    """
+
+    async def save_tracked_command(self, tracking_info: CommandTrackingInfo) -> None:
+        """Store a tracked command."""
+        ...
+
+    async def delete_tracked_command(self, command_id: str) -> None:
+        """Delete a completed command."""
+        ...
+
+    async def save_workflow(self, workflow_info: WorkflowInfo) -> None:
+        """Store a workflow."""
+        ...
+
+    async def delete_workflow(self, workflow_id: str) -> None:
+        """Delete a completed workflow."""
+        ...
+
+    async def load_tracked_commands(self) -> tuple[list[CommandTrackingInfo], list[WorkflowInfo]]:
+        """Load the commands and workflows stored before a restart."""
+        ...
+
+
 class AsyncCommandTracker:
     """Tracks SSM command execution with polling and workflow coordination.
 
@@ -59,6 +89,7 @@ class AsyncCommandTracker:
     - Exponential backoff (3s → 10s)
     - Timeout handling (15 minutes default)
     - Completion callbacks for decoupled notifications
+    - Optional store restoring tracked commands after a restart
     - No direct Teams/Bedrock dependencies
 
     Attributes:
@@ -88,28 +119,44 @@ class AsyncCommandTracker:
         self,
         mcp_manager: MCPManager,
         completion_callback: CommandCompletionCallback | None = None,
+        store: TrackedCommandStore | None = None,
     ) -> None:
         """Initialize AsyncCommandTracker.
 
         Args:
             mcp_manager: MCP Manager for SSM API calls.
             completion_callback: Optional callback for notifications.
+            store: Optional storage keeping tracked commands across restarts.
         """
         self.mcp_manager = mcp_manager
         self.completion_callback = completion_callback
+        self.store = store
         self.active_commands: dict[str, CommandTrackingInfo] = {}
         self.active_workflows: dict[str, WorkflowInfo] = {}
         self._polling_task: asyncio.Task[None] | None = None
         self._running = False
+        self._restored = False
+        self._store_writes: set[asyncio.Task[None]] = set()
         logger.debug("AsyncCommandTracker initialized")
 
     async def start(self) -> None:
-        """Start the background polling task.
+        """Restore stored commands and start the background polling task.
 
         Example:
             >>> tracker = AsyncCommandTracker(mcp_manager)
             >>> await tracker.start()
         """
+        if self.store and not self._restored:
+            commands, workflows = await self.store.load_tracked_commands()
+            for workflow in workflows:
+                self.active_workflows.setdefault(workflow.workflow_id, workflow)
+            for tracking_info in commands:
+                self.active_commands.setdefault(tracking_info.command_id, tracking_info)
+            self._restored = True
+            logger.info(
+                "Restored %d tracked commands and %d workflows", len(commands), len(workflows)
+            )
+
         if not self._running:
             self._running = True
             self._polling_task = asyncio.create_task(self._polling_loop())
@@ -126,6 +173,8 @@ class AsyncCommandTracker:
             self._polling_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await self._polling_task
+        if self._store_writes:
+            await asyncio.gather(*self._store_writes)
         logger.info("AsyncCommandTracker stopped (tracked %d commands)", len(self.active_commands))
 
     def track_command(
@@ -168,11 +217,15 @@ class AsyncCommandTracker:
         )
 
         self.active_commands[command_id] = tracking_info
+        if self.store:
+            self._write_to_store(self.store.save_tracked_command(tracking_info))
 
         # Add to workflow if applicable
         if workflow_id and workflow_id in self.active_workflows:
             workflow = self.active_workflows[workflow_id]
             workflow.command_ids.append(command_id)
+            if self.store:
+                self._write_to_store(self.store.save_workflow(workflow))
 
         logger.info(
             "Tracking command %s on instance %s (workflow: %s, timeout: %dm)",
@@ -214,6 +267,8 @@ class AsyncCommandTracker:
         )
 
         self.active_workflows[workflow_id] = workflow
+        if self.store:
+            self._write_to_store(self.store.save_workflow(workflow))
         logger.info(
             "Created workflow %s for %d %s commands",
             workflow_id,
@@ -223,34 +278,54 @@ class AsyncCommandTracker:
 
         return workflow
 
+    def _write_to_store(self, write: Awaitable[None]) -> None:
+        """Apply a store write in the background, in the order writes are made.
+
+        Args:
+            write: Pending store write.
+        """
+        task = asyncio.ensure_future(self._guarded_store_write(write))
+        self._store_writes.add(task)
+        task.add_done_callback(self._store_writes.discard)
+
+    @staticmethod
+    async def _guarded_store_write(write: Awaitable[None]) -> None:
+        """Await a store write, logging failures instead of raising them."""
+        try:
+            await write
+        except Exception as e:
+            logger.error("Failed to store tracked command state: %s", e, exc_info=True)
+
     async def _polling_loop(self) -> None:
         """Main polling loop for checking command status.
 
         Runs continuously while _running is True, checking each command
         to see if it needs polling based on exponential backoff timing.
+        Status polls run at background priority so they never delay users.
         """
-        while self._running:
-            try:
-                await asyncio.sleep(1)  # Check every second
+        with throttle_priority("background"):
+            while self._running:
+                try:
+                    await asyncio.sleep(1)  # Check every second
 
-                # Poll commands that are due
-                for command_id in list(self.active_commands.keys()):
-                    if command_id not in self.active_commands:
-                        continue  # May have been removed
+                    # Poll commands that are due
+                    for command_id in list(self.active_commands.keys()):
+                        if command_id not in self.active_commands:
+                            continue  # May have been removed
 
-                    tracking_info = self.active_commands[command_id]
+                        tracking_info = self.active_commands[command_id]
 
-                    if tracking_info.is_terminal_state():
-                        continue  # Already completed
+                        if tracking_info.is_terminal_state():
+                            continue  # Already completed
 
-                    # Check if it's time to poll
-                    if self._should_poll(tracking_info):
-                        await self._poll_command(tracking_info)
+                        # Check if it's time to poll
+                        if self._should_poll(tracking_info):
+                            await self._poll_command(tracking_info)
 
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error("Error in polling loop: %s", e, exc_info=True)
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    logger.error("Error in polling loop: %s", e, exc_info=True)
 
     def _should_poll(self, tracking_info: CommandTrackingInfo) -> bool:
         """Check if command should be polled now.
@@ -313,6 +388,8 @@ class AsyncCommandTracker:
 
             # Log status changes
             if old_status != new_status:
+                if self.store and not tracking_info.is_terminal_state():
+                    self._write_to_store(self.store.save_tracked_command(tracking_info))
                 logger.info(
                     "Command %s status: %s → %s (poll #%d)",
                     tracking_info.command_id,
@@ -417,6 +494,10 @@ class AsyncCommandTracker:
 
                 # Clean up workflow
                 del self.active_workflows[workflow_id]
+                if self.store:
+                    self._write_to_store(self.store.delete_workflow(workflow_id))
+            elif self.store:
+                self._write_to_store(self.store.save_workflow(workflow_info))
 
         # Notify completion callback
         if self.completion_callback:
@@ -424,6 +505,8 @@ class AsyncCommandTracker:
 
         # Remove from active tracking
         del self.active_commands[command_id]
+        if self.store:
+            self._write_to_store(self.store.delete_tracked_command(command_id))
 
     def get_command_status(self, command_id: str) -> CommandTrackingInfo | None:
         """Get current status of a tracked command.
@@ -63,6 +63,8 @@ class WriteOperationManager:
         """
         self.confirmation_timeout = timedelta(minutes=confirmation_timeout_minutes)
         self.pending_operations: dict[str, ApprovalRequest] = {}
+        # Operation IDs per requesting user (dicts used as insertion-ordered sets)
+        self._operations_by_user: dict[str, dict[str, None]] = {}
         self.operation_callbacks: dict[
             str, Callable[[ApprovalRequest], Coroutine[Any, Any, dict[str, Any]]]
         ] = {}
@@ -164,6 +166,7 @@ class WriteOperationManager:
         )
 
         self.pending_operations[operation_id] = approval_request
+        self._operations_by_user.setdefault(user_id, {})[operation_id] = None
 
         # Store callback separately (not serializable in the model)
         if callback:
@@ -320,10 +323,13 @@ class WriteOperationManager:
         user_operations: list[ApprovalRequest] = []
         expired_ids: list[str] = []
 
-        for op_id, operation in self.pending_operations.items():
+        # Only the user's own operations are read; other users' expired
+        # operations are left to the cleanup task
+        for op_id in self._operations_by_user.get(user_id, {}):
+            operation = self.pending_operations[op_id]
             if current_time > operation.expires_at:
                 expired_ids.append(op_id)
-            elif operation.requester_id == user_id:
+            else:
                 user_operations.append(operation)
 
         # Clean up expired operations
@@ -338,9 +344,16 @@ class WriteOperationManager:
         Args:
             operation_id: ID of the operation to remove.
         """
-        self.pending_operations.pop(operation_id, None)
+        operation = self.pending_operations.pop(operation_id, None)
         self.operation_callbacks.pop(operation_id, None)
 
+        if operation is not None:
+            user_operations = self._operations_by_user.get(operation.requester_id)
+            if user_operations is not None:
+                user_operations.pop(operation_id, None)
+                if not user_operations:
+                    del self._operations_by_user[operation.requester_id]
+
     async def _cleanup_expired_operations(self) -> None:
         """Periodically clean up expired operations.
 
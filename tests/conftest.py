@@ -1,6 +1,79 @@
 """Pytest configuration and shared fixtures."""
 
+import asyncio
+from collections.abc import AsyncGenerator, Generator
+from typing import Any
+from unittest.mock import patch
+
 import pytest
+import pytest_asyncio
+
+from ohlala_smartops.aws.client import get_client_registry
+from ohlala_smartops.utils.cost_cache import CostCache
+from ohlala_smartops.utils.token_calibration import get_token_calibrator
+
+
+class VirtualClock:
+    """Virtual time source for the running event loop.
+
+    Whenever the loop would block waiting for its next timer, virtual time jumps
+    straight to that timer. Sleeps and rate limit waits complete instantly while
+    ``loop.time()`` reports exactly how long they would have taken.
+    """
+
+    def __init__(self) -> None:
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def time(self) -> float:
+        """Get the current virtual time in seconds."""
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def reset_aws_client_registry() -> None:
+    """Drop shared AWS clients so tests never see clients built by other tests."""
+    get_client_registry().clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_token_calibration() -> None:
+    """Forget token usage learned from other tests' mocked Bedrock responses."""
+    get_token_calibrator().reset()
+
+
+@pytest.fixture(autouse=True)
+def cost_cache() -> Generator[CostCache]:
+    """Give each test an empty in-memory cost cache.
+
+    Yields:
+        The CostCache returned by get_cost_cache() during the test.
+    """
+    cache = CostCache()
+    with patch("ohlala_smartops.utils.cost_cache._cost_cache", cache):
+        yield cache
+    cache.close()
+
+
+@pytest_asyncio.fixture
+async def virtual_clock() -> AsyncGenerator[VirtualClock]:
+    """Run the test's event loop on a virtual clock.
+
+    Yields:
+        The VirtualClock driving ``loop.time()``.
+    """
+    loop = asyncio.get_running_loop()
+    clock = VirtualClock()
+    selector = loop._selector  # type: ignore[attr-defined]
+    real_select = selector.select
+
+    def select(timeout: float | None = None) -> Any:
+        if timeout is not None and timeout > 0:
+            clock.now += timeout
+        return real_select(0)
+
+    with patch.object(loop, "time", clock.time), patch.object(selector, "select", select):
+        yield clock
 
 
 @pytest.fixture
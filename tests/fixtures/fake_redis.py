@@ -0,0 +1,145 @@
+"""In-process stand-in for an async Redis client.
+
+Implements the subset of ``redis.asyncio.Redis`` (with ``decode_responses=True``)
+used by the state storage: strings with expiry, sorted sets and pipelines.
+"""
+
+import time
+from collections.abc import Mapping
+from typing import Any, Self
+
+
+class FakePipeline:
+    """Queues commands and runs them in order on ``execute``."""
+
+    def __init__(self, redis: "FakeRedis") -> None:
+        self._redis = redis
+        self._commands: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._commands.clear()
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any, **kwargs: Any) -> Self:
+            self._commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        self._redis.round_trips += 1
+        commands, self._commands = self._commands, []
+        return [self._redis.run(name, *args, **kwargs) for name, args, kwargs in commands]
+
+
+class FakeRedis:
+    """Async Redis client keeping data in process memory."""
+
+    def __init__(self) -> None:
+        self._strings: dict[str, str] = {}
+        self._zsets: dict[str, dict[str, float]] = {}
+        self._expiry: dict[str, float] = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def keys(self) -> list[str]:
+        """All live keys (test helper, not the Redis KEYS command)."""
+        for key in list(self._expiry):
+            self._expire_if_due(key)
+        return sorted([*self._strings, *self._zsets])
+
+    def ttl_of(self, key: str) -> float | None:
+        """Seconds until the key expires, or None without expiry (test helper)."""
+        deadline = self._expiry.get(key)
+        return None if deadline is None else deadline - time.monotonic()
+
+    def run(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        return getattr(self, f"_{name}")(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        if not hasattr(type(self), f"_{name}"):
+            raise AttributeError(name)
+
+        async def command(*args: Any, **kwargs: Any) -> Any:
+            self.round_trips += 1
+            return self.run(name, *args, **kwargs)
+
+        return command
+
+    def _expire_if_due(self, key: str) -> None:
+        deadline = self._expiry.get(key)
+        if deadline is not None and time.monotonic() >= deadline:
+            self._delete(key)
+
+    def _get(self, key: str) -> str | None:
+        self._expire_if_due(key)
+        return self._strings.get(key)
+
+    def _set(self, key: str, value: str, ex: int | None = None, px: int | None = None) -> bool:
+        self._delete(key)
+        self._strings[key] = value
+        if ex is not None:
+            self._expiry[key] = time.monotonic() + ex
+        elif px is not None:
+            self._expiry[key] = time.monotonic() + px / 1000
+        return True
+
+    def _mget(self, keys: list[str]) -> list[str | None]:
+        return [self._get(key) for key in keys]
+
+    def _delete(self, *keys: str) -> int:
+        deleted = 0
+        for key in keys:
+            self._expiry.pop(key, None)
+            found = self._strings.pop(key, None) is not None
+            found = self._zsets.pop(key, None) is not None or found
+            deleted += found
+        return deleted
+
+    def _expire(self, key: str, seconds: int) -> bool:
+        self._expire_if_due(key)
+        if key not in self._strings and key not in self._zsets:
+            return False
+        self._expiry[key] = time.monotonic() + seconds
+        return True
+
+    def _zadd(self, key: str, mapping: Mapping[str, float]) -> int:
+        self._expire_if_due(key)
+        zset = self._zsets.setdefault(key, {})
+        added = sum(member not in zset for member in mapping)
+        zset.update(mapping)
+        return added
+
+    def _zrem(self, key: str, *members: str) -> int:
+        self._expire_if_due(key)
+        zset = self._zsets.get(key, {})
+        removed = sum(zset.pop(member, None) is not None for member in members)
+        if key in self._zsets and not zset:
+            self._delete(key)
+        return removed
+
+    def _sorted(self, key: str) -> list[str]:
+        self._expire_if_due(key)
+        zset = self._zsets.get(key, {})
+        return [member for member, _ in sorted(zset.items(), key=lambda item: (item[1], item[0]))]
+
+    @staticmethod
+    def _slice(members: list[str], start: int, end: int) -> list[str]:
+        length = len(members)
+        start = max(0, start + length if start < 0 else start)
+        end = end + length if end < 0 else end
+        return members[start : end + 1] if end >= 0 else []
+
+    def _zrange(self, key: str, start: int, end: int) -> list[str]:
+        return self._slice(self._sorted(key), start, end)
+
+    def _zrevrange(self, key: str, start: int, end: int) -> list[str]:
+        return self._slice(self._sorted(key)[::-1], start, end)
+
+    def _zcard(self, key: str) -> int:
+        return len(self._sorted(key))
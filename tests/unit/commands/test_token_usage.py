@@ -10,6 +10,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from ohlala_smartops.commands.token_usage import TokenUsageCommand
+from ohlala_smartops.utils.token_quota import TokenQuotas
 
 
 class TestTokenUsageCommand:
@@ -120,6 +121,27 @@ class TestTokenUsageCommand:
             mock_tracker._create_daily_stats.assert_called_once()
             mock_tracker._save_daily_stats.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_execute_reports_quota_usage(self, command: TokenUsageCommand) -> None:
+        """Test that the report includes the user's and team's rolling usage."""
+        quotas = TokenQuotas(user_limits={"hour": 10_000})
+        quotas.record("user@example.com", "default", 1_500)
+        with (
+            patch("ohlala_smartops.commands.token_usage.get_token_tracker") as mock_get_tracker,
+            patch("ohlala_smartops.commands.token_usage.get_token_quotas", return_value=quotas),
+        ):
+            mock_tracker = Mock()
+            mock_tracker.get_session_summary.return_value = {}
+            mock_tracker.daily_stats = {}
+            mock_tracker.LIMITS = {"max_daily_cost": 5.0}
+            mock_get_tracker.return_value = mock_tracker
+
+            result = await command.execute([], {"user_id": "user@example.com"})
+
+        assert "Rolling Token Usage" in result["message"]
+        assert "• You: 1,500 per minute, 1,500 / 10,000 per hour" in result["message"]
+        assert "• Your team: 1,500 per minute" in result["message"]
+
     def test_format_brief_report(self, command: TokenUsageCommand) -> None:
         """Test _format_brief_report method."""
         with patch("ohlala_smartops.commands.token_usage.get_token_tracker") as mock_get_tracker:
@@ -1,12 +1,29 @@
 """Unit tests for audit logger."""
 
+import io
 import json
+import logging
+import threading
+from collections.abc import Generator
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from ohlala_smartops.config.settings import Settings
-from ohlala_smartops.utils.audit_logger import SENSITIVE_KEYS, AuditLogger, get_audit_logger
+from ohlala_smartops.utils.audit_logger import (
+    SENSITIVE_KEYS,
+    AuditLine,
+    AuditLogger,
+    AuditPipeline,
+    LoggingAuditSink,
+    MemoryAuditSink,
+    RotatingFileAuditSink,
+    StreamAuditSink,
+    create_audit_sink,
+    get_audit_logger,
+    get_audit_pipeline,
+)
 
 
 @pytest.fixture
@@ -49,9 +66,17 @@ def settings_disabled() -> Settings:
 
 
 @pytest.fixture
-def audit_logger(settings: Settings) -> AuditLogger:
+def pipeline() -> Generator[AuditPipeline]:
+    """Create an audit pipeline writing to the (patched) module logger."""
+    audit_pipeline = AuditPipeline(LoggingAuditSink())
+    yield audit_pipeline
+    audit_pipeline.close()
+
+
+@pytest.fixture
+def audit_logger(settings: Settings, pipeline: AuditPipeline) -> AuditLogger:
     """Create audit logger instance for testing."""
-    return AuditLogger(settings=settings)
+    return AuditLogger(settings=settings, pipeline=pipeline)
 
 
 class TestAuditLoggerInitialization:
@@ -101,6 +126,7 @@ class TestCommandExecution:
             success=True,
             execution_time_ms=1234.5,
         )
+        audit_logger.flush()
 
         # Verify info log was called
         mock_logger.info.assert_called_once()
@@ -125,10 +151,10 @@ class TestCommandExecution:
 
     @patch("ohlala_smartops.utils.audit_logger.logger")
     def test_log_command_execution_with_pii(
-        self, mock_logger: MagicMock, settings_with_pii: Settings
+        self, mock_logger: MagicMock, settings_with_pii: Settings, pipeline: AuditPipeline
     ) -> None:
         """Test logging with PII enabled."""
-        logger = AuditLogger(settings=settings_with_pii)
+        logger = AuditLogger(settings=settings_with_pii, pipeline=pipeline)
 
         logger.log_command_execution(
             user_id="user@example.com",
@@ -140,6 +166,7 @@ class TestCommandExecution:
             success=True,
             execution_time_ms=2340.5,
         )
+        logger.flush()
 
         log_message = mock_logger.info.call_args[0][0]
         json_part = log_message.split("AUDIT_COMMAND: ")[1]
@@ -164,6 +191,7 @@ class TestCommandExecution:
             execution_time_ms=500.0,
             error="Instance not found",
         )
+        audit_logger.flush()
 
         # Should use warning for failures
         mock_logger.warning.assert_called_once()
@@ -176,9 +204,11 @@ class TestCommandExecution:
         assert log_data["result"]["success"] is False
         assert log_data["result"]["error"] == "Instance not found"
 
-    def test_log_command_execution_disabled(self, settings_disabled: Settings) -> None:
+    def test_log_command_execution_disabled(
+        self, settings_disabled: Settings, pipeline: AuditPipeline
+    ) -> None:
         """Test that logging is skipped when disabled."""
-        logger = AuditLogger(settings=settings_disabled)
+        logger = AuditLogger(settings=settings_disabled, pipeline=pipeline)
 
         with patch("ohlala_smartops.utils.audit_logger.logger") as mock_logger:
             logger.log_command_execution(
@@ -191,6 +221,7 @@ class TestCommandExecution:
                 success=True,
                 execution_time_ms=100.0,
             )
+            logger.flush()
 
             # No logging should occur
             mock_logger.info.assert_not_called()
@@ -209,6 +240,7 @@ class TestMCPCall:
             success=True,
             execution_time_ms=456.2,
         )
+        audit_logger.flush()
 
         mock_logger.info.assert_called_once()
         log_message = mock_logger.info.call_args[0][0]
@@ -235,6 +267,7 @@ class TestMCPCall:
             execution_time_ms=123.4,
             error="Rate limit exceeded",
         )
+        audit_logger.flush()
 
         # Failed MCP calls use warning level
         mock_logger.warning.assert_called_once()
@@ -259,6 +292,7 @@ class TestBedrockCall:
             guardrail_applied=True,
             execution_time_ms=3456.7,
         )
+        audit_logger.flush()
 
         mock_logger.info.assert_called_once()
         log_message = mock_logger.info.call_args[0][0]
@@ -289,6 +323,7 @@ class TestSecurityEvent:
             details={"user_id": "user@example.com", "method": "oauth"},
             severity="info",
         )
+        audit_logger.flush()
 
         mock_logger.info.assert_called_once()
         log_message = mock_logger.info.call_args[0][0]
@@ -311,6 +346,7 @@ class TestSecurityEvent:
             details={"command": "rm -rf /", "user_id": "user@example.com"},
             severity="warning",
         )
+        audit_logger.flush()
 
         mock_logger.warning.assert_called_once()
         log_message = mock_logger.warning.call_args[0][0]
@@ -326,6 +362,7 @@ class TestSecurityEvent:
             details={"user_id": "user@example.com", "attempts": 5},
             severity="critical",
         )
+        audit_logger.flush()
 
         mock_logger.critical.assert_called_once()
         log_message = mock_logger.critical.call_args[0][0]
@@ -348,6 +385,7 @@ class TestWriteOperation:
             changes={"state": "running -> stopping"},
             confirmed=True,
         )
+        audit_logger.flush()
 
         mock_logger.info.assert_called_once()
         log_message = mock_logger.info.call_args[0][0]
@@ -434,6 +472,20 @@ class TestSanitization:
         assert sanitized["password"] == "should-not-be-redacted"
         assert sanitized["key"] == "also-visible"
 
+    @pytest.mark.parametrize("include_pii", [False, True])
+    def test_sanitize_returns_copy(
+        self, settings: Settings, settings_with_pii: Settings, include_pii: bool
+    ) -> None:
+        """Test that later changes by the caller do not reach the queued entry."""
+        logger = AuditLogger(settings=settings_with_pii if include_pii else settings)
+        arguments = {"instance_ids": ["i-1"], "filters": {"tags": ["web"]}}
+
+        sanitized = logger._sanitize_arguments(arguments)
+        arguments["instance_ids"].append("i-2")
+        arguments["filters"]["tags"].append("db")
+
+        assert sanitized == {"instance_ids": ["i-1"], "filters": {"tags": ["web"]}}
+
     def test_sensitive_keys_coverage(self) -> None:
         """Test that SENSITIVE_KEYS constant covers expected patterns."""
         assert "password" in SENSITIVE_KEYS
@@ -444,6 +496,183 @@ class TestSanitization:
         assert "auth" in SENSITIVE_KEYS
 
 
+class BlockingSink(MemoryAuditSink):
+    """Memory sink whose first write waits until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writing = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, lines: list[AuditLine]) -> None:
+        self.writing.set()
+        self.release.wait(timeout=5)
+        super().write(lines)
+
+
+class TestAuditPipeline:
+    """Test the background audit pipeline."""
+
+    def test_entries_written_in_batches(self) -> None:
+        """Test that entries queued during a write are written in one batch."""
+        sink = BlockingSink()
+        pipeline = AuditPipeline(sink)
+        pipeline.submit("AUDIT_MCP", logging.INFO, {"n": 0})
+        assert sink.writing.wait(timeout=5)
+        for n in range(1, 10):
+            pipeline.submit("AUDIT_MCP", logging.INFO, {"n": n})
+
+        sink.release.set()
+        pipeline.flush()
+
+        assert sink.batches == 2
+        assert [entry["n"] for entry in sink.entries] == list(range(10))
+        assert pipeline.get_stats()["max_queue_depth"] == 9
+        pipeline.close()
+
+    def test_full_queue_drops_entries(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that a full queue drops new entries instead of blocking, warning once."""
+        sink = BlockingSink()
+        pipeline = AuditPipeline(sink, queue_size=2)
+        pipeline.submit("AUDIT_WRITE", logging.INFO, {"n": 0})
+        assert sink.writing.wait(timeout=5)
+
+        with caplog.at_level(logging.WARNING):
+            accepted = [
+                pipeline.submit("AUDIT_WRITE", logging.INFO, {"n": n}) for n in (1, 2, 3, 4)
+            ]
+
+        assert accepted == [True, True, False, False]
+        assert caplog.text.count("Audit log queue full") == 1
+
+        sink.release.set()
+        pipeline.flush()
+        stats = pipeline.get_stats()
+        assert stats["submitted"] == 3
+        assert stats["written"] == 3
+        assert stats["dropped"] == 2
+        pipeline.close()
+
+    def test_sink_error_does_not_stop_pipeline(self) -> None:
+        """Test that a failing write is counted and later entries are still written."""
+        sink = MemoryAuditSink()
+        pipeline = AuditPipeline(sink)
+        with patch.object(sink, "write", side_effect=[OSError("disk full"), None]):
+            pipeline.submit("AUDIT_MCP", logging.INFO, {"n": 1})
+            pipeline.flush()
+            pipeline.submit("AUDIT_MCP", logging.INFO, {"n": 2})
+            pipeline.flush()
+
+        stats = pipeline.get_stats()
+        assert stats["sink_errors"] == 1
+        assert stats["written"] == 1
+        pipeline.close()
+
+    def test_unserializable_entry_does_not_stop_pipeline(self) -> None:
+        """Test that an entry json cannot serialize is counted and skipped alone."""
+        sink = MemoryAuditSink()
+        pipeline = AuditPipeline(sink)
+        pipeline.submit("AUDIT_MCP", logging.INFO, {("a", "b"): 1})
+        pipeline.submit("AUDIT_MCP", logging.INFO, {"n": 2})
+        pipeline.flush()
+
+        assert pipeline._thread.is_alive()
+        assert sink.entries == [{"n": 2}]
+        stats = pipeline.get_stats()
+        assert stats["serialize_errors"] == 1
+        assert stats["written"] == 1
+        pipeline.close()
+        assert not pipeline._thread.is_alive()
+
+    def test_thread_started_by_first_entry(self, settings_disabled: Settings) -> None:
+        """Test that a disabled audit logger never starts the pipeline thread."""
+        sink = MemoryAuditSink()
+        pipeline = AuditPipeline(sink)
+        AuditLogger(settings=settings_disabled, pipeline=pipeline).log_mcp_call(
+            "tool", {}, success=True, execution_time_ms=1.0
+        )
+        assert not pipeline._thread.is_alive()
+
+        pipeline.submit("AUDIT_MCP", logging.INFO, {"n": 1})
+        assert pipeline._thread.is_alive()
+        pipeline.close()
+        assert len(sink.lines) == 1
+
+    def test_close_without_entries(self) -> None:
+        """Test closing a pipeline whose thread never started."""
+        pipeline = AuditPipeline(MemoryAuditSink())
+        pipeline.close()
+
+        assert pipeline.submit("AUDIT_MCP", logging.INFO, {"n": 1}) is False
+        assert pipeline._thread.ident is None
+
+    def test_close_writes_queued_entries(self) -> None:
+        """Test that closing writes queued entries and later entries are dropped."""
+        sink = MemoryAuditSink()
+        pipeline = AuditPipeline(sink)
+        for n in range(5):
+            pipeline.submit("AUDIT_WRITE", logging.INFO, {"n": n})
+
+        pipeline.close()
+
+        assert len(sink.lines) == 5
+        assert pipeline.submit("AUDIT_WRITE", logging.INFO, {"n": 5}) is False
+        assert pipeline.get_stats()["dropped"] == 1
+
+    def test_audit_logger_levels(self, settings: Settings) -> None:
+        """Test the prefixes and levels of entries queued by the audit logger."""
+        sink = MemoryAuditSink()
+        audit_logger = AuditLogger(settings=settings, pipeline=AuditPipeline(sink))
+
+        audit_logger.log_mcp_call("tool", {}, success=False, execution_time_ms=1.0)
+        audit_logger.log_security_event("blocked", {}, severity="critical")
+        audit_logger.log_bedrock_call(1, 2, "model", False, 3.0)
+        audit_logger.pipeline.close()
+
+        assert [(level, line.split(":")[0]) for level, line in sink.lines] == [
+            (logging.WARNING, "AUDIT_MCP_FAILED"),
+            (logging.CRITICAL, "AUDIT_SECURITY"),
+            (logging.INFO, "AUDIT_BEDROCK"),
+        ]
+
+
+class TestAuditSinks:
+    """Test audit sinks."""
+
+    def test_stream_sink(self) -> None:
+        """Test that the stream sink writes one line per entry."""
+        stream = io.StringIO()
+        StreamAuditSink(stream).write(
+            [(logging.INFO, "AUDIT_A: {}"), (logging.INFO, "AUDIT_B: {}")]
+        )
+
+        assert stream.getvalue() == "AUDIT_A: {}\nAUDIT_B: {}\n"
+
+    def test_rotating_file_sink(self, tmp_path: Path) -> None:
+        """Test that the file is rotated before exceeding its size, keeping backups."""
+        path = tmp_path / "audit" / "audit.log"
+        sink = RotatingFileAuditSink(path, max_bytes=100, backup_count=2)
+        line = "AUDIT_WRITE: " + "x" * 36  # 50 bytes with the newline
+
+        for _ in range(7):
+            sink.write([(logging.INFO, line)])
+        sink.close()
+
+        assert path.read_text().count("\n") == 1
+        assert (tmp_path / "audit" / "audit.log.1").read_text().count("\n") == 2
+        assert (tmp_path / "audit" / "audit.log.2").read_text().count("\n") == 2
+        assert not (tmp_path / "audit" / "audit.log.3").exists()
+
+    def test_create_audit_sink(self, tmp_path: Path) -> None:
+        """Test creating the sink configured in settings."""
+        assert isinstance(create_audit_sink(Settings()), LoggingAuditSink)
+        assert isinstance(create_audit_sink(Settings(audit_log_sink="stdout")), StreamAuditSink)
+        file_sink = create_audit_sink(
+            Settings(audit_log_sink="file", audit_log_file=str(tmp_path / "audit.log"))
+        )
+        assert isinstance(file_sink, RotatingFileAuditSink)
+
+
 class TestGetAuditLogger:
     """Test get_audit_logger factory function."""
 
@@ -455,6 +684,19 @@ class TestGetAuditLogger:
         # Should return same instance
         assert logger1 is logger2
 
+    def test_get_audit_pipeline_rejects_other_settings(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the global pipeline is not reused for different sink settings."""
+        monkeypatch.setattr("ohlala_smartops.utils.audit_logger._audit_pipeline", None)
+        monkeypatch.setattr("ohlala_smartops.utils.audit_logger._audit_pipeline_config", None)
+        pipeline = get_audit_pipeline(Settings())
+
+        assert get_audit_pipeline(Settings(enable_audit_logging=False)) is pipeline
+        with pytest.raises(ValueError, match="already created"):
+            get_audit_pipeline(Settings(audit_log_sink="stdout"))
+        assert isinstance(pipeline.sink, LoggingAuditSink)
+
     def test_get_audit_logger_returns_instance(self) -> None:
         """Test get_audit_logger returns AuditLogger instance."""
         logger = get_audit_logger()
@@ -1,17 +1,22 @@
 """Tests for AWS client wrapper with throttling and error handling."""
 
 import asyncio
+from contextlib import asynccontextmanager
+from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from botocore.exceptions import BotoCoreError, ClientError
 
 from ohlala_smartops.aws.client import (
+    AWSClientRegistry,
     AWSClientWrapper,
     create_aws_client,
     execute_with_retry,
+    get_client_registry,
 )
 from ohlala_smartops.aws.exceptions import (
+    CostExplorerError,
     EC2Error,
     PermissionError,
     ResourceNotFoundError,
@@ -323,6 +328,150 @@ class TestAWSClientWrapper:
         assert client is mock_boto_client
 
 
+class TestAsyncBackend:
+    """Test suite for the native aiobotocore backend of AWSClientWrapper."""
+
+    @pytest.fixture
+    def mock_async_client(self) -> Mock:
+        """Fixture providing a mocked aiobotocore client."""
+        return Mock()
+
+    @pytest.fixture
+    def mock_session(self, mock_async_client: Mock) -> Mock:
+        """Fixture providing a mocked aioboto3 session yielding the async client."""
+        session = Mock()
+        session.exited = 0
+
+        @asynccontextmanager
+        async def client_cm(*args: Any, **kwargs: Any) -> Any:
+            try:
+                yield mock_async_client
+            finally:
+                session.exited += 1
+
+        session.client = Mock(side_effect=client_cm)
+        return session
+
+    @pytest.fixture
+    def wrapper(self, mock_session: Mock) -> Any:
+        """Fixture providing an async-backend wrapper with a mocked aioboto3 session."""
+        with (
+            patch("ohlala_smartops.aws.client.aioboto3.Session", return_value=mock_session),
+            patch("boto3.client") as mock_boto3_client,
+        ):
+            yield AWSClientWrapper("ec2", region="us-east-1", backend="async")
+            mock_boto3_client.assert_not_called()
+
+    def test_backend_resolved_from_settings(self) -> None:
+        """Test that per-service overrides in settings select the backend."""
+        settings = Mock()
+        settings.get_aws_client_backend.side_effect = lambda service: (
+            "async" if service == "ce" else "thread"
+        )
+        with (
+            patch("ohlala_smartops.aws.client.get_settings", return_value=settings),
+            patch("boto3.client") as mock_create,
+        ):
+            ce_wrapper = AWSClientWrapper("ce")
+            ec2_wrapper = AWSClientWrapper("ec2")
+
+        assert ce_wrapper.backend == "async"
+        assert ec2_wrapper.backend == "thread"
+        mock_create.assert_called_once_with("ec2", region_name=None)
+
+    @pytest.mark.asyncio
+    async def test_successful_call(
+        self, wrapper: AWSClientWrapper, mock_async_client: Mock, mock_session: Mock
+    ) -> None:
+        """Test that calls are awaited directly on the native client."""
+        mock_async_client.describe_instances = AsyncMock(return_value={"Reservations": []})
+
+        result = await wrapper.call("describe_instances", InstanceIds=["i-123"])
+
+        assert result == {"Reservations": []}
+        mock_async_client.describe_instances.assert_awaited_once_with(InstanceIds=["i-123"])
+        mock_session.client.assert_called_once_with("ec2", region_name="us-east-1")
+
+    @pytest.mark.asyncio
+    async def test_client_opened_once_for_concurrent_calls(
+        self, wrapper: AWSClientWrapper, mock_async_client: Mock, mock_session: Mock
+    ) -> None:
+        """Test that concurrent first calls share a single client."""
+        mock_async_client.describe_instances = AsyncMock(return_value={})
+
+        await asyncio.gather(*(wrapper.call("describe_instances") for _ in range(5)))
+
+        assert mock_async_client.describe_instances.await_count == 5
+        mock_session.client.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_client_error_conversion(
+        self, wrapper: AWSClientWrapper, mock_async_client: Mock
+    ) -> None:
+        """Test that aiobotocore ClientErrors convert like boto3 ones."""
+        mock_async_client.describe_instances = AsyncMock(
+            side_effect=ClientError(
+                error_response={
+                    "Error": {"Code": "RequestLimitExceeded", "Message": "Slow down"},
+                    "ResponseMetadata": {"HTTPStatusCode": 503},
+                },
+                operation_name="DescribeInstances",
+            )
+        )
+
+        with pytest.raises(ThrottlingError) as exc_info:
+            await wrapper.call("describe_instances")
+
+        assert exc_info.value.error_code == "RequestLimitExceeded"
+        assert exc_info.value.details["http_status"] == 503
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_uses_service_error_class(self, mock_session: Mock) -> None:
+        """Test that unexpected errors map to the service-specific error class."""
+        mock_session.client.side_effect = RuntimeError("no credentials")
+
+        with patch("ohlala_smartops.aws.client.aioboto3.Session", return_value=mock_session):
+            wrapper = AWSClientWrapper("ce", backend="async")
+            with pytest.raises(CostExplorerError, match="no credentials"):
+                await wrapper.call("get_cost_and_usage")
+
+    @pytest.mark.asyncio
+    async def test_close_exits_client(
+        self, wrapper: AWSClientWrapper, mock_async_client: Mock, mock_session: Mock
+    ) -> None:
+        """Test that close() exits the client context and allows reopening."""
+        mock_async_client.describe_instances = AsyncMock(return_value={})
+        await wrapper.call("describe_instances")
+
+        await wrapper.close()
+        assert mock_session.exited == 1
+
+        await wrapper.call("describe_instances")
+        assert mock_session.client.call_count == 2
+
+    def test_new_event_loop_closes_previous_client(
+        self, wrapper: AWSClientWrapper, mock_async_client: Mock, mock_session: Mock
+    ) -> None:
+        """Test that the client of a previous event loop is closed, not leaked."""
+        mock_async_client.describe_instances = AsyncMock(return_value={})
+
+        first_loop, second_loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+        try:
+            first_loop.run_until_complete(wrapper.call("describe_instances"))
+            second_loop.run_until_complete(wrapper.call("describe_instances"))
+        finally:
+            first_loop.close()
+            second_loop.close()
+
+        assert mock_session.client.call_count == 2
+        assert mock_session.exited == 1
+
+    @pytest.mark.asyncio
+    async def test_close_without_client_is_noop(self, wrapper: AWSClientWrapper) -> None:
+        """Test that closing an unopened wrapper does nothing."""
+        await wrapper.close()
+
+
 class TestCreateAWSClient:
     """Test suite for create_aws_client factory function."""
 
@@ -352,6 +501,119 @@ class TestCreateAWSClient:
             call_kwargs = mock_create.call_args[1]
             assert call_kwargs["endpoint_url"] == "https://custom.example.com"
 
+    def test_returns_shared_wrapper(self) -> None:
+        """Test factory function reuses the registry's wrapper for the same key."""
+        with patch("boto3.client") as mock_create:
+            first = create_aws_client("ec2", region="us-east-1")
+            second = create_aws_client("ec2", region="us-east-1")
+            other_region = create_aws_client("ec2", region="eu-west-1")
+
+            assert first is second
+            assert other_region is not first
+            assert mock_create.call_count == 2
+
+    def test_unshareable_kwargs_build_dedicated_wrapper(self) -> None:
+        """Test that extra boto3 arguments bypass the shared registry."""
+        with patch("boto3.client"):
+            first = create_aws_client("ec2", config=Mock())
+            second = create_aws_client("ec2", config=Mock())
+
+            assert first is not second
+            assert get_client_registry().get_stats()["clients_built"] == 0
+
+    def test_creates_wrapper_with_backend(self) -> None:
+        """Test factory function passes an explicit backend through."""
+        with patch("boto3.client") as mock_create:
+            wrapper = create_aws_client("ec2", backend="async")
+
+            assert wrapper.backend == "async"
+            mock_create.assert_not_called()
+
+
+class TestAWSClientRegistry:
+    """Test suite for the shared AWS client registry."""
+
+    @pytest.fixture
+    def registry(self) -> AWSClientRegistry:
+        """Fixture providing an empty registry."""
+        return AWSClientRegistry()
+
+    def test_builds_client_once_per_key(self, registry: AWSClientRegistry) -> None:
+        """Test that a client is only built on first request for a key."""
+        with patch("boto3.client") as mock_create:
+            first = registry.get_client("ssm", region="us-east-1")
+            second = registry.get_client("ssm", region="us-east-1")
+
+        assert first is second
+        mock_create.assert_called_once_with("ssm", region_name="us-east-1")
+
+    def test_key_includes_endpoint_profile_and_backend(self, registry: AWSClientRegistry) -> None:
+        """Test that endpoint, profile and backend produce distinct clients."""
+        with patch("boto3.client"), patch("boto3.Session"):
+            base = registry.get_client("ec2", region="us-east-1")
+            endpoint = registry.get_client(
+                "ec2", region="us-east-1", endpoint_url="http://localhost:5000"
+            )
+            profile = registry.get_client("ec2", region="us-east-1", profile_name="ops")
+            native = registry.get_client("ec2", region="us-east-1", backend="async")
+
+        assert len({id(base), id(endpoint), id(profile), id(native)}) == 4
+        assert profile.profile_name == "ops"
+        assert native.backend == "async"
+
+    def test_profile_uses_boto3_session(self, registry: AWSClientRegistry) -> None:
+        """Test that profile-keyed clients are built from a named boto3 session."""
+        with patch("boto3.Session") as mock_session:
+            registry.get_client("ce", profile_name="billing")
+
+        mock_session.assert_called_once_with(profile_name="billing")
+        mock_session.return_value.client.assert_called_once_with("ce", region_name=None)
+
+    def test_get_stats(self, registry: AWSClientRegistry) -> None:
+        """Test that statistics report built clients and reuses."""
+        with patch("boto3.client"):
+            registry.get_client("ec2", region="us-east-1")
+            registry.get_client("ec2", region="us-east-1")
+            registry.get_client("cloudwatch", endpoint_url="http://localhost:4566")
+
+        stats = registry.get_stats()
+        assert stats["clients_built"] == 2
+        assert stats["cache_hits"] == 1
+        assert stats["build_seconds"] >= 0
+        assert stats["clients"] == [
+            "ec2/us-east-1 (thread)",
+            "cloudwatch/default/http://localhost:4566 (thread)",
+        ]
+
+    def test_log_report(
+        self, registry: AWSClientRegistry, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that the report logs the number of clients built."""
+        with patch("boto3.client"):
+            registry.get_client("ec2", region="us-east-1")
+
+        with caplog.at_level("INFO", logger="ohlala_smartops.aws.client"):
+            registry.log_report()
+
+        assert "1 clients built" in caplog.text
+        assert "ec2/us-east-1 (thread)" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_close_all(self, registry: AWSClientRegistry) -> None:
+        """Test that close_all closes every client and empties the registry."""
+        with patch("boto3.client"):
+            wrapper = registry.get_client("ec2")
+
+        with patch.object(wrapper, "close", new_callable=AsyncMock) as mock_close:
+            await registry.close_all()
+
+        mock_close.assert_awaited_once()
+        assert registry.get_stats()["clients_built"] == 0
+
+    def test_get_client_registry_singleton(self) -> None:
+        """Test that the global registry is a singleton."""
+        assert get_client_registry() is get_client_registry()
+
 
 class TestExecuteWithRetry:
     """Test suite for execute_with_retry utility function."""
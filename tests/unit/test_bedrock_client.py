@@ -20,7 +20,10 @@ from ohlala_smartops.ai.bedrock_client import (
     BedrockClientError,
     BedrockGuardrailError,
     BedrockModelError,
+    BedrockQuotaError,
 )
+from ohlala_smartops.utils.fair_share import throttle_tenant
+from ohlala_smartops.utils.token_quota import TokenQuotas
 
 
 @pytest.fixture
@@ -197,6 +200,31 @@ class TestCallBedrock:
             assert call_args["max_tokens"] == 500
             assert call_args["temperature"] == 0.5
 
+    @pytest.mark.asyncio
+    async def test_call_records_quota_usage(self, bedrock_client, mock_bedrock_response):
+        """Test that input and output tokens count against the user's and team's quotas."""
+        bedrock_client.token_quotas = TokenQuotas()
+        with (
+            patch.object(bedrock_client, "_invoke_model_with_fallback") as mock_invoke,
+            throttle_tenant("team1"),
+        ):
+            mock_invoke.return_value = mock_bedrock_response
+            await bedrock_client.call_bedrock(prompt="Hello", user_id="user123")
+
+        usage = bedrock_client.token_quotas.get_usage("user123", "team1")
+        assert usage["user"]["hour"]["used"] == 150
+        assert usage["team"]["day"]["used"] == 150
+
+    @pytest.mark.asyncio
+    async def test_call_rejected_by_quota(self, bedrock_client):
+        """Test that a call over the user's quota is rejected before Bedrock is called."""
+        bedrock_client.token_quotas = TokenQuotas(user_limits={"hour": 10})
+        with patch.object(bedrock_client, "_invoke_model_with_fallback") as mock_invoke:
+            with pytest.raises(BedrockQuotaError, match="quota per hour"):
+                await bedrock_client.call_bedrock(prompt="Hello", user_id="user123")
+
+            mock_invoke.assert_not_called()
+
 
 class TestInvokeModelWithFallback:
     """Tests for _invoke_model_with_fallback method."""
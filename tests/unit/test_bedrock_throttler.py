@@ -14,6 +14,7 @@ from ohlala_smartops.utils.bedrock_throttler import (
     get_bedrock_throttler,
     throttled_bedrock_call,
 )
+from ohlala_smartops.utils.shared_limiter import InMemoryLimiterBackend
 
 
 class TestBedrockThrottler:
@@ -253,6 +254,68 @@ class TestBedrockThrottler:
         assert stats["throttled_requests"] == 0
         assert isinstance(stats["current_tokens"], float)
 
+    @pytest.mark.asyncio
+    async def test_get_stats_reports_priority_waits(self) -> None:
+        """Test that admission waits are reported per priority class."""
+        throttler = BedrockThrottler()
+
+        async with throttler.throttled_bedrock_request("chat"):
+            pass
+        async with throttler.throttled_bedrock_request("summary", priority="bulk"):
+            pass
+
+        priorities = throttler.get_stats()["priorities"]
+        assert priorities["interactive"]["requests"] == 1
+        assert priorities["bulk"]["requests"] == 1
+        assert priorities["background"]["requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_shared_bucket_between_replicas(self) -> None:
+        """Test that replicas take Bedrock tokens from one shared bucket."""
+        backend = InMemoryLimiterBackend()
+        with patch(
+            "ohlala_smartops.utils.bedrock_throttler.get_shared_limiter_backend",
+            return_value=backend,
+        ):
+            replicas = [BedrockThrottler(), BedrockThrottler()]
+
+        for replica in replicas:
+            async with replica.throttled_bedrock_request("chat"):
+                pass
+
+        shared = replicas[0].get_stats()["shared"]
+        assert shared["key"] == "bedrock"
+        assert shared["round_trips"] == 1
+        assert await backend.take("bedrock", 5, 0.5, 5) == (3, 0.0)
+
+    def test_not_shared_by_default(self) -> None:
+        """Test that limits apply per process without a shared backend."""
+        assert BedrockThrottler().get_stats()["shared"] is None
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"BEDROCK_TENANT_MAX_CONCURRENT": "1"})
+    async def test_tenant_concurrency_cap(self) -> None:
+        """Test that a tenant at its cap leaves the other slot to another tenant."""
+        throttler = BedrockThrottler()
+        release = asyncio.Event()
+
+        async def call(tenant: str) -> None:
+            async with throttler.throttled_bedrock_request("chat", tenant=tenant):
+                await release.wait()
+
+        tasks = [asyncio.create_task(call("team-a")) for _ in range(2)]
+        tasks.append(asyncio.create_task(call("team-b")))
+        await asyncio.sleep(0.01)
+
+        tenants = throttler.get_stats()["tenants"]
+        assert tenants["team-a"]["in_flight"] == 1
+        assert tenants["team-a"]["queued"] == 1
+        assert tenants["team-b"]["in_flight"] == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert throttler.get_stats()["tenants"]["team-a"]["requests"] == 2
+
     @pytest.mark.asyncio
     async def test_logging_debug_messages(self, caplog: pytest.LogCaptureFixture) -> None:
         """Test that debug logging occurs."""
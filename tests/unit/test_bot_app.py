@@ -35,6 +35,11 @@ class TestLifespanManagement:
             mock_settings_instance.microsoft_app_type = "SingleTenant"
             mock_settings_instance.mcp_aws_api_url = "http://localhost:8080"
             mock_settings_instance.bedrock_model_id = "anthropic.claude-3-sonnet"
+            mock_settings_instance.state_storage_type = "memory"
+            mock_settings_instance.state_redis_url = None
+            mock_settings_instance.state_max_entries = None
+            mock_settings_instance.state_write_behind_delay = 0.0
+            mock_settings_instance.state_sqlite_path = None
             mock_settings.return_value = mock_settings_instance
 
             mock_adapter = MagicMock()
@@ -71,7 +76,7 @@ class TestLifespanManagement:
                 # Verify startup - all components initialized
                 mock_settings.assert_called_once()
                 mock_create_adapter.assert_called_once_with(mock_settings_instance)
-                mock_create_state.assert_called_once_with("memory")
+                mock_create_state.assert_called_once_with("memory", None, None, 0.0, None)
                 mock_mcp.initialize.assert_called_once()
                 mock_mcp.list_available_tools.assert_called_once()
                 mock_bedrock_class.assert_called_once_with(mcp_manager=mock_mcp)
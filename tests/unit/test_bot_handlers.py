@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from ohlala_smartops.bot.handlers import OhlalaActivityHandler
+from ohlala_smartops.bot.handlers import OhlalaActivityHandler, get_tenant_key
 from ohlala_smartops.models import ConversationType, UserRole
 
 
@@ -320,6 +320,9 @@ class TestHelperMethods:
         context = await handler._create_conversation_context(mock_turn_context)
 
         assert context.conversation_type == ConversationType.CHANNEL
+        assert context.team is not None
+        assert context.team.id == "team123"
+        assert context.team.tenant_id == "tenant123"
 
     @pytest.mark.asyncio
     async def test_create_conversation_context_group(
@@ -436,3 +439,26 @@ class TestHelperMethods:
         assert result["status"] == 200
         assert "message" in result["body"]
         mock_turn_context.send_activity.assert_called_once()
+
+
+class TestGetTenantKey:
+    """Test suite for the throttling tenant of an activity."""
+
+    def test_team_channel(self, mock_turn_context: MagicMock) -> None:
+        """Test that channel messages are keyed by team."""
+        mock_turn_context.activity.channel_data = {
+            "team": {"id": "team123", "name": "Ops"},
+            "tenant": {"id": "tenant123"},
+        }
+
+        assert get_tenant_key(mock_turn_context.activity) == "team123"
+
+    def test_personal_chat(self, mock_turn_context: MagicMock) -> None:
+        """Test that chats outside a team are keyed by Azure AD tenant."""
+        assert get_tenant_key(mock_turn_context.activity) == "tenant123"
+
+    def test_no_tenant(self, mock_turn_context: MagicMock) -> None:
+        """Test that activities without team or tenant use the default tenant."""
+        mock_turn_context.activity.conversation.tenant_id = None
+
+        assert get_tenant_key(mock_turn_context.activity) == "default"
@@ -7,6 +7,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from ohlala_smartops.bot.app import create_app
+from ohlala_smartops.utils.global_throttler import GlobalThrottler
 
 
 @pytest.fixture
@@ -49,6 +50,23 @@ class TestHealthEndpoints:
         assert isinstance(data["checks"], dict)
         assert "configuration" in data["checks"]
 
+    def test_health_reports_open_circuit_breakers(self, client: TestClient) -> None:
+        """Test that open circuit breakers are listed and degrade the health status."""
+        throttler = GlobalThrottler()
+        throttler.circuit_breaker_enabled = True
+        throttler._get_circuit_breakers("ec2:describe_instances", None)
+        throttler._get_circuit_breakers("ce:get_cost_and_usage", None)[0]._open("test")
+
+        with patch("ohlala_smartops.bot.health.get_global_throttler", return_value=throttler):
+            data = client.get("/health").json()
+
+        check = data["checks"]["circuit_breakers"]
+        assert data["status"] == "degraded"
+        assert check["status"] == "degraded"
+        assert check["open"] == ["ce"]
+        assert check["breakers"]["ec2"]["state"] == "closed"
+        assert check["breakers"]["ce"]["state"] == "open"
+
     def test_liveness_check(self, client: TestClient) -> None:
         """Test the liveness probe endpoint."""
         response = client.get("/health/live")
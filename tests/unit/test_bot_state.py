@@ -1,21 +1,31 @@
 """Tests for conversation state management."""
 
 import asyncio
+import sqlite3
+import sys
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from ohlala_smartops.bot.state import (
     ConversationStateManager,
     InMemoryStateStorage,
+    RedisStateStorage,
+    SqliteStateStorage,
     create_state_manager,
 )
 from ohlala_smartops.models import (
     ApprovalRequest,
+    ApprovalStatus,
+    CommandHistoryEntry,
     ConversationContext,
     ConversationState,
     ConversationType,
     UserInfo,
 )
+from tests.fixtures.fake_redis import FakeRedis
 
 
 class TestInMemoryStateStorage:
@@ -79,6 +89,473 @@ class TestInMemoryStateStorage:
         result = await storage.get_state("conv123")
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_sweep_removes_expired_entries(self, storage: InMemoryStateStorage) -> None:
+        """Test that a sweep drops expired entries that are never read again."""
+        await storage.set_state(ConversationState(conversation_id="short"), ttl_seconds=10)
+        await storage.set_state(ConversationState(conversation_id="long"), ttl_seconds=3600)
+        await storage.set_approval(TestRedisStateStorage._approval("a1"))
+
+        later = datetime.now(tz=UTC) + timedelta(minutes=5)
+        with patch("ohlala_smartops.bot.state.datetime") as mock_datetime:
+            mock_datetime.now.return_value = later
+            assert storage.sweep_expired() == 1
+
+        stats = storage.get_stats()
+        assert stats["entries"]["states"] == 1
+        assert stats["entries"]["approvals"] == 1
+        assert stats["swept"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sweep_removes_approvals_after_retention(
+        self, storage: InMemoryStateStorage
+    ) -> None:
+        """Test that approvals are dropped once their retention period has passed."""
+        await storage.set_approval(TestRedisStateStorage._approval("a1"))
+
+        later = datetime.now(tz=UTC) + timedelta(days=8)
+        with patch("ohlala_smartops.bot.state.datetime") as mock_datetime:
+            mock_datetime.now.return_value = later
+            assert storage.sweep_expired() == 1
+
+        assert await storage.get_approval("a1") is None
+
+    @pytest.mark.asyncio
+    async def test_reset_ttl_supersedes_heap_entry(self, storage: InMemoryStateStorage) -> None:
+        """Test that re-storing an entry with a later expiry keeps it past the first one."""
+        await storage.set_state(ConversationState(conversation_id="conv123"), ttl_seconds=10)
+        await storage.set_state(ConversationState(conversation_id="conv123"), ttl_seconds=3600)
+
+        later = datetime.now(tz=UTC) + timedelta(minutes=5)
+        with patch("ohlala_smartops.bot.state.datetime") as mock_datetime:
+            mock_datetime.now.return_value = later
+            assert storage.sweep_expired() == 0
+
+        assert await storage.get_state("conv123") is not None
+
+    @pytest.mark.asyncio
+    async def test_expiry_heap_stays_bounded(self, storage: InMemoryStateStorage) -> None:
+        """Test that superseded heap entries are compacted away."""
+        for turn in range(1000):
+            await storage.set_state(
+                ConversationState(conversation_id="conv123", turn_count=turn), ttl_seconds=3600
+            )
+
+        assert storage.get_stats()["expiry_heap_size"] <= 2 * 1 + 64 + 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self) -> None:
+        """Test that the least recently used entries are evicted beyond max_entries."""
+        storage = InMemoryStateStorage(max_entries=2)
+        for conversation_id in ("conv1", "conv2"):
+            await storage.set_state(ConversationState(conversation_id=conversation_id))
+        await storage.get_state("conv1")
+
+        await storage.set_state(ConversationState(conversation_id="conv3"))
+
+        assert await storage.get_state("conv2") is None
+        assert await storage.get_state("conv1") is not None
+        assert storage.get_stats()["evicted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sweeper_runs_in_background(self) -> None:
+        """Test that the started sweeper removes expired entries on its own."""
+        storage = InMemoryStateStorage(sweep_interval=0.01)
+        await storage.set_state(ConversationState(conversation_id="conv123"), ttl_seconds=0.001)
+
+        await storage.start()
+        await asyncio.sleep(0.05)
+        await storage.stop()
+
+        assert storage.get_stats()["entries"]["states"] == 0
+
+    @pytest.mark.asyncio
+    async def test_pending_approvals_by_eligible_approver(
+        self, storage: InMemoryStateStorage
+    ) -> None:
+        """Test that approvals a user requested or voted on are not listed for them."""
+        await storage.set_approval(TestRedisStateStorage._approval("own", requester_id="user1"))
+        await storage.set_approval(TestRedisStateStorage._approval("other", requester_id="user2"))
+        voted = TestRedisStateStorage._approval("voted", requester_id="user2")
+        voted.approvers_required = 2
+        voted.approve("user1")
+        await storage.set_approval(voted)
+
+        assert [a.id for a in await storage.list_pending_approvals("user1")] == ["other"]
+        assert [a.id for a in await storage.list_pending_approvals("user3")] == [
+            "own",
+            "other",
+            "voted",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_status_index_follows_decisions(self, storage: InMemoryStateStorage) -> None:
+        """Test that approvals decided in place move out of the pending index on save."""
+        approval = TestRedisStateStorage._approval("a1", requester_id="user2")
+        await storage.set_approval(approval)
+
+        approval.approve("user1")
+        await storage.set_approval(approval)
+
+        assert await storage.list_pending_approvals("user3") == []
+        assert storage.get_stats()["approvals_by_status"] == {"approved": 1}
+
+    @pytest.mark.asyncio
+    async def test_unsaved_changes_not_listed(self, storage: InMemoryStateStorage) -> None:
+        """Test that approvals decided or voted on in place without a save are not listed."""
+        decided = TestRedisStateStorage._approval("decided", requester_id="user2")
+        voted = TestRedisStateStorage._approval("voted", requester_id="user2")
+        voted.approvers_required = 2
+        await storage.set_approval(decided)
+        await storage.set_approval(voted)
+
+        decided.approve("user3")
+        voted.approve("user1")
+
+        assert await storage.list_pending_approvals("user1") == []
+        assert storage.get_stats()["approvals_by_status"] == {"approved": 1, "pending": 1}
+
+    @pytest.mark.asyncio
+    async def test_expiry_transition_updates_index(self, storage: InMemoryStateStorage) -> None:
+        """Test that listing moves approvals past their expiry to the expired index."""
+        await storage.set_approval(TestRedisStateStorage._approval("a1", requester_id="user2"))
+
+        future = datetime.now(tz=UTC) + timedelta(hours=1)
+        with patch("ohlala_smartops.models.approvals.datetime") as mock_datetime:
+            mock_datetime.now.return_value = future
+            assert await storage.list_pending_approvals("user1") == []
+
+        assert storage.get_stats()["approvals_by_status"] == {"expired": 1}
+
+    @pytest.mark.asyncio
+    async def test_removed_approvals_unindexed(self) -> None:
+        """Test that evicted approvals leave every index."""
+        storage = InMemoryStateStorage(max_entries=1)
+        await storage.set_approval(TestRedisStateStorage._approval("a1", requester_id="user2"))
+        await storage.set_approval(TestRedisStateStorage._approval("a2", requester_id="user2"))
+
+        assert [a.id for a in await storage.list_pending_approvals("user1")] == ["a2"]
+        assert storage._approvals_by_requester == {"user2": {"a2": None}}
+
+    @pytest.mark.asyncio
+    async def test_get_stats(self, storage: InMemoryStateStorage) -> None:
+        """Test entry counts and approximate memory use."""
+        await storage.set_state(ConversationState(conversation_id="conv123"))
+        await storage.add_command_history(TestRedisStateStorage._command("cmd1", minutes_ago=0))
+
+        stats = storage.get_stats()
+
+        assert stats["entries"] == {"states": 1, "contexts": 0, "approvals": 0, "commands": 1}
+        assert stats["max_entries"] is None
+        assert stats["approx_bytes"] > 0
+
+
+class TestRedisStateStorage:
+    """Test suite for RedisStateStorage against an in-process fake Redis."""
+
+    @pytest.fixture
+    def redis(self) -> FakeRedis:
+        """Create a fake Redis client."""
+        return FakeRedis()
+
+    @pytest.fixture
+    def storage(self, redis: FakeRedis) -> RedisStateStorage:
+        """Create a RedisStateStorage instance."""
+        return RedisStateStorage(redis, key_prefix="test:")
+
+    @staticmethod
+    def _approval(approval_id: str, requester_id: str = "user1") -> ApprovalRequest:
+        return ApprovalRequest(
+            id=approval_id,
+            command_type="stop_instance",
+            command_parameters={"instance_id": "i-123"},
+            requester_id=requester_id,
+            requester_name="User",
+            conversation_id="conv123",
+            approval_level="single",
+            expires_at=datetime.now(tz=UTC) + timedelta(minutes=30),
+        )
+
+    @staticmethod
+    def _command(command_id: str, minutes_ago: int, user_id: str = "user1") -> CommandHistoryEntry:
+        return CommandHistoryEntry(
+            command_id=command_id,
+            user_id=user_id,
+            description=f"Command {command_id}",
+            timestamp=datetime.now(tz=UTC) - timedelta(minutes=minutes_ago),
+        )
+
+    @pytest.mark.asyncio
+    async def test_state_round_trip(self, storage: RedisStateStorage, redis: FakeRedis) -> None:
+        """Test storing and retrieving state with a native key TTL."""
+        await storage.set_state(
+            ConversationState(conversation_id="conv123", pending_command="stop", turn_count=2)
+        )
+
+        retrieved = await storage.get_state("conv123")
+        assert retrieved is not None
+        assert retrieved.pending_command == "stop"
+        assert retrieved.turn_count == 2
+        assert redis.ttl_of("test:state:conv123") == pytest.approx(3600, abs=1)
+
+        await storage.delete_state("conv123")
+        assert await storage.get_state("conv123") is None
+
+    @pytest.mark.asyncio
+    async def test_state_expiration(self, storage: RedisStateStorage) -> None:
+        """Test that state expires after TTL."""
+        await storage.set_state(ConversationState(conversation_id="conv123"), ttl_seconds=0.001)
+
+        await asyncio.sleep(0.01)
+
+        assert await storage.get_state("conv123") is None
+
+    @pytest.mark.asyncio
+    async def test_compact_serialization(
+        self, storage: RedisStateStorage, redis: FakeRedis
+    ) -> None:
+        """Test that fields at their defaults are not stored."""
+        await storage.set_state(ConversationState(conversation_id="conv123"))
+
+        stored = await redis.get("test:state:conv123")
+        assert "pending_command" not in stored
+        assert "conv123" in stored
+
+    @pytest.mark.asyncio
+    async def test_context_round_trip(self, storage: RedisStateStorage) -> None:
+        """Test storing and retrieving context."""
+        context = ConversationContext(
+            conversation_id="conv123",
+            conversation_type=ConversationType.PERSONAL,
+            user=UserInfo(id="user123", name="Test User", tenant_id="tenant123"),
+            service_url="https://example.com",
+        )
+
+        await storage.set_context(context)
+
+        assert await storage.get_context("conv123") == context
+
+    @pytest.mark.asyncio
+    async def test_pending_approvals_filtered(self, storage: RedisStateStorage) -> None:
+        """Test that only pending approvals the user may approve are listed."""
+        await storage.set_approval(self._approval("a1", requester_id="user1"))
+        await storage.set_approval(self._approval("a2", requester_id="user2"))
+        decided = self._approval("a3", requester_id="user2")
+        decided.approve("user3")
+        await storage.set_approval(decided)
+
+        pending = await storage.list_pending_approvals("user1")
+
+        assert [approval.id for approval in pending] == ["a2"]
+
+    @pytest.mark.asyncio
+    async def test_expired_approval_marked(
+        self, storage: RedisStateStorage, redis: FakeRedis
+    ) -> None:
+        """Test that an approval past its expiry is marked expired and unindexed."""
+        approval = self._approval("a1", requester_id="user2")
+        await storage.set_approval(approval)
+
+        future = datetime.now(tz=UTC) + timedelta(hours=1)
+        with patch("ohlala_smartops.models.approvals.datetime") as mock_datetime:
+            mock_datetime.now.return_value = future
+            assert await storage.list_pending_approvals("user1") == []
+
+        stored = await storage.get_approval("a1")
+        assert stored is not None
+        assert stored.status == ApprovalStatus.EXPIRED
+        assert await redis.zcard("test:approvals:pending") == 0
+
+    @pytest.mark.asyncio
+    async def test_recent_commands(self, storage: RedisStateStorage, redis: FakeRedis) -> None:
+        """Test that recent commands come newest first from one index read and one MGET."""
+        for index in range(5):
+            await storage.add_command_history(self._command(f"cmd{index}", minutes_ago=index))
+        await storage.add_command_history(self._command("other", minutes_ago=0, user_id="user2"))
+
+        redis.round_trips = 0
+        recent = await storage.get_recent_commands("user1", limit=3)
+
+        assert [entry.command_id for entry in recent] == ["cmd0", "cmd1", "cmd2"]
+        assert redis.round_trips == 2
+        assert (await storage.get_command_history("other")) is not None
+
+    @pytest.mark.asyncio
+    async def test_command_history_trimmed(
+        self, storage: RedisStateStorage, redis: FakeRedis
+    ) -> None:
+        """Test that only the newest 100 commands per user are kept."""
+        for index in range(105):
+            await storage.add_command_history(self._command(f"cmd{index}", minutes_ago=index))
+
+        assert await redis.zcard("test:history:user1") == 100
+        assert await storage.get_command_history("cmd104") is None
+        assert await storage.get_command_history("cmd99") is not None
+
+
+class TestSqliteStateStorage:
+    """Test suite for SqliteStateStorage."""
+
+    @pytest.fixture
+    def path(self, tmp_path: Path) -> str:
+        """Path of a new database file."""
+        return str(tmp_path / "state.db")
+
+    @pytest.mark.asyncio
+    async def test_survives_restart(self, path: str) -> None:
+        """Test that states, contexts, approvals and history are restored on start."""
+        storage = SqliteStateStorage(path)
+        await storage.start()
+        await storage.set_state(ConversationState(conversation_id="conv123", turn_count=2))
+        await storage.set_context(
+            ConversationContext(
+                conversation_id="conv123",
+                conversation_type=ConversationType.PERSONAL,
+                user=UserInfo(id="user123", name="Test User", tenant_id="tenant123"),
+                service_url="https://example.com",
+            )
+        )
+        await storage.set_approval(TestRedisStateStorage._approval("a1", requester_id="user2"))
+        for index in range(3):
+            await storage.add_command_history(
+                TestRedisStateStorage._command(f"cmd{index}", minutes_ago=index)
+            )
+        await storage.stop()
+
+        restarted = SqliteStateStorage(path)
+        await restarted.start()
+
+        state = await restarted.get_state("conv123")
+        assert state is not None
+        assert state.turn_count == 2
+        assert await restarted.get_context("conv123") is not None
+        assert [a.id for a in await restarted.list_pending_approvals("user1")] == ["a1"]
+        assert [e.command_id for e in await restarted.get_recent_commands("user1")] == [
+            "cmd2",
+            "cmd1",
+            "cmd0",
+        ]
+        await restarted.stop()
+
+    @pytest.mark.asyncio
+    async def test_writer_survives_unexpected_errors(self, path: str) -> None:
+        """Test that a write failing with a non-SQLite error fails alone."""
+
+        class Unbindable:
+            def __conform__(self, protocol: object) -> None:
+                raise ValueError("cannot bind")
+
+        storage = SqliteStateStorage(path)
+        await storage.start()
+
+        with pytest.raises(ValueError, match="cannot bind"):
+            await storage._writer.execute(
+                ("DELETE FROM states WHERE conversation_id = ?", (Unbindable(),))
+            )
+        await storage.set_state(ConversationState(conversation_id="conv123"))
+
+        assert storage.get_stats()["sqlite"]["errors"] == 1
+        await storage.stop()
+        with sqlite3.connect(path) as connection:
+            assert connection.execute("SELECT COUNT(*) FROM states").fetchone() == (1,)
+
+    @pytest.mark.asyncio
+    async def test_expired_rows_not_restored(self, path: str) -> None:
+        """Test that expired entries are neither restored nor kept by a purge."""
+        storage = SqliteStateStorage(path)
+        await storage.start()
+        await storage.set_state(ConversationState(conversation_id="short"), ttl_seconds=0.001)
+        await storage.set_state(ConversationState(conversation_id="long"))
+        await asyncio.sleep(0.01)
+        await storage.purge_expired()
+        await storage.stop()
+
+        restarted = SqliteStateStorage(path)
+        await restarted.start()
+
+        assert await restarted.get_state("short") is None
+        assert await restarted.get_state("long") is not None
+        await restarted.stop()
+        with sqlite3.connect(path) as connection:
+            assert connection.execute("SELECT COUNT(*) FROM states").fetchone() == (1,)
+
+    @pytest.mark.asyncio
+    async def test_deletes_persisted(self, path: str) -> None:
+        """Test that deleted states stay deleted after a restart."""
+        storage = SqliteStateStorage(path)
+        await storage.start()
+        await storage.set_state(ConversationState(conversation_id="conv123"))
+        await storage.delete_state("conv123")
+        await storage.stop()
+
+        restarted = SqliteStateStorage(path)
+        await restarted.start()
+
+        assert await restarted.get_state("conv123") is None
+        await restarted.stop()
+
+    @pytest.mark.asyncio
+    async def test_command_history_capped(self, path: str) -> None:
+        """Test that the database keeps the newest 100 commands per user."""
+        storage = SqliteStateStorage(path)
+        await storage.start()
+        await asyncio.gather(
+            *[
+                storage.add_command_history(
+                    TestRedisStateStorage._command(f"cmd{index}", minutes_ago=0)
+                )
+                for index in range(105)
+            ]
+        )
+        await storage.stop()
+
+        with sqlite3.connect(path) as connection:
+            rows = connection.execute(
+                "SELECT command_id FROM command_history WHERE user_id = ? ORDER BY seq",
+                ("user1",),
+            ).fetchall()
+        assert len(rows) == 100
+        assert rows[0] == ("cmd5",)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_share_commits(self, path: str) -> None:
+        """Test that writes queued during a commit are committed together."""
+        storage = SqliteStateStorage(path)
+        await storage.start()
+
+        await asyncio.gather(
+            *[
+                storage.set_state(ConversationState(conversation_id=f"conv{index}"))
+                for index in range(200)
+            ]
+        )
+
+        stats = storage.get_stats()["sqlite"]
+        assert stats["writes"] == 200
+        assert stats["commits"] < 200
+        assert stats["errors"] == 0
+        await storage.stop()
+
+    @pytest.mark.asyncio
+    async def test_wal_mode_and_indexes(self, path: str) -> None:
+        """Test that the database uses WAL and indexes users, commands and expiry."""
+        storage = SqliteStateStorage(path)
+        await storage.stop()
+
+        with sqlite3.connect(path) as connection:
+            assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+            indexes = {
+                row[0]
+                for row in connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+                )
+            }
+        assert {
+            "idx_states_expires_at",
+            "idx_approvals_requester_id",
+            "idx_command_history_user_id",
+        } <= indexes
+
 
 class TestConversationStateManager:
     """Test suite for ConversationStateManager."""
@@ -162,6 +639,160 @@ class TestConversationStateManager:
         assert context.conversation_id == "conv123"
         assert context.user.id == "user123"
 
+    @pytest.mark.asyncio
+    async def test_turn_reads_and_writes_once(self, manager: ConversationStateManager) -> None:
+        """Test that a turn loads each state once and writes it when it ends."""
+        async with manager.turn():
+            state = await manager.get_state("conv123")
+            state.turn_count += 1
+            await manager.save_state(state)
+
+            again = await manager.get_state("conv123")
+            again.pending_command = "stop instance"
+            await manager.save_state(again)
+
+            assert await manager.storage.get_state("conv123") is None
+
+        stored = await manager.storage.get_state("conv123")
+        assert stored is not None
+        assert stored.turn_count == 1
+        assert stored.pending_command == "stop instance"
+        assert manager.get_stats() == {
+            "state_reads": 1,
+            "state_writes": 1,
+            "coalesced_writes": 2,  # Creation and first save merged into the last save
+            "pending_writes": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_turn_writes_on_error(self, manager: ConversationStateManager) -> None:
+        """Test that changes made before a handler error are still written."""
+
+        async def handle() -> None:
+            async with manager.turn():
+                state = await manager.get_state("conv123")
+                state.turn_count = 3
+                await manager.save_state(state)
+                raise RuntimeError("handler failed")
+
+        with pytest.raises(RuntimeError):
+            await handle()
+
+        stored = await manager.storage.get_state("conv123")
+        assert stored is not None
+        assert stored.turn_count == 3
+
+    @pytest.mark.asyncio
+    async def test_nested_turns_join(self, manager: ConversationStateManager) -> None:
+        """Test that a nested turn writes with the outer one."""
+        async with manager.turn():
+            async with manager.turn():
+                await manager.save_state(ConversationState(conversation_id="conv123"))
+            assert await manager.storage.get_state("conv123") is None
+
+        assert await manager.storage.get_state("conv123") is not None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_turns_keep_both_changes(
+        self, manager: ConversationStateManager
+    ) -> None:
+        """Test that concurrent turns of a conversation do not overwrite each other."""
+        first_loaded = asyncio.Event()
+        second_done = asyncio.Event()
+
+        async def first() -> None:
+            async with manager.turn():
+                state = await manager.get_state("conv123")
+                first_loaded.set()
+                await second_done.wait()
+                state.pending_command = "stop instance"
+                await manager.save_state(state)
+
+        async def second() -> None:
+            await first_loaded.wait()
+            async with manager.turn():
+                state = await manager.get_state("conv123")
+                state.turn_count += 1
+                await manager.save_state(state)
+            second_done.set()
+
+        await asyncio.gather(first(), second())
+
+        stored = await manager.storage.get_state("conv123")
+        assert stored is not None
+        assert stored.turn_count == 1
+        assert stored.pending_command == "stop instance"
+        assert manager.get_stats()["state_reads"] == 1
+        assert manager._turn_states == {}
+
+    @pytest.mark.asyncio
+    async def test_save_after_turn_written_through(self, manager: ConversationStateManager) -> None:
+        """Test that saves by a task outliving its turn are not lost."""
+        turn_ended = asyncio.Event()
+
+        async def follow_up() -> None:
+            await turn_ended.wait()
+            state = await manager.get_state("conv123")
+            await manager.save_state(state.model_copy(update={"pending_command": "reboot"}))
+
+        async with manager.turn():
+            state = await manager.get_state("conv123")
+            state.turn_count = 1
+            await manager.save_state(state)
+            task = asyncio.create_task(follow_up())
+
+        turn_ended.set()
+        await task
+
+        stored = await manager.storage.get_state("conv123")
+        assert stored is not None
+        assert stored.turn_count == 1
+        assert stored.pending_command == "reboot"
+
+    @pytest.mark.asyncio
+    async def test_write_behind_merges_bursts(self) -> None:
+        """Test that writes within the delay are merged and reads see them."""
+        manager = ConversationStateManager(InMemoryStateStorage(), write_behind_delay=0.05)
+
+        for turn in range(3):
+            async with manager.turn():
+                state = await manager.get_state("conv123")
+                state.turn_count = turn
+                await manager.save_state(state)
+
+        assert (await manager.get_state("conv123")).turn_count == 2
+        assert await manager.storage.get_state("conv123") is None
+
+        await asyncio.sleep(0.1)
+
+        stored = await manager.storage.get_state("conv123")
+        assert stored is not None
+        assert stored.turn_count == 2
+        assert manager.get_stats()["state_writes"] == 1
+        assert manager.get_stats()["state_reads"] == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_held_states(self) -> None:
+        """Test that flush writes held states without waiting for the delay."""
+        manager = ConversationStateManager(InMemoryStateStorage(), write_behind_delay=60.0)
+        await manager.save_state(ConversationState(conversation_id="conv123"))
+
+        await manager.flush()
+
+        assert await manager.storage.get_state("conv123") is not None
+        assert manager.get_stats()["pending_writes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_clear_drops_held_write(self) -> None:
+        """Test that clearing a conversation discards its held write."""
+        manager = ConversationStateManager(InMemoryStateStorage(), write_behind_delay=60.0)
+        await manager.save_state(ConversationState(conversation_id="conv123", turn_count=4))
+
+        await manager.clear_conversation("conv123")
+        await manager.flush()
+
+        assert await manager.storage.get_state("conv123") is None
+
     @pytest.mark.asyncio
     async def test_get_approval(self, manager: ConversationStateManager) -> None:
         """Test storing and retrieving approval requests."""
@@ -190,6 +821,30 @@ class TestStateManagerFactory:
         assert isinstance(manager, ConversationStateManager)
         assert isinstance(manager.storage, InMemoryStateStorage)
 
+    @pytest.mark.asyncio
+    async def test_create_sqlite_manager(self, tmp_path: Path) -> None:
+        """Test creating a SQLite-backed state manager."""
+        manager = create_state_manager("sqlite", sqlite_path=str(tmp_path / "state.db"))
+
+        assert isinstance(manager.storage, SqliteStateStorage)
+        await manager.close()
+
+    def test_create_sqlite_requires_path(self) -> None:
+        """Test that the SQLite backend needs a database path."""
+        with pytest.raises(ValueError, match="requires a database path"):
+            create_state_manager("sqlite")
+
+    def test_create_redis_requires_url(self) -> None:
+        """Test that the Redis backend needs a URL."""
+        with pytest.raises(ValueError, match="requires a Redis URL"):
+            create_state_manager("redis")
+
+    @patch.dict(sys.modules, {"redis": None, "redis.asyncio": None})
+    def test_create_redis_without_package(self) -> None:
+        """Test that the Redis backend needs the optional redis package."""
+        with pytest.raises(ImportError):
+            create_state_manager("redis", "redis://localhost:6379/0")
+
     def test_create_invalid_type(self) -> None:
         """Test that invalid storage type raises ValueError."""
         with pytest.raises(ValueError, match="Unknown storage type"):
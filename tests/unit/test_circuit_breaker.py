@@ -0,0 +1,132 @@
+"""Tests for rolling-window circuit breakers."""
+
+from collections.abc import Generator
+from unittest.mock import patch
+
+import pytest
+
+from ohlala_smartops.utils.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
+
+
+class FakeClock:
+    """Manually advanced replacement for time.monotonic."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Generator[FakeClock]:
+    """Patch the breaker's clock with a manually advanced one."""
+    fake = FakeClock()
+    with patch("ohlala_smartops.utils.circuit_breaker.time.monotonic", fake.monotonic):
+        yield fake
+
+
+def _record(breaker: CircuitBreaker, successes: int, failures: int) -> None:
+    for _ in range(successes):
+        breaker.record_success(breaker.admit())
+    for _ in range(failures):
+        breaker.record_failure(breaker.admit())
+
+
+class TestCircuitBreaker:
+    """Test suite for CircuitBreaker."""
+
+    def test_opens_at_error_rate(self, clock: FakeClock) -> None:
+        """Test that the breaker opens once the window's error rate reaches the threshold."""
+        breaker = CircuitBreaker("ce", min_requests=10, error_rate_threshold=0.5)
+
+        _record(breaker, successes=5, failures=4)
+        assert breaker.state == "closed"
+
+        assert breaker.record_failure(breaker.admit()) is True
+        assert breaker.state == "open"
+        with pytest.raises(CircuitBreakerOpenError, match="open for ce"):
+            breaker.admit()
+
+    def test_needs_minimum_requests(self, clock: FakeClock) -> None:
+        """Test that a few failures on a quiet dependency do not open the breaker."""
+        breaker = CircuitBreaker("ce", min_requests=10, error_rate_threshold=0.5)
+
+        _record(breaker, successes=0, failures=9)
+
+        assert breaker.state == "closed"
+
+    def test_old_outcomes_leave_window(self, clock: FakeClock) -> None:
+        """Test that failures older than the window no longer count."""
+        breaker = CircuitBreaker("ce", min_requests=10, window_seconds=60.0)
+        _record(breaker, successes=0, failures=9)
+
+        clock.now += 61.0
+        _record(breaker, successes=9, failures=1)
+
+        stats = breaker.get_stats()
+        assert breaker.state == "closed"
+        assert stats["window_requests"] == 10
+        assert stats["error_rate"] == 0.1
+
+    def test_half_open_limits_probes(self, clock: FakeClock) -> None:
+        """Test that only the configured number of probes pass while half-open."""
+        breaker = CircuitBreaker("ce", min_requests=1, open_timeout=10.0, half_open_probes=2)
+        breaker.record_failure(breaker.admit())
+
+        clock.now += 10.0
+        assert breaker.state == "half_open"
+        assert breaker.admit() is True
+        assert breaker.admit() is True
+        with pytest.raises(CircuitBreakerOpenError, match="probes in progress"):
+            breaker.admit()
+
+    def test_successful_probes_close(self, clock: FakeClock) -> None:
+        """Test that the breaker closes after enough successful probes."""
+        breaker = CircuitBreaker("ce", min_requests=1, half_open_probes=2)
+        breaker.record_failure(breaker.admit())
+        clock.now += 10.0
+
+        breaker.record_success(breaker.admit())
+        assert breaker.state == "half_open"
+        breaker.record_success(breaker.admit())
+        assert breaker.state == "closed"
+
+    def test_failed_probe_reopens(self, clock: FakeClock) -> None:
+        """Test that a failed probe opens the breaker for another timeout."""
+        breaker = CircuitBreaker("ce", min_requests=1, half_open_probes=2)
+        breaker.record_failure(breaker.admit())
+        clock.now += 10.0
+
+        assert breaker.record_failure(breaker.admit()) is True
+
+        assert breaker.state == "open"
+        assert breaker.get_stats()["trips"] == 2
+
+    def test_released_probe_frees_slot(self, clock: FakeClock) -> None:
+        """Test that a probe without a health signal gives its slot back."""
+        breaker = CircuitBreaker("ce", min_requests=1, half_open_probes=1)
+        breaker.record_failure(breaker.admit())
+        clock.now += 10.0
+
+        breaker.release_probe(breaker.admit())
+
+        assert breaker.admit() is True
+
+    def test_get_stats(self, clock: FakeClock) -> None:
+        """Test breaker statistics while open."""
+        breaker = CircuitBreaker("ce", min_requests=2, open_timeout=10.0)
+        _record(breaker, successes=0, failures=2)
+        clock.now += 4.0
+        with pytest.raises(CircuitBreakerOpenError):
+            breaker.admit()
+
+        assert breaker.get_stats() == {
+            "state": "open",
+            "window_requests": 0,
+            "window_failures": 0,
+            "error_rate": 0.0,
+            "retry_after_seconds": 6.0,
+            "trips": 1,
+            "rejected": 1,
+        }
@@ -1,5 +1,6 @@
 """Tests for CloudWatch metrics utilities."""
 
+import json
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -12,6 +13,7 @@ from ohlala_smartops.aws.cloudwatch import (
     MetricDataPoint,
 )
 from ohlala_smartops.aws.exceptions import CloudWatchError, ValidationError
+from ohlala_smartops.constants import METRICS_MAX_REQUEST_BYTES
 
 
 class TestMetricDataPoint:
@@ -324,6 +326,50 @@ class TestCloudWatchManager:
                 dimensions=dimensions,
             )
 
+    @pytest.mark.asyncio
+    async def test_put_metric_data_batch_chunks(
+        self, cloudwatch_manager: CloudWatchManager, mock_client: Mock
+    ) -> None:
+        """Test that datums are published up to 1000 per request."""
+        mock_client.call.return_value = {}
+        metric_data = [{"MetricName": f"Metric{i}", "Values": [1.0]} for i in range(2500)]
+
+        requests = await cloudwatch_manager.put_metric_data_batch("Custom/App", metric_data)
+
+        assert requests == 3
+        sizes = [len(call[1]["MetricData"]) for call in mock_client.call.call_args_list]
+        assert sizes == [1000, 1000, 500]
+
+    @pytest.mark.asyncio
+    async def test_put_metric_data_batch_chunks_by_size(
+        self, cloudwatch_manager: CloudWatchManager, mock_client: Mock
+    ) -> None:
+        """Test that requests are also split to stay under the request size limit."""
+        mock_client.call.return_value = {}
+        values = [float(v) for v in range(150)]
+        metric_data = [
+            {"MetricName": f"Metric{i}", "Values": values, "Counts": values} for i in range(300)
+        ]
+
+        requests = await cloudwatch_manager.put_metric_data_batch("Custom/App", metric_data)
+
+        chunks = [call[1]["MetricData"] for call in mock_client.call.call_args_list]
+        assert requests == len(chunks) > 1
+        assert sum(len(chunk) for chunk in chunks) == 300
+        assert all(len(json.dumps(chunk)) <= METRICS_MAX_REQUEST_BYTES for chunk in chunks)
+
+    @pytest.mark.asyncio
+    async def test_put_metric_data_batch_error(
+        self, cloudwatch_manager: CloudWatchManager, mock_client: Mock
+    ) -> None:
+        """Test that a failed request raises CloudWatchError."""
+        mock_client.call.side_effect = Exception("Throttling")
+
+        with pytest.raises(CloudWatchError, match="Failed to put metric data"):
+            await cloudwatch_manager.put_metric_data_batch(
+                "Custom/App", [{"MetricName": "Test", "Values": [1.0]}]
+            )
+
     @pytest.mark.asyncio
     async def test_put_metric_data_invalid_storage_resolution(
         self, cloudwatch_manager: CloudWatchManager
@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+from ohlala_smartops.bot.state import SqliteStateStorage
 from ohlala_smartops.models.command_tracking import (
     CommandTrackingInfo,
     SSMCommandStatus,
@@ -551,3 +552,44 @@ class TestLifecycleManagement:
         # Should not raise
         await tracker.stop()
         assert tracker._polling_task is None
+
+
+class TestTrackedCommandStore:
+    """Test that tracked commands survive a restart through the store."""
+
+    @pytest.mark.asyncio
+    async def test_restored_after_restart(self, mock_mcp_manager, tmp_path):
+        """Test that pending commands and workflows are restored, completed ones are not."""
+        path = str(tmp_path / "state.db")
+        storage = SqliteStateStorage(path)
+        tracker = AsyncCommandTracker(mock_mcp_manager, store=storage)
+        tracker.create_workflow(workflow_id="wf-123", operation_type="restart", expected_count=2)
+        done = tracker.track_command(
+            command_id="cmd-1",
+            instance_id="i-1234567890abcdef0",
+            document_name="AWS-RunShellScript",
+            workflow_id="wf-123",
+        )
+        tracker.track_command(
+            command_id="cmd-2",
+            instance_id="i-1234567890abcdef1",
+            document_name="AWS-RunShellScript",
+            workflow_id="wf-123",
+        )
+        done.status = SSMCommandStatus.SUCCESS
+        await tracker._handle_completion(done)
+        await tracker.stop()
+        await storage.stop()
+
+        storage = SqliteStateStorage(path)
+        restarted = AsyncCommandTracker(mock_mcp_manager, store=storage)
+        await restarted.start()
+        await restarted.stop()
+        await storage.stop()
+
+        assert list(restarted.active_commands) == ["cmd-2"]
+        assert restarted.active_commands["cmd-2"].workflow_id == "wf-123"
+        workflow = restarted.get_workflow_status("wf-123")
+        assert workflow is not None
+        assert workflow.command_ids == ["cmd-1", "cmd-2"]
+        assert workflow.success_count == 1
@@ -23,6 +23,15 @@ class TestSettingsDefaults:
         settings = Settings()
         assert settings.port == 8000
 
+    def test_state_storage_default(self) -> None:
+        """Test that conversation state is kept in memory by default."""
+        settings = Settings()
+        assert settings.state_storage_type == "memory"
+        assert settings.state_redis_url is None
+        assert settings.state_sqlite_path is None
+        assert settings.state_max_entries is None
+        assert settings.state_write_behind_delay == 0.0
+
     def test_log_level_default(self) -> None:
         """Test that log level has a default value."""
         settings = Settings()
@@ -38,6 +47,23 @@ class TestSettingsDefaults:
         settings = Settings()
         assert settings.audit_log_include_pii is False
 
+    def test_metrics_output_default(self) -> None:
+        """Test that metrics are published with PutMetricData by default."""
+        settings = Settings()
+        assert settings.metrics_output == "api"
+        assert settings.metrics_emf_file is None
+
+    def test_audit_log_sink_default(self) -> None:
+        """Test that audit entries go to the application log by default."""
+        settings = Settings()
+        assert settings.audit_log_sink == "logging"
+        assert settings.audit_log_queue_size == 10_000
+
+    def test_cost_cache_default(self) -> None:
+        """Test that the cost cache lives in memory by default."""
+        settings = Settings()
+        assert settings.cost_cache_path is None
+
 
 class TestBedrockConfiguration:
     """Tests for Bedrock-related configuration."""
@@ -148,6 +174,12 @@ class TestRateLimitingConfiguration:
         assert settings.max_concurrent_aws_calls == 8
         assert settings.aws_api_rate_limit == 15.0
         assert settings.aws_api_max_tokens == 30
+        assert settings.aws_service_rate_limits_enabled is True
+        assert settings.aws_adaptive_rate_enabled is False
+        assert settings.aws_adaptive_rate_min == 1.0
+        assert settings.aws_adaptive_rate_max == 50.0
+        assert settings.aws_adaptive_rate_decrease_factor == 0.5
+        assert settings.aws_tenant_max_concurrent == 0
 
     def test_bedrock_rate_limiting_defaults(self) -> None:
         """Test Bedrock rate limiting defaults."""
@@ -155,6 +187,13 @@ class TestRateLimitingConfiguration:
         assert settings.max_concurrent_bedrock_calls == 2
         assert settings.bedrock_api_rate_limit == 0.5
         assert settings.bedrock_api_max_tokens == 5
+        assert settings.bedrock_tenant_max_concurrent == 0
+        assert settings.throttle_redis_url is None
+        assert settings.aws_shared_lease_size == 5
+        assert settings.bedrock_shared_lease_size == 1
+        assert settings.throttle_lease_ttl == 1.0
+        assert settings.token_quota_user_per_hour == 0
+        assert settings.token_quota_team_per_day == 0
 
     def test_circuit_breaker_defaults(self) -> None:
         """Test circuit breaker defaults."""
@@ -162,6 +201,40 @@ class TestRateLimitingConfiguration:
         assert settings.aws_circuit_breaker_enabled is False
         assert settings.aws_circuit_breaker_threshold == 100
         assert settings.aws_circuit_breaker_timeout == 10.0
+        assert settings.aws_circuit_breaker_error_rate == 0.5
+        assert settings.aws_circuit_breaker_window == 60.0
+        assert settings.aws_circuit_breaker_half_open_probes == 3
+
+
+class TestAWSClientBackendConfiguration:
+    """Tests for AWS client backend selection."""
+
+    def test_aws_client_backend_defaults_to_thread(self) -> None:
+        """Test that the thread backend is used by default for every service."""
+        settings = Settings()
+        assert settings.aws_client_backend == "thread"
+        assert settings.get_aws_client_backend("ec2") == "thread"
+
+    def test_per_service_override(self) -> None:
+        """Test that per-service overrides take precedence over the default."""
+        settings = Settings(aws_client_backend_overrides={"ce": "async"})
+        assert settings.get_aws_client_backend("ce") == "async"
+        assert settings.get_aws_client_backend("ssm") == "thread"
+
+    def test_overrides_load_from_environment(self) -> None:
+        """Test that overrides are parsed from a JSON environment variable."""
+        with patch.dict(
+            os.environ,
+            {"AWS_CLIENT_BACKEND": "async", "AWS_CLIENT_BACKEND_OVERRIDES": '{"ssm": "thread"}'},
+        ):
+            settings = Settings()
+            assert settings.get_aws_client_backend("ec2") == "async"
+            assert settings.get_aws_client_backend("ssm") == "thread"
+
+    def test_invalid_backend_rejected(self) -> None:
+        """Test that unknown backends are rejected."""
+        with pytest.raises(ValidationError):
+            Settings(aws_client_backend="process")
 
     def test_max_concurrent_requests_validation(self) -> None:
         """Test that concurrent request limits are validated."""
@@ -0,0 +1,78 @@
+"""Tests for the daily cost cache."""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import patch
+
+from ohlala_smartops.utils.cost_cache import CostCache
+
+TODAY = date(2025, 6, 20)
+DAYS = [TODAY - timedelta(days=offset) for offset in range(9, -1, -1)]
+
+
+class TestCostCache:
+    """Test suite for CostCache."""
+
+    def test_empty_cache_misses_every_day(self) -> None:
+        """Test that every day of a period is fetched the first time."""
+        cache = CostCache()
+
+        assert cache.missing_days("ec2", "UnblendedCost", DAYS) == DAYS
+        assert cache.get_daily("ec2", "UnblendedCost", DAYS[0], TODAY) == {}
+
+    def test_settled_days_served_estimated_days_expire(self) -> None:
+        """Test that settled days stay cached while recent days are fetched again."""
+        cache = CostCache(settle_days=3, estimated_ttl=3600)
+        cache.put_daily("ec2", "UnblendedCost", [(d, Decimal("1.25"), False) for d in DAYS], TODAY)
+
+        assert cache.missing_days("ec2", "UnblendedCost", DAYS) == []
+
+        with patch("ohlala_smartops.utils.cost_cache.time.time", return_value=10**12):
+            assert cache.missing_days("ec2", "UnblendedCost", DAYS) == DAYS[-4:]
+
+    def test_estimated_flag_keeps_old_day_refreshing(self) -> None:
+        """Test that a day Cost Explorer marks Estimated is refreshed however old."""
+        cache = CostCache(estimated_ttl=0)
+        cache.put_daily("ec2", "UnblendedCost", [(DAYS[0], Decimal("2"), True)], TODAY)
+
+        assert cache.missing_days("ec2", "UnblendedCost", DAYS[:1]) == DAYS[:1]
+
+    def test_keys_are_independent(self) -> None:
+        """Test that scopes, metrics and groups are cached separately."""
+        cache = CostCache()
+        cache.put_daily("ec2", "UnblendedCost", [(DAYS[0], Decimal("5.10"), False)], TODAY)
+        cache.put_daily("i-123", "UnblendedCost", [(DAYS[0], Decimal("0.40"), False)], TODAY)
+
+        assert cache.get_daily("ec2", "UnblendedCost", DAYS[0], TODAY) == {DAYS[0]: Decimal("5.10")}
+        assert cache.missing_days("ec2", "BlendedCost", DAYS[:1]) == DAYS[:1]
+        assert cache.missing_days("ec2", "UnblendedCost", DAYS[:1], group="t3.micro") == DAYS[:1]
+
+    def test_forecast_valid_until_next_day(self) -> None:
+        """Test that forecasts, including the lack of one, are cached for the day."""
+        cache = CostCache()
+        cache.put_forecast("ec2", "month", TODAY, {"amount": Decimal("150.00"), "period": "June"})
+        cache.put_forecast("i-123", "month", TODAY, None)
+
+        assert cache.get_forecast("ec2", "month", TODAY) == (
+            True,
+            {"amount": Decimal("150.00"), "period": "June"},
+        )
+        assert cache.get_forecast("i-123", "month", TODAY) == (True, None)
+        assert cache.get_forecast("ec2", "week", TODAY) == (False, None)
+        assert cache.get_forecast("ec2", "month", TODAY + timedelta(days=1)) == (False, None)
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        """Test that a file-backed cache keeps costs across restarts."""
+        path = str(tmp_path / "costs.db")
+        cache = CostCache(path)
+        cache.put_daily("ec2", "UnblendedCost", [(DAYS[0], Decimal("3.333"), False)], TODAY)
+        cache.close()
+
+        reopened = CostCache(path)
+
+        assert reopened.get_daily("ec2", "UnblendedCost", DAYS[0], DAYS[0]) == {
+            DAYS[0]: Decimal("3.333")
+        }
+        assert reopened.get_stats()["cached_days"] == 1
+        reopened.close()
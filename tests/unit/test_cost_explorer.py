@@ -2,6 +2,7 @@
 
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
+from typing import Any
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -279,6 +280,209 @@ class TestCostExplorerManager:
         with pytest.raises(ValidationError, match="instance_ids cannot be empty"):
             await cost_manager.get_instance_costs(instance_ids=[], start_date=start, end_date=end)
 
+    @pytest.mark.asyncio
+    async def test_get_instance_costs_batched_by_resource(
+        self, cost_manager: CostExplorerManager, mock_client: Mock
+    ) -> None:
+        """Test that recent costs of all instances come from one grouped query."""
+        day = datetime.now(UTC).date() - timedelta(days=2)
+        next_day = day + timedelta(days=1)
+        mock_client.call.return_value = {
+            "ResultsByTime": [
+                {
+                    "TimePeriod": {"Start": day.isoformat(), "End": next_day.isoformat()},
+                    "Groups": [
+                        {
+                            "Keys": ["i-123"],
+                            "Metrics": {"UnblendedCost": {"Amount": "4.20", "Unit": "USD"}},
+                        },
+                        {
+                            "Keys": ["i-456"],
+                            "Metrics": {"UnblendedCost": {"Amount": "1.10", "Unit": "USD"}},
+                        },
+                    ],
+                    "Estimated": True,
+                }
+            ]
+        }
+
+        costs = await cost_manager.get_instance_costs(
+            instance_ids=["i-123", "i-456", "i-789"],
+            start_date=datetime.combine(day, datetime.min.time(), UTC),
+            end_date=datetime.combine(next_day, datetime.min.time(), UTC),
+        )
+
+        mock_client.call.assert_called_once()
+        assert mock_client.call.call_args[0][0] == "get_cost_and_usage_with_resources"
+        call_kwargs = mock_client.call.call_args[1]
+        assert call_kwargs["GroupBy"] == [{"Type": "DIMENSION", "Key": "RESOURCE_ID"}]
+        assert call_kwargs["Filter"]["And"][1]["Dimensions"]["Values"] == [
+            "i-123",
+            "i-456",
+            "i-789",
+        ]
+        assert costs["i-123"][0].amount == Decimal("4.20")
+        assert costs["i-123"][0].estimated is True
+        assert costs["i-456"][0].amount == Decimal("1.10")
+        # No usage in the period: zero, as the per-instance query reports
+        assert costs["i-789"][0].amount == Decimal("0")
+
+    @pytest.mark.asyncio
+    async def test_get_instance_costs_batched_pagination(
+        self, cost_manager: CostExplorerManager, mock_client: Mock
+    ) -> None:
+        """Test that groups of one period spread over pages are merged."""
+        day = datetime.now(UTC).date() - timedelta(days=2)
+        period = {"Start": day.isoformat(), "End": (day + timedelta(days=1)).isoformat()}
+
+        def page(instance_id: str, amount: str) -> dict[str, Any]:
+            return {
+                "TimePeriod": period,
+                "Groups": [
+                    {
+                        "Keys": [instance_id],
+                        "Metrics": {"UnblendedCost": {"Amount": amount, "Unit": "USD"}},
+                    }
+                ],
+            }
+
+        mock_client.call.side_effect = [
+            {"ResultsByTime": [page("i-123", "2.00")], "NextPageToken": "token1"},
+            {"ResultsByTime": [page("i-456", "3.00")]},
+        ]
+
+        costs = await cost_manager.get_instance_costs(
+            instance_ids=["i-123", "i-456"],
+            start_date=datetime.combine(day, datetime.min.time(), UTC),
+            end_date=datetime.combine(day + timedelta(days=1), datetime.min.time(), UTC),
+        )
+
+        assert mock_client.call.call_count == 2
+        assert mock_client.call.call_args_list[1][1]["NextPageToken"] == "token1"
+        assert [len(points) for points in costs.values()] == [1, 1]
+        assert costs["i-123"][0].amount == Decimal("2.00")
+        assert costs["i-456"][0].amount == Decimal("3.00")
+
+    @pytest.mark.asyncio
+    async def test_get_instance_costs_falls_back_without_resource_data(
+        self, cost_manager: CostExplorerManager, mock_client: Mock
+    ) -> None:
+        """Test per-instance queries when resource-level data is not enabled."""
+        mock_client.call.side_effect = [
+            CostExplorerError(
+                "Resource level data is not enabled",
+                service="ce",
+                error_code="DataUnavailableException",
+            ),
+            {"ResultsByTime": []},
+            {"ResultsByTime": []},
+            {"ResultsByTime": []},
+            {"ResultsByTime": []},
+        ]
+        start = datetime.now(UTC) - timedelta(days=3)
+        end = datetime.now(UTC)
+
+        await cost_manager.get_instance_costs(["i-123", "i-456"], start, end)
+        await cost_manager.get_instance_costs(["i-123", "i-456"], start, end)
+
+        operations = [call[0][0] for call in mock_client.call.call_args_list]
+        assert operations == ["get_cost_and_usage_with_resources"] + ["get_cost_and_usage"] * 4
+        assert cost_manager.resource_level_data is False
+
+    @pytest.mark.asyncio
+    async def test_get_instance_costs_transient_error_keeps_resource_data(
+        self, cost_manager: CostExplorerManager, mock_client: Mock
+    ) -> None:
+        """Test that other errors of the grouped query fall back without disabling it."""
+        mock_client.call.side_effect = [
+            CostExplorerError("Rate exceeded", service="ce", error_code="ThrottlingException"),
+            {"ResultsByTime": []},
+            {"ResultsByTime": []},
+            {"ResultsByTime": []},
+        ]
+        start = datetime.now(UTC) - timedelta(days=3)
+        end = datetime.now(UTC)
+
+        await cost_manager.get_instance_costs(["i-123", "i-456"], start, end)
+        await cost_manager.get_instance_costs(["i-123", "i-456"], start, end)
+
+        operations = [call[0][0] for call in mock_client.call.call_args_list]
+        assert operations == [
+            "get_cost_and_usage_with_resources",
+            "get_cost_and_usage",
+            "get_cost_and_usage",
+            "get_cost_and_usage_with_resources",
+        ]
+        assert cost_manager.resource_level_data is True
+
+    @pytest.mark.asyncio
+    async def test_get_instance_costs_paths_match(
+        self, cost_manager: CostExplorerManager, mock_client: Mock
+    ) -> None:
+        """Test that the grouped and per-instance queries count the same costs."""
+        day = datetime.now(UTC).date() - timedelta(days=2)
+        period = {"Start": day.isoformat(), "End": (day + timedelta(days=1)).isoformat()}
+        # Billed amounts by service and instance, e.g. EBS volumes attached to it
+        billing = {
+            "Amazon Elastic Compute Cloud - Compute": {"i-123": "4.00", "i-456": "1.50"},
+            "EC2 - Other": {"i-123": "0.80", "i-456": "0.20"},
+        }
+
+        def amount(filter_dict: dict[str, Any], instance_id: str) -> Decimal:
+            dimensions = {
+                f["Dimensions"]["Key"]: f["Dimensions"]["Values"] for f in filter_dict["And"]
+            }
+            services = dimensions.get("SERVICE", list(billing))
+            return sum(
+                (Decimal(billing[service].get(instance_id, "0")) for service in services),
+                Decimal("0"),
+            )
+
+        async def call(operation: str, **kwargs: Any) -> dict[str, Any]:
+            instance_ids = next(
+                f["Dimensions"]["Values"]
+                for f in kwargs["Filter"]["And"]
+                if f["Dimensions"]["Key"] == "RESOURCE_ID"
+            )
+            if operation == "get_cost_and_usage_with_resources":
+                groups = [
+                    {
+                        "Keys": [iid],
+                        "Metrics": {
+                            "UnblendedCost": {
+                                "Amount": str(amount(kwargs["Filter"], iid)),
+                                "Unit": "USD",
+                            }
+                        },
+                    }
+                    for iid in instance_ids
+                ]
+                return {"ResultsByTime": [{"TimePeriod": period, "Groups": groups}]}
+            total = {"Amount": str(amount(kwargs["Filter"], instance_ids[0])), "Unit": "USD"}
+            return {"ResultsByTime": [{"TimePeriod": period, "Total": {"UnblendedCost": total}}]}
+
+        mock_client.call.side_effect = call
+        start = datetime.combine(day, datetime.min.time(), UTC)
+        end = start + timedelta(days=1)
+
+        grouped = await cost_manager.get_instance_costs(["i-123", "i-456"], start, end)
+        cost_manager.resource_level_data = False
+        per_instance = await cost_manager.get_instance_costs(["i-123", "i-456"], start, end)
+
+        def totals(costs: dict[str, list[CostDataPoint]]) -> dict[str, Decimal]:
+            return {
+                iid: sum((p.amount for p in points), Decimal("0")) for iid, points in costs.items()
+            }
+
+        assert (
+            totals(grouped)
+            == totals(per_instance)
+            == {
+                "i-123": Decimal("4.00"),
+                "i-456": Decimal("1.50"),
+            }
+        )
+
     # Tests for forecast_cost()
 
     @pytest.mark.asyncio
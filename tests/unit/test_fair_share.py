@@ -0,0 +1,246 @@
+"""Tests for per-tenant fair-share scheduling."""
+
+import asyncio
+import logging
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ohlala_smartops.utils.fair_share import (
+    FairShareQueue,
+    FairShareSemaphore,
+    TenantWaitStats,
+    get_throttle_tenant,
+    load_tenant_weights,
+    throttle_tenant,
+)
+
+
+class TestThrottleTenantContext:
+    """Test suite for the throttle_tenant context."""
+
+    def test_default_tenant(self) -> None:
+        """Test that calls outside a conversation use the default tenant."""
+        assert get_throttle_tenant() == "default"
+
+    def test_tenant_restored_after_block(self) -> None:
+        """Test that the block sets and restores the tenant."""
+        with throttle_tenant("team-a"):
+            assert get_throttle_tenant() == "team-a"
+            with throttle_tenant(None):
+                assert get_throttle_tenant() == "default"
+            assert get_throttle_tenant() == "team-a"
+
+        assert get_throttle_tenant() == "default"
+
+
+class TestLoadTenantWeights:
+    """Test suite for tenant weight configuration."""
+
+    def test_unset(self) -> None:
+        """Test that all tenants weigh the same by default."""
+        assert load_tenant_weights() == {}
+
+    @patch.dict(os.environ, {"THROTTLE_TENANT_WEIGHTS": '{"team-a": 3, "team-b": "0.5"}'})
+    def test_weights_parsed(self) -> None:
+        """Test that weights are read from JSON."""
+        assert load_tenant_weights() == {"team-a": 3.0, "team-b": 0.5}
+
+    @patch.dict(os.environ, {"THROTTLE_TENANT_WEIGHTS": '{"team-a": 0, "team-b": 2}'})
+    def test_non_positive_weights_ignored(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that tenants with a zero weight are dropped with a warning."""
+        with caplog.at_level(logging.WARNING):
+            assert load_tenant_weights() == {"team-b": 2.0}
+        assert "team-a" in caplog.text
+
+    @patch.dict(os.environ, {"THROTTLE_TENANT_WEIGHTS": "[1, 2]"})
+    def test_invalid_json_ignored(self) -> None:
+        """Test that a malformed value falls back to equal weights."""
+        assert load_tenant_weights() == {}
+
+
+class TestFairShareQueue:
+    """Test suite for FairShareQueue."""
+
+    @staticmethod
+    def _fill(queue: FairShareQueue, tenants: list[str]) -> dict[asyncio.Future[None], str]:
+        loop = asyncio.get_running_loop()
+        labels: dict[asyncio.Future[None], str] = {}
+        for tenant in tenants:
+            waiter: asyncio.Future[None] = loop.create_future()
+            labels[waiter] = tenant
+            queue.append(tenant, "interactive", waiter)
+        return labels
+
+    @staticmethod
+    def _drain(queue: FairShareQueue, labels: dict[asyncio.Future[None], str]) -> list[str]:
+        served = []
+        while queue.peek() is not None:
+            _, _, waiter = queue.popleft()
+            served.append(labels[waiter])
+        return served
+
+    @pytest.mark.asyncio
+    async def test_tenants_alternate(self) -> None:
+        """Test that a late tenant is not stuck behind an earlier tenant's backlog."""
+        queue = FairShareQueue()
+        labels = self._fill(queue, ["a"] * 5 + ["b"] * 2)
+
+        assert self._drain(queue, labels) == ["a", "b", "a", "b", "a", "a", "a"]
+
+    @pytest.mark.asyncio
+    async def test_weights_set_shares(self) -> None:
+        """Test that a tenant with twice the weight gets twice the grants."""
+        queue = FairShareQueue(weights={"a": 2.0})
+        labels = self._fill(queue, ["a"] * 6 + ["b"] * 3)
+
+        assert self._drain(queue, labels) == ["a", "b", "a", "a", "b", "a", "a", "b", "a"]
+
+    @pytest.mark.asyncio
+    async def test_idle_tenant_does_not_bank_credit(self) -> None:
+        """Test that a tenant returning from idle shares from the current virtual time."""
+        queue = FairShareQueue()
+        labels = self._fill(queue, ["a"] * 4)
+        assert self._drain(queue, labels) == ["a"] * 4
+
+        labels = self._fill(queue, ["b"] * 4 + ["a"] * 2)
+
+        # b gets one grant to even out a's last one, then they alternate
+        assert self._drain(queue, labels) == ["b", "b", "a", "b", "a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_ineligible_tenants_skipped(self) -> None:
+        """Test that the eligibility filter skips tenants without removing them."""
+        queue = FairShareQueue()
+        labels = self._fill(queue, ["a", "b"])
+
+        head = queue.peek(lambda tenant: tenant != "a")
+        assert head is not None
+        assert labels[head[2]] == "b"
+        assert queue.get_queued() == {"a": 1, "b": 1}
+
+
+class TestFairShareSemaphore:
+    """Test suite for FairShareSemaphore."""
+
+    @pytest.mark.asyncio
+    async def test_tenant_cap_enforced(self) -> None:
+        """Test that a tenant at its cap waits even when slots are free."""
+        semaphore = FairShareSemaphore(4, max_per_tenant=2)
+
+        await semaphore.acquire(tenant="a")
+        await semaphore.acquire(tenant="a")
+        blocked = asyncio.create_task(semaphore.acquire(tenant="a"))
+        await asyncio.sleep(0)
+        await semaphore.acquire(tenant="b")
+
+        assert not blocked.done()
+        assert semaphore.get_in_flight() == {"a": 2, "b": 1}
+        assert semaphore.get_queued() == {"a": 1}
+
+        semaphore.release("a")
+        await blocked
+        assert semaphore.get_in_flight() == {"a": 2, "b": 1}
+
+    @pytest.mark.asyncio
+    async def test_freed_slots_shared_between_tenants(self) -> None:
+        """Test that freed slots alternate between tenants instead of arrival order."""
+        semaphore = FairShareSemaphore(1)
+        order: list[str] = []
+
+        async def hold(tenant: str) -> None:
+            async with semaphore.hold(tenant=tenant):
+                order.append(tenant)
+                await asyncio.sleep(0)
+
+        await semaphore.acquire(tenant="setup")
+        tasks = [asyncio.create_task(hold("a")) for _ in range(3)]
+        tasks += [asyncio.create_task(hold("b")) for _ in range(2)]
+        await asyncio.sleep(0)
+        semaphore.release("setup")
+        await asyncio.gather(*tasks)
+
+        assert order == ["a", "b", "a", "b", "a"]
+        assert semaphore.get_in_flight() == {}
+
+    @pytest.mark.asyncio
+    async def test_tenant_from_context(self) -> None:
+        """Test that holders default to the current context's tenant."""
+        semaphore = FairShareSemaphore(2)
+
+        with throttle_tenant("team-a"):
+            async with semaphore.hold():
+                assert semaphore.get_in_flight() == {"team-a": 1}
+
+        assert semaphore.get_in_flight() == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self) -> None:
+        """Test that cancelling a queued holder keeps the slot count intact."""
+        semaphore = FairShareSemaphore(1)
+        await semaphore.acquire(tenant="a")
+
+        waiter = asyncio.create_task(semaphore.acquire(tenant="b"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        semaphore.release("a")
+
+        assert waiter.cancelled()
+        assert semaphore._value == 1
+        assert semaphore.get_queued() == {}
+
+
+class TestTenantWaitStats:
+    """Test suite for TenantWaitStats."""
+
+    def test_records_wait_per_tenant(self) -> None:
+        """Test average and maximum waits per tenant."""
+        stats = TenantWaitStats()
+        stats.record("team-a", 0.1)
+        stats.record("team-a", 0.3)
+        stats.record("team-b", 2.0)
+
+        assert stats.get_stats() == {
+            "team-a": {"requests": 2, "avg_wait_seconds": 0.2, "max_wait_seconds": 0.3},
+            "team-b": {"requests": 1, "avg_wait_seconds": 2.0, "max_wait_seconds": 2.0},
+        }
+
+    def test_idle_tenants_dropped(self) -> None:
+        """Test that tenants without calls for the idle period are forgotten."""
+        now = 1_000.0
+        with patch("ohlala_smartops.utils.fair_share.time.monotonic", side_effect=lambda: now):
+            stats = TenantWaitStats(idle_seconds=60.0)
+            stats.record("team-a", 0.1)
+            now += 30
+            stats.record("team-b", 0.2)
+            now += 40
+            stats.record("team-b", 0.4)
+
+            assert list(stats.get_stats()) == ["team-b"]
+            now += 60
+            assert stats.get_stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_includes_semaphore_state(self) -> None:
+        """Test that tenants still waiting for a slot are reported."""
+        stats = TenantWaitStats()
+        semaphore = FairShareSemaphore(1)
+        await semaphore.acquire(tenant="team-a")
+        stats.record("team-a", 0.0)
+        waiter = asyncio.create_task(semaphore.acquire(tenant="team-b"))
+        await asyncio.sleep(0)
+
+        result = stats.get_stats(semaphore)
+
+        assert result["team-a"]["in_flight"] == 1
+        assert result["team-b"] == {
+            "requests": 0,
+            "avg_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+            "in_flight": 0,
+            "queued": 1,
+        }
+        semaphore.release("team-a")
+        await waiter
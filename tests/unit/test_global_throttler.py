@@ -7,15 +7,25 @@ import time
 from unittest.mock import patch
 
 import pytest
+from botocore.exceptions import ClientError
 
 import ohlala_smartops.utils.global_throttler
+from ohlala_smartops.aws.exceptions import CostExplorerError, EC2Error, ThrottlingError
+from ohlala_smartops.mcp.exceptions import MCPError, MCPRateLimitError
+from ohlala_smartops.utils.fair_share import throttle_tenant
 from ohlala_smartops.utils.global_throttler import (
     CircuitBreakerOpenError,
     CircuitBreakerTrippedError,
     GlobalThrottler,
+    TokenBucket,
+    classify_operation,
     get_global_throttler,
+    is_circuit_breaker_failure,
+    is_rate_limit_error,
     throttled_aws_call,
 )
+from ohlala_smartops.utils.priority import throttle_priority
+from tests.conftest import VirtualClock
 
 
 class TestGlobalThrottler:
@@ -31,11 +41,11 @@ class TestGlobalThrottler:
         assert throttler.circuit_breaker_enabled is False  # default
         assert throttler.circuit_breaker_threshold == 100  # default
         assert throttler.circuit_breaker_timeout == 10.0  # default
-        assert throttler._tokens == 30.0
+        assert throttler._bucket._tokens == 30.0
         assert throttler._total_requests == 0
         assert throttler._throttled_requests == 0
         assert throttler._circuit_breaker_trips == 0
-        assert throttler._consecutive_failures == 0
+        assert throttler._circuit_breakers == {}
 
     @patch.dict(
         os.environ,
@@ -65,14 +75,14 @@ class TestGlobalThrottler:
         throttler = GlobalThrottler()
 
         # Consume all tokens
-        throttler._tokens = 0.0
-        throttler._last_refill = time.time() - 1.0  # 1 second ago
+        throttler._bucket._tokens = 0.0
+        throttler._bucket._last_refill -= 1.0  # 1 second ago
 
-        await throttler._refill_tokens()
+        throttler._bucket._refill()
 
         # Should have refilled: 1 second * 15 tokens/sec = 15 tokens
-        assert throttler._tokens >= 14.0
-        assert throttler._tokens <= 16.0
+        assert throttler._bucket._tokens >= 14.0
+        assert throttler._bucket._tokens <= 16.0
 
     @pytest.mark.asyncio
     async def test_throttled_request_success(self) -> None:
@@ -237,22 +247,27 @@ class TestGlobalThrottler:
 
         # Circuit breaker should not have tripped
         assert throttler._circuit_breaker_trips == 0
-        assert throttler._consecutive_failures == 0
+        assert throttler.get_circuit_breaker_stats()["aws"]["window_failures"] == 0
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"AWS_CIRCUIT_BREAKER_ENABLED": "true"})
-    async def test_circuit_breaker_resets_on_success(self) -> None:
-        """Test that successful requests reset the circuit breaker failure counter."""
+    async def test_circuit_breaker_success_lowers_error_rate(self) -> None:
+        """Test that successful requests dilute the failure rate of the window."""
         throttler = GlobalThrottler()
 
-        # Record some failures
-        throttler._consecutive_failures = 5
+        # Record a failure
+        with pytest.raises(ValueError, match="Test error"):
+            async with throttler.throttled_request("test"):
+                raise ValueError("Test error")
 
-        # Successful request should reset counter
-        async with throttler.throttled_request("test"):
-            pass
+        # Successful requests count towards the same window
+        for _ in range(3):
+            async with throttler.throttled_request("test"):
+                pass
 
-        assert throttler._consecutive_failures == 0
+        stats = throttler.get_circuit_breaker_stats()["aws"]
+        assert stats["window_requests"] == 4
+        assert stats["error_rate"] == 0.25
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"AWS_CIRCUIT_BREAKER_ENABLED": "true"})
@@ -260,16 +275,17 @@ class TestGlobalThrottler:
         """Test manual circuit breaker reset."""
         throttler = GlobalThrottler()
 
-        # Set circuit breaker to open state
-        throttler._circuit_open_until = time.time() + 100.0
-        throttler._consecutive_failures = 10
+        # Set circuit breakers to open state
+        for operation in ("ec2:describe_instances", "ce:get_cost_and_usage"):
+            throttler._get_circuit_breakers(operation, None)[0]._open("test")
 
-        # Manually reset
-        await throttler.reset_circuit_breaker()
+        # Manually reset one, then all
+        await throttler.reset_circuit_breaker("ce")
+        assert throttler.get_circuit_breaker_stats()["ce"]["state"] == "closed"
+        assert throttler.get_circuit_breaker_stats()["ec2"]["state"] == "open"
 
-        # Should be reset
-        assert throttler._circuit_open_until == 0.0
-        assert throttler._consecutive_failures == 0
+        await throttler.reset_circuit_breaker()
+        assert throttler.get_circuit_breaker_stats()["ec2"]["state"] == "closed"
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"MAX_CONCURRENT_AWS_CALLS": "3"})
@@ -326,8 +342,8 @@ class TestGlobalThrottler:
         assert stats["current_tokens"] == 30.0  # default max_tokens
         assert stats["max_concurrent_calls"] == 8
         assert stats["tokens_per_second"] == 15.0
-        assert stats["consecutive_failures"] == 0
         assert stats["circuit_open"] is False
+        assert stats["circuit_breakers"] == {}
 
     @pytest.mark.asyncio
     async def test_get_stats_after_requests(self) -> None:
@@ -352,11 +368,12 @@ class TestGlobalThrottler:
         throttler = GlobalThrottler()
 
         # Open circuit breaker
-        throttler._circuit_open_until = time.time() + 10.0
+        throttler._get_circuit_breakers("test", None)[0]._open("test")
 
         stats = throttler.get_stats()
 
         assert stats["circuit_open"] is True
+        assert stats["circuit_breakers"]["aws"]["state"] == "open"
 
     @pytest.mark.asyncio
     async def test_logging_occurs(self, caplog: pytest.LogCaptureFixture) -> None:
@@ -387,6 +404,720 @@ class TestGlobalThrottler:
         assert any("TRIPPED" in record.message for record in caplog.records)
 
 
+class TestClassifyOperation:
+    """Test suite for operation classification."""
+
+    @pytest.mark.parametrize(
+        ("operation_name", "expected"),
+        [
+            ("ec2:describe_instances", ("ec2", "read")),
+            ("ec2:start_instances", ("ec2", "mutate")),
+            ("ce:get_cost_and_usage", ("ce", "read")),
+            ("ssm:send_command", ("ssm", "mutate")),
+            ("resourcegroupstaggingapi:tag_resources", ("resourcegroupstaggingapi", "mutate")),
+            ("list-instances", ("ec2", "read")),
+            ("send-command", ("ssm", "mutate")),
+            ("get-instance-costs", ("ce", "read")),
+            ("forecast-cost", ("ce", "read")),
+            ("knowledge_search_documentation", (None, "mutate")),
+        ],
+    )
+    def test_classify_operation(self, operation_name: str, expected: tuple[str, str]) -> None:
+        """Test classification of boto3 operations and MCP tool names."""
+        assert classify_operation(operation_name) == expected
+
+
+class TestTokenBucket:
+    """Test suite for the TokenBucket helper."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_without_waiting(self) -> None:
+        """Test that tokens are taken immediately while the bucket is not empty."""
+        bucket = TokenBucket("test", tokens_per_second=1.0, max_tokens=3)
+
+        waits = [await bucket.acquire() for _ in range(3)]
+
+        assert waits == [0.0, 0.0, 0.0]
+        assert bucket.get_stats()["acquired"] == 3
+        assert bucket.get_stats()["waits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_when_empty(self) -> None:
+        """Test that an empty bucket makes callers wait and never overdrafts."""
+        bucket = TokenBucket("test", tokens_per_second=20.0, max_tokens=1)
+        await bucket.acquire()
+
+        start_time = time.time()
+        waited = await bucket.acquire()
+        elapsed = time.time() - start_time
+
+        assert waited > 0
+        assert elapsed >= 0.04
+        assert bucket._tokens >= 0
+        stats = bucket.get_stats()
+        assert stats["waits"] == 1
+        assert stats["total_wait_seconds"] > 0
+
+    @pytest.mark.asyncio
+    async def test_waiters_get_exact_wait_times(self, virtual_clock: VirtualClock) -> None:
+        """Test that each queued waiter is woken exactly when its token is available."""
+        bucket = TokenBucket("test", tokens_per_second=10.0, max_tokens=1)
+        await bucket.acquire()
+
+        waits = await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+
+        assert waits == pytest.approx([0.1, 0.2, 0.3, 0.4, 0.5])
+        assert virtual_clock.now == pytest.approx(0.5)
+        assert bucket.get_stats()["waits"] == 5
+
+    @pytest.mark.asyncio
+    async def test_waiters_served_in_fifo_order(self, virtual_clock: VirtualClock) -> None:
+        """Test that later small requests never jump ahead of an earlier large one."""
+        bucket = TokenBucket("test", tokens_per_second=2.0, max_tokens=4)
+        await bucket.acquire(4)
+        completed: list[str] = []
+
+        async def take(label: str, tokens: int) -> None:
+            await bucket.acquire(tokens)
+            completed.append(label)
+
+        await asyncio.gather(take("batch", 3), take("first", 1), take("second", 1))
+
+        assert completed == ["batch", "first", "second"]
+        # 3 tokens at 2/sec, then one more token every 0.5s
+        assert virtual_clock.now == pytest.approx(2.5)
+
+    @pytest.mark.asyncio
+    async def test_acquire_many_tokens(self, virtual_clock: VirtualClock) -> None:
+        """Test that a batch acquire waits for all of its tokens at once."""
+        bucket = TokenBucket("test", tokens_per_second=2.0, max_tokens=5)
+
+        assert await bucket.acquire(5) == 0.0
+        assert await bucket.acquire(3) == pytest.approx(1.5)
+        assert bucket.get_stats()["acquired"] == 8
+
+    @pytest.mark.asyncio
+    async def test_never_overdrafts(self, virtual_clock: VirtualClock) -> None:
+        """Test that grants never exceed the burst plus what was refilled."""
+        bucket = TokenBucket("test", tokens_per_second=5.0, max_tokens=3)
+        grant_times: list[float] = []
+
+        async def take() -> None:
+            await bucket.acquire()
+            grant_times.append(virtual_clock.now)
+            assert bucket._tokens >= 0
+
+        await asyncio.gather(*(take() for _ in range(20)))
+
+        for granted, grant_time in enumerate(grant_times, start=1):
+            assert granted <= 3 + 5.0 * grant_time + 1e-6
+        assert grant_times[-1] == pytest.approx(17 / 5.0)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self, virtual_clock: VirtualClock) -> None:
+        """Test that cancelling a queued waiter lets the next one take its place."""
+        bucket = TokenBucket("test", tokens_per_second=1.0, max_tokens=1)
+        await bucket.acquire()
+
+        cancelled = asyncio.create_task(bucket.acquire())
+        remaining = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert await remaining == pytest.approx(1.0)
+        assert cancelled.cancelled()
+        assert bucket.get_stats()["queued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_rate_change_reschedules_waiters(self, virtual_clock: VirtualClock) -> None:
+        """Test that a rate cut while waiters are queued delays their wake-up."""
+        bucket = TokenBucket("test", tokens_per_second=10.0, max_tokens=1, min_rate=1.0)
+        await bucket.acquire()
+
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        bucket.decrease_rate(0.1)
+
+        assert await waiter == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_acquire_more_than_capacity_rejected(self) -> None:
+        """Test that requests the bucket can never satisfy fail fast."""
+        bucket = TokenBucket("test", tokens_per_second=1.0, max_tokens=3)
+
+        with pytest.raises(ValueError, match="Cannot acquire 4 tokens"):
+            await bucket.acquire(4)
+        with pytest.raises(ValueError, match="Cannot acquire 0 tokens"):
+            await bucket.acquire(0)
+
+    @pytest.mark.asyncio
+    async def test_throttled_request_takes_batch_tokens(self) -> None:
+        """Test that batch calls take their token count from every bucket."""
+        throttler = GlobalThrottler()
+
+        async with throttler.throttled_request("ec2:describe_instances", tokens=10):
+            pass
+
+        stats = throttler.get_stats()
+        assert stats["current_tokens"] == pytest.approx(20.0, abs=0.1)
+        assert stats["buckets"]["ec2:read"]["acquired"] == 10
+        assert stats["buckets"]["ec2"]["acquired"] == 10
+
+
+class TestServiceRateLimits:
+    """Test suite for per-service and per-operation-class buckets."""
+
+    def test_service_rate_limits_enabled_by_default(self) -> None:
+        """Test that the default table is loaded."""
+        throttler = GlobalThrottler()
+
+        assert throttler.service_rate_limits_enabled is True
+        assert throttler.service_rate_limits["ce"]["service"] == (5.0, 5)
+
+    @pytest.mark.asyncio
+    async def test_buckets_created_per_service_and_class(self) -> None:
+        """Test that calls take tokens from their service and class buckets."""
+        throttler = GlobalThrottler()
+
+        async with throttler.throttled_request("ec2:describe_instances"):
+            pass
+        async with throttler.throttled_request("start-instances"):
+            pass
+
+        buckets = throttler.get_stats()["buckets"]
+        assert set(buckets) == {"ec2", "ec2:mutate", "ec2:read"}
+        assert buckets["ec2"]["acquired"] == 2
+        assert buckets["ec2:read"]["acquired"] == 1
+        assert buckets["ec2:mutate"]["acquired"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_service_uses_global_bucket_only(self) -> None:
+        """Test that unknown operations are only limited by the global bucket."""
+        throttler = GlobalThrottler()
+
+        async with throttler.throttled_request("test_operation"):
+            pass
+
+        assert throttler.get_stats()["buckets"] == {}
+        assert throttler._bucket._tokens < throttler.max_tokens
+
+    @pytest.mark.asyncio
+    async def test_service_bucket_limits_rate(self) -> None:
+        """Test that a low service quota throttles only that service."""
+        throttler = GlobalThrottler()
+        throttler.service_rate_limits["ce"] = {"service": (20.0, 1)}
+
+        start_time = time.time()
+        for _ in range(3):
+            async with throttler.throttled_request("ce:get_cost_and_usage"):
+                pass
+        ce_elapsed = time.time() - start_time
+
+        start_time = time.time()
+        for _ in range(3):
+            async with throttler.throttled_request("ec2:describe_instances"):
+                pass
+        ec2_elapsed = time.time() - start_time
+
+        # Two refills at 20 tokens/sec for Cost Explorer, none for EC2
+        assert ce_elapsed >= 0.09
+        assert ec2_elapsed < 0.05
+        assert throttler.get_stats()["buckets"]["ce"]["waits"] == 2
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"AWS_SERVICE_RATE_LIMITS_ENABLED": "false"})
+    async def test_service_rate_limits_disabled(self) -> None:
+        """Test that per-service buckets can be disabled."""
+        throttler = GlobalThrottler()
+
+        async with throttler.throttled_request("ce:get_cost_and_usage"):
+            pass
+
+        assert throttler.get_stats()["buckets"] == {}
+
+    @patch.dict(
+        os.environ,
+        {"AWS_SERVICE_RATE_LIMITS": '{"ce": {"read": [2, 4]}, "sts": {"service": [1, 1]}}'},
+    )
+    def test_rate_limit_overrides_from_environment(self) -> None:
+        """Test that JSON overrides replace and extend the default table."""
+        throttler = GlobalThrottler()
+
+        assert throttler.service_rate_limits["ce"]["read"] == (2.0, 4)
+        assert throttler.service_rate_limits["ce"]["service"] == (5.0, 5)
+        assert throttler.service_rate_limits["sts"] == {"service": (1.0, 1)}
+
+    @patch.dict(os.environ, {"AWS_SERVICE_RATE_LIMITS": "not json"})
+    def test_invalid_rate_limit_overrides_ignored(self) -> None:
+        """Test that invalid overrides fall back to the default table."""
+        throttler = GlobalThrottler()
+
+        assert throttler.service_rate_limits["ce"]["service"] == (5.0, 5)
+
+
+class TestIsRateLimitError:
+    """Test suite for rate limit error detection."""
+
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (ThrottlingError("Rate exceeded", error_code="Throttling"), True),
+            (ThrottlingError("Slow down", error_code="ThrottlingException"), True),
+            (EC2Error("Not found", error_code="InvalidInstanceID.NotFound"), False),
+            (
+                CostExplorerError(
+                    "Rate exceeded", service="ce", error_code="LimitExceededException"
+                ),
+                True,
+            ),
+            (EC2Error("Quota", service="ec2", error_code="LimitExceededException"), False),
+            (MCPRateLimitError("JSON-RPC error -32002: Too many requests"), True),
+            (MCPError("JSON-RPC error -32000: Server error"), False),
+            (Exception("Rate limit exceeded"), True),
+            (Exception("HTTP 429 Too Many Requests"), True),
+            (ValueError("bad input"), False),
+        ],
+    )
+    def test_is_rate_limit_error(self, error: Exception, expected: bool) -> None:
+        """Test typed and message-based throttling detection."""
+        assert is_rate_limit_error(error) is expected
+
+    def test_botocore_client_error(self) -> None:
+        """Test that raw botocore errors are recognized by their error code."""
+        throttled = ClientError(
+            {"Error": {"Code": "RequestLimitExceeded", "Message": "Request limit exceeded."}},
+            "DescribeInstances",
+        )
+        denied = ClientError(
+            {"Error": {"Code": "AccessDenied", "Message": "Access denied"}}, "DescribeInstances"
+        )
+
+        assert is_rate_limit_error(throttled) is True
+        assert is_rate_limit_error(denied) is False
+
+
+class TestAdaptiveRateControl:
+    """Test suite for AIMD adaptive rate control."""
+
+    def test_adaptive_rate_disabled_by_default(self) -> None:
+        """Test that adaptive mode is opt-in and exposed in stats."""
+        throttler = GlobalThrottler()
+        stats = throttler.get_stats()
+
+        assert throttler.adaptive_rate_enabled is False
+        assert stats["adaptive_rate"] == {
+            "enabled": False,
+            "min_rate": 1.0,
+            "max_rate": 50.0,
+            "rate_decreases": 0,
+        }
+        assert stats["configured_tokens_per_second"] == 15.0
+
+    @pytest.mark.asyncio
+    @patch.dict(
+        os.environ,
+        {"AWS_ADAPTIVE_RATE_ENABLED": "true", "AWS_ADAPTIVE_RATE_INCREASE": "0.5"},
+    )
+    async def test_success_increases_rate_additively(self) -> None:
+        """Test that each successful call adds to the global rate."""
+        throttler = GlobalThrottler()
+
+        for _ in range(4):
+            async with throttler.throttled_request("test_operation"):
+                pass
+
+        assert throttler.get_stats()["tokens_per_second"] == 17.0
+
+    @pytest.mark.asyncio
+    @patch.dict(
+        os.environ,
+        {"AWS_ADAPTIVE_RATE_ENABLED": "true", "AWS_ADAPTIVE_RATE_MAX": "15.2"},
+    )
+    async def test_rate_capped_at_ceiling(self) -> None:
+        """Test that additive increases stop at the ceiling."""
+        throttler = GlobalThrottler()
+
+        for _ in range(5):
+            async with throttler.throttled_request("test_operation"):
+                pass
+
+        assert throttler.tokens_per_second == 15.2
+
+    @pytest.mark.asyncio
+    @patch.dict(
+        os.environ,
+        {"AWS_ADAPTIVE_RATE_ENABLED": "true", "AWS_ADAPTIVE_RATE_COOLDOWN": "0"},
+    )
+    async def test_throttling_decreases_rate_multiplicatively(self) -> None:
+        """Test that throttling halves the rate without the fixed recovery delay."""
+        throttler = GlobalThrottler()
+
+        start_time = time.time()
+        with pytest.raises(MCPRateLimitError):
+            async with throttler.throttled_request("test_operation"):
+                raise MCPRateLimitError("JSON-RPC error -32002: Too many requests")
+        elapsed = time.time() - start_time
+
+        stats = throttler.get_stats()
+        assert stats["tokens_per_second"] == 7.5
+        assert stats["throttled_requests"] == 1
+        assert stats["adaptive_rate"]["rate_decreases"] == 1
+        assert throttler._bucket._tokens == 0.0
+        assert elapsed < 1.0
+
+    @pytest.mark.asyncio
+    @patch.dict(
+        os.environ,
+        {
+            "AWS_ADAPTIVE_RATE_ENABLED": "true",
+            "AWS_ADAPTIVE_RATE_MIN": "5.0",
+            "AWS_ADAPTIVE_RATE_COOLDOWN": "0",
+        },
+    )
+    async def test_rate_floored_at_minimum(self) -> None:
+        """Test that repeated throttling never cuts the rate below the floor."""
+        throttler = GlobalThrottler()
+
+        for _ in range(5):
+            with pytest.raises(Exception, match="Rate limit"):
+                async with throttler.throttled_request("test_operation"):
+                    raise Exception("Rate limit exceeded")
+
+        assert throttler.tokens_per_second == 5.0
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"AWS_ADAPTIVE_RATE_ENABLED": "true"})
+    async def test_cooldown_limits_decreases(self) -> None:
+        """Test that a burst of throttled calls only cuts the rate once."""
+        throttler = GlobalThrottler()
+
+        for _ in range(3):
+            with pytest.raises(Exception, match="Rate limit"):
+                async with throttler.throttled_request("test_operation"):
+                    raise Exception("Rate limit exceeded")
+
+        assert throttler.tokens_per_second == 7.5
+        assert throttler.get_stats()["throttled_requests"] == 3
+        assert throttler.get_stats()["adaptive_rate"]["rate_decreases"] == 1
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"AWS_ADAPTIVE_RATE_ENABLED": "true"})
+    async def test_service_throttling_adapts_service_buckets_only(self) -> None:
+        """Test that AWS throttling cuts the service's buckets but not the global rate."""
+        throttler = GlobalThrottler()
+
+        with pytest.raises(ClientError):
+            async with throttler.throttled_request("ce:get_cost_and_usage"):
+                raise ClientError(
+                    {"Error": {"Code": "LimitExceededException", "Message": "Rate exceeded"}},
+                    "GetCostAndUsage",
+                )
+
+        stats = throttler.get_stats()
+        assert stats["tokens_per_second"] == 15.0
+        assert stats["buckets"]["ce"]["tokens_per_second"] == 2.5
+        assert stats["buckets"]["ce:read"]["tokens_per_second"] == 2.5
+        assert stats["buckets"]["ce"]["rate_decreases"] == 1
+
+        # Service buckets recover additively, up to their configured limit
+        for _ in range(30):
+            throttler._adapt_rate(throttler._get_service_buckets("ce:get_cost"), False)
+        assert throttler.get_stats()["buckets"]["ce"]["tokens_per_second"] == 5.0
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"AWS_ADAPTIVE_RATE_ENABLED": "false"})
+    async def test_non_adaptive_mode_keeps_rate(self) -> None:
+        """Test that rates never change when adaptive mode is disabled."""
+        throttler = GlobalThrottler()
+
+        with (
+            patch("asyncio.sleep") as mock_sleep,
+            pytest.raises(ThrottlingError),
+        ):
+            async with throttler.throttled_request("ec2:describe_instances"):
+                raise ThrottlingError("Rate exceeded", error_code="RequestLimitExceeded")
+
+        mock_sleep.assert_awaited_once_with(2.0)
+        stats = throttler.get_stats()
+        assert stats["tokens_per_second"] == 15.0
+        assert stats["buckets"]["ec2"]["tokens_per_second"] == 25.0
+
+    def test_decrease_rate_respects_cooldown(self) -> None:
+        """Test TokenBucket rate cuts and cooldown directly."""
+        bucket = TokenBucket("ssm", tokens_per_second=20.0, max_tokens=40, min_rate=1.0)
+
+        assert bucket.decrease_rate(0.5, cooldown=60.0) is True
+        assert bucket.decrease_rate(0.5, cooldown=60.0) is False
+        assert bucket.tokens_per_second == 10.0
+        assert bucket._tokens == 0.0
+
+
+class TestPriorityClasses:
+    """Test suite for priority scheduling in the throttler."""
+
+    @pytest.mark.asyncio
+    async def test_interactive_latency_stable_under_background_load(
+        self, virtual_clock: VirtualClock
+    ) -> None:
+        """Test that a user call is admitted promptly while 500 polls are queued."""
+        throttler = GlobalThrottler()
+        throttler._bucket._tokens = 0.0
+
+        async def poll() -> None:
+            async with throttler.throttled_request("ssm:get_command_invocation"):
+                await asyncio.sleep(0.2)
+
+        with throttle_priority("background"):
+            polls = [asyncio.create_task(poll()) for _ in range(500)]
+        await asyncio.sleep(1.0)
+
+        requested_at = virtual_clock.now
+        async with throttler.throttled_request("ec2:describe_instances"):
+            admitted_at = virtual_clock.now
+
+        assert admitted_at - requested_at < 0.5
+        await asyncio.gather(*polls)
+
+        priorities = throttler.get_stats()["priorities"]
+        assert priorities["interactive"]["requests"] == 1
+        assert priorities["background"]["requests"] == 500
+        assert priorities["background"]["max_wait_seconds"] > 10.0
+        assert priorities["bulk"]["requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_explicit_priority_overrides_context(self) -> None:
+        """Test that a priority passed to the call wins over the context."""
+        throttler = GlobalThrottler()
+
+        with throttle_priority("background"):
+            async with throttler.throttled_request("test_operation", priority="bulk"):
+                pass
+
+        priorities = throttler.get_stats()["priorities"]
+        assert priorities["bulk"]["requests"] == 1
+        assert priorities["background"]["requests"] == 0
+
+
+class TestTenantFairShare:
+    """Test suite for per-tenant fair-share scheduling in the throttler."""
+
+    @pytest.mark.asyncio
+    async def test_other_team_not_stuck_behind_backlog(self, virtual_clock: VirtualClock) -> None:
+        """Test that one team's 500 queued calls do not delay another team's call."""
+        throttler = GlobalThrottler()
+        throttler._bucket._tokens = 0.0
+
+        async def check_instance() -> None:
+            async with throttler.throttled_request("ec2:describe_instance_status"):
+                await asyncio.sleep(0.2)
+
+        with throttle_tenant("team-a"):
+            backlog = [asyncio.create_task(check_instance()) for _ in range(500)]
+        await asyncio.sleep(1.0)
+
+        requested_at = virtual_clock.now
+        async with throttler.throttled_request("ec2:describe_instances", tenant="team-b"):
+            admitted_at = virtual_clock.now
+
+        assert admitted_at - requested_at < 0.5
+        await asyncio.gather(*backlog)
+
+        tenants = throttler.get_stats()["tenants"]
+        assert tenants["team-a"]["requests"] == 500
+        assert tenants["team-a"]["max_wait_seconds"] > 10.0
+        assert tenants["team-b"]["requests"] == 1
+        assert tenants["team-b"]["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"AWS_TENANT_MAX_CONCURRENT": "2"})
+    async def test_tenant_concurrency_cap(self) -> None:
+        """Test that one tenant cannot hold more slots than its cap."""
+        throttler = GlobalThrottler()
+        release = asyncio.Event()
+        peak_in_flight = 0
+
+        async def call() -> None:
+            nonlocal peak_in_flight
+            async with throttler.throttled_request("test_operation", tenant="team-a"):
+                in_flight = throttler.get_stats()["tenants"]["team-a"]["in_flight"]
+                peak_in_flight = max(peak_in_flight, in_flight)
+                await release.wait()
+
+        tasks = [asyncio.create_task(call()) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        assert throttler.get_stats()["tenants"]["team-a"]["queued"] == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert peak_in_flight == 2
+
+
+class TestPerServiceCircuitBreakers:
+    """Test suite for per-service and per-MCP-server circuit breakers."""
+
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (CostExplorerError("Internal error", error_code="InternalServerException"), True),
+            (EC2Error("Unavailable", error_code="Unavailable"), True),
+            (EC2Error("Not found", error_code="InvalidInstanceID.NotFound"), False),
+            (EC2Error("Denied", error_code="UnauthorizedOperation"), False),
+            (MCPError("JSON-RPC error -32000: Server error"), True),
+            (TimeoutError("Timed out"), True),
+        ],
+    )
+    def test_is_circuit_breaker_failure(self, error: Exception, expected: bool) -> None:
+        """Test that only dependency faults count against a breaker."""
+        assert is_circuit_breaker_failure(error) is expected
+
+    def test_botocore_status_code(self) -> None:
+        """Test that raw botocore errors are classified by their HTTP status."""
+        unavailable = ClientError(
+            {
+                "Error": {"Code": "ServiceUnavailable", "Message": "Service unavailable"},
+                "ResponseMetadata": {"HTTPStatusCode": 503},
+            },
+            "GetCostAndUsage",
+        )
+        bad_request = ClientError(
+            {
+                "Error": {"Code": "ValidationException", "Message": "Invalid date"},
+                "ResponseMetadata": {"HTTPStatusCode": 400},
+            },
+            "GetCostAndUsage",
+        )
+
+        assert is_circuit_breaker_failure(unavailable) is True
+        assert is_circuit_breaker_failure(bad_request) is False
+
+    @pytest.mark.asyncio
+    @patch.dict(
+        os.environ, {"AWS_CIRCUIT_BREAKER_ENABLED": "true", "AWS_CIRCUIT_BREAKER_THRESHOLD": "4"}
+    )
+    async def test_failing_service_does_not_block_others(self) -> None:
+        """Test that a Cost Explorer outage fails fast while EC2 keeps working."""
+        throttler = GlobalThrottler()
+
+        for _ in range(3):
+            with pytest.raises(CostExplorerError):
+                async with throttler.throttled_request("ce:get_cost_and_usage"):
+                    raise CostExplorerError("Internal error", error_code="InternalServerException")
+        with pytest.raises(CircuitBreakerTrippedError):
+            async with throttler.throttled_request("ce:get_cost_and_usage"):
+                raise CostExplorerError("Internal error", error_code="InternalServerException")
+
+        with pytest.raises(CircuitBreakerOpenError, match="open for ce"):
+            async with throttler.throttled_request("ce:get_cost_forecast"):
+                pass
+        for _ in range(10):
+            async with throttler.throttled_request("ec2:describe_instances"):
+                pass
+
+        stats = throttler.get_stats()
+        assert stats["circuit_open"] is True
+        assert stats["circuit_breakers"]["ce"]["state"] == "open"
+        assert stats["circuit_breakers"]["ce"]["rejected"] == 1
+        assert stats["circuit_breakers"]["ec2"]["state"] == "closed"
+
+    @pytest.mark.asyncio
+    @patch.dict(
+        os.environ, {"AWS_CIRCUIT_BREAKER_ENABLED": "true", "AWS_CIRCUIT_BREAKER_THRESHOLD": "2"}
+    )
+    async def test_mcp_server_breaker(self) -> None:
+        """Test that a failing MCP server opens its own breaker only."""
+        throttler = GlobalThrottler()
+
+        for _ in range(2):
+            with pytest.raises((MCPError, CircuitBreakerTrippedError)):
+                async with throttler.throttled_request("describe_instances", mcp_server="aws-api"):
+                    raise MCPError("JSON-RPC error -32000: Server error")
+
+        with pytest.raises(CircuitBreakerOpenError):
+            async with throttler.throttled_request("describe_instances", mcp_server="aws-api"):
+                pass
+        async with throttler.throttled_request("knowledge_search", mcp_server="aws-knowledge"):
+            pass
+
+        breakers = throttler.get_circuit_breaker_stats()
+        assert breakers["mcp:aws-api"]["state"] == "open"
+        assert breakers["mcp:aws-knowledge"]["state"] == "closed"
+
+    @pytest.mark.asyncio
+    @patch.dict(
+        os.environ, {"AWS_CIRCUIT_BREAKER_ENABLED": "true", "AWS_CIRCUIT_BREAKER_THRESHOLD": "2"}
+    )
+    async def test_mcp_outage_does_not_block_direct_calls(self) -> None:
+        """Test that an MCP server outage leaves the AWS service breakers closed."""
+        throttler = GlobalThrottler()
+
+        for _ in range(2):
+            with pytest.raises((MCPError, CircuitBreakerTrippedError)):
+                async with throttler.throttled_request("describe-instances", mcp_server="aws-api"):
+                    raise MCPError("Connection refused")
+        with pytest.raises(CircuitBreakerOpenError):
+            async with throttler.throttled_request("describe-instances", mcp_server="aws-api"):
+                pass
+
+        async with throttler.throttled_request("ec2:describe_instances"):
+            pass
+
+        breakers = throttler.get_circuit_breaker_stats()
+        assert breakers["mcp:aws-api"]["state"] == "open"
+        assert breakers["ec2"]["state"] == "closed"
+        assert breakers["ec2"]["window_failures"] == 0
+
+    @pytest.mark.asyncio
+    @patch.dict(
+        os.environ, {"AWS_CIRCUIT_BREAKER_ENABLED": "true", "AWS_CIRCUIT_BREAKER_THRESHOLD": "2"}
+    )
+    async def test_client_errors_do_not_trip(self) -> None:
+        """Test that users mistyping instance IDs cannot open the EC2 breaker."""
+        throttler = GlobalThrottler()
+
+        for _ in range(5):
+            with pytest.raises(EC2Error):
+                async with throttler.throttled_request("ec2:describe_instances"):
+                    raise EC2Error("Not found", error_code="InvalidInstanceID.NotFound")
+
+        assert throttler.get_circuit_breaker_stats()["ec2"]["window_failures"] == 0
+
+    @pytest.mark.asyncio
+    @patch.dict(
+        os.environ,
+        {
+            "AWS_CIRCUIT_BREAKER_ENABLED": "true",
+            "AWS_CIRCUIT_BREAKER_THRESHOLD": "1",
+            "AWS_CIRCUIT_BREAKER_TIMEOUT": "0.1",
+            "AWS_CIRCUIT_BREAKER_HALF_OPEN_PROBES": "1",
+        },
+    )
+    async def test_half_open_probe_recovers(self) -> None:
+        """Test that one probe passes while half-open and closes the breaker on success."""
+        throttler = GlobalThrottler()
+        with pytest.raises(CircuitBreakerTrippedError):
+            async with throttler.throttled_request("ce:get_cost_and_usage"):
+                raise CostExplorerError("Internal error", error_code="InternalServerException")
+        await asyncio.sleep(0.15)
+
+        probe_started = asyncio.Event()
+        finish_probe = asyncio.Event()
+
+        async def probe() -> None:
+            async with throttler.throttled_request("ce:get_cost_and_usage"):
+                probe_started.set()
+                await finish_probe.wait()
+
+        task = asyncio.create_task(probe())
+        await probe_started.wait()
+        with pytest.raises(CircuitBreakerOpenError, match="probes in progress"):
+            async with throttler.throttled_request("ce:get_cost_and_usage"):
+                pass
+
+        finish_probe.set()
+        await task
+        assert throttler.get_circuit_breaker_stats()["ce"]["state"] == "closed"
+
+
 class TestGlobalSingleton:
     """Test suite for global singleton functions."""
 
@@ -451,7 +1182,7 @@ class TestCircuitBreakerExceptions:
         """Test that circuit breaker exceptions propagate correctly."""
         throttler = GlobalThrottler()
         throttler.circuit_breaker_enabled = True
-        throttler._circuit_open_until = time.time() + 10.0
+        throttler._get_circuit_breakers("test", None)[0]._open("test")
 
         try:
             async with throttler.throttled_request("test"):
@@ -491,7 +1222,7 @@ class TestEdgeCases:
         except Exception:
             pass
 
-        assert throttler._consecutive_failures == 0
+        assert throttler.get_circuit_breaker_stats()["aws"]["window_failures"] == 0
 
         # Regular errors should count
         try:
@@ -500,7 +1231,7 @@ class TestEdgeCases:
         except ValueError:
             pass
 
-        assert throttler._consecutive_failures == 1
+        assert throttler.get_circuit_breaker_stats()["aws"]["window_failures"] == 1
 
     @pytest.mark.asyncio
     async def test_concurrent_circuit_breaker_checks(self) -> None:
@@ -508,13 +1239,16 @@ class TestEdgeCases:
         throttler = GlobalThrottler()
         throttler.circuit_breaker_enabled = True
 
+        async def request() -> None:
+            async with throttler.throttled_request("ec2:describe_instances"):
+                await asyncio.sleep(0)
+
         # Launch multiple concurrent checks
-        results = await asyncio.gather(
-            *[throttler._check_circuit_breaker() for _ in range(5)], return_exceptions=False
-        )
+        results = await asyncio.gather(*[request() for _ in range(5)], return_exceptions=False)
 
         # All should complete without errors (circuit is not open)
         assert len(results) == 5
+        assert throttler.get_circuit_breaker_stats()["ec2"]["window_requests"] == 5
 
     @pytest.mark.asyncio
     async def test_stats_accuracy_after_many_requests(self) -> None:
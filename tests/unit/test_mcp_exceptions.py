@@ -5,6 +5,7 @@ from ohlala_smartops.mcp.exceptions import (
     MCPAuthenticationError,
     MCPConnectionError,
     MCPError,
+    MCPRateLimitError,
     MCPTimeoutError,
     MCPToolNotFoundError,
 )
@@ -16,6 +17,7 @@ def test_exception_hierarchy() -> None:
     assert issubclass(MCPTimeoutError, MCPError)
     assert issubclass(MCPAuthenticationError, MCPError)
     assert issubclass(MCPToolNotFoundError, MCPError)
+    assert issubclass(MCPRateLimitError, MCPError)
 
 
 def test_mcp_error() -> None:
@@ -53,6 +55,14 @@ def test_mcp_tool_not_found_error() -> None:
     assert isinstance(error, MCPError)
 
 
+def test_mcp_rate_limit_error() -> None:
+    """Test MCPRateLimitError carries the JSON-RPC rate limit code."""
+    error = MCPRateLimitError("Too many requests")
+    assert str(error) == "Too many requests"
+    assert error.error_code == -32002
+    assert isinstance(error, MCPError)
+
+
 def test_module_exports() -> None:
     """Test that the MCP module exports all exception classes."""
     assert hasattr(mcp, "MCPError")
@@ -60,3 +70,4 @@ def test_module_exports() -> None:
     assert hasattr(mcp, "MCPTimeoutError")
     assert hasattr(mcp, "MCPAuthenticationError")
     assert hasattr(mcp, "MCPToolNotFoundError")
+    assert hasattr(mcp, "MCPRateLimitError")
@@ -10,6 +10,7 @@ from ohlala_smartops.mcp.exceptions import (
     MCPAuthenticationError,
     MCPConnectionError,
     MCPError,
+    MCPRateLimitError,
     MCPTimeoutError,
     MCPToolNotFoundError,
 )
@@ -483,6 +484,34 @@ class TestMCPHTTPClientRetryLogic:
                 assert result == {"status": "ok"}
                 assert mock_post.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_jsonrpc_rate_limit_after_max_retries(self) -> None:
+        """Test that a persistent JSON-RPC rate limit raises MCPRateLimitError."""
+        client = MCPHTTPClient(base_url="https://mcp.example.com", api_key="test-key")
+
+        mock_response_limit = AsyncMock()
+        mock_response_limit.status = 200
+        mock_response_limit.json = AsyncMock(
+            return_value={
+                "jsonrpc": "2.0",
+                "id": 1,
+                "error": {"code": -32002, "message": "Rate limit exceeded"},
+            }
+        )
+
+        async with client:
+            with (
+                patch.object(client.session, "post") as mock_post,
+                patch("asyncio.sleep", new_callable=AsyncMock),
+            ):
+                mock_post.return_value.__aenter__ = AsyncMock(return_value=mock_response_limit)
+                mock_post.return_value.__aexit__ = AsyncMock(return_value=None)
+
+                with pytest.raises(MCPRateLimitError, match="-32002"):
+                    await client.call_tool(name="test", arguments={})
+
+                assert mock_post.call_count == client.max_retries + 1
+
     @pytest.mark.asyncio
     async def test_max_retries_exceeded(self) -> None:
         """Test that max retries is respected."""
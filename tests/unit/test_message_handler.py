@@ -10,6 +10,7 @@ import pytest
 from botbuilder.core import TurnContext
 from botbuilder.schema import Activity, ChannelAccount, ConversationAccount, Entity
 
+from ohlala_smartops.ai.bedrock_client import BedrockQuotaError
 from ohlala_smartops.bot.message_handler import MessageHandler
 
 
@@ -424,6 +425,27 @@ class TestMessageHandler:
         assert hasattr(activity, "text")
         assert "trouble" in activity.text.lower()
 
+    @pytest.mark.asyncio
+    async def test_handle_natural_language_quota_exceeded(
+        self,
+        message_handler: MessageHandler,
+        mock_turn_context: Mock,
+        mock_bedrock_client: Mock,
+    ) -> None:
+        """Test that a used-up token quota is reported to the user."""
+        mock_bedrock_client.call_bedrock.side_effect = BedrockQuotaError(
+            "Your Bedrock token quota per hour is used up, retry in 12 min"
+        )
+
+        await message_handler._handle_natural_language(
+            mock_turn_context,
+            "Show me my instances",
+            "user123",
+        )
+
+        activity = mock_turn_context.send_activity.call_args[0][0]
+        assert "retry in 12 min" in activity.text
+
     # Mention removal tests
 
     def test_remove_mentions_html_tags(
@@ -1,13 +1,20 @@
 """Unit tests for CloudWatch metrics emitter."""
 
+import asyncio
+import json
+from collections.abc import AsyncGenerator, Generator
 from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import pytest_asyncio
 
 from ohlala_smartops.aws.cloudwatch import CloudWatchManager
 from ohlala_smartops.aws.metrics_emitter import (
     DEFAULT_NAMESPACE,
+    EmfWriter,
     MetricsEmitter,
     emit_command_execution,
     emit_unauthorized_access,
@@ -44,18 +51,31 @@ def settings_no_stack() -> Settings:
 def mock_cloudwatch() -> MagicMock:
     """Create mock CloudWatch manager."""
     mock = MagicMock(spec=CloudWatchManager)
-    mock.put_metric_data = AsyncMock()
+    mock.put_metric_data_batch = AsyncMock(return_value=1)
     return mock
 
 
-@pytest.fixture
-def metrics_emitter(settings: Settings, mock_cloudwatch: MagicMock) -> MetricsEmitter:
+@pytest_asyncio.fixture
+async def metrics_emitter(
+    settings: Settings, mock_cloudwatch: MagicMock
+) -> AsyncGenerator[MetricsEmitter]:
     """Create metrics emitter for testing."""
-    return MetricsEmitter(
+    emitter = MetricsEmitter(
         namespace="TestNamespace",
         cloudwatch=mock_cloudwatch,
         settings=settings,
     )
+    yield emitter
+    await emitter.close()
+
+
+def published(mock_cloudwatch: MagicMock) -> list[dict[str, Any]]:
+    """Datums published through put_metric_data_batch, with dimensions as a dict."""
+    return [
+        {**datum, "Dimensions": {d["Name"]: d["Value"] for d in datum.get("Dimensions", [])}}
+        for call in mock_cloudwatch.put_metric_data_batch.call_args_list
+        for datum in call.kwargs["metric_data"]
+    ]
 
 
 class TestMetricsEmitterInitialization:
@@ -113,16 +133,19 @@ class TestEmitMetric:
             value=42.0,
             unit="Count",
         )
+        mock_cloudwatch.put_metric_data_batch.assert_not_called()
 
-        mock_cloudwatch.put_metric_data.assert_called_once()
-        call_kwargs = mock_cloudwatch.put_metric_data.call_args[1]
+        await metrics_emitter.flush()
 
-        assert call_kwargs["namespace"] == "TestNamespace"
-        assert call_kwargs["metric_name"] == "TestMetric"
-        assert call_kwargs["value"] == 42.0
-        assert call_kwargs["unit"] == "Count"
-        assert isinstance(call_kwargs["timestamp"], datetime)
-        assert call_kwargs["timestamp"].tzinfo == UTC
+        mock_cloudwatch.put_metric_data_batch.assert_called_once()
+        assert mock_cloudwatch.put_metric_data_batch.call_args[1]["namespace"] == "TestNamespace"
+        (datum,) = published(mock_cloudwatch)
+        assert datum["MetricName"] == "TestMetric"
+        assert datum["Values"] == [42.0]
+        assert datum["Counts"] == [1.0]
+        assert datum["Unit"] == "Count"
+        assert isinstance(datum["Timestamp"], datetime)
+        assert datum["Timestamp"].tzinfo == UTC
 
     @pytest.mark.asyncio
     async def test_emit_metric_with_dimensions(
@@ -135,8 +158,7 @@ class TestEmitMetric:
             unit="Milliseconds",
             dimensions={"Environment": "Production", "Service": "API"},
         )
-
-        call_kwargs = mock_cloudwatch.put_metric_data.call_args[1]
+        await metrics_emitter.flush()
 
         # Should include both common dimensions and custom dimensions
         expected_dimensions = {
@@ -144,14 +166,14 @@ class TestEmitMetric:
             "Environment": "Production",
             "Service": "API",
         }
-        assert call_kwargs["dimensions"] == expected_dimensions
+        assert published(mock_cloudwatch)[0]["Dimensions"] == expected_dimensions
 
     @pytest.mark.asyncio
     async def test_emit_metric_error_handling(
         self, metrics_emitter: MetricsEmitter, mock_cloudwatch: MagicMock
     ) -> None:
         """Test that errors are logged but not raised."""
-        mock_cloudwatch.put_metric_data.side_effect = Exception("CloudWatch error")
+        mock_cloudwatch.put_metric_data_batch.side_effect = Exception("CloudWatch error")
 
         # Should not raise exception
         with patch("ohlala_smartops.aws.metrics_emitter.logger") as mock_logger:
@@ -159,11 +181,133 @@ class TestEmitMetric:
                 metric_name="FailingMetric",
                 value=1.0,
             )
+            await metrics_emitter.flush()
 
             # Error should be logged
             mock_logger.error.assert_called_once()
             error_message = mock_logger.error.call_args[0][0]
-            assert "Failed to emit metric FailingMetric" in error_message
+            assert "Failed to emit metrics FailingMetric" in error_message
+
+        stats = metrics_emitter.get_stats()
+        assert stats["failed_datums"] == 1
+        assert stats["buffered_datums"] == 0
+
+
+class TestAggregation:
+    """Test in-memory aggregation and batched publishing."""
+
+    @pytest.mark.asyncio
+    async def test_events_aggregated_into_one_datum(
+        self, metrics_emitter: MetricsEmitter, mock_cloudwatch: MagicMock
+    ) -> None:
+        """Test that events of the same metric and dimensions share a Values/Counts datum."""
+        for latency in (100.0, 250.0, 100.0):
+            await metrics_emitter.emit_mcp_call("aws_ec2_describe_instances", True, latency)
+        await metrics_emitter.emit_mcp_call("aws_ec2_start_instances", True, 80.0)
+
+        await metrics_emitter.flush()
+
+        mock_cloudwatch.put_metric_data_batch.assert_called_once()
+        datums = published(mock_cloudwatch)
+        assert len(datums) == 4
+        describe_latency = next(
+            d
+            for d in datums
+            if d["MetricName"] == "MCPCallLatency"
+            and d["Dimensions"]["ToolName"] == "aws_ec2_describe_instances"
+        )
+        assert describe_latency["Values"] == [100.0, 250.0]
+        assert describe_latency["Counts"] == [2.0, 1.0]
+        assert metrics_emitter.get_stats()["events"] == 8
+
+    @pytest.mark.asyncio
+    async def test_many_distinct_values_use_statistic_set(
+        self, metrics_emitter: MetricsEmitter, mock_cloudwatch: MagicMock
+    ) -> None:
+        """Test that more distinct values than a datum can hold become a statistic set."""
+        for value in range(200):
+            await metrics_emitter.emit_metric("Latency", float(value), unit="Milliseconds")
+
+        await metrics_emitter.flush()
+
+        (datum,) = published(mock_cloudwatch)
+        assert "Values" not in datum
+        assert datum["StatisticValues"] == {
+            "SampleCount": 200.0,
+            "Sum": 19_900.0,
+            "Minimum": 0.0,
+            "Maximum": 199.0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_flush_on_size(self, settings: Settings, mock_cloudwatch: MagicMock) -> None:
+        """Test that a full buffer is published by the flush task, not by the emitter."""
+        emitter = MetricsEmitter(
+            cloudwatch=mock_cloudwatch, settings=settings, max_buffered_metrics=3
+        )
+
+        for component in ("a", "b", "c"):
+            await emitter.emit_health_status(component, healthy=True)
+        mock_cloudwatch.put_metric_data_batch.assert_not_called()
+
+        await asyncio.sleep(0.01)
+        assert len(published(mock_cloudwatch)) == 3
+        await emitter.emit_health_status("d", healthy=True)
+        await asyncio.sleep(0.01)
+
+        assert emitter.get_stats()["buffered_datums"] == 1
+        await emitter.close()
+        assert len(published(mock_cloudwatch)) == 4
+
+    @pytest.mark.asyncio
+    async def test_events_buffered_during_slow_publish(
+        self, settings: Settings, mock_cloudwatch: MagicMock
+    ) -> None:
+        """Test that emitting does not wait for a publish and later events are published."""
+        release = asyncio.Event()
+
+        async def slow_publish(**kwargs: Any) -> int:
+            await release.wait()
+            return 1
+
+        mock_cloudwatch.put_metric_data_batch.side_effect = slow_publish
+        emitter = MetricsEmitter(
+            cloudwatch=mock_cloudwatch, settings=settings, max_buffered_metrics=2
+        )
+
+        for component in ("a", "b", "c", "d"):
+            await asyncio.wait_for(emitter.emit_health_status(component, healthy=True), 1)
+            await asyncio.sleep(0)
+        release.set()
+        await asyncio.sleep(0.01)
+
+        assert len(published(mock_cloudwatch)) == 4
+        assert emitter.get_stats()["buffered_datums"] == 0
+        await emitter.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_on_interval(self, settings: Settings, mock_cloudwatch: MagicMock) -> None:
+        """Test that buffered metrics are published once the flush interval has passed."""
+        emitter = MetricsEmitter(cloudwatch=mock_cloudwatch, settings=settings, flush_interval=0.01)
+
+        await emitter.emit_health_status("bedrock", healthy=True)
+        await emitter.emit_health_status("bedrock", healthy=True)
+        await asyncio.sleep(0.05)
+
+        mock_cloudwatch.put_metric_data_batch.assert_called_once()
+        assert published(mock_cloudwatch)[0]["Counts"] == [2.0]
+
+    @pytest.mark.asyncio
+    async def test_close_drains_buffer(
+        self, metrics_emitter: MetricsEmitter, mock_cloudwatch: MagicMock
+    ) -> None:
+        """Test that closing publishes buffered metrics and cancels the delayed publish."""
+        await metrics_emitter.emit_auth_failure()
+
+        await metrics_emitter.close()
+
+        mock_cloudwatch.put_metric_data_batch.assert_called_once()
+        assert metrics_emitter._flush_task is None
 
 
 class TestSecurityMetrics:
@@ -175,13 +319,14 @@ class TestSecurityMetrics:
     ) -> None:
         """Test emitting unauthorized access without source IP."""
         await metrics_emitter.emit_unauthorized_access()
+        await metrics_emitter.flush()
 
-        call_kwargs = mock_cloudwatch.put_metric_data.call_args[1]
+        (datum,) = published(mock_cloudwatch)
 
-        assert call_kwargs["metric_name"] == "UnauthorizedAccess"
-        assert call_kwargs["value"] == 1
+        assert datum["MetricName"] == "UnauthorizedAccess"
+        assert datum["Values"] == [1.0]
         # Should only have common dimensions
-        assert call_kwargs["dimensions"] == {"StackName": "test-stack"}
+        assert datum["Dimensions"] == {"StackName": "test-stack"}
 
     @pytest.mark.asyncio
     async def test_emit_unauthorized_access_with_ip(
@@ -189,14 +334,13 @@ class TestSecurityMetrics:
     ) -> None:
         """Test emitting unauthorized access with source IP."""
         await metrics_emitter.emit_unauthorized_access(source_ip="192.168.1.100")
-
-        call_kwargs = mock_cloudwatch.put_metric_data.call_args[1]
+        await metrics_emitter.flush()
 
         expected_dimensions = {
             "StackName": "test-stack",
             "SourceIP": "192.168.1.100",
         }
-        assert call_kwargs["dimensions"] == expected_dimensions
+        assert published(mock_cloudwatch)[0]["Dimensions"] == expected_dimensions
 
     @pytest.mark.asyncio
     async def test_emit_auth_failure(
@@ -204,13 +348,14 @@ class TestSecurityMetrics:
     ) -> None:
         """Test emitting authentication failure."""
         await metrics_emitter.emit_auth_failure(auth_type="Teams")
+        await metrics_emitter.flush()
 
-        call_kwargs = mock_cloudwatch.put_metric_data.call_args[1]
+        (datum,) = published(mock_cloudwatch)
 
-        assert call_kwargs["metric_name"] == "AuthenticationFailure"
-        assert call_kwargs["value"] == 1
+        assert datum["MetricName"] == "AuthenticationFailure"
+        assert datum["Values"] == [1.0]
         expected_dimensions = {"StackName": "test-stack", "AuthType": "Teams"}
-        assert call_kwargs["dimensions"] == expected_dimensions
+        assert datum["Dimensions"] == expected_dimensions
 
     @pytest.mark.asyncio
     async def test_emit_rate_limit_exceeded(
@@ -218,15 +363,16 @@ class TestSecurityMetrics:
     ) -> None:
         """Test emitting rate limit exceeded."""
         await metrics_emitter.emit_rate_limit_exceeded(client_id="user@example.com")
+        await metrics_emitter.flush()
 
-        call_kwargs = mock_cloudwatch.put_metric_data.call_args[1]
+        (datum,) = published(mock_cloudwatch)
 
-        assert call_kwargs["metric_name"] == "RateLimitExceeded"
+        assert datum["MetricName"] == "RateLimitExceeded"
         expected_dimensions = {
             "StackName": "test-stack",
             "ClientID": "user@example.com",
         }
-        assert call_kwargs["dimensions"] == expected_dimensions
+        assert datum["Dimensions"] == expected_dimensions
 
 
 class TestMCPMetrics:
@@ -242,22 +388,22 @@ class TestMCPMetrics:
             success=True,
             latency_ms=456.2,
         )
+        await metrics_emitter.flush()
 
         # Should emit 2 metrics: count and latency (not error for success)
-        assert mock_cloudwatch.put_metric_data.call_count == 2
+        datums = published(mock_cloudwatch)
+        assert len(datums) == 2
 
-        # Check first call (count)
-        first_call = mock_cloudwatch.put_metric_data.call_args_list[0][1]
-        assert first_call["metric_name"] == "MCPCallCount"
-        assert first_call["value"] == 1
-        assert first_call["dimensions"]["ToolName"] == "aws_ec2_describe_instances"
-        assert first_call["dimensions"]["Success"] == "True"
+        # Check first metric (count)
+        assert datums[0]["MetricName"] == "MCPCallCount"
+        assert datums[0]["Values"] == [1.0]
+        assert datums[0]["Dimensions"]["ToolName"] == "aws_ec2_describe_instances"
+        assert datums[0]["Dimensions"]["Success"] == "True"
 
-        # Check second call (latency)
-        second_call = mock_cloudwatch.put_metric_data.call_args_list[1][1]
-        assert second_call["metric_name"] == "MCPCallLatency"
-        assert second_call["value"] == 456.2
-        assert second_call["unit"] == "Milliseconds"
+        # Check second metric (latency)
+        assert datums[1]["MetricName"] == "MCPCallLatency"
+        assert datums[1]["Values"] == [456.2]
+        assert datums[1]["Unit"] == "Milliseconds"
 
     @pytest.mark.asyncio
     async def test_emit_mcp_call_failure(
@@ -269,14 +415,15 @@ class TestMCPMetrics:
             success=False,
             latency_ms=123.4,
         )
+        await metrics_emitter.flush()
 
         # Should emit 3 metrics: count, latency, and error
-        assert mock_cloudwatch.put_metric_data.call_count == 3
+        datums = published(mock_cloudwatch)
+        assert len(datums) == 3
 
         # Check error metric
-        error_call = mock_cloudwatch.put_metric_data.call_args_list[2][1]
-        assert error_call["metric_name"] == "MCPCallError"
-        assert error_call["value"] == 1
+        assert datums[2]["MetricName"] == "MCPCallError"
+        assert datums[2]["Values"] == [1.0]
 
 
 class TestCommandMetrics:
@@ -292,21 +439,21 @@ class TestCommandMetrics:
             success=True,
             execution_time_ms=2340.5,
         )
+        await metrics_emitter.flush()
 
         # Should emit 2 metrics: count and time (not error)
-        assert mock_cloudwatch.put_metric_data.call_count == 2
+        datums = published(mock_cloudwatch)
+        assert len(datums) == 2
 
         # Check count metric
-        count_call = mock_cloudwatch.put_metric_data.call_args_list[0][1]
-        assert count_call["metric_name"] == "CommandExecutionCount"
-        assert count_call["dimensions"]["Command"] == "start_instance"
-        assert count_call["dimensions"]["Success"] == "True"
+        assert datums[0]["MetricName"] == "CommandExecutionCount"
+        assert datums[0]["Dimensions"]["Command"] == "start_instance"
+        assert datums[0]["Dimensions"]["Success"] == "True"
 
         # Check time metric
-        time_call = mock_cloudwatch.put_metric_data.call_args_list[1][1]
-        assert time_call["metric_name"] == "CommandExecutionTime"
-        assert time_call["value"] == 2340.5
-        assert time_call["unit"] == "Milliseconds"
+        assert datums[1]["MetricName"] == "CommandExecutionTime"
+        assert datums[1]["Values"] == [2340.5]
+        assert datums[1]["Unit"] == "Milliseconds"
 
     @pytest.mark.asyncio
     async def test_emit_command_execution_failure(
@@ -318,12 +465,12 @@ class TestCommandMetrics:
             success=False,
             execution_time_ms=500.0,
         )
+        await metrics_emitter.flush()
 
         # Should emit 3 metrics including error
-        assert mock_cloudwatch.put_metric_data.call_count == 3
-
-        error_call = mock_cloudwatch.put_metric_data.call_args_list[2][1]
-        assert error_call["metric_name"] == "CommandError"
+        datums = published(mock_cloudwatch)
+        assert len(datums) == 3
+        assert datums[2]["MetricName"] == "CommandError"
 
 
 class TestWriteOperationMetrics:
@@ -339,14 +486,15 @@ class TestWriteOperationMetrics:
             resource_type="ec2_instance",
             confirmed=True,
         )
+        await metrics_emitter.flush()
 
-        call_kwargs = mock_cloudwatch.put_metric_data.call_args[1]
+        (datum,) = published(mock_cloudwatch)
 
-        assert call_kwargs["metric_name"] == "WriteOperationCount"
-        assert call_kwargs["value"] == 1
-        assert call_kwargs["dimensions"]["OperationType"] == "stop"
-        assert call_kwargs["dimensions"]["ResourceType"] == "ec2_instance"
-        assert call_kwargs["dimensions"]["Status"] == "confirmed"
+        assert datum["MetricName"] == "WriteOperationCount"
+        assert datum["Values"] == [1.0]
+        assert datum["Dimensions"]["OperationType"] == "stop"
+        assert datum["Dimensions"]["ResourceType"] == "ec2_instance"
+        assert datum["Dimensions"]["Status"] == "confirmed"
 
     @pytest.mark.asyncio
     async def test_emit_write_operation_timed_out(
@@ -359,9 +507,9 @@ class TestWriteOperationMetrics:
             confirmed=False,
             timed_out=True,
         )
+        await metrics_emitter.flush()
 
-        call_kwargs = mock_cloudwatch.put_metric_data.call_args[1]
-        assert call_kwargs["dimensions"]["Status"] == "timed_out"
+        assert published(mock_cloudwatch)[0]["Dimensions"]["Status"] == "timed_out"
 
     @pytest.mark.asyncio
     async def test_emit_write_operation_pending(
@@ -374,9 +522,9 @@ class TestWriteOperationMetrics:
             confirmed=False,
             timed_out=False,
         )
+        await metrics_emitter.flush()
 
-        call_kwargs = mock_cloudwatch.put_metric_data.call_args[1]
-        assert call_kwargs["dimensions"]["Status"] == "pending"
+        assert published(mock_cloudwatch)[0]["Dimensions"]["Status"] == "pending"
 
 
 class TestBedrockMetrics:
@@ -393,26 +541,25 @@ class TestBedrockMetrics:
             output_tokens=500,
             latency_ms=3456.7,
         )
+        await metrics_emitter.flush()
 
         # Should emit 3 metrics: input tokens, output tokens, latency
-        assert mock_cloudwatch.put_metric_data.call_count == 3
+        datums = published(mock_cloudwatch)
+        assert len(datums) == 3
 
         # Check input tokens
-        input_call = mock_cloudwatch.put_metric_data.call_args_list[0][1]
-        assert input_call["metric_name"] == "BedrockInputTokens"
-        assert input_call["value"] == 1500.0
-        assert input_call["dimensions"]["ModelId"] == "anthropic.claude-3-sonnet-20240229-v1:0"
+        assert datums[0]["MetricName"] == "BedrockInputTokens"
+        assert datums[0]["Values"] == [1500.0]
+        assert datums[0]["Dimensions"]["ModelId"] == "anthropic.claude-3-sonnet-20240229-v1:0"
 
         # Check output tokens
-        output_call = mock_cloudwatch.put_metric_data.call_args_list[1][1]
-        assert output_call["metric_name"] == "BedrockOutputTokens"
-        assert output_call["value"] == 500.0
+        assert datums[1]["MetricName"] == "BedrockOutputTokens"
+        assert datums[1]["Values"] == [500.0]
 
         # Check latency
-        latency_call = mock_cloudwatch.put_metric_data.call_args_list[2][1]
-        assert latency_call["metric_name"] == "BedrockLatency"
-        assert latency_call["value"] == 3456.7
-        assert latency_call["unit"] == "Milliseconds"
+        assert datums[2]["MetricName"] == "BedrockLatency"
+        assert datums[2]["Values"] == [3456.7]
+        assert datums[2]["Unit"] == "Milliseconds"
 
 
 class TestHealthMetrics:
@@ -427,12 +574,13 @@ class TestHealthMetrics:
             component="bedrock",
             healthy=True,
         )
+        await metrics_emitter.flush()
 
-        call_kwargs = mock_cloudwatch.put_metric_data.call_args[1]
+        (datum,) = published(mock_cloudwatch)
 
-        assert call_kwargs["metric_name"] == "ComponentHealth"
-        assert call_kwargs["value"] == 1.0
-        assert call_kwargs["dimensions"]["Component"] == "bedrock"
+        assert datum["MetricName"] == "ComponentHealth"
+        assert datum["Values"] == [1.0]
+        assert datum["Dimensions"]["Component"] == "bedrock"
 
     @pytest.mark.asyncio
     async def test_emit_health_status_unhealthy(
@@ -443,9 +591,9 @@ class TestHealthMetrics:
             component="database",
             healthy=False,
         )
+        await metrics_emitter.flush()
 
-        call_kwargs = mock_cloudwatch.put_metric_data.call_args[1]
-        assert call_kwargs["value"] == 0.0
+        assert published(mock_cloudwatch)[0]["Values"] == [0.0]
 
 
 class TestGetMetricsEmitter:
@@ -502,3 +650,92 @@ class TestConvenienceFunctions:
             mock_emitter.emit_command_execution.assert_called_once_with(
                 "start_instance", True, 1234.5
             )
+
+
+GOLDEN_DIR = Path(__file__).parent.parent / "fixtures" / "emf"
+
+
+class TestEmfOutput:
+    """Test Embedded Metric Format output against golden files."""
+
+    @pytest.fixture(autouse=True)
+    def fixed_time(self) -> Generator[None]:
+        """Pin EMF timestamps to 2024-01-01T00:00:00Z."""
+        with patch("ohlala_smartops.aws.metrics_emitter.time.time", return_value=1_704_067_200.0):
+            yield
+
+    def emf_emitter(self, settings: Settings, path: Path) -> MetricsEmitter:
+        return MetricsEmitter(
+            namespace="TestNamespace",
+            cloudwatch=MagicMock(spec=CloudWatchManager),
+            settings=settings,
+            output="emf",
+            emf_writer=EmfWriter("TestNamespace", path),
+        )
+
+    @pytest.mark.asyncio
+    async def test_operational_metrics(self, settings: Settings, tmp_path: Path) -> None:
+        """Test EMF lines of MCP, command, Bedrock and health metrics."""
+        path = tmp_path / "metrics.log"
+        emitter = self.emf_emitter(settings, path)
+
+        await emitter.emit_mcp_call("aws_ec2_start_instances", success=False, latency_ms=123.4)
+        await emitter.emit_command_execution("start_instance", True, 2340.5)
+        await emitter.emit_bedrock_usage("anthropic.claude-sonnet-4-5", 1500, 500, 3456.7)
+        await emitter.emit_health_status("bedrock", healthy=True)
+        await emitter.close()
+
+        assert path.read_text() == (GOLDEN_DIR / "operational_metrics.jsonl").read_text()
+        emitter.cloudwatch.put_metric_data_batch.assert_not_called()
+        assert emitter.get_stats()["events"] == 9
+
+    @pytest.mark.asyncio
+    async def test_metric_without_dimensions(
+        self, settings_no_stack: Settings, tmp_path: Path
+    ) -> None:
+        """Test the EMF line of a metric without any dimensions."""
+        path = tmp_path / "metrics.log"
+        emitter = self.emf_emitter(settings_no_stack, path)
+
+        await emitter.emit_metric("QueueDepth", 7, unit="Count")
+        await emitter.close()
+
+        assert path.read_text() == (GOLDEN_DIR / "no_dimensions.jsonl").read_text()
+
+    @pytest.mark.asyncio
+    async def test_events_aggregated_into_value_arrays(
+        self, settings_no_stack: Settings, tmp_path: Path
+    ) -> None:
+        """Test that events of one metric share a line with up to 100 values."""
+        path = tmp_path / "metrics.log"
+        emitter = self.emf_emitter(settings_no_stack, path)
+
+        for value in range(130):
+            await emitter.emit_metric("Latency", float(value % 3), unit="Milliseconds")
+        await emitter.emit_metric("QueueDepth", 7, unit="Count")
+        assert not path.exists()
+        assert emitter.get_stats()["buffered_datums"] == 3
+
+        await emitter.close()
+
+        documents = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [len(d["Latency"]) for d in documents if "Latency" in d] == [100, 30]
+        assert sum(sum(d.get("Latency", [])) for d in documents) == 129.0
+        assert documents[-1]["QueueDepth"] == 7.0
+        assert emitter.get_stats()["published_datums"] == 3
+
+    @pytest.mark.asyncio
+    async def test_stdout_from_settings(
+        self, settings: Settings, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that EMF mode from settings writes to stdout when no file is set."""
+        settings.metrics_output = "emf"
+        emitter = MetricsEmitter(cloudwatch=MagicMock(spec=CloudWatchManager), settings=settings)
+
+        await emitter.emit_auth_failure(auth_type="Teams")
+        await emitter.close()
+
+        document = json.loads(capsys.readouterr().out)
+        assert document["_aws"]["CloudWatchMetrics"][0]["Namespace"] == DEFAULT_NAMESPACE
+        assert document["AuthenticationFailure"] == 1.0
+        assert document["AuthType"] == "Teams"
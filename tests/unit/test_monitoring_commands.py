@@ -8,15 +8,38 @@ This test suite covers the three monitoring commands:
 Tests include success cases, error handling, edge cases, and data formatting.
 """
 
+import asyncio
+import json
+import time
+from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 from typing import Any
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from ohlala_smartops.commands import CostsCommand, InstanceDetailsCommand, MetricsCommand
 
 
+def daily_costs_result(params: dict[str, Any]) -> dict[str, Any]:
+    """Cost tool result of $2.00 for each day of the requested TimePeriod."""
+    start = date.fromisoformat(params["TimePeriod"]["Start"])
+    end = date.fromisoformat(params["TimePeriod"]["End"])
+    return {
+        "costs": {
+            "daily_costs": [
+                {"date": (start + timedelta(days=n)).isoformat(), "amount": Decimal("2.00")}
+                for n in range((end - start).days)
+            ]
+        }
+    }
+
+
+def is_last_day_of_month() -> bool:
+    """Whether no forecast period is left in the current UTC month."""
+    return (datetime.now(UTC) + timedelta(days=1)).day == 1
+
+
 class TestInstanceDetailsCommand:
     """Test suite for InstanceDetailsCommand."""
 
@@ -434,3 +457,197 @@ class TestCostsCommand:
             result = await command.execute(["all", period], mock_context)
             assert result["success"] is True
             assert period in result["message"]
+
+    @pytest.mark.asyncio
+    async def test_costs_fetched_incrementally(
+        self, command: CostsCommand, mock_context: dict[str, Any]
+    ) -> None:
+        """Test that only days missing from the cost cache or still estimated are fetched."""
+        mock_mcp = mock_context["mcp_manager"]
+        requested: list[dict[str, str]] = []
+
+        def mock_call_side_effect(
+            tool_name: str, params: dict[str, Any], **kwargs: Any
+        ) -> dict[str, Any]:
+            if tool_name == "forecast-cost":
+                return {"forecast": {"amount": "60.00", "period": "remaining month"}}
+            requested.append(params["TimePeriod"])
+            return daily_costs_result(params)
+
+        mock_mcp.call_aws_api_tool.side_effect = mock_call_side_effect
+        today = datetime.now(UTC).date()
+
+        first = await command._get_costs("all", "week", mock_context)
+        second = await command._get_costs("all", "week", mock_context)
+        with patch("ohlala_smartops.utils.cost_cache.time.time", return_value=time.time() + 86400):
+            third = await command._get_costs("all", "week", mock_context)
+
+        assert requested == [
+            {
+                "Start": (today - timedelta(days=6)).isoformat(),
+                "End": (today + timedelta(days=1)).isoformat(),
+            },
+            {
+                "Start": (today - timedelta(days=3)).isoformat(),
+                "End": (today + timedelta(days=1)).isoformat(),
+            },
+        ]
+        for costs in (first, second, third):
+            assert costs["total_cost"] == Decimal("14.00")
+            assert len(costs["daily_costs"]) == 7
+        assert mock_mcp.call_aws_api_tool.call_count == (2 if is_last_day_of_month() else 3)
+
+    @pytest.mark.asyncio
+    async def test_failed_costs_not_cached(
+        self, command: CostsCommand, mock_context: dict[str, Any]
+    ) -> None:
+        """Test that error payloads are not cached as $0 days."""
+        mock_mcp = mock_context["mcp_manager"]
+        responses: list[dict[str, Any]] = [
+            {"error": "Circuit breaker open"},
+            {"costs": {"error": "Cost Explorer unavailable"}},
+        ]
+        requested: list[dict[str, str]] = []
+
+        def mock_call_side_effect(
+            tool_name: str, params: dict[str, Any], **kwargs: Any
+        ) -> dict[str, Any]:
+            if tool_name == "forecast-cost":
+                return {"error": "Circuit breaker open"}
+            requested.append(params["TimePeriod"])
+            return responses.pop(0) if responses else daily_costs_result(params)
+
+        mock_mcp.call_aws_api_tool.side_effect = mock_call_side_effect
+        today = datetime.now(UTC).date()
+
+        failed = await command.execute(["all", "week"], mock_context)
+        partial = await command._get_costs("all", "week", mock_context)
+        costs = await command._get_costs("all", "week", mock_context)
+
+        assert failed["success"] is False
+        assert "Circuit breaker open" in failed["error"]
+        assert partial["error"] == "Cost Explorer unavailable"
+        assert costs["total_cost"] == Decimal("14.00")
+        assert {period["Start"] for period in requested} == {
+            (today - timedelta(days=6)).isoformat()
+        }
+        assert len(requested) == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_forecast_not_cached(
+        self, command: CostsCommand, mock_context: dict[str, Any]
+    ) -> None:
+        """Test that forecast error payloads and empty forecasts are fetched again."""
+        if is_last_day_of_month():
+            pytest.skip("No forecast on the last day of the month")
+        mock_mcp = mock_context["mcp_manager"]
+        forecasts: list[dict[str, Any]] = [
+            {"error": "Circuit breaker open"},
+            {},
+            {"forecast": {"amount": "60.00"}},
+        ]
+
+        def mock_call_side_effect(
+            tool_name: str, params: dict[str, Any], **kwargs: Any
+        ) -> dict[str, Any]:
+            if tool_name == "forecast-cost":
+                return forecasts.pop(0)
+            return daily_costs_result(params)
+
+        mock_mcp.call_aws_api_tool.side_effect = mock_call_side_effect
+
+        results = [await command._get_costs("all", "week", mock_context) for _ in range(4)]
+
+        assert [costs["forecast"] for costs in results[:2]] == [None, None]
+        assert results[2]["forecast"]["amount"] == Decimal("60.00")
+        assert results[3]["forecast"]["amount"] == Decimal("60.00")
+        assert not forecasts
+
+    @pytest.mark.asyncio
+    async def test_costs_and_forecast_fetched_concurrently(
+        self, command: CostsCommand, mock_context: dict[str, Any]
+    ) -> None:
+        """Test that /costs takes as long as the slowest call, not the sum of both."""
+        if is_last_day_of_month():
+            pytest.skip("No forecast on the last day of the month")
+        mock_mcp = mock_context["mcp_manager"]
+
+        async def mock_call_side_effect(
+            tool_name: str, params: dict[str, Any], **kwargs: Any
+        ) -> dict[str, Any]:
+            await asyncio.sleep(0.2)
+            if tool_name == "forecast-cost":
+                return {"forecast": {"amount": "60.00"}}
+            return daily_costs_result(params)
+
+        mock_mcp.call_aws_api_tool.side_effect = mock_call_side_effect
+
+        started = time.monotonic()
+        costs = await command._get_costs("all", "week", mock_context)
+
+        assert time.monotonic() - started < 0.35
+        assert costs["forecast"] == {"amount": Decimal("60.00"), "period": "remaining month"}
+        assert "forecast_pending" not in costs
+
+    @pytest.mark.asyncio
+    @patch("ohlala_smartops.commands.costs.COSTS_FORECAST_BUDGET_SECONDS", 0.1)
+    async def test_slow_forecast_marked_pending(
+        self, command: CostsCommand, mock_context: dict[str, Any]
+    ) -> None:
+        """Test that a forecast over the latency budget is shown pending, then from the cache."""
+        if is_last_day_of_month():
+            pytest.skip("No forecast on the last day of the month")
+        mock_mcp = mock_context["mcp_manager"]
+
+        async def mock_call_side_effect(
+            tool_name: str, params: dict[str, Any], **kwargs: Any
+        ) -> dict[str, Any]:
+            if tool_name == "forecast-cost":
+                await asyncio.sleep(0.3)
+                return {"forecast": {"amount": "60.00"}}
+            return daily_costs_result(params)
+
+        mock_mcp.call_aws_api_tool.side_effect = mock_call_side_effect
+
+        started = time.monotonic()
+        result = await command.execute(["all", "week"], mock_context)
+        elapsed = time.monotonic() - started
+        await asyncio.sleep(0.3)
+        refreshed = await command._get_costs("all", "week", mock_context)
+
+        assert 0.1 <= elapsed < 0.25
+        assert "Still being calculated" in json.dumps(result["card"])
+        assert refreshed["forecast"]["amount"] == Decimal("60.00")
+        assert "forecast_pending" not in refreshed
+        assert mock_mcp.call_aws_api_tool.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("ohlala_smartops.commands.costs.COSTS_FORECAST_BUDGET_SECONDS", 0.0)
+    async def test_forecast_in_flight_shared_between_commands(
+        self, mock_context: dict[str, Any]
+    ) -> None:
+        """Test that a /costs arriving while a late forecast is fetched reuses that fetch."""
+        if is_last_day_of_month():
+            pytest.skip("No forecast on the last day of the month")
+        mock_mcp = mock_context["mcp_manager"]
+        forecast_calls = 0
+
+        async def mock_call_side_effect(
+            tool_name: str, params: dict[str, Any], **kwargs: Any
+        ) -> dict[str, Any]:
+            nonlocal forecast_calls
+            if tool_name == "forecast-cost":
+                forecast_calls += 1
+                await asyncio.sleep(0.1)
+                return {"forecast": {"amount": "60.00"}}
+            return daily_costs_result(params)
+
+        mock_mcp.call_aws_api_tool.side_effect = mock_call_side_effect
+
+        first = await CostsCommand()._get_costs("all", "week", mock_context)
+        second = await CostsCommand()._get_costs("all", "month", mock_context)
+        await asyncio.sleep(0.15)
+
+        assert first["forecast_pending"] is True
+        assert second["forecast_pending"] is True
+        assert forecast_calls == 1
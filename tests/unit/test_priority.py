@@ -0,0 +1,198 @@
+"""Tests for throttler priority classes."""
+
+import asyncio
+
+import pytest
+
+from ohlala_smartops.utils.priority import (
+    PrioritySemaphore,
+    PriorityWaitQueue,
+    PriorityWaitStats,
+    get_throttle_priority,
+    throttle_priority,
+)
+
+
+class TestThrottlePriorityContext:
+    """Test suite for the throttle_priority context."""
+
+    def test_default_priority_is_interactive(self) -> None:
+        """Test that calls are interactive unless marked otherwise."""
+        assert get_throttle_priority() == "interactive"
+
+    def test_priority_restored_after_block(self) -> None:
+        """Test that nested blocks set and restore the priority."""
+        with throttle_priority("background"):
+            assert get_throttle_priority() == "background"
+            with throttle_priority("bulk"):
+                assert get_throttle_priority() == "bulk"
+            assert get_throttle_priority() == "background"
+
+        assert get_throttle_priority() == "interactive"
+
+    @pytest.mark.asyncio
+    async def test_tasks_inherit_priority(self) -> None:
+        """Test that tasks created inside the block inherit its priority."""
+
+        async def current() -> str:
+            return get_throttle_priority()
+
+        with throttle_priority("background"):
+            task = asyncio.create_task(current())
+
+        assert await task == "background"
+
+
+class TestPriorityWaitQueue:
+    """Test suite for PriorityWaitQueue."""
+
+    @staticmethod
+    def _drain(queue: PriorityWaitQueue, labels: dict[asyncio.Future[None], str]) -> list[str]:
+        served = []
+        while queue.peek() is not None:
+            _, waiter = queue.popleft()
+            served.append(labels[waiter])
+        return served
+
+    @pytest.mark.asyncio
+    async def test_higher_class_served_first(self) -> None:
+        """Test that interactive waiters overtake earlier background and bulk waiters."""
+        loop = asyncio.get_running_loop()
+        queue = PriorityWaitQueue(reserved_shares={})
+        labels: dict[asyncio.Future[None], str] = {}
+        for priority, label in [
+            ("bulk", "bulk-1"),
+            ("background", "bg-1"),
+            ("interactive", "user-1"),
+            ("background", "bg-2"),
+            ("interactive", "user-2"),
+        ]:
+            waiter: asyncio.Future[None] = loop.create_future()
+            labels[waiter] = label
+            queue.append(priority, waiter)  # type: ignore[arg-type]
+
+        assert self._drain(queue, labels) == ["user-1", "user-2", "bg-1", "bg-2", "bulk-1"]
+
+    @pytest.mark.asyncio
+    async def test_reserved_share_prevents_starvation(self) -> None:
+        """Test that a waiting lower class gets its reserved share of grants."""
+        loop = asyncio.get_running_loop()
+        queue = PriorityWaitQueue(reserved_shares={"background": 0.25})
+        labels: dict[asyncio.Future[None], str] = {}
+        for index in range(8):
+            waiter: asyncio.Future[None] = loop.create_future()
+            labels[waiter] = f"user-{index}"
+            queue.append("interactive", waiter)
+        for index in range(2):
+            waiter = loop.create_future()
+            labels[waiter] = f"bg-{index}"
+            queue.append("background", waiter)
+
+        served = self._drain(queue, labels)
+
+        # One grant in four goes to background while it waits
+        assert served == [
+            "user-0",
+            "user-1",
+            "user-2",
+            "user-3",
+            "bg-0",
+            "user-4",
+            "user-5",
+            "user-6",
+            "bg-1",
+            "user-7",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiters_skipped(self) -> None:
+        """Test that cancelled waiters are dropped instead of served."""
+        loop = asyncio.get_running_loop()
+        queue = PriorityWaitQueue()
+        cancelled: asyncio.Future[None] = loop.create_future()
+        live: asyncio.Future[None] = loop.create_future()
+        queue.append("interactive", cancelled)
+        queue.append("interactive", live, tokens=3)
+        cancelled.cancel()
+
+        assert queue.peek() == (3, live)
+        assert queue.get_queued() == {"interactive": 1, "background": 0, "bulk": 0}
+
+
+class TestPrioritySemaphore:
+    """Test suite for PrioritySemaphore."""
+
+    @pytest.mark.asyncio
+    async def test_free_slots_granted_immediately(self) -> None:
+        """Test that holders do not wait while slots are free."""
+        semaphore = PrioritySemaphore(2)
+
+        await semaphore.acquire()
+        await semaphore.acquire()
+
+        assert semaphore._value == 0
+        semaphore.release()
+        semaphore.release()
+        assert semaphore._value == 2
+
+    @pytest.mark.asyncio
+    async def test_released_slot_goes_to_highest_priority(self) -> None:
+        """Test that a freed slot goes to a user before earlier background work."""
+        semaphore = PrioritySemaphore(1)
+        order: list[str] = []
+
+        async def hold(label: str, priority: str) -> None:
+            async with semaphore.hold(priority):  # type: ignore[arg-type]
+                order.append(label)
+                await asyncio.sleep(0)
+
+        await semaphore.acquire()
+        tasks = [
+            asyncio.create_task(hold("bg", "background")),
+            asyncio.create_task(hold("bulk", "bulk")),
+            asyncio.create_task(hold("user", "interactive")),
+        ]
+        await asyncio.sleep(0)
+        semaphore.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["user", "bg", "bulk"]
+        assert semaphore._value == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self) -> None:
+        """Test that cancelling a queued holder keeps the slot count intact."""
+        semaphore = PrioritySemaphore(1)
+        await semaphore.acquire()
+
+        waiter = asyncio.create_task(semaphore.acquire("background"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        semaphore.release()
+
+        assert waiter.cancelled()
+        assert semaphore._value == 1
+        assert semaphore.get_queued()["background"] == 0
+
+
+class TestPriorityWaitStats:
+    """Test suite for PriorityWaitStats."""
+
+    def test_records_wait_per_class(self) -> None:
+        """Test average and maximum waits per priority class."""
+        stats = PriorityWaitStats()
+        stats.record("interactive", 0.1)
+        stats.record("interactive", 0.3)
+        stats.record("bulk", 2.0)
+
+        result = stats.get_stats()
+
+        assert result["interactive"] == {
+            "requests": 2,
+            "avg_wait_seconds": 0.2,
+            "max_wait_seconds": 0.3,
+        }
+        assert result["background"]["requests"] == 0
+        assert result["background"]["avg_wait_seconds"] == 0.0
+        assert result["bulk"]["max_wait_seconds"] == 2.0
@@ -0,0 +1,230 @@
+"""Tests for token buckets shared between bot replicas."""
+
+import asyncio
+import logging
+import os
+import sys
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from ohlala_smartops.utils.global_throttler import GlobalThrottler
+from ohlala_smartops.utils.shared_limiter import (
+    InMemoryLimiterBackend,
+    RedisLimiterBackend,
+    SharedTokenBucket,
+    get_shared_limiter_backend,
+)
+from tests.conftest import VirtualClock
+
+
+class FailingBackend:
+    """Backend whose server is unreachable."""
+
+    async def take(
+        self, key: str, tokens: int, tokens_per_second: float, max_tokens: int
+    ) -> tuple[int, float]:
+        raise ConnectionError("Connection refused")
+
+
+class HangingBackend:
+    """Backend whose server accepts connections but never answers."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def take(
+        self, key: str, tokens: int, tokens_per_second: float, max_tokens: int
+    ) -> tuple[int, float]:
+        self.calls += 1
+        await asyncio.Event().wait()
+        raise AssertionError("unreachable")
+
+
+class TestInMemoryLimiterBackend:
+    """Test suite for the in-memory stand-in backend."""
+
+    @pytest.mark.asyncio
+    async def test_grants_up_to_available(self, virtual_clock: VirtualClock) -> None:
+        """Test that a take is granted partially when the bucket runs low."""
+        backend = InMemoryLimiterBackend()
+
+        assert await backend.take("aws:global", 4, 2.0, 6) == (4, 0.0)
+        assert await backend.take("aws:global", 4, 2.0, 6) == (2, 0.0)
+        assert await backend.take("aws:global", 4, 2.0, 6) == (0, 0.5)
+
+        await asyncio.sleep(1.0)
+        assert await backend.take("aws:global", 4, 2.0, 6) == (2, 0.0)
+
+    @pytest.mark.asyncio
+    async def test_keys_are_independent(self) -> None:
+        """Test that buckets with different keys do not share tokens."""
+        backend = InMemoryLimiterBackend()
+
+        assert await backend.take("aws:ce", 2, 1.0, 2) == (2, 0.0)
+        assert await backend.take("aws:ec2", 2, 1.0, 2) == (2, 0.0)
+
+
+class TestRedisLimiterBackend:
+    """Test suite for the Redis backend."""
+
+    @pytest.mark.asyncio
+    async def test_runs_script_with_prefixed_key(self) -> None:
+        """Test that takes run the token bucket script against the prefixed key."""
+        calls: list[dict[str, Any]] = []
+
+        async def script(**kwargs: Any) -> list[Any]:
+            calls.append(kwargs)
+            return [0, b"0.25"]
+
+        class FakeRedis:
+            def register_script(self, source: str) -> Any:
+                assert "redis.call('TIME')" in source
+                return script
+
+        backend = RedisLimiterBackend(FakeRedis(), key_prefix="test:")
+
+        assert await backend.take("aws:global", 5, 15.0, 30) == (0, 0.25)
+        assert calls == [{"keys": ["test:aws:global"], "args": [5, 15.0, 30]}]
+
+    def test_from_url_sets_timeouts(self) -> None:
+        """Test that connections fail fast instead of waiting for TCP timeouts."""
+        redis_asyncio = pytest.importorskip("redis.asyncio")
+        with patch.object(redis_asyncio.Redis, "from_url") as mock_from_url:
+            RedisLimiterBackend.from_url("redis://cache:6379/0", timeout=0.25)
+
+        mock_from_url.assert_called_once_with(
+            "redis://cache:6379/0", socket_timeout=0.25, socket_connect_timeout=0.25
+        )
+
+
+class TestSharedTokenBucket:
+    """Test suite for the lease cache in front of a shared bucket."""
+
+    @pytest.mark.asyncio
+    async def test_lease_saves_round_trips(self) -> None:
+        """Test that tokens are leased in batches instead of one round trip per call."""
+        bucket = SharedTokenBucket(InMemoryLimiterBackend(), "aws:global", lease_size=5)
+
+        for _ in range(10):
+            await bucket.acquire(1, tokens_per_second=15.0, max_tokens=30)
+
+        stats = bucket.get_stats()
+        assert stats["round_trips"] == 2
+        assert stats["leased_tokens"] == 0
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_dropped(self, virtual_clock: VirtualClock) -> None:
+        """Test that unused tokens are not kept past the lease TTL."""
+        bucket = SharedTokenBucket(
+            InMemoryLimiterBackend(), "aws:global", lease_size=5, lease_ttl=1.0
+        )
+        await bucket.acquire(1, tokens_per_second=15.0, max_tokens=30)
+
+        await asyncio.sleep(1.5)
+        await bucket.acquire(1, tokens_per_second=15.0, max_tokens=30)
+
+        stats = bucket.get_stats()
+        assert stats["expired_tokens"] == 4
+        assert stats["round_trips"] == 2
+
+    @pytest.mark.asyncio
+    async def test_waits_for_shared_tokens(self, virtual_clock: VirtualClock) -> None:
+        """Test that callers wait when other replicas used up the shared bucket."""
+        backend = InMemoryLimiterBackend()
+        await backend.take("aws:global", 2, 2.0, 2)
+        bucket = SharedTokenBucket(backend, "aws:global", lease_size=1)
+
+        waited = await bucket.acquire(1, tokens_per_second=2.0, max_tokens=2)
+
+        assert waited == pytest.approx(0.5)
+
+    @pytest.mark.asyncio
+    async def test_backend_failure_falls_back(
+        self, virtual_clock: VirtualClock, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that an unreachable backend leaves calls to the local limits, warning once."""
+        bucket = SharedTokenBucket(FailingBackend(), "aws:global", retry_interval=5.0)
+
+        with caplog.at_level(logging.WARNING):
+            for _ in range(3):
+                assert await bucket.acquire(1, tokens_per_second=15.0, max_tokens=30) == 0.0
+            await asyncio.sleep(5.0)
+            await bucket.acquire(1, tokens_per_second=15.0, max_tokens=30)
+
+        stats = bucket.get_stats()
+        assert stats["degraded"] is True
+        assert stats["backend_errors"] == 2  # First call, then one retry after the interval
+        assert caplog.text.count("Shared rate limiter unavailable") == 1
+
+    @pytest.mark.asyncio
+    async def test_hanging_backend_stalls_calls_once(self, virtual_clock: VirtualClock) -> None:
+        """Test that a backend that never answers delays calls by one timeout at most."""
+        backend = HangingBackend()
+        bucket = SharedTokenBucket(backend, "aws:global", timeout=0.5, retry_interval=5.0)
+
+        waits = await asyncio.gather(
+            *(bucket.acquire(1, tokens_per_second=15.0, max_tokens=30) for _ in range(10))
+        )
+
+        assert max(waits) == pytest.approx(0.5)
+        assert backend.calls == 1
+
+        # Degraded: calls skip the backend until the retry interval has passed
+        assert await bucket.acquire(1, tokens_per_second=15.0, max_tokens=30) == 0.0
+        assert backend.calls == 1
+        await asyncio.sleep(5.0)
+        probe, skipped = await asyncio.gather(
+            bucket.acquire(1, tokens_per_second=15.0, max_tokens=30),
+            bucket.acquire(1, tokens_per_second=15.0, max_tokens=30),
+        )
+        assert (probe, skipped) == (pytest.approx(0.5), 0.0)
+        assert backend.calls == 2
+
+
+class TestGetSharedLimiterBackend:
+    """Test suite for backend configuration."""
+
+    def test_unset(self) -> None:
+        """Test that limits apply per process by default."""
+        assert get_shared_limiter_backend() is None
+
+    @patch.dict(os.environ, {"THROTTLE_REDIS_URL": "redis://localhost:6379/0"})
+    @patch.dict(sys.modules, {"redis": None, "redis.asyncio": None})
+    def test_missing_package_falls_back(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that a URL without the redis package installed falls back with a warning."""
+        with caplog.at_level(logging.WARNING):
+            assert get_shared_limiter_backend() is None
+
+        assert "redis package is not installed" in caplog.text
+
+
+class TestSharedThrottling:
+    """Test suite for throttlers sharing limits across replicas."""
+
+    @pytest.mark.asyncio
+    async def test_replicas_share_global_rate(self, virtual_clock: VirtualClock) -> None:
+        """Test that two replicas together stay within one replica's configured rate."""
+        backend = InMemoryLimiterBackend()
+        with patch(
+            "ohlala_smartops.utils.global_throttler.get_shared_limiter_backend",
+            return_value=backend,
+        ):
+            replicas = [GlobalThrottler(), GlobalThrottler()]
+
+        async def call(throttler: GlobalThrottler) -> None:
+            async with throttler.throttled_request("test_operation"):
+                pass
+
+        start = virtual_clock.now
+        await asyncio.gather(*[call(replicas[index % 2]) for index in range(100)])
+        elapsed = virtual_clock.now - start
+
+        # 30 burst tokens, then 15/sec shared: 70 more calls take ~4.7s. Each
+        # replica alone would admit its 50 calls in ~1.3s.
+        assert elapsed > 4.0
+        for replica in replicas:
+            shared = replica.get_stats()["shared"]
+            assert shared["key"] == "aws:global"
+            assert shared["backend_errors"] == 0
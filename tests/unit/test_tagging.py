@@ -1,12 +1,19 @@
 """Tests for resource tagging utilities."""
 
+import asyncio
+from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from pydantic import ValidationError as PydanticValidationError
 
-from ohlala_smartops.aws.exceptions import TaggingError, ValidationError
-from ohlala_smartops.aws.tagging import ResourceTag, TaggingManager
+from ohlala_smartops.aws.exceptions import EC2Error, TaggingError, ThrottlingError, ValidationError
+from ohlala_smartops.aws.tagging import (
+    TAG_BATCH_SIZE,
+    ResourceTag,
+    TaggingManager,
+    get_tagging_manager,
+)
 
 
 class TestResourceTag:
@@ -196,6 +203,91 @@ class TestTaggingManager:
         assert len(result) == 100
         assert all(v is True for v in result.values())
 
+    @pytest.mark.asyncio
+    async def test_tag_resources_sent_in_concurrent_batches(
+        self, tagging_manager: TaggingManager, mock_ec2_client: Mock
+    ) -> None:
+        """Test that a large selection is split into batches sent concurrently."""
+        resource_ids = [f"i-{i:04d}" for i in range(1000)]
+        in_flight = 0
+        max_in_flight = 0
+
+        async def create_tags(operation: str, **kwargs: Any) -> dict[str, Any]:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {}
+
+        mock_ec2_client.call.side_effect = create_tags
+
+        result = await tagging_manager.tag_resources(resource_ids, {"Environment": "Test"})
+
+        batches = [c.kwargs["Resources"] for c in mock_ec2_client.call.call_args_list]
+        assert len(batches) == 1000 // TAG_BATCH_SIZE
+        assert all(len(batch) == TAG_BATCH_SIZE for batch in batches)
+        assert max_in_flight == len(batches)
+        assert result == dict.fromkeys(resource_ids, True)
+
+    @pytest.mark.asyncio
+    async def test_tag_resources_retries_batch_without_rejected_ids(
+        self, tagging_manager: TaggingManager, mock_ec2_client: Mock
+    ) -> None:
+        """Test that IDs AWS rejects fail alone while the rest of their batch is retried."""
+        resource_ids = [f"i-{i:04d}" for i in range(150)]
+
+        async def create_tags(operation: str, **kwargs: Any) -> dict[str, Any]:
+            unknown = {"i-0007", "i-0042"} & set(kwargs["Resources"])
+            if unknown:
+                raise EC2Error(
+                    f"The instance IDs '{', '.join(sorted(unknown))}' do not exist",
+                    error_code="InvalidInstanceID.NotFound",
+                )
+            return {}
+
+        mock_ec2_client.call.side_effect = create_tags
+
+        result = await tagging_manager.tag_resources(resource_ids, {"Environment": "Test"})
+
+        assert [rid for rid, ok in result.items() if not ok] == ["i-0007", "i-0042"]
+        assert list(result) == resource_ids
+        retried = mock_ec2_client.call.call_args_list[2].kwargs["Resources"]
+        assert len(retried) == TAG_BATCH_SIZE - 2
+        assert mock_ec2_client.call.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_remove_tags_retries_throttled_batch(
+        self, tagging_manager: TaggingManager, mock_ec2_client: Mock
+    ) -> None:
+        """Test that a throttled batch is retried while successful batches are not."""
+        resource_ids = [f"i-{i:04d}" for i in range(2 * TAG_BATCH_SIZE)]
+        mock_ec2_client.call.side_effect = [
+            {},
+            ThrottlingError("Rate exceeded", error_code="RequestLimitExceeded"),
+            {},
+        ]
+
+        result = await tagging_manager.remove_tags(resource_ids, ["Temp"])
+
+        assert result == dict.fromkeys(resource_ids, True)
+        retried = mock_ec2_client.call.call_args_list[2].kwargs["Resources"]
+        assert retried == resource_ids[TAG_BATCH_SIZE:]
+
+    @pytest.mark.asyncio
+    async def test_tag_resources_partial_failure_not_retried(
+        self, tagging_manager: TaggingManager, mock_ec2_client: Mock
+    ) -> None:
+        """Test that a batch failing for good is reported without failing the others."""
+        resource_ids = [f"i-{i:04d}" for i in range(2 * TAG_BATCH_SIZE)]
+        mock_ec2_client.call.side_effect = [{}, Exception("UnauthorizedOperation")]
+
+        result = await tagging_manager.tag_resources(resource_ids, {"Environment": "Test"})
+
+        assert sum(result.values()) == TAG_BATCH_SIZE
+        assert result[resource_ids[-1]] is False
+        assert mock_ec2_client.call.call_count == 2
+
     # Tests for get_resource_tags()
 
     @pytest.mark.asyncio
@@ -363,6 +455,33 @@ class TestTaggingManager:
         assert len(result) == 2
         assert mock_tagging_client.call.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_iter_resources_by_tags_pages_and_key_only_filter(
+        self, tagging_manager: TaggingManager, mock_tagging_client: Mock
+    ) -> None:
+        """Test that pages are yielded as fetched and key-only filters omit Values."""
+        mock_tagging_client.call.side_effect = [
+            {"ResourceTagMappingList": [{"ResourceARN": "arn-1"}], "PaginationToken": "t1"},
+            {"ResourceTagMappingList": [], "PaginationToken": "t2"},
+            {"ResourceTagMappingList": [{"ResourceARN": "arn-2"}, {"ResourceARN": "arn-3"}]},
+        ]
+
+        pages = [
+            page
+            async for page in tagging_manager.iter_resources_by_tags(
+                {"Environment": "Production", "Owner": None}, resource_types=["ec2:instance"]
+            )
+        ]
+
+        assert pages == [["arn-1"], ["arn-2", "arn-3"]]
+        first_call = mock_tagging_client.call.call_args_list[0]
+        assert first_call.kwargs["TagFilters"] == [
+            {"Key": "Environment", "Values": ["Production"]},
+            {"Key": "Owner"},
+        ]
+        assert first_call.kwargs["ResourceTypeFilters"] == ["ec2:instance"]
+        assert mock_tagging_client.call.call_args_list[2].kwargs["PaginationToken"] == "t2"
+
     @pytest.mark.asyncio
     async def test_find_resources_by_tags_no_results(
         self, tagging_manager: TaggingManager, mock_tagging_client: Mock
@@ -403,6 +522,17 @@ class TestTaggingManager:
         assert manager.client is not None
         assert manager._tagging_client is not None
 
+    def test_get_tagging_manager_shared_per_region(self) -> None:
+        """Test that the tagging manager of a region is created once."""
+        get_tagging_manager.cache_clear()
+        with patch("ohlala_smartops.aws.tagging.create_aws_client") as mock_create:
+            manager = get_tagging_manager("us-west-2")
+
+            assert get_tagging_manager("us-west-2") is manager
+            assert get_tagging_manager("eu-west-1") is not manager
+            assert mock_create.call_count == 4
+        get_tagging_manager.cache_clear()
+
     def test_tagging_manager_with_client(self, mock_ec2_client: Mock) -> None:
         """Test TaggingManager initialization with pre-configured client."""
         with patch("ohlala_smartops.aws.tagging.create_aws_client") as mock_create:
@@ -8,12 +8,14 @@ This test suite covers the three tagging commands:
 Tests include success cases, error handling, edge cases, and confirmation workflow.
 """
 
+from collections.abc import AsyncIterator
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from ohlala_smartops.commands.find_by_tags import FindByTagsCommand
+from ohlala_smartops.aws.exceptions import TaggingError
+from ohlala_smartops.commands.find_by_tags import DESCRIBE_BATCH_SIZE, FindByTagsCommand
 from ohlala_smartops.commands.tag import TagCommand
 from ohlala_smartops.commands.untag import UntagCommand
 
@@ -327,6 +329,53 @@ class TestUntagCommand:
         assert "aws" in result["error"].lower()
 
 
+class FakeTaggingManager:
+    """Tagging API stand-in returning preset pages of instance ARNs."""
+
+    def __init__(self, pages: list[list[str]], error: Exception | None = None) -> None:
+        self.pages = pages
+        self.error = error
+        self.calls: list[tuple[dict[str, str | None], list[str] | None]] = []
+
+    async def iter_resources_by_tags(
+        self, tag_filters: dict[str, str | None], resource_types: list[str] | None = None
+    ) -> AsyncIterator[list[str]]:
+        self.calls.append((dict(tag_filters), resource_types))
+        for page in self.pages:
+            yield page
+        if self.error is not None:
+            raise self.error
+
+
+def instance_arn(instance_id: str) -> str:
+    """ARN of an EC2 instance as returned by the Tagging API."""
+    return f"arn:aws:ec2:us-east-1:123456789012:instance/{instance_id}"
+
+
+def requested_ids(params: dict[str, Any]) -> list[str]:
+    """Instance IDs of the instance-id filter of describe-instances parameters."""
+    (instance_filter,) = params["Filters"]
+    assert instance_filter["Name"] == "instance-id"
+    return list(instance_filter["Values"])
+
+
+def describe_side_effect(tool_name: str, params: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+    """describe-instances stand-in returning a running instance per ID, except ``i-gone*``."""
+    assert tool_name == "describe-instances"
+    return {
+        "instances": [
+            {
+                "InstanceId": instance_id,
+                "Name": f"name-{instance_id}",
+                "State": "running",
+                "InstanceType": "t3.micro",
+            }
+            for instance_id in requested_ids(params)
+            if not instance_id.startswith("i-gone")
+        ]
+    }
+
+
 class TestFindByTagsCommand:
     """Test suite for FindByTagsCommand."""
 
@@ -336,9 +385,16 @@ class TestFindByTagsCommand:
         return FindByTagsCommand()
 
     @pytest.fixture
-    def mock_context(self) -> dict[str, Any]:
+    def tagging_manager(self) -> FakeTaggingManager:
+        """Create a Tagging API stand-in matching one instance."""
+        return FakeTaggingManager([[instance_arn("i-123")]])
+
+    @pytest.fixture
+    def mock_context(self, tagging_manager: FakeTaggingManager) -> dict[str, Any]:
         """Create mock context."""
-        return {"mcp_manager": AsyncMock()}
+        mcp_manager = AsyncMock()
+        mcp_manager.call_aws_api_tool.side_effect = describe_side_effect
+        return {"mcp_manager": mcp_manager, "tagging_manager": tagging_manager}
 
     def test_name_property(self, command: FindByTagsCommand) -> None:
         """Test command name."""
@@ -367,121 +423,153 @@ class TestFindByTagsCommand:
         self, command: FindByTagsCommand, mock_context: dict[str, Any]
     ) -> None:
         """Test execute when no instances match."""
-        mock_mcp = mock_context["mcp_manager"]
-        mock_mcp.call_aws_api_tool.return_value = {
-            "instances": [
-                {
-                    "InstanceId": "i-123",
-                    "Name": "test",
-                    "State": "running",
-                    "Tags": {"Environment": "Dev"},
-                }
-            ]
-        }
+        mock_context["tagging_manager"].pages = []
 
         result = await command.execute(["Environment=Production"], mock_context)
 
         assert result["success"] is True
-        assert (
-            "0" in result["message"]
-            or "no" in result["card"]["body"][2]["items"][0]["text"].lower()
-        )
+        assert "Found 0 instance(s)" in result["message"]
+        assert "no" in result["card"]["body"][2]["items"][0]["text"].lower()
+        mock_context["mcp_manager"].call_aws_api_tool.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_execute_with_matches(
         self, command: FindByTagsCommand, mock_context: dict[str, Any]
     ) -> None:
-        """Test execute with matching instances."""
-        mock_mcp = mock_context["mcp_manager"]
-        mock_mcp.call_aws_api_tool.return_value = {
-            "instances": [
-                {
-                    "InstanceId": "i-123",
-                    "Name": "prod-1",
-                    "State": "running",
-                    "InstanceType": "t3.micro",
-                    "PrivateIpAddress": "10.0.1.5",
-                    "Tags": {"Environment": "Production", "Team": "DevOps"},
-                },
-                {
-                    "InstanceId": "i-456",
-                    "Name": "dev-1",
-                    "State": "running",
-                    "InstanceType": "t3.micro",
-                    "PrivateIpAddress": "10.0.1.6",
-                    "Tags": {"Environment": "Dev", "Team": "DevOps"},
-                },
-            ]
-        }
-
+        """Test that tag filters are searched server side and only matches described."""
         result = await command.execute(["Environment=Production"], mock_context)
 
         assert result["success"] is True
-        assert "1" in result["message"]
+        assert "Found 1 instance(s)" in result["message"]
+        assert mock_context["tagging_manager"].calls == [
+            ({"Environment": "Production"}, ["ec2:instance"])
+        ]
+        mock_context["mcp_manager"].call_aws_api_tool.assert_called_once_with(
+            "describe-instances",
+            {"Filters": [{"Name": "instance-id", "Values": ["i-123"]}]},
+            turn_context=None,
+        )
 
     @pytest.mark.asyncio
     async def test_execute_multiple_filters(
         self, command: FindByTagsCommand, mock_context: dict[str, Any]
     ) -> None:
         """Test execute with multiple filters (AND logic)."""
-        mock_mcp = mock_context["mcp_manager"]
-        mock_mcp.call_aws_api_tool.return_value = {
-            "instances": [
-                {
-                    "InstanceId": "i-123",
-                    "Name": "prod-1",
-                    "State": "running",
-                    "InstanceType": "t3.micro",
-                    "PrivateIpAddress": "10.0.1.5",
-                    "Tags": {"Environment": "Production", "Team": "DevOps"},
-                },
-                {
-                    "InstanceId": "i-456",
-                    "Name": "prod-2",
-                    "State": "running",
-                    "InstanceType": "t3.micro",
-                    "PrivateIpAddress": "10.0.1.6",
-                    "Tags": {"Environment": "Production", "Team": "Platform"},
-                },
-            ]
-        }
-
         result = await command.execute(["Environment=Production", "Team=DevOps"], mock_context)
 
         assert result["success"] is True
-        assert "1" in result["message"]  # Only one instance matches both
+        assert mock_context["tagging_manager"].calls[0][0] == {
+            "Environment": "Production",
+            "Team": "DevOps",
+        }
 
     @pytest.mark.asyncio
     async def test_execute_key_only_filter(
         self, command: FindByTagsCommand, mock_context: dict[str, Any]
     ) -> None:
         """Test execute with key-only filter (any value)."""
-        mock_mcp = mock_context["mcp_manager"]
-        mock_mcp.call_aws_api_tool.return_value = {
-            "instances": [
-                {
-                    "InstanceId": "i-123",
-                    "Name": "inst-1",
-                    "State": "running",
-                    "InstanceType": "t3.micro",
-                    "PrivateIpAddress": "10.0.1.5",
-                    "Tags": {"Project": "WebApp"},
-                },
-                {
-                    "InstanceId": "i-456",
-                    "Name": "inst-2",
-                    "State": "running",
-                    "InstanceType": "t3.micro",
-                    "PrivateIpAddress": "10.0.1.6",
-                    "Tags": {"Environment": "Dev"},
-                },
-            ]
-        }
-
         result = await command.execute(["Project"], mock_context)
 
         assert result["success"] is True
-        assert "1" in result["message"]  # Only i-123 has Project tag
+        assert mock_context["tagging_manager"].calls[0][0] == {"Project": None}
+
+    @pytest.mark.asyncio
+    async def test_matches_described_in_batches_per_page(
+        self, command: FindByTagsCommand, mock_context: dict[str, Any]
+    ) -> None:
+        """Test that each page of matches is described in chunked batches."""
+        pages = [
+            [instance_arn(f"i-{page}{n:03d}") for n in range(size)]
+            for page, size in enumerate([DESCRIBE_BATCH_SIZE + 20, 5])
+        ]
+        mock_context["tagging_manager"].pages = pages
+
+        instances = await command._find_instances_by_tags({"Environment": "Prod"}, mock_context)
+
+        batches = [
+            requested_ids(c.args[1])
+            for c in mock_context["mcp_manager"].call_aws_api_tool.call_args_list
+        ]
+        assert [len(batch) for batch in batches] == [DESCRIBE_BATCH_SIZE, 20, 5]
+        assert [i["InstanceId"] for i in instances] == [
+            arn.rsplit("/", 1)[-1] for page in pages for arn in page
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_describe_batch_skipped(
+        self, command: FindByTagsCommand, mock_context: dict[str, Any]
+    ) -> None:
+        """Test that a batch failing to describe does not hide the other matches."""
+        mock_context["tagging_manager"].pages = [[instance_arn("i-fail")], [instance_arn("i-123")]]
+
+        def side_effect(tool_name: str, params: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+            if requested_ids(params) == ["i-fail"]:
+                raise Exception("RequestLimitExceeded")
+            return describe_side_effect(tool_name, params)
+
+        mock_context["mcp_manager"].call_aws_api_tool.side_effect = side_effect
+
+        instances = await command._find_instances_by_tags({"Environment": "Prod"}, mock_context)
+
+        assert [i["InstanceId"] for i in instances] == ["i-123"]
+
+    @pytest.mark.asyncio
+    async def test_terminated_instance_does_not_fail_batch(
+        self, command: FindByTagsCommand, mock_context: dict[str, Any]
+    ) -> None:
+        """Test that a tagged instance terminated since is left out of its batch."""
+        mock_context["tagging_manager"].pages = [
+            [instance_arn("i-123"), instance_arn("i-gone1"), instance_arn("i-456")]
+        ]
+
+        instances = await command._find_instances_by_tags({"Environment": "Prod"}, mock_context)
+
+        assert [i["InstanceId"] for i in instances] == ["i-123", "i-456"]
+        mock_context["mcp_manager"].call_aws_api_tool.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_error_payloads_fail_search(
+        self, command: FindByTagsCommand, mock_context: dict[str, Any]
+    ) -> None:
+        """Test that MCP error payloads are batch failures, not zero matches."""
+        mock_context["mcp_manager"].call_aws_api_tool.side_effect = None
+        mock_context["mcp_manager"].call_aws_api_tool.return_value = {
+            "error": "Circuit breaker open for ec2"
+        }
+
+        result = await command.execute(["Environment=Production"], mock_context)
+
+        assert result["success"] is False
+        assert "Circuit breaker open" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_shared_tagging_manager_by_default(
+        self, command: FindByTagsCommand, mock_context: dict[str, Any]
+    ) -> None:
+        """Test that without a tagging_manager in the context the shared one is used."""
+        tagging_manager = mock_context.pop("tagging_manager")
+        mock_context["region"] = "eu-west-1"
+
+        with patch(
+            "ohlala_smartops.commands.find_by_tags.get_tagging_manager",
+            return_value=tagging_manager,
+        ) as mock_get:
+            instances = await command._find_instances_by_tags({"Team": None}, mock_context)
+
+        mock_get.assert_called_once_with("eu-west-1")
+        assert [i["InstanceId"] for i in instances] == ["i-123"]
+
+    @pytest.mark.asyncio
+    async def test_execute_tag_search_failure(
+        self, command: FindByTagsCommand, mock_context: dict[str, Any]
+    ) -> None:
+        """Test that a failing tag search reports the error instead of partial results."""
+        mock_context["tagging_manager"].error = TaggingError("AccessDenied")
+
+        result = await command.execute(["Environment=Production"], mock_context)
+
+        assert result["success"] is False
+        assert "AccessDenied" in result["error"]
 
     def test_parse_tag_filters_key_value(self, command: FindByTagsCommand) -> None:
         """Test parsing key=value filters."""
@@ -11,6 +11,7 @@ from botbuilder.core import TurnContext
 from botbuilder.schema import Activity, ChannelAccount, ConversationAccount
 
 from ohlala_smartops.bot.teams_bot import OhlalaBot
+from ohlala_smartops.utils.fair_share import get_throttle_tenant
 
 
 class TestOhlalaBot:
@@ -67,6 +68,42 @@ class TestOhlalaBot:
         assert bot.write_op_manager is mock_write_op
         assert bot.command_tracker is mock_tracker
 
+    # Turn handling tests
+
+    @pytest.mark.asyncio
+    async def test_on_turn_sets_throttle_tenant(self, mock_turn_context: Mock) -> None:
+        """Test that activities from a team are throttled under the team's ID."""
+        bot = OhlalaBot()
+        mock_turn_context.activity.channel_data = {"team": {"id": "team123", "name": "Ops"}}
+        seen_tenants: list[str] = []
+
+        async def record_tenant(_turn_context: TurnContext) -> None:
+            seen_tenants.append(get_throttle_tenant())
+
+        with patch.object(bot.message_handler, "on_message_activity", new=record_tenant):
+            await bot.on_turn(mock_turn_context)
+
+        assert seen_tenants == ["team123"]
+        assert get_throttle_tenant() == "default"
+
+    @pytest.mark.asyncio
+    async def test_on_turn_writes_state_once(self, mock_turn_context: Mock) -> None:
+        """Test that the user and assistant messages of a turn share one state write."""
+        bot = OhlalaBot()
+
+        async def handle(_turn_context: TurnContext) -> None:
+            await bot.message_handler._store_user_message("conv123", "user123", "hi")
+            await bot.message_handler._store_assistant_message("conv123", "hello")
+
+        with patch.object(bot.message_handler, "on_message_activity", new=handle):
+            await bot.on_turn(mock_turn_context)
+
+        state = await bot.state_manager.storage.get_state("conv123")
+        assert state is not None
+        assert [message["role"] for message in state.history] == ["user", "assistant"]
+        assert bot.state_manager.get_stats()["state_reads"] == 1
+        assert bot.state_manager.get_stats()["state_writes"] == 1
+
     # Message activity tests
 
     @pytest.mark.asyncio
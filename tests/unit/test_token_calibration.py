@@ -0,0 +1,82 @@
+"""Tests for token estimate calibration from actual Bedrock usage."""
+
+import pytest
+
+from ohlala_smartops.utils.token_calibration import TokenCalibrator, TokenFeatures
+
+
+def observe_calls(calibrator: TokenCalibrator, calls: int = 40) -> None:
+    """Observe calls whose input tokens follow a known linear model.
+
+    The true model is 3000 base tokens, 250 tokens per 1K characters and 400 per
+    1K JSON characters.
+    """
+    for call in range(calls):
+        features = TokenFeatures(
+            chars=2_000 + (call * 733) % 6_000,
+            json_chars=1_000 + (call * 389) % 3_000,
+        )
+        tokens = 3_000 + 0.25 * features.chars + 0.4 * features.json_chars
+        calibrator.observe("bedrock_call", features, round(tokens))
+
+
+class TestTokenFeatures:
+    """Test suite for TokenFeatures."""
+
+    def test_from_request(self) -> None:
+        """Test that text and JSON parts are measured separately."""
+        features = TokenFeatures.from_request(
+            system_prompt="System",
+            user_message="Hello",
+            tool_definitions=[{"name": "tool1"}],
+            conversation_context="Before",
+            tool_results=[{"result": "ok"}],
+        )
+
+        assert features.chars == len("System") + len("Hello") + len("Before")
+        assert features.json_chars == len('[{"name": "tool1"}]') + len('[{"result": "ok"}]')
+
+
+class TestTokenCalibrator:
+    """Test suite for TokenCalibrator."""
+
+    def test_uncalibrated_until_min_samples(self) -> None:
+        """Test that no estimate is given before enough calls were observed."""
+        calibrator = TokenCalibrator(min_samples=20)
+        features = TokenFeatures(chars=4_000, json_chars=0)
+        for _ in range(19):
+            calibrator.observe("bedrock_call", features, 1_500)
+
+        assert calibrator.estimate("bedrock_call", features) is None
+        assert calibrator.estimate("other", features) is None
+
+        calibrator.observe("bedrock_call", features, 1_500)
+
+        assert calibrator.estimate("bedrock_call", features) == pytest.approx(1_650, abs=2)
+
+    def test_learns_token_model(self) -> None:
+        """Test that the fitted weights match the model behind the observations."""
+        calibrator = TokenCalibrator(safety_margin=0.0)
+        observe_calls(calibrator)
+
+        weights = calibrator.get_stats()["bedrock_call"]["weights"]
+        assert weights["base"] == pytest.approx(3_000, rel=0.01)
+        assert weights["per_1k_chars"] == pytest.approx(250, rel=0.01)
+        assert weights["per_1k_json_chars"] == pytest.approx(400, rel=0.01)
+
+        features = TokenFeatures(chars=5_000, json_chars=2_000)
+        assert calibrator.estimate("bedrock_call", features) == pytest.approx(5_050, rel=0.01)
+
+    def test_get_stats_and_reset(self) -> None:
+        """Test reporting of samples and prediction error, and forgetting them."""
+        calibrator = TokenCalibrator()
+        observe_calls(calibrator, calls=30)
+
+        stats = calibrator.get_stats()["bedrock_call"]
+        assert stats["samples"] == 30
+        assert stats["calibrated"] is True
+        assert stats["mean_abs_error"] < 0.5
+
+        calibrator.reset()
+
+        assert calibrator.get_stats() == {}
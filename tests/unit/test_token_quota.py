@@ -0,0 +1,142 @@
+"""Tests for rolling-window token quotas."""
+
+import os
+from collections.abc import Generator
+from unittest.mock import patch
+
+import pytest
+
+from ohlala_smartops.utils.token_quota import (
+    RollingWindowCounter,
+    TokenQuotaExceededError,
+    TokenQuotas,
+)
+
+
+class FakeClock:
+    """Manually advanced replacement for time.time."""
+
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Generator[FakeClock]:
+    """Patch the quotas' clock with a manually advanced one."""
+    fake = FakeClock()
+    with patch("ohlala_smartops.utils.token_quota.time.time", fake.time):
+        yield fake
+
+
+class TestRollingWindowCounter:
+    """Test suite for RollingWindowCounter."""
+
+    def test_amounts_leave_window(self) -> None:
+        """Test that amounts stop counting once they are older than the window."""
+        counter = RollingWindowCounter(window_seconds=60, buckets=60)
+        counter.add(100, now=0.0)
+        counter.add(50, now=30.0)
+
+        assert counter.total(now=59.0) == 150
+        assert counter.total(now=60.0) == 50
+        assert counter.total(now=90.0) == 0
+
+    def test_long_idle_clears_everything(self) -> None:
+        """Test that a gap longer than the window clears every bucket."""
+        counter = RollingWindowCounter(window_seconds=3600, buckets=60)
+        for minute in range(60):
+            counter.add(10, now=minute * 60.0)
+
+        assert counter.total(now=3599.0) == 600
+        assert counter.total(now=100_000.0) == 0
+
+    def test_time_until_below(self) -> None:
+        """Test the wait until enough old amounts have expired."""
+        counter = RollingWindowCounter(window_seconds=60, buckets=60)
+        counter.add(100, now=0.0)
+        counter.add(50, now=30.0)
+
+        assert counter.time_until_below(200, now=40.0) == 0.0
+        assert counter.time_until_below(60, now=40.0) == pytest.approx(20.0)
+        assert counter.time_until_below(0, now=40.0) == pytest.approx(50.0)
+
+
+class TestTokenQuotas:
+    """Test suite for TokenQuotas."""
+
+    def test_rejects_call_over_user_quota(self, clock: FakeClock) -> None:
+        """Test that a user over their hourly quota is rejected with a retry time."""
+        quotas = TokenQuotas(user_limits={"hour": 10_000})
+        quotas.record("user1", "team1", 9_000)
+        clock.now += 600
+
+        with pytest.raises(TokenQuotaExceededError, match="Your Bedrock token quota per hour") as e:
+            quotas.check("user1", "team1", estimated_tokens=2_000)
+
+        assert e.value.scope == "user"
+        assert e.value.retry_after == pytest.approx(3000.0, abs=60.0)
+        assert quotas.get_stats()["rejected"] == 1
+
+    def test_users_counted_separately(self, clock: FakeClock) -> None:
+        """Test that one user's usage does not count against another user."""
+        quotas = TokenQuotas(user_limits={"minute": 1_000})
+        quotas.record("user1", "team1", 1_000)
+
+        quotas.check("user2", "team1", estimated_tokens=900)
+
+    def test_team_quota_shared_by_members(self, clock: FakeClock) -> None:
+        """Test that all members of a team count against the team quota."""
+        quotas = TokenQuotas(team_limits={"day": 5_000})
+        quotas.record("user1", "team1", 3_000)
+        quotas.record("user2", "team1", 1_500)
+
+        with pytest.raises(TokenQuotaExceededError, match="Your team's") as e:
+            quotas.check("user3", "team1", estimated_tokens=1_000)
+        quotas.check("user3", "team2", estimated_tokens=1_000)
+
+        assert e.value.window == "day"
+
+    def test_quota_frees_up_as_window_moves(self, clock: FakeClock) -> None:
+        """Test that calls are allowed again once old usage has left the window."""
+        quotas = TokenQuotas(user_limits={"minute": 1_000})
+        quotas.record("user1", "team1", 1_000)
+
+        clock.now += 61
+        quotas.check("user1", "team1", estimated_tokens=1_000)
+
+    def test_get_usage(self, clock: FakeClock) -> None:
+        """Test usage reporting for windows with and without limits."""
+        quotas = TokenQuotas(user_limits={"hour": 10_000})
+        quotas.record("user1", "team1", 1_500)
+        clock.now += 120
+
+        usage = quotas.get_usage("user1", "team1")
+
+        assert usage["user"]["minute"] == {"used": 0, "limit": None}
+        assert usage["user"]["hour"] == {"used": 1_500, "limit": 10_000}
+        assert usage["team"]["day"] == {"used": 1_500, "limit": None}
+        assert quotas.get_usage("user2", "team2")["user"]["day"]["used"] == 0
+
+    def test_idle_counters_dropped(self, clock: FakeClock) -> None:
+        """Test that users and teams without usage in any window are forgotten."""
+        quotas = TokenQuotas(user_limits={"hour": 10_000})
+        quotas.record("user1", "team1", 1_000)
+        clock.now += 3600
+        quotas.record("user2", "team1", 1_000)
+
+        clock.now += 86400 - 1800
+        quotas.record("user3", "team2", 1_000)
+
+        stats = quotas.get_stats()
+        assert (stats["users"], stats["teams"]) == (2, 2)
+        assert quotas.get_usage("user1", "team1")["user"]["day"]["used"] == 0
+
+    @patch.dict(os.environ, {"TOKEN_QUOTA_USER_PER_HOUR": "50000", "TOKEN_QUOTA_TEAM_PER_DAY": "0"})
+    def test_from_env(self) -> None:
+        """Test loading limits from the environment, 0 meaning no limit."""
+        quotas = TokenQuotas.from_env()
+
+        assert quotas.limits == {"user": {"hour": 50_000}, "team": {}}
@@ -1,5 +1,6 @@
 """Tests for token usage tracking and cost monitoring utilities."""
 
+import asyncio
 import json
 import time
 from datetime import UTC, datetime
@@ -9,6 +10,7 @@ from unittest.mock import patch
 import pytest
 
 import ohlala_smartops.utils.token_tracker
+from ohlala_smartops.utils.token_calibration import TokenFeatures, get_token_calibrator
 from ohlala_smartops.utils.token_tracker import (
     TokenTracker,
     check_operation_limits,
@@ -276,6 +278,50 @@ class TestTokenTracker:
         assert data["operations"] == 1
         assert data["total_input_tokens"] == 1000
 
+    @pytest.mark.asyncio
+    async def test_daily_stats_written_behind(self, tmp_path: Path) -> None:
+        """Test that updates inside the event loop are coalesced into one delayed write."""
+        storage = tmp_path / "test_tokens.json"
+        tracker = TokenTracker(str(storage), flush_interval=0.05)
+
+        for _ in range(10):
+            tracker.track_operation("test", 1000, 500)
+        assert not storage.exists()
+
+        await asyncio.sleep(0.2)
+
+        assert tracker._flushes == 1
+        assert json.loads(storage.read_text())["operations"] == 10
+        assert list(tmp_path.iterdir()) == [storage]
+
+    @pytest.mark.asyncio
+    async def test_close_writes_pending_stats(self, tmp_path: Path) -> None:
+        """Test that closing writes held updates without waiting for the interval."""
+        storage = tmp_path / "test_tokens.json"
+        tracker = TokenTracker(str(storage), flush_interval=3600)
+        tracker.track_operation("test", 1000, 500)
+
+        await tracker.close()
+
+        assert json.loads(storage.read_text())["total_input_tokens"] == 1000
+        await tracker.close()
+        assert tracker._flushes == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_write_stays_pending(self, tmp_path: Path) -> None:
+        """Test that statistics a failed write did not save are written by the next flush."""
+        storage = tmp_path / "test_tokens.json"
+        tracker = TokenTracker(str(storage), flush_interval=3600)
+        tracker.track_operation("test", 1000, 500)
+
+        with patch("ohlala_smartops.utils.token_tracker.os.fdopen", side_effect=OSError("full")):
+            await tracker.flush()
+        assert not storage.exists()
+
+        await tracker.close()
+
+        assert json.loads(storage.read_text())["total_input_tokens"] == 1000
+
     def test_daily_stats_loading(self, tmp_path: Path) -> None:
         """Test loading daily stats from file."""
         storage = tmp_path / "test_tokens.json"
@@ -397,6 +443,18 @@ class TestGlobalFunctions:
         assert isinstance(tokens, int)
         assert tokens > 0
 
+    def test_estimate_bedrock_input_tokens_calibrated(self) -> None:
+        """Test that estimates follow observed Bedrock usage once calibrated."""
+        calibrator = get_token_calibrator()
+        for length in range(100, 3_100, 100):
+            features = TokenFeatures.from_request("S" * length, "Hello", [])
+            calibrator.observe("bedrock_call", features, 1_000 + length // 5)
+
+        tokens = estimate_bedrock_input_tokens("S" * 2_000, "Hello", [])
+
+        # 1401 tokens plus the 10% safety margin
+        assert tokens == pytest.approx(1_541, abs=5)
+
     def test_check_operation_limits_function(self) -> None:
         """Test convenience function for checking limits."""
         result = check_operation_limits(1000, "test", 1)
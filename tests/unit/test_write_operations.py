@@ -398,6 +398,22 @@ class TestUserOperations:
         assert len(operations) == 0
         assert operation.id not in manager.pending_operations
 
+    def test_get_user_pending_operations_after_cancel(self, manager):
+        """Test that cancelled operations leave the per-user index."""
+        operation = manager.create_approval_request(
+            operation_type="stop-instances",
+            resource_ids=["i-1234"],
+            user_id="user-123",
+            user_name="John Doe",
+            team_id="team-456",
+            description="Test",
+        )
+
+        manager.cancel_operation(operation.id, "user-123")
+
+        assert manager.get_user_pending_operations("user-123") == []
+        assert manager._operations_by_user == {}
+
 
 class TestLifecycleManagement:
     """Test manager lifecycle (start/stop)."""